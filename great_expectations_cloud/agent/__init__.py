@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import great_expectations_cloud.agent.actions  # import actions to register them
+import great_expectations_cloud.agent.actions  # register actions, imported when first needed
 from great_expectations_cloud.agent.agent import GXAgent
 from great_expectations_cloud.agent.event_handler import register_event_action
 from great_expectations_cloud.agent.models import Event, EventType
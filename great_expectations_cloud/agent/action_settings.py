@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ActionSettings:
+    """Settings of the GX Agent's actions, set from GxAgentEnvVars when the agent starts."""
+
+    # data assets of one event processed at once; 1 processes them one after another
+    data_quality_check_asset_workers: int = 4
+    # expectations sent to GX Cloud per request when an asset gets one for each column
+    expectation_batch_size: int = 100
+    # columns whose metrics are computed together; wider tables are split into chunks of them
+    metric_column_chunk_size: int = 250
+    # chunks of columns computed at once, each on its own pooled connection
+    metric_column_workers: int = 4
+    # validation definitions of one Checkpoint validated at once against each datasource;
+    # 0 leaves the Checkpoint to validate them one after another
+    validations_per_datasource: int = 0
+
+
+_settings = ActionSettings()
+
+
+def get_action_settings() -> ActionSettings:
+    """The process-wide ActionSettings, the defaults until configured."""
+    return _settings
+
+
+def configure_action_settings(settings: ActionSettings) -> None:
+    """Replace the process-wide ActionSettings."""
+    global _settings  # noqa: PLW0603 # process-wide singleton
+    _settings = settings
@@ -1,27 +1,95 @@
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any, Final
+
 from great_expectations_cloud.agent.actions.agent_action import (
     ActionResult,
     AgentAction,
     CreatedResource,
 )
+from great_expectations_cloud.agent.constants import JobWeight
+from great_expectations_cloud.agent.event_handler import register_lazy_event_action
+from great_expectations_cloud.agent.models import (
+    DraftDatasourceConfigEvent,
+    GenerateDataQualityCheckExpectationsEvent,
+    GenerateExpectationsEvent,
+    GenerateSqlExpectationEvent,
+    ListAssetNamesEvent,
+    RunCheckpointEvent,
+    RunMetricsListEvent,
+    RunScheduledCheckpointEvent,
+    RunWindowCheckpointEvent,
+)
+
+if TYPE_CHECKING:
+    from great_expectations_cloud.agent.actions.draft_datasource_config_action import (
+        DraftDatasourceConfigAction,
+    )
+    from great_expectations_cloud.agent.actions.generate_data_quality_check_expectations_action import (
+        GenerateDataQualityCheckExpectationsAction,
+    )
+    from great_expectations_cloud.agent.actions.generate_expectations_action import (
+        GenerateExpectationsAction,
+    )
+    from great_expectations_cloud.agent.actions.generate_sql_expectation import (
+        GenerateSqlExpectationAction,
+    )
+    from great_expectations_cloud.agent.actions.list_asset_names import ListAssetNamesAction
+    from great_expectations_cloud.agent.actions.run_checkpoint import RunCheckpointAction
+    from great_expectations_cloud.agent.actions.run_metric_list_action import MetricListAction
+    from great_expectations_cloud.agent.actions.run_scheduled_checkpoint import (
+        RunScheduledCheckpointAction,
+    )
 
-# Import all actions to register them:
-from great_expectations_cloud.agent.actions.draft_datasource_config_action import (
-    DraftDatasourceConfigAction,
+# Register all actions by event type, with the worker lane they run on. Their modules are
+# imported when the first matching event arrives, so agents that never run an ExpectAI job
+# don't import LangChain or OpenAI. The modules register their actions without a weight.
+register_lazy_event_action(
+    DraftDatasourceConfigEvent,
+    f"{__name__}.draft_datasource_config_action",
+    weight=JobWeight.LIGHT,
 )
-from great_expectations_cloud.agent.actions.generate_data_quality_check_expectations_action import (
-    GenerateDataQualityCheckExpectationsAction,
+register_lazy_event_action(
+    ListAssetNamesEvent,
+    f"{__name__}.list_asset_names",
+    weight=JobWeight.LIGHT,
 )
-from great_expectations_cloud.agent.actions.generate_expectations_action import (
-    GenerateExpectationsAction,
+register_lazy_event_action(
+    GenerateSqlExpectationEvent,
+    f"{__name__}.generate_sql_expectation",
+    weight=JobWeight.LIGHT,
+    expect_ai=True,
 )
-from great_expectations_cloud.agent.actions.generate_sql_expectation import (
-    GenerateSqlExpectationAction,
+register_lazy_event_action(
+    GenerateExpectationsEvent,
+    f"{__name__}.generate_expectations_action",
+    expect_ai=True,
 )
-from great_expectations_cloud.agent.actions.list_asset_names import ListAssetNamesAction
-from great_expectations_cloud.agent.actions.run_checkpoint import RunCheckpointAction
-from great_expectations_cloud.agent.actions.run_metric_list_action import MetricListAction
-from great_expectations_cloud.agent.actions.run_scheduled_checkpoint import (
-    RunScheduledCheckpointAction,
+register_lazy_event_action(
+    GenerateDataQualityCheckExpectationsEvent,
+    f"{__name__}.generate_data_quality_check_expectations_action",
 )
+register_lazy_event_action(RunCheckpointEvent, f"{__name__}.run_checkpoint")
+register_lazy_event_action(RunWindowCheckpointEvent, f"{__name__}.run_checkpoint")
+register_lazy_event_action(RunScheduledCheckpointEvent, f"{__name__}.run_scheduled_checkpoint")
+register_lazy_event_action(RunMetricsListEvent, f"{__name__}.run_metric_list_action")
+
+# action class -> module defining it, for `from great_expectations_cloud.agent.actions import ...`
+_LAZY_ACTION_CLASSES: Final[dict[str, str]] = {
+    "DraftDatasourceConfigAction": "draft_datasource_config_action",
+    "GenerateDataQualityCheckExpectationsAction": "generate_data_quality_check_expectations_action",
+    "GenerateExpectationsAction": "generate_expectations_action",
+    "GenerateSqlExpectationAction": "generate_sql_expectation",
+    "ListAssetNamesAction": "list_asset_names",
+    "RunCheckpointAction": "run_checkpoint",
+    "MetricListAction": "run_metric_list_action",
+    "RunScheduledCheckpointAction": "run_scheduled_checkpoint",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ACTION_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
+    return getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
@@ -4,13 +4,13 @@ from typing import Any
 from urllib.parse import urljoin
 from uuid import UUID
 
-from great_expectations.core.http import create_session
 from great_expectations.datasource.fluent import SQLDatasource
 from great_expectations.datasource.fluent.interfaces import TestConnectionError
 from typing_extensions import override
 
 from great_expectations_cloud.agent.actions import ActionResult, AgentAction
 from great_expectations_cloud.agent.actions.utils import get_asset_names
+from great_expectations_cloud.agent.cloud_client import get_cloud_session
 from great_expectations_cloud.agent.event_handler import register_event_action
 from great_expectations_cloud.agent.exceptions import ErrorCode, raise_with_error_code
 from great_expectations_cloud.agent.models import DraftDatasourceConfigEvent
@@ -67,7 +67,7 @@ class DraftDatasourceConfigAction(AgentAction[DraftDatasourceConfigEvent]):
         )
 
     def _update_asset_names_list(self, config_id: UUID, asset_names: list[str]) -> None:
-        with create_session(access_token=self._auth_key) as session:
+        with get_cloud_session(access_token=self._auth_key) as session:
             url = urljoin(
                 base=self._base_url,
                 url=f"/api/v1/organizations/{self._domain_context.organization_id}/workspaces/{self._domain_context.workspace_id}/draft-table-names/{config_id}",
@@ -89,7 +89,7 @@ class DraftDatasourceConfigAction(AgentAction[DraftDatasourceConfigEvent]):
             base=self._base_url,
             url=f"/api/v1/organizations/{self._domain_context.organization_id}/workspaces/{self._domain_context.workspace_id}/draft-datasources/{config_id}",
         )
-        with create_session(access_token=self._auth_key) as session:
+        with get_cloud_session(access_token=self._auth_key) as session:
             response = session.get(resource_url)
             if not response.ok:
                 raise RuntimeError(  # noqa: TRY003 # one off error
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import re
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any, Final
@@ -10,7 +11,6 @@ from urllib.parse import urljoin
 from uuid import UUID
 
 import great_expectations.expectations as gx_expectations
-from great_expectations.core.http import create_session
 from great_expectations.datasource.fluent.interfaces import TestConnectionError
 from great_expectations.exceptions import (
     GXCloudError,
@@ -27,9 +27,6 @@ from great_expectations.experimental.metric_repository.batch_inspector import (
 from great_expectations.experimental.metric_repository.cloud_data_store import (
     CloudDataStore,
 )
-from great_expectations.experimental.metric_repository.metric_list_metric_retriever import (
-    MetricListMetricRetriever,
-)
 from great_expectations.experimental.metric_repository.metric_repository import (
     MetricRepository,
 )
@@ -40,7 +37,16 @@ from great_expectations.experimental.metric_repository.metrics import (
 )
 from typing_extensions import override
 
+from great_expectations_cloud.agent.action_settings import get_action_settings
 from great_expectations_cloud.agent.actions import ActionResult, AgentAction
+from great_expectations_cloud.agent.cloud_client import (
+    get_cloud_session,
+    get_job_correlation_id,
+    set_job_correlation_id,
+)
+from great_expectations_cloud.agent.connection_test_cache import get_connection_test_cache
+from great_expectations_cloud.agent.count_metric_retriever import CountScanMetricRetriever
+from great_expectations_cloud.agent.engine_registry import get_engine_registry
 from great_expectations_cloud.agent.event_handler import register_event_action
 from great_expectations_cloud.agent.exceptions import GXAgentError
 from great_expectations_cloud.agent.models import (
@@ -55,6 +61,8 @@ from great_expectations_cloud.agent.utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from great_expectations.core.suite_parameters import SuiteParameterDict
     from great_expectations.data_context import CloudDataContext
     from great_expectations.datasource.fluent import DataAsset
@@ -115,7 +123,7 @@ class GenerateDataQualityCheckExpectationsAction(
         auth_key: str,
         analytics: AgentAnalytics,
         metric_repository: MetricRepository | None = None,
-        batch_inspector: BatchInspector | None = None,
+        batch_inspector_factory: Callable[[], BatchInspector] | None = None,
     ):
         super().__init__(
             context=context,
@@ -127,89 +135,41 @@ class GenerateDataQualityCheckExpectationsAction(
         self._metric_repository = metric_repository or MetricRepository(
             data_store=CloudDataStore(self._context)
         )
-        self._batch_inspector = batch_inspector or BatchInspector(
-            context, [MetricListMetricRetriever(self._context)]
+        # assets are inspected on several threads, and a retriever caches its asset's validator,
+        # so each asset gets a BatchInspector of its own
+        self._batch_inspector_factory = batch_inspector_factory or (
+            lambda: BatchInspector(context, [CountScanMetricRetriever(context)])
         )
 
     @override
     def run(self, event: GenerateDataQualityCheckExpectationsEvent, id: str) -> ActionResult:
-        created_resources: list[CreatedResource] = []
-        assets_with_errors: dict[str, str] = {}
-        selected_dqis: Sequence[DataQualityIssues] = event.selected_data_quality_issues or []
-        created_via: str | None = event.created_via or None
-        for asset_name in event.data_assets:
-            try:
-                data_asset = self._retrieve_asset_from_asset_name(event, asset_name)
+        asset_names = list(event.data_assets)
+        asset_workers = min(
+            get_action_settings().data_quality_check_asset_workers,
+            len(asset_names),
+        )
+        if asset_workers <= 1:
+            outcomes = [self._generate_for_asset_safely(event, name) for name in asset_names]
+        else:
+            # GX Cloud requests from the asset threads are tagged with this job's id
+            correlation_id = get_job_correlation_id()
 
-                metric_run, metric_run_id = self._get_metrics(data_asset)
-                created_resources.append(
-                    CreatedResource(resource_id=str(metric_run_id), type="MetricRun")
-                )
+            def generate(asset_name: str) -> tuple[list[CreatedResource], str | None]:
+                set_job_correlation_id(correlation_id)
+                return self._generate_for_asset_safely(event, asset_name)
 
-                if selected_dqis:
-                    pre_existing_anomaly_detection_coverage = (
-                        self._get_current_anomaly_detection_coverage(data_asset.id)
-                    )
+            with ThreadPoolExecutor(
+                max_workers=asset_workers, thread_name_prefix="gx-data-quality-check-asset"
+            ) as pool:
+                outcomes = list(pool.map(generate, asset_names))
 
-                    if self._should_add_volume_change_detection_coverage(
-                        selected_data_quality_issues=selected_dqis,
-                        pre_existing_anomaly_detection_coverage=pre_existing_anomaly_detection_coverage,
-                    ):
-                        volume_change_expectation_id = self._add_volume_change_expectation(
-                            asset_id=data_asset.id,
-                            use_forecast=event.use_forecast,
-                            created_via=created_via,
-                        )
-                        created_resources.append(
-                            CreatedResource(
-                                resource_id=str(volume_change_expectation_id), type="Expectation"
-                            )
-                        )
-
-                    if self._should_add_schema_change_detection_coverage(
-                        selected_data_quality_issues=selected_dqis,
-                        pre_existing_anomaly_detection_coverage=pre_existing_anomaly_detection_coverage,
-                    ):
-                        schema_change_expectation_id = self._add_schema_change_expectation(
-                            metric_run=metric_run, asset_id=data_asset.id, created_via=created_via
-                        )
-                        created_resources.append(
-                            CreatedResource(
-                                resource_id=str(schema_change_expectation_id), type="Expectation"
-                            )
-                        )
-
-                    if DataQualityIssues.COMPLETENESS in selected_dqis:
-                        pre_existing_completeness_change_expectations = (
-                            pre_existing_anomaly_detection_coverage.get(
-                                DataQualityIssues.COMPLETENESS, []
-                            )
-                        )
-                        completeness_change_expectation_ids = self._add_completeness_change_expectations(
-                            metric_run=metric_run,
-                            asset_id=data_asset.id,
-                            pre_existing_completeness_change_expectations=pre_existing_completeness_change_expectations,
-                            created_via=created_via,
-                            use_forecast=event.use_forecast,
-                        )
-                        for exp_id in completeness_change_expectation_ids:
-                            created_resources.append(
-                                CreatedResource(resource_id=str(exp_id), type="Expectation")
-                            )
-
-            except TestConnectionError as e:
-                # User configuration error - log at WARNING to avoid Sentry capture
-                LOGGER.warning(
-                    "User configuration error for asset %s: %s",
-                    asset_name,
-                    str(e),
-                    exc_info=True,
-                )
-                assets_with_errors[asset_name] = str(e)
-            except Exception as e:
-                # Unexpected error - log at ERROR for Sentry visibility
-                LOGGER.exception("Failed to generate expectations for %s: %s", asset_name, str(e))  # noqa: TRY401
-                assets_with_errors[asset_name] = str(e)
+        # results are merged in event order, however the assets finished
+        created_resources: list[CreatedResource] = []
+        assets_with_errors: dict[str, str] = {}
+        for asset_name, (asset_resources, error) in zip(asset_names, outcomes, strict=True):
+            created_resources.extend(asset_resources)
+            if error is not None:
+                assets_with_errors[asset_name] = error
 
         if assets_with_errors:
             raise PartialGenerateDataQualityCheckExpectationError(
@@ -223,13 +183,100 @@ class GenerateDataQualityCheckExpectationsAction(
             created_resources=created_resources,
         )
 
+    def _generate_for_asset_safely(
+        self, event: GenerateDataQualityCheckExpectationsEvent, asset_name: str
+    ) -> tuple[list[CreatedResource], str | None]:
+        """Generate an asset's expectations, returning the resources created and any error."""
+        created_resources: list[CreatedResource] = []
+        try:
+            self._generate_for_asset(event, asset_name, created_resources)
+        except TestConnectionError as e:
+            # User configuration error - log at WARNING to avoid Sentry capture
+            LOGGER.warning(
+                "User configuration error for asset %s: %s",
+                asset_name,
+                str(e),
+                exc_info=True,
+            )
+            return created_resources, str(e)
+        except Exception as e:
+            # Unexpected error - log at ERROR for Sentry visibility
+            LOGGER.exception("Failed to generate expectations for %s: %s", asset_name, str(e))  # noqa: TRY401
+            return created_resources, str(e)
+        return created_resources, None
+
+    def _generate_for_asset(
+        self,
+        event: GenerateDataQualityCheckExpectationsEvent,
+        asset_name: str,
+        created_resources: list[CreatedResource],
+    ) -> None:
+        """Compute an asset's metrics and add its expectations, appending what gets created."""
+        selected_dqis: Sequence[DataQualityIssues] = event.selected_data_quality_issues or []
+        created_via: str | None = event.created_via or None
+        data_asset = self._retrieve_asset_from_asset_name(event, asset_name)
+
+        metric_run, metric_run_id = self._get_metrics(data_asset)
+        created_resources.append(CreatedResource(resource_id=str(metric_run_id), type="MetricRun"))
+
+        if selected_dqis:
+            pre_existing_anomaly_detection_coverage = self._get_current_anomaly_detection_coverage(
+                data_asset.id
+            )
+
+            if self._should_add_volume_change_detection_coverage(
+                selected_data_quality_issues=selected_dqis,
+                pre_existing_anomaly_detection_coverage=pre_existing_anomaly_detection_coverage,
+            ):
+                volume_change_expectation_id = self._add_volume_change_expectation(
+                    asset_id=data_asset.id,
+                    use_forecast=event.use_forecast,
+                    created_via=created_via,
+                )
+                created_resources.append(
+                    CreatedResource(
+                        resource_id=str(volume_change_expectation_id), type="Expectation"
+                    )
+                )
+
+            if self._should_add_schema_change_detection_coverage(
+                selected_data_quality_issues=selected_dqis,
+                pre_existing_anomaly_detection_coverage=pre_existing_anomaly_detection_coverage,
+            ):
+                schema_change_expectation_id = self._add_schema_change_expectation(
+                    metric_run=metric_run, asset_id=data_asset.id, created_via=created_via
+                )
+                created_resources.append(
+                    CreatedResource(
+                        resource_id=str(schema_change_expectation_id), type="Expectation"
+                    )
+                )
+
+            if DataQualityIssues.COMPLETENESS in selected_dqis:
+                pre_existing_completeness_change_expectations = (
+                    pre_existing_anomaly_detection_coverage.get(DataQualityIssues.COMPLETENESS, [])
+                )
+                completeness_change_expectation_ids = self._add_completeness_change_expectations(
+                    metric_run=metric_run,
+                    asset_id=data_asset.id,
+                    pre_existing_completeness_change_expectations=pre_existing_completeness_change_expectations,
+                    created_via=created_via,
+                    use_forecast=event.use_forecast,
+                )
+                for exp_id in completeness_change_expectation_ids:
+                    created_resources.append(
+                        CreatedResource(resource_id=str(exp_id), type="Expectation")
+                    )
+
     def _retrieve_asset_from_asset_name(
         self, event: GenerateDataQualityCheckExpectationsEvent, asset_name: str
     ) -> DataAsset[Any, Any]:
         try:
             datasource = self._context.data_sources.get(event.datasource_name)
+            get_engine_registry().attach(datasource)
             data_asset = datasource.get_asset(asset_name)
-            data_asset.test_connection()  # raises `TestConnectionError` on failure
+            # raises `TestConnectionError` on failure
+            get_connection_test_cache().test_data_asset(data_asset)
         except TestConnectionError:
             # Let TestConnectionError propagate directly - it's a user configuration error
             raise
@@ -242,7 +289,7 @@ class GenerateDataQualityCheckExpectationsAction(
         batch_request = data_asset.build_batch_request()
         if data_asset.id is None:
             raise RuntimeError("DataAsset.id is None")  # noqa: TRY003
-        metric_run = self._batch_inspector.compute_metric_list_run(
+        metric_run = self._batch_inspector_factory().compute_metric_list_run(
             data_asset_id=data_asset.id,
             batch_request=batch_request,
             metric_list=[
@@ -269,7 +316,7 @@ class GenerateDataQualityCheckExpectationsAction(
             base=self._base_url,
             url=f"/api/v1/organizations/{self._domain_context.organization_id}/workspaces/{self._domain_context.workspace_id}/expectations/",
         )
-        with create_session(access_token=self._auth_key) as session:
+        with get_cloud_session(access_token=self._auth_key) as session:
             response = session.get(
                 url=url,
                 params={"anomaly_detection": str(True), "data_asset_id": str(data_asset_id)},
@@ -423,7 +470,7 @@ class GenerateDataQualityCheckExpectationsAction(
         if not column_null_values_metric or len(column_null_values_metric) == 0:
             raise RuntimeError("missing COLUMN_NON_NULL_COUNT metrics")  # noqa: TRY003
 
-        expectation_ids = []
+        expectations: list[gx_expectations.Expectation] = []
         # Single-expectation approach using ExpectColumnProportionOfNonNullValuesToBeBetween
         # Expectations are only added to columns that do not have coverage
         columns_missing_completeness_coverage = self._get_columns_missing_completeness_coverage(
@@ -512,12 +559,11 @@ class GenerateDataQualityCheckExpectationsAction(
                     severity=FailureSeverity.WARNING,
                 )
 
-            expectation_id = self._create_expectation_for_asset(
-                expectation=expectation, asset_id=asset_id, created_via=created_via
-            )
-            expectation_ids.append(expectation_id)
+            expectations.append(expectation)
 
-        return expectation_ids
+        return self._create_expectations_for_asset(
+            expectations=expectations, asset_id=asset_id, created_via=created_via
+        )
 
     def _get_columns_missing_completeness_coverage(
         self,
@@ -566,27 +612,66 @@ class GenerateDataQualityCheckExpectationsAction(
         asset_id: UUID | None,
         created_via: str | None,
     ) -> UUID:
-        url = urljoin(
+        expectation_payload = self._expectation_payload(expectation, created_via)
+        expectation_type = expectation_payload["expectation_type"]
+
+        with get_cloud_session(access_token=self._auth_key) as session:
+            response = session.post(url=self._expectations_url(asset_id), json=expectation_payload)
+
+        if response.status_code != HTTPStatus.CREATED:
+            message = f"Failed to add autogenerated expectation: {expectation_type}"
+            raise GXAgentError(message)
+        return UUID(response.json()["data"]["id"])
+
+    def _create_expectations_for_asset(
+        self,
+        expectations: list[gx_expectations.Expectation],
+        asset_id: UUID | None,
+        created_via: str | None,
+    ) -> list[UUID]:
+        """Create expectations with as few requests as the batch size allows, in one session.
+
+        Returns:
+            The ids of the created expectations, in the order they were given.
+        """
+        if not expectations:
+            return []
+        batch_size = get_action_settings().expectation_batch_size
+        url = self._expectations_url(asset_id)
+        expectation_ids: list[UUID] = []
+        with get_cloud_session(access_token=self._auth_key) as session:
+            for start in range(0, len(expectations), batch_size):
+                payload = [
+                    self._expectation_payload(expectation, created_via)
+                    for expectation in expectations[start : start + batch_size]
+                ]
+                response = session.post(url=url, json=payload)
+                if response.status_code != HTTPStatus.CREATED:
+                    expectation_types = sorted({item["expectation_type"] for item in payload})
+                    message = (
+                        f"Failed to add autogenerated expectations: {', '.join(expectation_types)}"
+                    )
+                    raise GXAgentError(message)
+                expectation_ids.extend(UUID(data["id"]) for data in response.json()["data"])
+        return expectation_ids
+
+    def _expectations_url(self, asset_id: UUID | None) -> str:
+        return urljoin(
             base=self._base_url,
             url=f"/api/v1/organizations/{self._domain_context.organization_id}/workspaces/{self._domain_context.workspace_id}/expectations/{asset_id}",
         )
 
+    def _expectation_payload(
+        self, expectation: gx_expectations.Expectation, created_via: str | None
+    ) -> dict[str, Any]:
         expectation_payload = expectation.configuration.to_json_dict()
         expectation_payload["autogenerated"] = True
         if created_via is not None:
             expectation_payload["created_via"] = created_via
 
         # Backend expects `expectation_type` instead of `type`:
-        expectation_type = expectation_payload.pop("type")
-        expectation_payload["expectation_type"] = expectation_type
-
-        with create_session(access_token=self._auth_key) as session:
-            response = session.post(url=url, json=expectation_payload)
-
-        if response.status_code != HTTPStatus.CREATED:
-            message = f"Failed to add autogenerated expectation: {expectation_type}"
-            raise GXAgentError(message)
-        return UUID(response.json()["data"]["id"])
+        expectation_payload["expectation_type"] = expectation_payload.pop("type")
+        return expectation_payload
 
     def _raise_on_any_metric_exception(self, metric_run: MetricRun) -> None:
         if any(metric.exception for metric in metric_run.metrics):
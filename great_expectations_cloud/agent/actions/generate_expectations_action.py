@@ -8,12 +8,12 @@ from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 from uuid import UUID
 
-from great_expectations.core.http import create_session
 from great_expectations.metrics import BatchRowCount
 from typing_extensions import override
 
 from great_expectations_cloud.agent.actions import ActionResult, AgentAction
 from great_expectations_cloud.agent.actions.utils import ensure_openai_credentials
+from great_expectations_cloud.agent.cloud_client import get_cloud_session
 from great_expectations_cloud.agent.event_handler import register_event_action
 from great_expectations_cloud.agent.expect_ai.asset_review_agent.agent import (
     AssetReviewAgent,
@@ -76,10 +76,29 @@ class GenerateExpectationsAction(AgentAction[GenerateExpectationsEvent]):
             metric_service=metric_service,
             analytics=self._analytics,
         )
+
+        try:
+            return self._generate_expectations(
+                event=event, id=id, agent=agent, metric_service=metric_service
+            )
+        finally:
+            cache_stats = metric_service.cache_stats
+            logger.info(
+                "metric_cache.stats",
+                extra={"hits": cache_stats.hits, "misses": cache_stats.misses},
+            )
+
+    def _generate_expectations(
+        self,
+        event: GenerateExpectationsEvent,
+        id: str,
+        agent: AssetReviewAgent,
+        metric_service: MetricService,
+    ) -> ActionResult:
         expectation_service = ExpectationService(context=self._context)
 
         # Do not proceed with generating Expectations if the Data Asset is empty
-        if self._batch_contains_no_rows(event):
+        if self._batch_contains_no_rows(event, metric_service=metric_service):
             error_message = "Could not generate Expectations because the Data Asset has no records. Ensure the table or view connected to your Data Asset has records and try again."
             raise RuntimeError(error_message)
 
@@ -126,14 +145,16 @@ class GenerateExpectationsAction(AgentAction[GenerateExpectationsEvent]):
 
         return self._create_expectation_draft_configs(id=id, event=event, expectations=expectations)
 
-    def _batch_contains_no_rows(self, event: GenerateExpectationsEvent) -> bool:
+    def _batch_contains_no_rows(
+        self, event: GenerateExpectationsEvent, metric_service: MetricService
+    ) -> bool:
         batch_definition = (
             self._context.data_sources.get(event.datasource_name)
             .get_asset(event.data_asset_name)
             .get_batch_definition(event.batch_definition_name)
         )
 
-        metric_service = MetricService(context=self._context)
+        # the agent reuses this row count from the job's MetricService
         row_count_result = metric_service.get_metric_result(
             batch_definition=batch_definition,
             metric=BatchRowCount(),
@@ -197,7 +218,7 @@ class GenerateExpectationsAction(AgentAction[GenerateExpectationsEvent]):
             expectation_payload["expectation_type"] = expectation_payload.pop("type")
             payload.append(expectation_payload)
 
-        with create_session(access_token=self._auth_key) as session:
+        with get_cloud_session(access_token=self._auth_key) as session:
             response = session.post(url=url, json=payload)
             if response.status_code != HTTPStatus.CREATED:
                 raise ExpectAIAgentError(
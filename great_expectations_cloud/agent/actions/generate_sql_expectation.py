@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING, Final
 from urllib.parse import urljoin
 from uuid import UUID
 
-from great_expectations.core.http import create_session
 from pydantic import BaseModel
 from typing_extensions import override
 
@@ -16,6 +15,7 @@ from great_expectations_cloud.agent.actions.agent_action import (
     AgentAction,
 )
 from great_expectations_cloud.agent.actions.utils import ensure_openai_credentials
+from great_expectations_cloud.agent.cloud_client import get_cloud_session
 from great_expectations_cloud.agent.event_handler import register_event_action
 from great_expectations_cloud.agent.exceptions import GXAgentError
 from great_expectations_cloud.agent.expect_ai.metric_service import MetricService
@@ -91,7 +91,7 @@ class GenerateSqlExpectationAction(AgentAction[GenerateSqlExpectationEvent]):
             url=f"/api/v1/organizations/{self._domain_context.organization_id!s}/workspaces/{self._domain_context.workspace_id!s}/expectations/prompt-metadata/{expectation_prompt_id}",
         )
 
-        with create_session(access_token=self._auth_key) as session:
+        with get_cloud_session(access_token=self._auth_key) as session:
             response = session.get(url=url)
             if response.status_code != HTTPStatus.OK:
                 logger.error(
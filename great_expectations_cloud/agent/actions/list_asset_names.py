@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from urllib.parse import urljoin
 
-from great_expectations.core.http import create_session
 from great_expectations.datasource.fluent import SQLDatasource
 from great_expectations.exceptions import GXCloudError
 from typing_extensions import override
@@ -12,6 +11,8 @@ from great_expectations_cloud.agent.actions.agent_action import (
     AgentAction,
 )
 from great_expectations_cloud.agent.actions.utils import get_asset_names
+from great_expectations_cloud.agent.cloud_client import get_cloud_session
+from great_expectations_cloud.agent.engine_registry import get_engine_registry
 from great_expectations_cloud.agent.event_handler import register_event_action
 from great_expectations_cloud.agent.models import ListAssetNamesEvent
 
@@ -29,6 +30,7 @@ class ListAssetNamesAction(AgentAction[ListAssetNamesEvent]):
                 f"This operation requires a SQL Data Source but got {type(datasource).__name__}."
             )
 
+        get_engine_registry().attach(datasource)
         asset_names = get_asset_names(datasource)
 
         self._add_or_update_asset_names_list(
@@ -43,7 +45,7 @@ class ListAssetNamesAction(AgentAction[ListAssetNamesEvent]):
         )
 
     def _add_or_update_asset_names_list(self, datasource_id: str, asset_names: list[str]) -> None:
-        with create_session(access_token=self._auth_key) as session:
+        with get_cloud_session(access_token=self._auth_key) as session:
             url = urljoin(
                 base=self._base_url,
                 url=f"/api/v1/organizations/{self._domain_context.organization_id}/workspaces/{self._domain_context.workspace_id}/table-names/{datasource_id}",
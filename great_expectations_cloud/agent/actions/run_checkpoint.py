@@ -1,18 +1,33 @@
 from __future__ import annotations
 
+import datetime as dt
 import logging
 import socket
-from concurrent.futures import TimeoutError as FuturesTimeoutError
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from concurrent.futures.thread import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any, Final
 
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.exceptions import CheckpointRunWithoutValidationDefinitionError
 from typing_extensions import override
 
+from great_expectations_cloud.agent.action_settings import get_action_settings
 from great_expectations_cloud.agent.actions.agent_action import (
     ActionResult,
     AgentAction,
 )
+from great_expectations_cloud.agent.circuit_breaker import get_circuit_breaker
+from great_expectations_cloud.agent.cloud_client import (
+    get_job_correlation_id,
+    set_job_correlation_id,
+)
+from great_expectations_cloud.agent.connection_test_cache import get_connection_test_cache
+from great_expectations_cloud.agent.engine_registry import get_engine_registry
 from great_expectations_cloud.agent.event_handler import register_event_action
 from great_expectations_cloud.agent.models import (
     CreatedResource,
@@ -20,15 +35,33 @@ from great_expectations_cloud.agent.models import (
     RunScheduledCheckpointEvent,
     RunWindowCheckpointEvent,
 )
+from great_expectations_cloud.agent.query_cancellation import CancelScope
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from great_expectations.checkpoint import Checkpoint
+    from great_expectations.checkpoint.checkpoint import CheckpointResult
+    from great_expectations.core.expectation_validation_result import (
+        ExpectationSuiteValidationResult,
+    )
     from great_expectations.data_context import CloudDataContext
+    from great_expectations.data_context.types.resource_identifiers import (
+        ValidationResultIdentifier,
+    )
     from great_expectations.datasource.fluent.interfaces import DataAsset, Datasource
 
 from great_expectations.datasource.fluent.interfaces import TestConnectionError
 
 LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 DATASOURCE_TEST_CONNECTION_TIMEOUT_SECONDS: Final[int] = 600
+# connection tests from every job share one pool of threads for the life of the process
+CONNECTION_TEST_MAX_WORKERS: Final[int] = 8
+# connection tests of one job in the pool at once, leaving the rest of it to other jobs
+CONNECTION_TEST_WORKERS_PER_JOB: Final[int] = 4
+
+_connection_test_pool: ThreadPoolExecutor | None = None
+_connection_test_pool_lock = threading.Lock()
 
 
 class RunCheckpointAction(AgentAction[RunCheckpointEvent]):
@@ -54,9 +87,7 @@ def check_datasource_and_assets_connection(
     log_extra: dict[str, Any],
 ) -> None:
     """
-    Test connection to a datasource and its assets.
-
-    This function is designed to be run in a worker thread with a timeout.
+    Test connection to a datasource and its assets, one after another.
 
     Args:
         ds_name: Name of the datasource
@@ -66,27 +97,9 @@ def check_datasource_and_assets_connection(
     Raises:
         TestConnectionError: If connection test fails
     """
-    data_source = data_sources_assets.data_source
-    LOGGER.debug(
-        "Testing datasource connection",
-        extra={**log_extra, "datasource_name": ds_name},
-    )
-    data_source.test_connection(test_assets=False)  # raises `TestConnectionError` on failure
-    LOGGER.debug(
-        "Datasource connection successful",
-        extra={**log_extra, "datasource_name": ds_name},
-    )
-
+    _test_datasource_connection(ds_name, data_sources_assets.data_source, log_extra)
     for asset_name, data_asset in data_sources_assets.assets_by_name.items():
-        LOGGER.debug(
-            "Testing data asset connection",
-            extra={**log_extra, "datasource_name": ds_name, "asset_name": asset_name},
-        )
-        data_asset.test_connection()  # raises `TestConnectionError` on failure
-        LOGGER.debug(
-            "Data asset connection successful",
-            extra={**log_extra, "datasource_name": ds_name, "asset_name": asset_name},
-        )
+        _test_data_asset_connection(ds_name, asset_name, data_asset, log_extra)
 
 
 def check_datasource_and_assets_connection_with_timeout(
@@ -98,7 +111,7 @@ def check_datasource_and_assets_connection_with_timeout(
     """
     Test connection to a datasource and its assets with a timeout.
 
-    Runs the connection test in a worker thread and enforces a timeout.
+    Runs the connection tests on the shared connection test pool and enforces a timeout.
     If the timeout is exceeded, raises TestConnectionError.
 
     Args:
@@ -110,29 +123,247 @@ def check_datasource_and_assets_connection_with_timeout(
     Raises:
         TestConnectionError: If connection test fails or timeout is exceeded
     """
-    executor = ThreadPoolExecutor(max_workers=1)
-    try:
-        future = executor.submit(
-            check_datasource_and_assets_connection, ds_name, data_sources_assets, log_extra
-        )
+    check_datasources_and_assets_connections(
+        {ds_name: data_sources_assets}, log_extra=log_extra, timeout=timeout
+    )
+
+
+def check_datasources_and_assets_connections(
+    data_sources_assets_by_data_source_name: dict[str, DataSourceAssets],
+    log_extra: dict[str, Any],
+    timeout: int = DATASOURCE_TEST_CONNECTION_TIMEOUT_SECONDS,
+) -> None:
+    """
+    Test connections to several datasources and their assets concurrently.
+
+    Every datasource is tested at once on the shared connection test pool. Once a datasource
+    connects, its assets are tested at once too. Each datasource and its assets must finish
+    within its timeout, counted from when the tests are dispatched. The circuit breaker may
+    lower that timeout for a datasource that reliably connects faster, and fails the test
+    straight away for one that keeps failing to connect.
+
+    Args:
+        data_sources_assets_by_data_source_name: DataSourceAssets by datasource name
+        log_extra: Extra logging context
+        timeout: Timeout in seconds (default: DATASOURCE_TEST_CONNECTION_TIMEOUT_SECONDS)
+
+    Raises:
+        TestConnectionError: If any connection test fails or times out. When several
+            datasources fail, the error lists each of them.
+    """
+    breaker = get_circuit_breaker()
+    errors: dict[str, BaseException] = {}
+    tests = _ConnectionTests(data_sources_assets_by_data_source_name, log_extra)
+    for ds_name, data_source_assets in data_sources_assets_by_data_source_name.items():
+        data_source = data_source_assets.data_source
         try:
-            future.result(timeout=timeout)
-        except FuturesTimeoutError:
+            breaker.before_test(data_source)
+        except TestConnectionError as error:
             LOGGER.warning(
-                f"Datasource connection test timed out after {timeout} seconds",
-                extra={**log_extra, "datasource_name": ds_name, "timeout_seconds": timeout},
+                "Skipping connection test of a datasource that keeps failing",
+                extra={**log_extra, "datasource_name": ds_name},
             )
-            raise TestConnectionError(
-                message=f"Datasource '{ds_name}' was unresponsive after {timeout} seconds"
-            ) from None
-    finally:
-        # shutdown(wait=False) is necessary here because the default shutdown(wait=True)
-        # would block until the worker thread completes. On timeout, the worker thread
-        # may still be blocked on an unresponsive datasource connection, and waiting for
-        # it would defeat the purpose of the timeout. Python threads cannot be forcibly
-        # interrupted, so the abandoned thread will continue running in the background
-        # until the blocking I/O call returns or the process exits.
-        executor.shutdown(wait=False)
+            errors[ds_name] = error
+            continue
+        tests.start(ds_name, timeout=breaker.timeout(data_source, default=timeout))
+
+    errors.update(tests.wait())
+    for ds_name in tests.datasource_names:
+        data_source = data_sources_assets_by_data_source_name[ds_name].data_source
+        if ds_name in tests.unreachable:
+            breaker.record_failure(data_source)
+        else:
+            # a missing table is no reason to stop testing the datasource
+            breaker.record_success(data_source, connect_seconds=tests.connect_seconds.get(ds_name))
+
+    _raise_connection_errors(errors)
+
+
+class _ConnectionTests:
+    """Connection tests of several datasources on the shared pool, each with its own deadline.
+
+    A test's deadline starts once a pool thread picks it up, so tests waiting behind other
+    jobs' tests don't time out before they run. A job keeps at most
+    CONNECTION_TEST_WORKERS_PER_JOB tests in the pool at once and holds the rest back.
+    """
+
+    def __init__(
+        self,
+        data_sources_assets_by_data_source_name: dict[str, DataSourceAssets],
+        log_extra: dict[str, Any],
+    ) -> None:
+        self._pool = _get_connection_test_pool()
+        self._data_sources_assets = data_sources_assets_by_data_source_name
+        self._log_extra = log_extra
+        self._timeouts: dict[str, float] = {}
+        # tests held back until one of the job's tests in the pool finishes
+        self._queued: deque[tuple[str, str | None, Callable[[], float | None]]] = deque()
+        # future -> (datasource name, asset name or None for the datasource itself)
+        self._tests: dict[Future[float | None], tuple[str, str | None]] = {}
+        self._scopes: dict[Future[float | None], CancelScope] = {}
+        # future -> future set to the time a pool thread started the test
+        self._starts: dict[Future[float | None], Future[float]] = {}
+        # seconds each datasource took to connect, if it was tested rather than cached
+        self.connect_seconds: dict[str, float | None] = {}
+        # datasources that failed to connect or timed out
+        self.unreachable: set[str] = set()
+
+    @property
+    def datasource_names(self) -> list[str]:
+        return list(self._timeouts)
+
+    def start(self, ds_name: str, timeout: float) -> None:
+        self._timeouts[ds_name] = timeout
+        data_source = self._data_sources_assets[ds_name].data_source
+        self._queue(ds_name, None, _test_datasource_connection, data_source)
+
+    def wait(self) -> dict[str, BaseException]:
+        """Wait for every test to finish or time out, returning the first error of each datasource."""
+        errors: dict[str, BaseException] = {}
+        pending = self._submit_queued(running=0)
+        while pending:
+            # also wake up when a test starts, to start counting down its deadline
+            waiting: set[Future[Any]] = {*pending}
+            waiting.update(self._starts[f] for f in pending if not self._starts[f].done())
+            done, _ = wait(
+                waiting, timeout=self._seconds_left(pending), return_when=FIRST_COMPLETED
+            )
+            for future in done & pending:
+                pending.remove(future)
+                self._finished(future, errors)
+            expired = {future for future in pending if self._seconds_left({future}) == 0}
+            pending -= expired
+            self._expire(expired, errors)
+            pending |= self._submit_queued(running=len(pending))
+        return errors
+
+    def _queue(
+        self, ds_name: str, asset_name: str | None, test: Callable[..., float | None], *args: Any
+    ) -> None:
+        self._queued.append((ds_name, asset_name, partial(test, ds_name, *args, self._log_extra)))
+
+    def _submit_queued(self, running: int) -> set[Future[float | None]]:
+        """Submit queued tests to the pool while the job has fewer than its share running."""
+        submitted: set[Future[float | None]] = set()
+        while self._queued and running + len(submitted) < CONNECTION_TEST_WORKERS_PER_JOB:
+            ds_name, asset_name, test = self._queued.popleft()
+            scope = CancelScope()
+            started: Future[float] = Future()
+            future = self._pool.submit(_run_started, started, partial(scope.run, test))
+            self._tests[future] = (ds_name, asset_name)
+            self._scopes[future] = scope
+            self._starts[future] = started
+            submitted.add(future)
+        return submitted
+
+    def _seconds_left(self, futures: set[Future[float | None]]) -> float | None:
+        """Seconds until the first deadline of the tests, or None if none of them has started."""
+        deadlines = [
+            self._starts[f].result() + self._timeouts[self._tests[f][0]]
+            for f in futures
+            if self._starts[f].done()
+        ]
+        if not deadlines:
+            return None
+        return max(min(deadlines) - time.monotonic(), 0)
+
+    def _finished(self, future: Future[float | None], errors: dict[str, BaseException]) -> None:
+        """Record a finished test, queueing the asset tests of a connected datasource."""
+        ds_name, asset_name = self._tests[future]
+        error = future.exception()
+        if error is not None:
+            # keep the first error for each datasource
+            errors.setdefault(ds_name, error)
+            if asset_name is None:
+                self.unreachable.add(ds_name)
+            return
+        if asset_name is not None:
+            return
+        self.connect_seconds[ds_name] = future.result()
+        for name, data_asset in self._data_sources_assets[ds_name].assets_by_name.items():
+            self._queue(ds_name, name, _test_data_asset_connection, name, data_asset)
+
+    def _expire(self, expired: set[Future[float | None]], errors: dict[str, BaseException]) -> None:
+        # Python threads cannot be interrupted, so the queries of timed out tests are cancelled
+        # in the database instead, which frees their pool threads
+        cancelled: dict[str, int] = {}
+        for future in expired:
+            ds_name = self._tests[future][0]
+            cancelled[ds_name] = cancelled.get(ds_name, 0) + self._scopes[future].cancel()
+        for ds_name in sorted(cancelled.keys() - errors.keys()):
+            timeout = self._timeouts[ds_name]
+            LOGGER.warning(
+                f"Datasource connection test timed out after {timeout:g} seconds",
+                extra={
+                    **self._log_extra,
+                    "datasource_name": ds_name,
+                    "timeout_seconds": timeout,
+                    "cancelled_queries": cancelled[ds_name],
+                },
+            )
+            errors[ds_name] = TestConnectionError(
+                message=f"Datasource '{ds_name}' was unresponsive after {timeout:g} seconds"
+            )
+            self.unreachable.add(ds_name)
+
+
+def _run_started(started: Future[float], test: Callable[[], float | None]) -> float | None:
+    """Run a test on a pool thread, first recording when it started."""
+    started.set_result(time.monotonic())
+    return test()
+
+
+def _raise_connection_errors(errors: dict[str, BaseException]) -> None:
+    """Re-raise a single datasource's error as is, or list the errors of several."""
+    if len(errors) == 1:
+        raise next(iter(errors.values()))
+    if errors:
+        raise TestConnectionError(
+            message="; ".join(f"{ds_name}: {error}" for ds_name, error in errors.items())
+        )
+
+
+def _test_datasource_connection(
+    ds_name: str, data_source: Datasource[Any, Any], log_extra: dict[str, Any]
+) -> float | None:
+    """Test a datasource's connection, returning how long it took, or None if it was cached."""
+    LOGGER.debug(
+        "Testing datasource connection",
+        extra={**log_extra, "datasource_name": ds_name},
+    )
+    started = time.monotonic()
+    # raises `TestConnectionError` on failure; skipped if it passed within the cache TTL
+    tested = get_connection_test_cache().test_datasource(data_source)
+    LOGGER.debug(
+        "Datasource connection successful",
+        extra={**log_extra, "datasource_name": ds_name},
+    )
+    return time.monotonic() - started if tested else None
+
+
+def _test_data_asset_connection(
+    ds_name: str, asset_name: str, data_asset: DataAsset[Any, Any], log_extra: dict[str, Any]
+) -> None:
+    LOGGER.debug(
+        "Testing data asset connection",
+        extra={**log_extra, "datasource_name": ds_name, "asset_name": asset_name},
+    )
+    # raises `TestConnectionError` on failure; skipped if it passed within the cache TTL
+    get_connection_test_cache().test_data_asset(data_asset)
+    LOGGER.debug(
+        "Data asset connection successful",
+        extra={**log_extra, "datasource_name": ds_name, "asset_name": asset_name},
+    )
+
+
+def _get_connection_test_pool() -> ThreadPoolExecutor:
+    global _connection_test_pool  # noqa: PLW0603 # one pool per process
+    with _connection_test_pool_lock:
+        if _connection_test_pool is None:
+            _connection_test_pool = ThreadPoolExecutor(
+                max_workers=CONNECTION_TEST_MAX_WORKERS, thread_name_prefix="gx-connection-test"
+            )
+        return _connection_test_pool
 
 
 def run_checkpoint(
@@ -173,14 +404,15 @@ def run_checkpoint(
         ds_name = ds.name
         # create assets by name dict
         if ds_name not in data_sources_assets_by_data_source_name:
+            # reuse warm connections from earlier jobs against the same database
+            get_engine_registry().attach(ds)
             data_sources_assets_by_data_source_name[ds_name] = DataSourceAssets(
                 data_source=ds, assets_by_name={}
             )
         data_sources_assets_by_data_source_name[ds_name].assets_by_name[vd.asset.name] = vd.asset
 
     # Test connections to all datasources and assets
-    for ds_name, data_sources_assets in data_sources_assets_by_data_source_name.items():
-        check_datasource_and_assets_connection_with_timeout(ds_name, data_sources_assets, log_extra)
+    check_datasources_and_assets_connections(data_sources_assets_by_data_source_name, log_extra)
 
     LOGGER.debug(
         "Running checkpoint",
@@ -190,9 +422,18 @@ def run_checkpoint(
             "has_expectation_parameters": expectation_parameters is not None,
         },
     )
-    checkpoint_run_result = checkpoint.run(
-        batch_parameters=event.splitter_options, expectation_parameters=expectation_parameters
-    )
+    validations_per_datasource = get_action_settings().validations_per_datasource
+    if validations_per_datasource and len(checkpoint.validation_definitions) > 1:
+        checkpoint_run_result = run_checkpoint_concurrently(
+            checkpoint,
+            batch_parameters=event.splitter_options,
+            expectation_parameters=expectation_parameters,
+            validations_per_datasource=validations_per_datasource,
+        )
+    else:
+        checkpoint_run_result = checkpoint.run(
+            batch_parameters=event.splitter_options, expectation_parameters=expectation_parameters
+        )
     LOGGER.debug(
         "Checkpoint run completed",
         extra={
@@ -228,5 +469,102 @@ def run_checkpoint(
     )
 
 
+def run_checkpoint_concurrently(
+    checkpoint: Checkpoint,
+    batch_parameters: dict[str, Any] | None,
+    expectation_parameters: dict[str, Any] | None,
+    validations_per_datasource: int,
+) -> CheckpointResult:
+    """
+    Run a Checkpoint like Checkpoint.run, but validate its validation definitions concurrently.
+
+    Validation definitions on different datasources run at once, and up to
+    validations_per_datasource run at once against each datasource. The Checkpoint's actions
+    run once every validation definition has been validated, as they do in Checkpoint.run.
+
+    Raises:
+        CheckpointRunWithoutValidationDefinitionError: If the Checkpoint has no validation
+            definitions.
+        Exception: The error of the first validation definition that failed, in Checkpoint
+            order, once the others have finished.
+    """
+    if not checkpoint.validation_definitions:
+        raise CheckpointRunWithoutValidationDefinitionError()
+    diagnostics = checkpoint.is_fresh()
+    if not diagnostics.success:
+        # the same recovery as Checkpoint.run: add a Checkpoint whose children are all added
+        if not diagnostics.parent_added and diagnostics.children_added:
+            checkpoint._add_to_store()
+        else:
+            diagnostics.raise_for_error()
+
+    batch_parameters = batch_parameters or {}
+    expectation_parameters = expectation_parameters or {}
+    run_id = RunIdentifier(run_time=dt.datetime.now(dt.UTC))
+    checkpoint._prepare_checkpoint_run_for_context(batch_parameters, expectation_parameters)
+    results = _validate_concurrently(
+        checkpoint, batch_parameters, expectation_parameters, run_id, validations_per_datasource
+    )
+
+    run_results: dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
+    for vd, result in zip(checkpoint.validation_definitions, results, strict=True):
+        key = checkpoint._build_result_key(
+            validation_definition=vd, run_id=run_id, batch_identifier=result.batch_id
+        )
+        run_results[key] = result
+    checkpoint_result = checkpoint._construct_result(run_id=run_id, run_results=run_results)
+    checkpoint._run_actions(checkpoint_result=checkpoint_result)
+    return checkpoint_result
+
+
+def _validate_concurrently(
+    checkpoint: Checkpoint,
+    batch_parameters: dict[str, Any],
+    expectation_parameters: dict[str, Any],
+    run_id: RunIdentifier,
+    validations_per_datasource: int,
+) -> list[ExpectationSuiteValidationResult]:
+    """Run the Checkpoint's validation definitions, returning their results in Checkpoint order."""
+    validation_definitions = checkpoint.validation_definitions
+    slots = {
+        vd.data_source.name: threading.Semaphore(validations_per_datasource)
+        for vd in validation_definitions
+    }
+    # validation definitions loaded with the same datasource object share its execution
+    # engine, which holds one batch at a time, so they are validated one after another
+    lanes: dict[int, list[int]] = {}
+    for index, vd in enumerate(validation_definitions):
+        lanes.setdefault(id(vd.data_source), []).append(index)
+    results: dict[int, ExpectationSuiteValidationResult] = {}
+    # GX Cloud requests from the validation threads are tagged with this job's id
+    correlation_id = get_job_correlation_id()
+
+    def validate(indexes: list[int]) -> None:
+        set_job_correlation_id(correlation_id)
+        for index in indexes:
+            vd = validation_definitions[index]
+            with slots[vd.data_source.name]:
+                results[index] = vd.run(
+                    checkpoint_id=checkpoint.id,
+                    batch_parameters=batch_parameters,
+                    expectation_parameters=expectation_parameters,
+                    result_format=checkpoint.result_format,
+                    run_id=run_id,
+                )
+
+    lane_of: dict[int, Future[None]] = {}
+    with ThreadPoolExecutor(
+        max_workers=len(lanes), thread_name_prefix="gx-checkpoint-validation"
+    ) as pool:
+        for indexes in lanes.values():
+            future = pool.submit(validate, indexes)
+            lane_of.update(dict.fromkeys(indexes, future))
+    for index in range(len(validation_definitions)):
+        if index not in results:
+            # re-raise the error of the first validation definition that failed
+            lane_of[index].result()
+    return [results[index] for index in range(len(validation_definitions))]
+
+
 register_event_action("1", RunCheckpointEvent, RunCheckpointAction)
 register_event_action("1", RunWindowCheckpointEvent, RunCheckpointAction)
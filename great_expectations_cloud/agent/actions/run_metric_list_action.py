@@ -8,15 +8,16 @@ from great_expectations.experimental.metric_repository.batch_inspector import (
 from great_expectations.experimental.metric_repository.cloud_data_store import (
     CloudDataStore,
 )
-from great_expectations.experimental.metric_repository.metric_list_metric_retriever import (
-    MetricListMetricRetriever,
-)
 from great_expectations.experimental.metric_repository.metric_repository import (
     MetricRepository,
 )
 from typing_extensions import override
 
+from great_expectations_cloud.agent.action_settings import get_action_settings
 from great_expectations_cloud.agent.actions import ActionResult, AgentAction
+from great_expectations_cloud.agent.column_chunk_metric_retriever import ColumnChunkMetricRetriever
+from great_expectations_cloud.agent.connection_test_cache import get_connection_test_cache
+from great_expectations_cloud.agent.engine_registry import get_engine_registry
 from great_expectations_cloud.agent.event_handler import register_event_action
 from great_expectations_cloud.agent.models import (
     CreatedResource,
@@ -52,15 +53,25 @@ class MetricListAction(AgentAction[RunMetricsListEvent]):
         self._metric_repository = metric_repository or MetricRepository(
             data_store=CloudDataStore(self._context)
         )
+        settings = get_action_settings()
         self._batch_inspector = batch_inspector or BatchInspector(
-            context, [MetricListMetricRetriever(self._context)]
+            context,
+            [
+                ColumnChunkMetricRetriever(
+                    self._context,
+                    column_chunk_size=settings.metric_column_chunk_size,
+                    max_workers=settings.metric_column_workers,
+                )
+            ],
         )
 
     @override
     def run(self, event: RunMetricsListEvent, id: str) -> ActionResult:
         datasource = self._context.data_sources.get(event.datasource_name)
+        get_engine_registry().attach(datasource)
         data_asset = datasource.get_asset(event.data_asset_name)
-        data_asset.test_connection()  # raises `TestConnectionError` on failure
+        # raises `TestConnectionError` on failure
+        get_connection_test_cache().test_data_asset(data_asset)
 
         batch_request = data_asset.build_batch_request()
 
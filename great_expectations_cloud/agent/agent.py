@@ -7,13 +7,15 @@ import resource
 import signal
 import socket
 import sys
+import threading
 import time
 import traceback
 import warnings
 from collections import defaultdict
 from collections.abc import Callable
-from concurrent.futures import Future
+from concurrent.futures import Executor, Future
 from concurrent.futures.thread import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from functools import partial
 from http import HTTPStatus
 from importlib.metadata import version as metadata_version
@@ -25,7 +27,6 @@ import orjson
 import requests
 from great_expectations import __version__, get_context
 from great_expectations.core import http
-from great_expectations.core.http import create_session
 from great_expectations.data_context.cloud_constants import CLOUD_DEFAULT_BASE_URL
 from great_expectations.data_context.types.base import ProgressBarsConfig
 from pika.adapters.utils.connection_workflow import AMQPConnectorException
@@ -46,17 +47,55 @@ from tenacity import (
     wait_random_exponential,
 )
 
+from great_expectations_cloud.agent.action_settings import (
+    ActionSettings,
+    configure_action_settings,
+)
 from great_expectations_cloud.agent.analytics import AgentAnalytics
+from great_expectations_cloud.agent.circuit_breaker import configure_circuit_breaker
+from great_expectations_cloud.agent.cloud_client import (
+    RETRY_STATUS_CODES,
+    GXCloudClientSettings,
+    configure_cloud_client,
+    get_cloud_client,
+    get_cloud_session,
+    get_job_correlation_id,
+    set_job_correlation_id,
+    set_user_agent,
+)
 from great_expectations_cloud.agent.config import (
     GxAgentEnvVars,
     generate_config_validation_error_text,
 )
-from great_expectations_cloud.agent.constants import USER_AGENT_HEADER, HeaderName
-from great_expectations_cloud.agent.event_handler import EventHandler
+from great_expectations_cloud.agent.connection_test_cache import configure_connection_test_cache
+from great_expectations_cloud.agent.constants import (
+    USER_AGENT_HEADER,
+    ExecutionMode,
+    HeaderName,
+    JobPriority,
+    JobWeight,
+)
+from great_expectations_cloud.agent.data_context_pool import DataContextPool
+from great_expectations_cloud.agent.engine_registry import (
+    configure_engine_registry,
+    get_engine_registry,
+)
+from great_expectations_cloud.agent.event_handler import (
+    EventHandler,
+    get_event_weight,
+    get_import_report,
+    preload_event_actions,
+)
 from great_expectations_cloud.agent.exceptions import (
     GXAgentConfigError,
     GXAgentError,
     GXAgentUnrecoverableConnectionError,
+    GXAgentWorkerProcessError,
+)
+from great_expectations_cloud.agent.job_queue import JobQueue
+from great_expectations_cloud.agent.job_status_reporter import (
+    JobStatusReporter,
+    JobStatusUpdate,
 )
 from great_expectations_cloud.agent.message_service.asyncio_rabbit_mq_client import (
     AsyncRabbitMQClient,
@@ -81,6 +120,7 @@ from great_expectations_cloud.agent.models import (
     UpdateJobStatusRequest,
     build_failed_job_completed_status,
 )
+from great_expectations_cloud.agent.prefork import PreforkExecutor, handle_event_in_worker_process
 
 if TYPE_CHECKING:
     from typing import Self
@@ -94,6 +134,9 @@ LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
 HandlerMap = dict[str, OnMessageCallback]
 
+# optional stacks that are only imported once a job needs them; reported if loaded at startup
+DEFERRED_IMPORTS: Final = ("langchain_openai", "langgraph", "openai")
+
 
 class GXAgentConfig(AgentBaseExtraForbid):
     """GXAgent configuration.
@@ -108,6 +151,32 @@ class GXAgentConfig(AgentBaseExtraForbid):
     gx_cloud_organization_id: str
     gx_cloud_access_token: str
     enable_progress_bars: bool = True
+    max_workers: int = 1
+    execution_mode: ExecutionMode = ExecutionMode.THREAD
+    data_context_pool_size: int = 8
+    data_context_ttl_seconds: int = 600
+    connection_test_ttl_seconds: int = 300
+    engine_idle_seconds: int = 600
+    circuit_breaker_failures: int = 3
+    circuit_breaker_open_seconds: int = 300
+    connection_test_min_timeout_seconds: int = 60
+    status_update_max_attempts: int = 5
+    status_update_backoff_seconds: float = 1.0
+    max_reconnect_attempts: int = 5
+    job_queue_depth: int = 0
+    job_priorities: dict[str, JobPriority] = pydantic_v1.Field(default_factory=dict)
+    light_workers: int = 1
+    job_weights: dict[str, JobWeight] = pydantic_v1.Field(default_factory=dict)
+    data_quality_check_asset_workers: int = 4
+    expectation_batch_size: int = 100
+    metric_column_chunk_size: int = 250
+    metric_column_workers: int = 4
+    validations_per_datasource: int = 0
+    http_timeout_seconds: float = 20
+    http_retries: int = 5
+    http_backoff_factor: float = 1.0
+    http_pool_size: int = 10
+    expect_ai_enabled: bool = False
 
 
 def orjson_dumps(v: Any, *, default: Callable[[Any], Any] | None) -> str:
@@ -133,6 +202,19 @@ class Payload(AgentBaseExtraForbid):
         json_loads = orjson_loads
 
 
+@dataclass
+class ActiveJob:
+    """A job currently occupying one of the GX Agent's worker slots."""
+
+    correlation_id: str
+    event_type: str
+    start_time: float
+    weight: JobWeight = JobWeight.HEAVY
+    future: Future[Any] | None = None
+    # deliveries of the same message received while the job was running, e.g. after a reconnect
+    redeliveries: list[EventContext] = field(default_factory=list)
+
+
 class GXAgent:
     """
     Run GX in any environment from GX Cloud.
@@ -148,9 +230,23 @@ class GXAgent:
     def __init__(
         self: Self,
         agent_analytics: AgentAnalytics | None = None,
+        max_workers: int | None = None,
+        execution_mode: ExecutionMode | None = None,
     ):
         self._config = self._create_config()
         self._agent_analytics = agent_analytics or AgentAnalytics()
+        self._max_workers = max_workers or self._config.max_workers
+        self._execution_mode = execution_mode or self._config.execution_mode
+        self._light_workers = self._config.light_workers
+        set_user_agent(self.user_agent_str)
+        configure_cloud_client(
+            GXCloudClientSettings(
+                timeout_seconds=self._config.http_timeout_seconds,
+                retries=self._config.http_retries,
+                backoff_factor=self._config.http_backoff_factor,
+                pool_size=self._config.http_pool_size,
+            )
+        )
 
         agent_version: str = self.get_current_gx_agent_version()
         great_expectations_version: str = self._get_current_great_expectations_version()
@@ -159,16 +255,75 @@ class GXAgent:
             extra={
                 "agent_version": agent_version,
                 "great_expectations_version": great_expectations_version,
+                "max_workers": self._max_workers,
+                "light_workers": self._light_workers,
+                "execution_mode": str(self._execution_mode),
+                "deferred_imports_loaded": [
+                    module for module in DEFERRED_IMPORTS if module in sys.modules
+                ],
             },
         )
 
-        # Create a thread pool with a single worker, so we can run long-lived
-        # GX processes and maintain our connection to the broker. Note that
-        # the CloudDataContext cached here is used by the worker, so
-        # it isn't safe to increase the number of workers running GX jobs.
-        self._executor = ThreadPoolExecutor(max_workers=1)
-        self._current_task: Future[Any] | None = None
+        # Create a worker pool so we can run long-lived GX processes and maintain
+        # our connection to the broker. Each job builds its own CloudDataContext in
+        # get_data_context, so workers do not share GX state.
+        self._executor: Executor
+        if self._execution_mode == ExecutionMode.PREFORK:
+            self._executor = PreforkExecutor(
+                max_workers=self._max_workers,
+                agent=self,
+                on_all_workers_exited=self._stop_after_worker_processes_exited,
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="gx-agent-job"
+            )
+        # light jobs get a lane of their own, so they never wait behind heavy jobs. In prefork mode
+        # the lane has worker processes of its own, so light jobs are isolated from the agent too.
+        self._light_executor: Executor | None = None
+        if self._light_workers > 0 and self._execution_mode == ExecutionMode.PREFORK:
+            self._light_executor = PreforkExecutor(
+                max_workers=self._light_workers,
+                agent=self,
+                on_all_workers_exited=self._stop_after_worker_processes_exited,
+            )
+        elif self._light_workers > 0:
+            self._light_executor = ThreadPoolExecutor(
+                max_workers=self._light_workers, thread_name_prefix="gx-agent-light-job"
+            )
         self._redeliver_msg_task: asyncio.Task[Any] | None = None
+        # warm contexts are reused across jobs; in prefork mode each worker process fills its own copy
+        self._data_context_pool = DataContextPool(
+            factory=self._build_data_context,
+            max_size=self._config.data_context_pool_size,
+            ttl_seconds=self._config.data_context_ttl_seconds,
+        )
+        # set before any worker process is forked, so every worker uses the same settings
+        configure_connection_test_cache(ttl_seconds=self._config.connection_test_ttl_seconds)
+        configure_engine_registry(idle_seconds=self._config.engine_idle_seconds)
+        configure_circuit_breaker(
+            failure_threshold=self._config.circuit_breaker_failures,
+            open_seconds=self._config.circuit_breaker_open_seconds,
+            min_timeout_seconds=self._config.connection_test_min_timeout_seconds,
+        )
+        configure_action_settings(
+            ActionSettings(
+                data_quality_check_asset_workers=self._config.data_quality_check_asset_workers,
+                expectation_batch_size=self._config.expectation_batch_size,
+                metric_column_chunk_size=self._config.metric_column_chunk_size,
+                metric_column_workers=self._config.metric_column_workers,
+                validations_per_datasource=self._config.validations_per_datasource,
+            )
+        )
+        # job status updates are sent from a background thread so jobs don't wait on GX Cloud
+        self._status_reporter = JobStatusReporter(
+            max_attempts=self._config.status_update_max_attempts,
+            backoff_seconds=self._config.status_update_backoff_seconds,
+        )
+        # jobs that arrive while every worker is busy wait here, instead of going back to the broker
+        self._job_queue = JobQueue(
+            max_size=self._config.job_queue_depth, priorities=self._config.job_priorities
+        )
         self._correlation_ids: defaultdict[str, int] = defaultdict(lambda: 0)
         self._listen_tries = 0
 
@@ -177,12 +332,28 @@ class GXAgent:
 
     def _init_job_tracking(self) -> None:
         """Initialize job tracking properties for signal handlers and exit logging. Can be called by subclasses that don't call super().__init__()."""
-        self._current_job_correlation_id: str | None = None
-        self._current_job_start_time: float | None = None
+        # keyed by correlation_id; mutated from the event loop thread and from worker threads
+        self._active_jobs: dict[str, ActiveJob] = {}
+        self._active_jobs_lock = threading.Lock()
 
     def run(self) -> None:
         """Open a connection to GX Cloud."""
 
+        prefork_executors = [
+            executor
+            for executor in (self._executor, getattr(self, "_light_executor", None))
+            if isinstance(executor, PreforkExecutor)
+        ]
+        if prefork_executors:
+            # import actions before forking so that workers share them, skipping ExpectAI's
+            # heavy imports unless it can be used
+            preload_event_actions(include_expect_ai=self._get_config().expect_ai_enabled)
+            # fork while the process is still single threaded and has no broker connection
+            for executor in prefork_executors:
+                executor.fork_workers()
+            for executor in prefork_executors:
+                executor.start()
+
         LOGGER.debug("Opening connection to GX Cloud.")
         self._listen_tries = 0
         self._listen()
@@ -210,8 +381,16 @@ class GXAgent:
         config = self._get_config(force_refresh=force_creds_refresh)
 
         try:
-            client = AsyncRabbitMQClient(url=str(config.connection_string))
-            subscriber = Subscriber(client=client)
+            # the broker stops delivering once every worker is busy and the job queue is full
+            client = AsyncRabbitMQClient(
+                url=str(config.connection_string),
+                prefetch_count=self._get_max_workers()
+                + self._get_light_workers()
+                + self._get_job_queue_depth(),
+            )
+            subscriber = Subscriber(
+                client=client, max_reconnect_attempts=config.max_reconnect_attempts
+            )
             LOGGER.info("The GX Agent is ready.")
             # Open a connection until encountering a shutdown event
             subscriber.consume(
@@ -224,6 +403,8 @@ class GXAgent:
             LOGGER.exception("The connection to GX Cloud has encountered an error.")
         except GXAgentUnrecoverableConnectionError:
             LOGGER.exception("The connection to GX Cloud has encountered an unrecoverable error.")
+            # The Subscriber reconnects in-process after a lost connection; this is only reached
+            # once it has failed to reconnect max_reconnect_attempts times in a row.
             # We want to kill the process immediately and rely on the orchestrator to bring up a
             # replacement worker. We SIGKILL since we are running in a container and process
             # cleanup isn't necessary since that will happen when the container dies. Also note,
@@ -266,24 +447,44 @@ class GXAgent:
         signal.signal(signal.SIGTERM, sigterm_handler)
         signal.signal(signal.SIGINT, sigint_handler)
 
+    def _stop_after_worker_processes_exited(self) -> None:
+        """Stop the GX Agent once every prefork worker process of a lane has crashed.
+
+        Workers are only forked at startup, so the agent can't run that lane's jobs again until it
+        is restarted; SIGTERM takes the same shutdown path as a stop from the supervisor.
+        """
+        LOGGER.error("All prefork worker processes have exited, stopping the GX Agent.")
+        os.kill(os.getpid(), signal.SIGTERM)
+
     def _log_signal_received(self, signal_name: str, signum: int) -> None:
         """Log when a shutdown signal is received, including current job info."""
         memory_mb = self._get_memory_usage_mb()
-        # May not be initialized in subclasses that don't call super().__init__()
-        current_job_correlation_id = getattr(self, "_current_job_correlation_id", None)
-        current_job_start_time = getattr(self, "_current_job_start_time", None)
+        now = time.time()
+        active_jobs = [
+            {
+                "correlation_id": job.correlation_id,
+                "event_type": job.event_type,
+                "job_elapsed_seconds": now - job.start_time,
+            }
+            for job in self._get_active_jobs()
+        ]
         LOGGER.warning(
             f"Received {signal_name} signal - shutting down",
             extra={
                 "signal": signal_name,
                 "signal_number": signum,
                 "hostname": socket.gethostname(),
-                "current_job_correlation_id": current_job_correlation_id,
-                "job_elapsed_seconds": (
-                    time.time() - current_job_start_time if current_job_start_time else None
-                ),
+                "active_jobs": active_jobs,
                 "memory_usage_mb": memory_mb,
-                "has_active_task": self._current_task is not None and not self._current_task.done(),
+                "has_active_task": len(active_jobs) > 0,
+                "action_import_seconds": get_import_report(),
+                "gx_cloud_request_metrics": {
+                    method: vars(metrics)
+                    for method, metrics in get_cloud_client().get_metrics().items()
+                },
+                "engine_pools": {
+                    key: vars(stats) for key, stats in get_engine_registry().get_stats().items()
+                },
             },
         )
 
@@ -315,6 +516,9 @@ class GXAgent:
         Args:
             event_context: An Event with related properties and actions.
         """
+        if self._attach_redelivery(event_context):
+            return
+
         # Track how many times this correlation_id has been seen BY THIS POD (for local diagnostics)
         # Note: event_context.redelivered is set by RabbitMQ and indicates cross-pod redelivery
         local_delivery_count = self._correlation_ids.get(event_context.correlation_id, 0)
@@ -337,7 +541,22 @@ class GXAgent:
             )
             event_context.processed_with_failures()
             return
-        elif self._can_accept_new_task() is not True:
+
+        job, queued = self._claim_slot_or_enqueue(event_context)
+        if queued:
+            LOGGER.info(
+                "job.queued",
+                extra={
+                    "event_type": event_context.event.type,
+                    "correlation_id": event_context.correlation_id,
+                    "priority": str(self._job_queue.priority_of(event_context.event.type)),
+                    "queued_jobs": len(self._job_queue),
+                    "redelivered": event_context.redelivered,
+                },
+            )
+            return
+        elif job is None:
+            # only reached when the job queue is disabled, or a redelivery overfilled it
             LOGGER.warning(
                 "Cannot accept new task, redelivering.",
                 extra={
@@ -371,27 +590,124 @@ class GXAgent:
                 },
             )
 
-        # Set before task submission so signal handlers can access immediately
-        self._current_job_correlation_id = event_context.correlation_id
-        self._current_job_start_time = time.time()
+        self._start_job(event_context, job)
 
-        self._current_task = self._executor.submit(
-            self._handle_event,
-            event_context=event_context,
+    def _claim_slot_or_enqueue(self, event_context: EventContext) -> tuple[ActiveJob | None, bool]:
+        """Claim a free worker slot for a job, or else queue it until one frees up.
+
+        Returns the job holding the slot, if one was claimed, and whether the job was queued.
+        Both happen under the job lock, so a slot freed meanwhile can't miss a queued job.
+        """
+        queue: JobQueue | None = getattr(self, "_job_queue", None)
+        weight = self._get_job_weight(event_context)
+        with self._active_jobs_lock:
+            if self._has_free_slot(weight):
+                return self._claim_slot(event_context, weight), False
+            if queue is not None and queue.put(event_context):
+                return None, True
+            return None, False
+
+    def _claim_slot(self, event_context: EventContext, weight: JobWeight) -> ActiveJob:
+        """Track a job as holding a worker slot. The caller must hold the job lock."""
+        # Claim a slot before task submission so signal handlers can access it immediately
+        job = ActiveJob(
+            correlation_id=event_context.correlation_id,
+            event_type=event_context.event.type,
+            start_time=time.time(),
+            weight=weight,
         )
+        self._active_jobs[event_context.correlation_id] = job
+        return job
 
-        if self._current_task is not None:
-            # add a callback for when the thread exits and pass it the event context
-            on_exit_callback = partial(
-                self._handle_event_as_thread_exit, event_context=event_context
+    def _start_next_queued_job(self) -> None:
+        """Start the highest priority queued job that has a free worker slot in its lane."""
+        queue: JobQueue | None = getattr(self, "_job_queue", None)
+        if queue is None:
+            return
+        with self._active_jobs_lock:
+            event_context = queue.pop(
+                can_start=lambda queued: self._has_free_slot(self._get_job_weight(queued))
+            )
+            if event_context is None:
+                return
+            weight = self._get_job_weight(event_context)
+            job = self._claim_slot(event_context, weight)
+        LOGGER.info(
+            "job.dequeued",
+            extra={
+                "event_type": event_context.event.type,
+                "correlation_id": event_context.correlation_id,
+                "queued_jobs": len(queue),
+            },
+        )
+        self._start_job(event_context, job)
+
+    def _start_job(self, event_context: EventContext, job: ActiveJob) -> None:
+        """Run a job that has claimed a worker slot."""
+        # reported from this thread rather than the job's, so that in prefork mode every
+        # update for a job goes through the parent's reporter, in order
+        self._report_job_started(event_context)
+        job.future = self._submit_job(event_context)
+
+        # add a callback for when the thread exits and pass it the event context
+        on_exit_callback = partial(self._handle_event_as_thread_exit, event_context=event_context)
+        job.future.add_done_callback(on_exit_callback)
+
+    def _submit_job(self, event_context: EventContext) -> Future[ActionResult]:
+        """Hand a job to the executor, running _handle_event on a worker thread or process."""
+        executor = self._get_executor(self._get_job_weight(event_context))
+        if isinstance(executor, PreforkExecutor):
+            # only picklable values can be sent to a worker process
+            return executor.submit(
+                handle_event_in_worker_process,
+                event=event_context.event,
+                correlation_id=event_context.correlation_id,
+                redelivered=event_context.redelivered,
             )
-            self._current_task.add_done_callback(on_exit_callback)
+        return executor.submit(self._handle_event, event_context=event_context)
+
+    def _get_executor(self, weight: JobWeight) -> Executor:
+        """The executor running the lane for this weight."""
+        # May not be initialized in subclasses that don't call super().__init__()
+        light_executor: Executor | None = getattr(self, "_light_executor", None)
+        if light_executor is not None and weight == JobWeight.LIGHT:
+            return light_executor
+        return self._executor
 
     def get_data_context(self, event_context: EventContext) -> CloudDataContext:
-        """Create a new CloudDataContext for each job using the event's workspace_id."""
+        """Check out a CloudDataContext for the event's workspace_id.
+
+        The context comes from the pool of warm contexts when one is available. Return it
+        with release_data_context once the job is done.
+        """
+        workspace_id = self.get_workspace_id(event_context)
+        # May not be initialized in subclasses that don't call super().__init__()
+        pool: DataContextPool | None = getattr(self, "_data_context_pool", None)
+        if pool is None:
+            return self._build_data_context(workspace_id)
+        return pool.checkout(workspace_id)
+
+    def release_data_context(
+        self, event_context: EventContext, data_context: CloudDataContext, reusable: bool
+    ) -> None:
+        """Return a context from get_data_context to the pool.
+
+        Contexts used by a failed job are not reused, and the workspace's other pooled
+        contexts are dropped too, in case the failure came from stale configuration.
+        """
+        pool: DataContextPool | None = getattr(self, "_data_context_pool", None)
+        if pool is None:
+            return
+        if reusable:
+            pool.checkin(data_context)
+        else:
+            pool.discard(data_context)
+            pool.invalidate(self.get_workspace_id(event_context))
+
+    def _build_data_context(self, workspace_id: UUID) -> CloudDataContext:
+        """Load a CloudDataContext for the workspace from GX Cloud."""
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", message="You are using great_expectations version")
-            workspace_id = self.get_workspace_id(event_context)
 
             LOGGER.debug("Loading a DataContext - this might take a moment.")
 
@@ -437,6 +753,19 @@ class GXAgent:
         # warning:  this method will not be executed in the main thread
 
         data_context = self.get_data_context(event_context=event_context)
+        job_succeeded = False
+        try:
+            result = self._handle_event_with_context(
+                event_context=event_context, data_context=data_context
+            )
+            job_succeeded = True
+        finally:
+            self.release_data_context(event_context, data_context, reusable=job_succeeded)
+        return result
+
+    def _handle_event_with_context(
+        self, event_context: EventContext, data_context: CloudDataContext
+    ) -> ActionResult:
         # ensure that great_expectations.http requests to GX Cloud include the job_id/correlation_id
         self._set_http_session_headers(
             correlation_id=event_context.correlation_id, data_context=data_context
@@ -448,14 +777,7 @@ class GXAgent:
         auth_key = self.get_auth_key()
 
         if isinstance(event_context.event, ScheduledEventBase):
-            self._create_scheduled_job_and_set_started(event_context, org_id, workspace_id)
-        else:
-            self._update_status(
-                correlation_id=event_context.correlation_id,
-                status=JobStarted(),
-                org_id=org_id,
-                workspace_id=workspace_id,
-            )
+            self._create_scheduled_job(event_context, org_id, workspace_id)
 
         memory_mb = self._get_memory_usage_mb()
         LOGGER.info(
@@ -498,9 +820,8 @@ class GXAgent:
         """
         # warning:  this method will not be executed in the main thread
 
-        # May not be initialized in subclasses that don't call super().__init__()
-        current_job_start_time = getattr(self, "_current_job_start_time", None)
-        job_elapsed_time = time.time() - current_job_start_time if current_job_start_time else None
+        active_job = self._get_active_job(event_context.correlation_id)
+        job_elapsed_time = time.time() - active_job.start_time if active_job else None
 
         org_id = self.get_organization_id(event_context)
         workspace_id = self.get_workspace_id(event_context)
@@ -586,49 +907,234 @@ class GXAgent:
                     if isinstance(event_context.event, ScheduledEventBase)
                     else None,
                     "hostname": socket.gethostname(),
-                    "error_type": type(error).__name__,
+                    "error_type": error.error_type
+                    if isinstance(error, GXAgentWorkerProcessError)
+                    else type(error).__name__,
                     "error_message": str(error)[:500],  # Truncate to avoid huge logs
                 },
             )
 
-        try:
-            self._update_status(
+        released_job = self._release_job(event_context.correlation_id)
+        # the message is acked or nacked once GX Cloud has the final status, not before
+        self._report_job_completed(
+            event_context,
+            status,
+            org_id=org_id,
+            workspace_id=workspace_id,
+            redeliveries=released_job.redeliveries if released_job else [],
+        )
+        self._start_next_queued_job()
+
+    def _attach_redelivery(self, event_context: EventContext) -> bool:
+        """Tie a redelivered message to the job for it that is still running or queued here, if any.
+
+        After a reconnect, the broker redelivers every message it had not received an ack for,
+        including those of jobs that kept running through the outage. Instead of running such a
+        job twice, the new delivery is acked or nacked together with the running job. A job still
+        waiting in the queue is tracked by the new delivery instead, since the delivery it was
+        queued with belongs to the lost channel.
+        """
+        lock: threading.Lock | None = getattr(self, "_active_jobs_lock", None)
+        if lock is None:
+            return False
+        queue: JobQueue | None = getattr(self, "_job_queue", None)
+        superseded: EventContext | None = None
+        with lock:
+            job = self._active_jobs.get(event_context.correlation_id)
+            if job is not None:
+                job.redeliveries.append(event_context)
+            elif queue is not None:
+                superseded = queue.replace(event_context)
+            if job is None and superseded is None:
+                return False
+        if superseded is not None:
+            # dropped if its channel is closed; otherwise the duplicate is removed from the queue
+            superseded.processed_with_failures()
+        LOGGER.info(
+            "job.redelivery_attached",
+            extra={
+                "event_type": event_context.event.type,
+                "correlation_id": event_context.correlation_id,
+                "redelivered": event_context.redelivered,
+                "queued": superseded is not None,
+            },
+        )
+        return True
+
+    def _report_job_started(self, event_context: EventContext) -> None:
+        """Queue the update telling GX Cloud that a job has started."""
+        if isinstance(event_context.event, ScheduledEventBase):
+            # the job must exist in GX Cloud before it runs, so it is created by the job itself
+            return
+        org_id = self.get_organization_id(event_context)
+        workspace_id = self.get_workspace_id(event_context)
+        status = JobStarted()
+        update = JobStatusUpdate(
+            correlation_id=event_context.correlation_id,
+            send=partial(
+                self._update_status,
                 correlation_id=event_context.correlation_id,
                 status=status,
                 org_id=org_id,
                 workspace_id=workspace_id,
+            ),
+            description=str(status),
+            # redundant once the job has completed
+            supersedable=True,
+        )
+        self._report_status(update)
+
+    def _create_scheduled_job(
+        self, event_context: EventContext, org_id: UUID, workspace_id: UUID
+    ) -> None:
+        """Create a scheduled job in GX Cloud, raising to fail the job if every attempt fails."""
+        send = partial(
+            self._create_scheduled_job_and_set_started, event_context, org_id, workspace_id
+        )
+        # May not be initialized in subclasses that don't call super().__init__()
+        reporter: JobStatusReporter | None = getattr(self, "_status_reporter", None)
+        if reporter is None:
+            send()
+            return
+        reporter.send(
+            JobStatusUpdate(
+                correlation_id=event_context.correlation_id,
+                send=send,
+                description="create scheduled job",
             )
-        except Exception:
-            LOGGER.exception(
+        )
+
+    def _report_job_completed(
+        self,
+        event_context: EventContext,
+        status: JobStatus,
+        org_id: UUID,
+        workspace_id: UUID,
+        redeliveries: list[EventContext] | None = None,
+    ) -> None:
+        """Queue the final status of a job, acking its message once GX Cloud has it."""
+        deliveries = [event_context, *(redeliveries or [])]
+
+        def on_delivered() -> None:
+            for delivery in deliveries:
+                delivery.processed_successfully()
+
+        def on_failed(error: Exception) -> None:
+            LOGGER.error(
                 "Error updating status, removing message from queue",
                 extra={
                     "correlation_id": event_context.correlation_id,
                     "status": str(status),
                     "organization_id": str(org_id),
                     "workspace_id": str(workspace_id),
+                    "error_message": str(error)[:500],
                 },
             )
             # We do not want to cause an infinite loop of errors
             # If the status update fails, remove the message from the queue
-            # Otherwise, it would attempt to handle the error again via this done callback
-            event_context.processed_with_failures()
-            self._current_task = None
-            self._current_job_correlation_id = None
-            self._current_job_start_time = None
-            return
+            for delivery in deliveries:
+                delivery.processed_with_failures()
 
-        event_context.processed_successfully()
-        self._current_task = None
-        self._current_job_correlation_id = None
-        self._current_job_start_time = None
+        update = JobStatusUpdate(
+            correlation_id=event_context.correlation_id,
+            send=partial(
+                self._update_status,
+                correlation_id=event_context.correlation_id,
+                status=status,
+                org_id=org_id,
+                workspace_id=workspace_id,
+            ),
+            description=str(status),
+            on_delivered=on_delivered,
+            on_failed=on_failed,
+        )
+        self._report_status(update)
+
+    def _report_status(self, update: JobStatusUpdate) -> None:
+        # May not be initialized in subclasses that don't call super().__init__()
+        reporter: JobStatusReporter | None = getattr(self, "_status_reporter", None)
+        if reporter is not None:
+            reporter.report(update)
+            return
+        try:
+            update.send()
+        except Exception as error:
+            if update.on_failed is None:
+                LOGGER.exception(
+                    "Error updating status",
+                    extra={"correlation_id": update.correlation_id, "status": update.description},
+                )
+                return
+            update.on_failed(error)
+            return
+        if update.on_delivered is not None:
+            update.on_delivered()
 
     def _get_processed_by(self) -> Literal["agent", "runner"]:
         """Return the name of the service that processed the event."""
         return "runner" if self._get_config().queue == "gx-runner" else "agent"
 
-    def _can_accept_new_task(self) -> bool:
-        """Are we currently processing a task or are we free to take a new one?"""
-        return self._current_task is None or self._current_task.done()
+    def _can_accept_new_task(self, weight: JobWeight = JobWeight.HEAVY) -> bool:
+        """Is there a free worker slot to take a new task in the lane for its weight?"""
+        with self._active_jobs_lock:
+            return self._has_free_slot(weight)
+
+    def _has_free_slot(self, weight: JobWeight) -> bool:
+        """Is a slot free in the lane for this weight? The caller must hold the job lock."""
+        slots = self._get_light_workers() if weight == JobWeight.LIGHT else self._get_max_workers()
+        executor = self._get_executor(weight) if hasattr(self, "_executor") else None
+        if isinstance(executor, PreforkExecutor):
+            # crashed worker processes are not replaced, so their slots are gone
+            slots = min(slots, executor.live_workers)
+        busy = sum(1 for job in self._active_jobs.values() if job.weight == weight)
+        return busy < slots
+
+    def _get_job_weight(self, event_context: EventContext) -> JobWeight:
+        """The lane a job runs on: the weight its event was registered with, unless overridden."""
+        if self._get_light_workers() == 0:
+            return JobWeight.HEAVY
+        weight = self._get_config().job_weights.get(event_context.event.type)
+        return weight or get_event_weight(event_context.event)
+
+    def _get_light_workers(self) -> int:
+        """Number of light jobs that may run concurrently, on top of max_workers."""
+        # May not be initialized in subclasses that don't call super().__init__()
+        return getattr(self, "_light_workers", 0)
+
+    def _get_max_workers(self) -> int:
+        """Number of jobs that may run concurrently."""
+        # May not be initialized in subclasses that don't call super().__init__()
+        return getattr(self, "_max_workers", None) or self._get_config().max_workers
+
+    def _get_job_queue_depth(self) -> int:
+        """Number of jobs that may wait in memory for a free worker."""
+        queue: JobQueue | None = getattr(self, "_job_queue", None)
+        return queue.max_size if queue is not None else 0
+
+    def _get_active_jobs(self) -> list[ActiveJob]:
+        """Snapshot of the jobs currently occupying a worker slot."""
+        # May not be initialized in subclasses that don't call super().__init__()
+        lock: threading.Lock | None = getattr(self, "_active_jobs_lock", None)
+        if lock is None:
+            return []
+        with lock:
+            return list(self._active_jobs.values())
+
+    def _get_active_job(self, correlation_id: str) -> ActiveJob | None:
+        """The job holding a worker slot for this correlation_id, if any."""
+        lock: threading.Lock | None = getattr(self, "_active_jobs_lock", None)
+        if lock is None:
+            return None
+        with lock:
+            return self._active_jobs.get(correlation_id)
+
+    def _release_job(self, correlation_id: str) -> ActiveJob | None:
+        """Free the worker slot held by a job, returning the job if it held one."""
+        lock: threading.Lock | None = getattr(self, "_active_jobs_lock", None)
+        if lock is None:
+            return None
+        with lock:
+            return self._active_jobs.pop(correlation_id, None)
 
     def _reject_correlation_id(self, id: str) -> bool:
         """Has this correlation ID been seen too many times?"""
@@ -670,12 +1176,11 @@ class GXAgent:
             f"/api/v1/organizations/{env_vars.gx_cloud_organization_id}/agent-sessions",
         )
 
-        session = create_session(access_token=env_vars.gx_cloud_access_token)
+        session = get_cloud_session(access_token=env_vars.gx_cloud_access_token)
         response = session.post(
             agent_sessions_url,
             json={"expect_ai_enabled": env_vars.expect_ai_enabled},
         )
-        session.close()
         if response.ok is not True:
             raise GXAgentError(  # noqa: TRY003 # TODO: use AuthenticationError
                 "Unable to authenticate to GX Cloud. Please check your credentials."
@@ -707,6 +1212,34 @@ class GXAgent:
                 gx_cloud_organization_id=env_vars.gx_cloud_organization_id,
                 gx_cloud_access_token=env_vars.gx_cloud_access_token,
                 enable_progress_bars=env_vars.enable_progress_bars,
+                max_workers=env_vars.gx_agent_max_workers,
+                execution_mode=env_vars.gx_agent_execution_mode,
+                data_context_pool_size=env_vars.gx_agent_data_context_pool_size,
+                data_context_ttl_seconds=env_vars.gx_agent_data_context_ttl_seconds,
+                connection_test_ttl_seconds=env_vars.gx_agent_connection_test_ttl_seconds,
+                engine_idle_seconds=env_vars.gx_agent_engine_idle_seconds,
+                circuit_breaker_failures=env_vars.gx_agent_circuit_breaker_failures,
+                circuit_breaker_open_seconds=env_vars.gx_agent_circuit_breaker_open_seconds,
+                connection_test_min_timeout_seconds=(
+                    env_vars.gx_agent_connection_test_min_timeout_seconds
+                ),
+                status_update_max_attempts=env_vars.gx_agent_status_update_max_attempts,
+                status_update_backoff_seconds=env_vars.gx_agent_status_update_backoff_seconds,
+                max_reconnect_attempts=env_vars.gx_agent_max_reconnect_attempts,
+                job_queue_depth=env_vars.gx_agent_job_queue_depth,
+                job_priorities=env_vars.gx_agent_job_priorities,
+                light_workers=env_vars.gx_agent_light_workers,
+                job_weights=env_vars.gx_agent_job_weights,
+                data_quality_check_asset_workers=env_vars.gx_agent_data_quality_check_asset_workers,
+                expectation_batch_size=env_vars.gx_agent_expectation_batch_size,
+                metric_column_chunk_size=env_vars.gx_agent_metric_column_chunk_size,
+                metric_column_workers=env_vars.gx_agent_metric_column_workers,
+                validations_per_datasource=env_vars.gx_agent_validations_per_datasource,
+                http_timeout_seconds=env_vars.gx_cloud_http_timeout_seconds,
+                http_retries=env_vars.gx_cloud_http_retries,
+                http_backoff_factor=env_vars.gx_cloud_http_backoff_factor,
+                http_pool_size=env_vars.gx_cloud_http_pool_size,
+                expect_ai_enabled=env_vars.expect_ai_enabled,
             )
         except pydantic_v1.ValidationError as validation_err:
             raise GXAgentConfigError(
@@ -753,7 +1286,7 @@ class GXAgent:
             self._get_config().gx_cloud_base_url,
             f"/api/v1/organizations/{org_id}/workspaces/{workspace_id}/agent-jobs/{correlation_id}",
         )
-        with create_session(access_token=self.get_auth_key()) as session:
+        with get_cloud_session(access_token=self.get_auth_key()) as session:
             data = UpdateJobStatusRequest(data=status).json()
             response = session.patch(agent_sessions_url, data=data)
             LOGGER.info(
@@ -768,6 +1301,7 @@ class GXAgent:
             GXAgent._log_http_error(
                 response, message="Status Update action had an error while connecting to GX Cloud."
             )
+            GXAgent._raise_for_retryable_status(response)
 
     def _create_scheduled_job_and_set_started(
         self, event_context: EventContext, org_id: UUID, workspace_id: UUID
@@ -810,7 +1344,7 @@ class GXAgent:
             splitter_options=event_context.event.splitter_options,
             checkpoint_name=event_context.event.checkpoint_name,
         )
-        with create_session(access_token=self.get_auth_key()) as session:
+        with get_cloud_session(access_token=self.get_auth_key()) as session:
             payload = CreateScheduledJobAndSetJobStartedRequest(data=data).json()
             response = session.post(agent_sessions_url, data=payload)
 
@@ -853,6 +1387,7 @@ class GXAgent:
                 response,
                 message="Create schedule job action had an error while connecting to GX Cloud.",
             )
+            GXAgent._raise_for_retryable_status(response)
 
     def get_header_name(self) -> type[HeaderName]:
         return HeaderName
@@ -896,8 +1431,8 @@ class GXAgent:
         In particular, set the User-Agent header to identify the GX Agent and the correlation_id as
         Agent-Job-Id if provided.
 
-        Note: the Agent-Job-Id header value will be set for all GX Cloud request until this method is
-        called again.
+        Note: the Agent-Job-Id header value will be set for all GX Cloud requests made from the
+        calling thread until this method is called again on that thread.
         """
 
         header_name = self.get_header_name()
@@ -918,6 +1453,8 @@ class GXAgent:
         if correlation_id:
             core_headers.update({header_name.AGENT_JOB_ID: correlation_id})
         self._set_data_context_store_headers(data_context=data_context, headers=core_headers)
+        # jobs run concurrently on worker threads, so the job id is looked up per thread
+        set_job_correlation_id(correlation_id)
 
         def _update_headers_agent_patch(
             session: requests.Session, access_token: str
@@ -931,8 +1468,9 @@ class GXAgent:
                 "Gx-Version": __version__,
                 header_name.USER_AGENT: user_agent_header_value,
             }
-            if correlation_id:
-                headers[header_name.AGENT_JOB_ID] = correlation_id
+            job_correlation_id = get_job_correlation_id()
+            if job_correlation_id:
+                headers[header_name.AGENT_JOB_ID] = job_correlation_id
             session.headers.update(headers)
             return session
 
@@ -949,3 +1487,9 @@ class GXAgent:
             response.raise_for_status()
         except requests.HTTPError:
             LOGGER.exception(message, extra={"response": response})
+
+    @staticmethod
+    def _raise_for_retryable_status(response: requests.Response) -> None:
+        """Raise for transient errors from GX Cloud, so that the request is sent again."""
+        if response.status_code in RETRY_STATUS_CODES:
+            response.raise_for_status()
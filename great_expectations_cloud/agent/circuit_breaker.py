@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final
+
+from great_expectations.datasource.fluent.interfaces import TestConnectionError
+
+from great_expectations_cloud.agent.datasource_fingerprint import (
+    fingerprint_datasource,
+    get_datasource_scope,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from great_expectations.datasource.fluent.interfaces import Datasource
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+# connect latencies kept per datasource, and how many are needed before timeouts adapt to them
+LATENCY_SAMPLES: Final[int] = 100
+MIN_LATENCY_SAMPLES: Final[int] = 20
+# headroom over the p99 connect latency, which also has to cover the data asset tests
+LATENCY_TIMEOUT_MULTIPLIER: Final[float] = 4.0
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+
+class DatasourceCircuitBreaker:
+    """Fail connection tests fast for datasources that keep failing them.
+
+    Without it, every scheduled Checkpoint against an unreachable database waits out the full
+    connection test timeout, holding a worker the whole time. After failure_threshold
+    consecutive failures the datasource's circuit opens, and its tests fail straight away.
+    Once open_seconds have passed, one test is let through to probe the datasource: if it
+    passes the circuit closes, otherwise it stays open for another open_seconds.
+
+    The breaker also derives each datasource's connection test timeout from its observed
+    connect latency, once enough tests have run: LATENCY_TIMEOUT_MULTIPLIER times the p99,
+    no less than min_timeout_seconds and no more than the caller's timeout.
+
+    Circuits are kept per organization, workspace and datasource config fingerprint, so
+    datasources of the same name in other workspaces don't share one, and a datasource whose
+    config was fixed, e.g. with a new password, starts with a closed circuit.
+
+    Args:
+        failure_threshold: consecutive failures that open a circuit. 0 never opens one.
+        open_seconds: how long an open circuit fails tests before letting a probe through.
+        min_timeout_seconds: the lowest timeout latency may lower a test to. 0 keeps the
+            caller's timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        open_seconds: float,
+        min_timeout_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._open_seconds = open_seconds
+        self._min_timeout_seconds = min_timeout_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[tuple[str, str, str], _Circuit] = {}
+
+    def before_test(self, datasource: Datasource[Any, Any]) -> None:
+        """Check that a datasource may be tested, claiming the probe of a half-open circuit.
+
+        Raises:
+            TestConnectionError: if the datasource's circuit is open.
+        """
+        if self._failure_threshold <= 0:
+            return
+        key = _circuit_key(datasource)
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None or circuit.opened_at is None:
+                return
+            retry_in = circuit.opened_at + self._open_seconds - self._clock()
+            if retry_in <= 0 and not circuit.probing:
+                circuit.probing = True
+                LOGGER.info("circuit_breaker.half_open", extra={"datasource_name": datasource.name})
+                return
+            failures = circuit.failures
+        retry = (
+            f"it will be tested again in {math.ceil(retry_in)} seconds"
+            if retry_in > 0
+            else "another job is testing it again"
+        )
+        raise TestConnectionError(
+            message=f"Datasource '{datasource.name}' failed its last {failures} connection tests; "
+            + retry
+        )
+
+    def record_success(
+        self, datasource: Datasource[Any, Any], connect_seconds: float | None = None
+    ) -> None:
+        """Close the datasource's circuit, noting how long connecting took if it was timed."""
+        if self._failure_threshold <= 0 and self._min_timeout_seconds <= 0:
+            return
+        key = _circuit_key(datasource)
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            was_open = circuit.opened_at is not None
+            circuit.failures = 0
+            circuit.opened_at = None
+            circuit.probing = False
+            if connect_seconds is not None:
+                circuit.latencies.append(connect_seconds)
+        if was_open:
+            LOGGER.info("circuit_breaker.closed", extra={"datasource_name": datasource.name})
+
+    def record_failure(self, datasource: Datasource[Any, Any]) -> None:
+        """Count a failed test, opening the datasource's circuit at failure_threshold."""
+        if self._failure_threshold <= 0:
+            return
+        key = _circuit_key(datasource)
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            circuit.probing = False
+            if self._failure_threshold <= 0 or circuit.failures < self._failure_threshold:
+                return
+            # a failed probe keeps the circuit open for another open_seconds
+            circuit.opened_at = self._clock()
+            failures = circuit.failures
+        LOGGER.warning(
+            "circuit_breaker.opened",
+            extra={
+                "datasource_name": datasource.name,
+                "failures": failures,
+                "open_seconds": self._open_seconds,
+            },
+        )
+
+    def timeout(self, datasource: Datasource[Any, Any], default: float) -> float:
+        """The connection test timeout for a datasource, at most default."""
+        if self._min_timeout_seconds <= 0:
+            return default
+        key = _circuit_key(datasource)
+        with self._lock:
+            circuit = self._circuits.get(key)
+            latencies = sorted(circuit.latencies) if circuit else []
+        if len(latencies) < MIN_LATENCY_SAMPLES:
+            return default
+        p99 = latencies[math.ceil(len(latencies) * 0.99) - 1]
+        return min(default, max(self._min_timeout_seconds, p99 * LATENCY_TIMEOUT_MULTIPLIER))
+
+
+def _circuit_key(datasource: Datasource[Any, Any]) -> tuple[str, str, str]:
+    return (*get_datasource_scope(datasource), fingerprint_datasource(datasource))
+
+
+_breaker = DatasourceCircuitBreaker(failure_threshold=0, open_seconds=0, min_timeout_seconds=0)
+
+
+def get_circuit_breaker() -> DatasourceCircuitBreaker:
+    """The process-wide DatasourceCircuitBreaker. It does nothing until configured."""
+    return _breaker
+
+
+def configure_circuit_breaker(
+    failure_threshold: int, open_seconds: float, min_timeout_seconds: float
+) -> None:
+    """Replace the process-wide DatasourceCircuitBreaker with one using the given settings."""
+    global _breaker  # noqa: PLW0603 # process-wide singleton
+    _breaker = DatasourceCircuitBreaker(
+        failure_threshold=failure_threshold,
+        open_seconds=open_seconds,
+        min_timeout_seconds=min_timeout_seconds,
+    )
+
+
+def _reset_lock_after_fork() -> None:
+    # the lock may have been held by another thread of the parent when it forked
+    _breaker._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_lock_after_fork)
@@ -8,6 +8,7 @@ import pathlib
 import sys
 from typing import Any
 
+from great_expectations_cloud.agent.constants import ExecutionMode
 from great_expectations_cloud.logging.logging_cfg import LogLevel, LogSettings, configure_logger
 
 LOGGER = logging.getLogger(__name__)
@@ -21,6 +22,8 @@ class Arguments:
     log_cfg_file: pathlib.Path | None
     version: bool
     custom_log_tags: str
+    workers: int | None
+    execution_mode: ExecutionMode | None
 
 
 def _parse_args() -> Arguments:
@@ -58,6 +61,19 @@ def _parse_args() -> Arguments:
         type=str,
         default="{}",
     )
+    parser.add_argument(
+        "--workers",
+        help="Number of jobs to run concurrently. Overrides GX_AGENT_MAX_WORKERS. Defaults to 1.",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--execution-mode",
+        help="Run jobs on worker threads or in prefork worker processes. Overrides GX_AGENT_EXECUTION_MODE. Defaults to thread.",
+        type=ExecutionMode,
+        choices=list(ExecutionMode),
+        default=None,
+    )
     parser.add_argument("--version", help="Show the gx agent version.", action="store_true")
     args = parser.parse_args()
     return Arguments(
@@ -67,6 +83,8 @@ def _parse_args() -> Arguments:
         version=args.version,
         json_log=args.json_log,
         custom_log_tags=args.custom_log_tags,
+        workers=args.workers,
+        execution_mode=args.execution_mode,
     )
 
 
@@ -98,7 +116,7 @@ def main() -> None:
 
     from great_expectations_cloud.agent import run_agent  # noqa: PLC0415
 
-    run_agent()
+    run_agent(max_workers=args.workers, execution_mode=args.execution_mode)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+import requests
+from great_expectations import __version__
+from requests.adapters import HTTPAdapter
+from typing_extensions import override
+from urllib3.util.retry import Retry
+
+from great_expectations_cloud.agent.constants import HeaderName
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Self
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+# responses worth retrying for idempotent requests; POST and PATCH are never retried
+RETRY_STATUS_CODES: Final = (429, 502, 503, 504)
+
+
+@dataclass(frozen=True)
+class GXCloudClientSettings:
+    """HTTP settings for agent requests to GX Cloud, set by the GXAgent from GxAgentEnvVars."""
+
+    timeout_seconds: float = 20
+    retries: int = 5
+    backoff_factor: float = 1.0
+    # keep-alive connections kept per host; should cover the number of concurrent jobs
+    pool_size: int = 10
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """Apply a default timeout to requests that don't set their own."""
+
+    def __init__(self, timeout: float, **kwargs: Any) -> None:
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    @override
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override] # requests stubs spell out every keyword
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+@dataclass
+class RequestMetrics:
+    """Latency of GX Cloud requests for one HTTP method."""
+
+    count: int = 0
+    error_count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+
+class GXCloudClient:
+    """One pooled HTTP client for all of the agent's requests to GX Cloud.
+
+    Connections are kept alive and reused across requests and jobs, idempotent requests
+    are retried with backoff, every request gets a timeout, and request latency is
+    recorded per HTTP method. Credentials are not stored on the client: each caller
+    gets a GXCloudSession for its access token from session().
+    """
+
+    def __init__(self, settings: GXCloudClientSettings | None = None) -> None:
+        settings = settings or GXCloudClientSettings()
+        self._settings = settings
+        self._session = requests.Session()
+        retries = Retry(
+            total=settings.retries,
+            backoff_factor=settings.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        adapter = _TimeoutHTTPAdapter(
+            timeout=settings.timeout_seconds,
+            max_retries=retries,
+            pool_connections=settings.pool_size,
+            pool_maxsize=settings.pool_size,
+        )
+        for protocol in ("http://", "https://"):
+            self._session.mount(protocol, adapter)
+        self._metrics: dict[str, RequestMetrics] = {}
+        self._metrics_lock = threading.Lock()
+
+    def session(self, access_token: str) -> GXCloudSession:
+        """A session that sends requests through this client with the given credentials."""
+        return GXCloudSession(client=self, access_token=access_token)
+
+    def request(self, method: str, url: str, access_token: str, **kwargs: Any) -> requests.Response:
+        headers = {
+            "Content-Type": "application/vnd.api+json",
+            "Authorization": f"Bearer {access_token}",
+            "Gx-Version": __version__,
+        }
+        if _user_agent:
+            headers[HeaderName.USER_AGENT] = _user_agent
+        correlation_id = get_job_correlation_id()
+        if correlation_id:
+            headers[HeaderName.AGENT_JOB_ID] = correlation_id
+        headers.update(kwargs.pop("headers", None) or {})
+
+        start = time.perf_counter()
+        try:
+            response = self._session.request(method, url, headers=headers, **kwargs)
+        except requests.RequestException:
+            self._record(method, time.perf_counter() - start, failed=True)
+            raise
+        elapsed = time.perf_counter() - start
+        self._record(method, elapsed, failed=not response.ok)
+        LOGGER.debug(
+            "gx_cloud.request",
+            extra={
+                "method": method.upper(),
+                "url": url,
+                "status_code": response.status_code,
+                "elapsed_ms": round(elapsed * 1000, 1),
+                "correlation_id": correlation_id,
+            },
+        )
+        return response
+
+    def get_metrics(self) -> dict[str, RequestMetrics]:
+        """Snapshot of request latency per HTTP method since the client was created."""
+        with self._metrics_lock:
+            return {
+                method: RequestMetrics(**vars(metrics)) for method, metrics in self._metrics.items()
+            }
+
+    def close(self) -> None:
+        self._session.close()
+
+    def _record(self, method: str, elapsed: float, failed: bool) -> None:
+        with self._metrics_lock:
+            metrics = self._metrics.setdefault(method.upper(), RequestMetrics())
+            metrics.count += 1
+            metrics.error_count += int(failed)
+            metrics.total_seconds += elapsed
+            metrics.max_seconds = max(metrics.max_seconds, elapsed)
+
+
+class GXCloudSession:
+    """requests.Session-like view of the GXCloudClient for one access token.
+
+    Usable as a context manager like the session from great_expectations.core.http;
+    leaving the context does not close the pooled connections.
+    """
+
+    def __init__(self, client: GXCloudClient, access_token: str) -> None:
+        self._client = client
+        self._access_token = access_token
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self._client.request(method, url, access_token=self._access_token, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """No-op: the connections belong to the process-wide client."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
+
+
+_client: GXCloudClient | None = None
+_client_settings = GXCloudClientSettings()
+_client_lock = threading.Lock()
+_user_agent: str | None = None
+# correlation_id of the job running on the current thread, sent as the Agent-Job-Id header
+_job_context = threading.local()
+
+
+def get_cloud_client() -> GXCloudClient:
+    """The process-wide GXCloudClient, created on first use."""
+    global _client  # noqa: PLW0603 # process-wide singleton
+    with _client_lock:
+        if _client is None:
+            _client = GXCloudClient(_client_settings)
+        return _client
+
+
+def configure_cloud_client(settings: GXCloudClientSettings) -> None:
+    """Replace the process-wide GXCloudClient with one using the given settings."""
+    global _client, _client_settings  # noqa: PLW0603 # process-wide singleton
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+        _client_settings = settings
+
+
+def get_cloud_session(access_token: str) -> GXCloudSession:
+    """A session on the process-wide GXCloudClient for the given access token."""
+    return get_cloud_client().session(access_token=access_token)
+
+
+def set_user_agent(user_agent: str) -> None:
+    """Identify the agent in the User-Agent header of every GX Cloud request."""
+    global _user_agent  # noqa: PLW0603 # process-wide setting
+    _user_agent = user_agent
+
+
+def set_job_correlation_id(correlation_id: str | None) -> None:
+    """Tag GX Cloud requests made from the current thread with a job's correlation_id."""
+    _job_context.correlation_id = correlation_id
+
+
+def get_job_correlation_id() -> str | None:
+    correlation_id: str | None = getattr(_job_context, "correlation_id", None)
+    return correlation_id
+
+
+def _reset_client_after_fork() -> None:
+    # pooled sockets must not be shared with a forked worker process; the settings are kept
+    global _client, _client_lock  # noqa: PLW0603
+    _client = None
+    _client_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_client_after_fork)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Final
+
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    _PERSISTED_CONNECTION_DIALECTS,
+)
+from great_expectations.experimental.metric_repository.metric_list_metric_retriever import (
+    MetricListMetricRetriever,
+)
+from great_expectations.validator.validator import Validator
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from great_expectations.data_context import AbstractDataContext
+    from great_expectations.datasource.fluent import BatchRequest
+    from great_expectations.experimental.metric_repository.metrics import (
+        ColumnMetric,
+        Metric,
+        MetricTypes,
+    )
+
+# GX runs every query of these dialects on one persistent connection, which threads can't share
+_SINGLE_CONNECTION_DIALECTS: Final[frozenset[str]] = frozenset(
+    dialect.value for dialect in _PERSISTED_CONNECTION_DIALECTS
+)
+
+
+class ColumnChunkMetricRetriever(MetricListMetricRetriever):
+    """A MetricListMetricRetriever computing column metrics a chunk of columns at a time.
+
+    MetricListMetricRetriever computes each group of column metrics over every column at once,
+    so a table with thousands of columns gets one huge query, run on one thread, whose results
+    are all held together. This retriever splits the columns into chunks of column_chunk_size
+    and computes up to max_workers chunks at once, each on its own pooled connection. The
+    metrics are merged back in the order MetricListMetricRetriever returns them.
+
+    GX's execution engines cache batches and metrics without locking, so each chunk computed
+    concurrently gets a validator of the batch on an execution engine of its own, which shares
+    only the SQLAlchemy engine. Chunks of dialects that GX runs on one persistent connection
+    are computed one after another, on the asset's validator.
+    """
+
+    def __init__(self, context: AbstractDataContext, column_chunk_size: int, max_workers: int):
+        super().__init__(context=context)
+        self._column_chunk_size = column_chunk_size
+        self._max_workers = max_workers
+        # the validator of the chunk a pool thread is computing
+        self._chunk = threading.local()
+
+    @override
+    def get_validator(self, batch_request: BatchRequest[Any]) -> Validator:
+        validator: Validator | None = getattr(self._chunk, "validator", None)
+        return validator or super().get_validator(batch_request=batch_request)
+
+    @override
+    def _get_column_metrics(
+        self,
+        batch_request: BatchRequest[Any],
+        column_list: list[str],
+        column_metric_names: list[MetricTypes | str],
+        column_metric_type: type[ColumnMetric[Any]],
+    ) -> Sequence[Metric[Any]]:
+        chunks = [
+            column_list[start : start + self._column_chunk_size]
+            for start in range(0, len(column_list), self._column_chunk_size)
+        ]
+        compute = partial(
+            super()._get_column_metrics,
+            batch_request,
+            column_metric_names=column_metric_names,
+            column_metric_type=column_metric_type,
+        )
+        if len(chunks) <= 1:
+            return compute(column_list=column_list)
+
+        validator = self.get_validator(batch_request=batch_request)
+        execution_engine = validator.execution_engine
+        batch = validator.active_batch
+        workers = min(self._max_workers, len(chunks))
+        if (
+            workers <= 1
+            or batch is None
+            or not isinstance(execution_engine, SqlAlchemyExecutionEngine)
+            or execution_engine.dialect_name in _SINGLE_CONNECTION_DIALECTS
+        ):
+            chunk_metrics = [compute(column_list=chunk) for chunk in chunks]
+        else:
+
+            def compute_chunk(chunk: list[str]) -> Sequence[Metric[Any]]:
+                self._chunk.validator = Validator(
+                    execution_engine=type(execution_engine)(engine=execution_engine.engine),
+                    data_context=self._context,
+                    batches=[batch],
+                )
+                try:
+                    return compute(column_list=chunk)
+                finally:
+                    self._chunk.validator = None
+
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="gx-metric-columns"
+            ) as pool:
+                chunk_metrics = list(pool.map(compute_chunk, chunks))
+
+        # every column's value of one metric comes before the next metric's
+        return [
+            metric
+            for metric_name in column_metric_names
+            for metrics in chunk_metrics
+            for metric in metrics
+            if metric.metric_name == metric_name
+        ]
@@ -5,12 +5,65 @@ from typing import Optional
 from great_expectations.data_context.cloud_constants import CLOUD_DEFAULT_BASE_URL
 from pydantic.v1 import AnyUrl, BaseSettings, Field, ValidationError
 
+from great_expectations_cloud.agent.constants import ExecutionMode, JobPriority, JobWeight
+
 
 class GxAgentEnvVars(BaseSettings):
     gx_cloud_base_url: AnyUrl = AnyUrl(url=CLOUD_DEFAULT_BASE_URL, scheme="https")
     gx_cloud_organization_id: str
     gx_cloud_access_token: str
     enable_progress_bars: bool = True
+    # number of jobs the GX Agent runs concurrently, each with its own CloudDataContext
+    gx_agent_max_workers: int = Field(default=1, ge=1)
+    # run jobs on worker threads, or in worker processes forked after imports are warm
+    gx_agent_execution_mode: ExecutionMode = ExecutionMode.THREAD
+    # warm CloudDataContexts kept between jobs, keyed by workspace; 0 disables reuse
+    gx_agent_data_context_pool_size: int = Field(default=8, ge=0)
+    gx_agent_data_context_ttl_seconds: int = Field(default=600, ge=0)
+    # The connection test cache, engine registry, circuit breaker and per-datasource caps below
+    # are kept per process. In prefork mode each worker process has its own, so a datasource may
+    # be tested, hold engines and run queries once per worker, and trips a worker's breaker only
+    # after that worker's own failures.
+    # how long a passed datasource or asset connection test is trusted; 0 tests before every job
+    gx_agent_connection_test_ttl_seconds: int = Field(default=300, ge=0)
+    # SQLAlchemy engines are shared across jobs until unused this long; 0 gives each job its own
+    gx_agent_engine_idle_seconds: int = Field(default=600, ge=0)
+    # consecutive failed connection tests after which a datasource's tests fail fast; 0 never
+    gx_agent_circuit_breaker_failures: int = Field(default=3, ge=0)
+    # how long a datasource's tests fail fast before one is let through to probe it
+    gx_agent_circuit_breaker_open_seconds: int = Field(default=300, ge=0)
+    # lowest connection test timeout derived from connect latency; 0 always uses the fixed timeout
+    gx_agent_connection_test_min_timeout_seconds: int = Field(default=60, ge=0)
+    # job status updates are sent in the background and retried with exponential backoff
+    gx_agent_status_update_max_attempts: int = Field(default=5, ge=1)
+    gx_agent_status_update_backoff_seconds: float = Field(default=1.0, ge=0)
+    # consecutive failed attempts to reconnect to the broker before the process is restarted
+    gx_agent_max_reconnect_attempts: int = Field(default=5, ge=0)
+    # jobs held in memory while every worker is busy; 0 (the default) leaves them with the broker
+    gx_agent_job_queue_depth: int = Field(default=0, ge=0)
+    # JSON object of event type to JobPriority, overriding the default priority of those events
+    gx_agent_job_priorities: dict[str, JobPriority] = Field(default_factory=dict)
+    # worker threads reserved for light jobs, on top of gx_agent_max_workers; 0 runs them with heavy jobs
+    gx_agent_light_workers: int = Field(default=1, ge=0)
+    # JSON object of event type to JobWeight, overriding the weight the event was registered with
+    gx_agent_job_weights: dict[str, JobWeight] = Field(default_factory=dict)
+    # data assets of one Data Quality Check event processed at once; 1 processes them one by one
+    gx_agent_data_quality_check_asset_workers: int = Field(default=4, ge=1)
+    # expectations sent to GX Cloud per request when an asset gets one for each column
+    gx_agent_expectation_batch_size: int = Field(default=100, ge=1)
+    # columns whose metrics are computed together; wider tables are split into chunks of them
+    gx_agent_metric_column_chunk_size: int = Field(default=250, ge=1)
+    # chunks of columns computed at once, each on its own pooled connection
+    gx_agent_metric_column_workers: int = Field(default=4, ge=1)
+    # validation definitions of one Checkpoint validated at once against each datasource;
+    # 0 leaves the Checkpoint to validate them one after another
+    gx_agent_validations_per_datasource: int = Field(default=0, ge=0)
+    # HTTP client for the agent's own requests to GX Cloud; only idempotent requests are retried
+    gx_cloud_http_timeout_seconds: float = Field(default=20, gt=0)
+    gx_cloud_http_retries: int = Field(default=5, ge=0)
+    gx_cloud_http_backoff_factor: float = Field(default=1.0, ge=0)
+    # keep-alive connections kept per host; should cover the number of concurrent jobs
+    gx_cloud_http_pool_size: int = Field(default=10, ge=1)
 
     amqp_host_override: Optional[str] = None  # noqa: UP045 # pipe not working with 3.9
     amqp_port_override: Optional[int] = None  # noqa: UP045 # pipe not working with 3.9
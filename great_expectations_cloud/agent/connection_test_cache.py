@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+from great_expectations_cloud.agent.datasource_fingerprint import (
+    fingerprint_datasource,
+    get_datasource_scope,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from great_expectations.datasource.fluent.interfaces import DataAsset, Datasource
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class ConnectionTestCache:
+    """Remember which datasources and assets recently passed a connection test.
+
+    Scheduled Checkpoints on the same datasource run every few minutes, and testing the
+    connection each time can mean resuming a Snowflake or Databricks warehouse just to prove
+    it exists. Successful tests are cached for a TTL instead, keyed by the datasource's
+    workspace and name and a fingerprint of its resolved config, so that a changed config or
+    rotated secret is tested again. A failed test drops every cached result for its datasource.
+
+    Args:
+        ttl_seconds: how long a successful test is trusted. 0 disables caching.
+    """
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (organization id, workspace id, datasource name) -> {(config fingerprint, asset name
+        # or None) -> time of the test}
+        self._passed: dict[tuple[str, str, str], dict[tuple[str, str | None], float]] = {}
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    def test_datasource(self, datasource: Datasource[Any, Any]) -> bool:
+        """Test the connection to a datasource, but not its assets, unless it passed recently.
+
+        Returns:
+            Whether the test ran, rather than a recent pass being reused.
+
+        Raises:
+            TestConnectionError: if the connection test fails.
+        """
+        return self._test(
+            datasource, None, partial_test=lambda: datasource.test_connection(test_assets=False)
+        )
+
+    def test_data_asset(self, data_asset: DataAsset[Any, Any]) -> bool:
+        """Test the connection to a data asset, unless it passed recently.
+
+        Returns:
+            Whether the test ran, rather than a recent pass being reused.
+
+        Raises:
+            TestConnectionError: if the connection test fails.
+        """
+        return self._test(
+            data_asset.datasource, data_asset.name, partial_test=data_asset.test_connection
+        )
+
+    def invalidate(self, datasource: Datasource[Any, Any] | None = None) -> None:
+        """Forget the results for a datasource, or for every datasource if none is given."""
+        with self._lock:
+            if datasource is None:
+                self._passed.clear()
+                return
+            self._passed.pop(_datasource_key(datasource), None)
+
+    def _test(
+        self,
+        datasource: Datasource[Any, Any],
+        asset_name: str | None,
+        partial_test: Callable[[], None],
+    ) -> bool:
+        if self._ttl_seconds <= 0:
+            partial_test()
+            return True
+        datasource_key = _datasource_key(datasource)
+        key = (fingerprint_datasource(datasource), asset_name)
+        with self._lock:
+            tested_at = self._passed.get(datasource_key, {}).get(key)
+        if tested_at is not None and self._clock() - tested_at < self._ttl_seconds:
+            LOGGER.debug(
+                "Skipping connection test that passed recently.",
+                extra={"datasource_name": datasource.name, "asset_name": asset_name},
+            )
+            return False
+        try:
+            partial_test()
+        except Exception:
+            self.invalidate(datasource)
+            raise
+        with self._lock:
+            passed = self._passed.setdefault(datasource_key, {})
+            # results for an older config of this datasource will not be used again
+            for stale in [cached for cached in passed if cached[0] != key[0]]:
+                del passed[stale]
+            passed[key] = self._clock()
+        return True
+
+
+def _datasource_key(datasource: Datasource[Any, Any]) -> tuple[str, str, str]:
+    return (*get_datasource_scope(datasource), datasource.name)
+
+
+_cache = ConnectionTestCache(ttl_seconds=0)
+
+
+def get_connection_test_cache() -> ConnectionTestCache:
+    """The process-wide ConnectionTestCache. Caching is off until configured."""
+    return _cache
+
+
+def configure_connection_test_cache(ttl_seconds: float) -> None:
+    """Replace the process-wide ConnectionTestCache with one using the given TTL."""
+    global _cache  # noqa: PLW0603 # process-wide singleton
+    _cache = ConnectionTestCache(ttl_seconds=ttl_seconds)
+
+
+def _reset_lock_after_fork() -> None:
+    # the lock may have been held by another thread of the parent when it forked
+    _cache._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_lock_after_fork)
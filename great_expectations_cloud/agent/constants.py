@@ -9,6 +9,39 @@ class HeaderName(StrEnum):
     AGENT_JOB_ID = "Agent-Job-Id"
 
 
+class ExecutionMode(StrEnum):
+    """How the GX Agent runs jobs.
+
+    THREAD runs jobs on worker threads in the agent process.
+    PREFORK runs jobs in worker processes forked from the agent after imports are warm.
+    """
+
+    THREAD = "thread"
+    PREFORK = "prefork"
+
+
+class JobPriority(StrEnum):
+    """Order in which jobs waiting for a free worker are started.
+
+    INTERACTIVE jobs are started first, then DEFAULT jobs, then SCHEDULED jobs.
+    """
+
+    INTERACTIVE = "interactive"
+    DEFAULT = "default"
+    SCHEDULED = "scheduled"
+
+
+class JobWeight(StrEnum):
+    """Which of the GX Agent's worker lanes runs a job.
+
+    LIGHT jobs are short requests a user is waiting on in the UI; they run on a small lane
+    of their own so they never wait behind HEAVY jobs, such as Checkpoint runs.
+    """
+
+    LIGHT = "light"
+    HEAVY = "heavy"
+
+
 USER_AGENT_HEADER: Final = "gx-agent"
 
 __all__ = ["USER_AGENT_HEADER"]
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Final
+
+import sqlalchemy as sa
+from great_expectations.datasource.fluent.interfaces import Batch
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    DATABRICKS_MAX_PARAMS_PER_QUERY,
+)
+from great_expectations.experimental.metric_repository.metric_list_metric_retriever import (
+    MetricListMetricRetriever,
+)
+from great_expectations.experimental.metric_repository.metrics import (
+    ColumnMetric,
+    Metric,
+    MetricException,
+    MetricTypes,
+    TableMetric,
+)
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from great_expectations.datasource.fluent import BatchRequest
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+# the most expressions some databases accept in one select list
+SELECT_LIST_LIMITS: Final[dict[str, int]] = {
+    "databricks": DATABRICKS_MAX_PARAMS_PER_QUERY,
+    "mssql": 4096,
+    "oracle": 1000,
+    "postgresql": 1664,
+    "redshift": 1600,
+    "sqlite": 2000,
+}
+
+# the metrics computed together, in one scan of the batch
+COUNT_METRICS: Final[tuple[MetricTypes, ...]] = (
+    MetricTypes.TABLE_ROW_COUNT,
+    MetricTypes.COLUMN_NON_NULL_COUNT,
+)
+
+
+class CountScanMetricRetriever(MetricListMetricRetriever):
+    """A MetricListMetricRetriever counting rows and every column's non-null values in one scan.
+
+    MetricListMetricRetriever computes the row count and the non-null counts separately, each
+    after its own column filtering. For SQL batches this retriever selects
+    COUNT(*), COUNT(col1), COUNT(col2), ... instead, split into several selects only where the
+    dialect limits the size of a select list. Other metrics, and batches of other execution
+    engines, are left to MetricListMetricRetriever.
+    """
+
+    @override
+    def get_metrics(
+        self,
+        batch_request: BatchRequest[Any],
+        metric_list: list[MetricTypes] | None = None,
+    ) -> Sequence[Metric[Any]]:
+        counts = [metric for metric in COUNT_METRICS if metric in (metric_list or [])]
+        validator = self.get_validator(batch_request=batch_request)
+        execution_engine = validator.execution_engine
+        batch = validator.active_batch
+        if (
+            not counts
+            or not isinstance(execution_engine, SqlAlchemyExecutionEngine)
+            or not isinstance(batch, Batch)
+        ):
+            return super().get_metrics(batch_request=batch_request, metric_list=metric_list)
+
+        other_metrics = [metric for metric in metric_list or [] if metric not in counts]
+        metrics = (
+            list(super().get_metrics(batch_request=batch_request, metric_list=other_metrics))
+            if other_metrics
+            else []
+        )
+        columns: list[str] = []
+        if MetricTypes.COLUMN_NON_NULL_COUNT in counts:
+            # as in MetricListMetricRetriever, column metrics need the column types
+            if MetricTypes.TABLE_COLUMN_TYPES in other_metrics:
+                columns = self._get_all_column_names(metrics) or []
+            else:
+                LOGGER.warning(
+                    "TABLE_COLUMN_TYPES metric is required to compute column metrics. "
+                    "Skipping column metrics."
+                )
+        row_count, non_null_counts = self._count(
+            execution_engine=execution_engine,
+            batch_id=batch.id,
+            row_count=MetricTypes.TABLE_ROW_COUNT in counts,
+            columns=columns,
+        )
+        # the order MetricListMetricRetriever returns them in: table metrics, then column metrics
+        return [*row_count, *metrics, *non_null_counts]
+
+    def _count(
+        self,
+        execution_engine: SqlAlchemyExecutionEngine,
+        batch_id: str,
+        row_count: bool,
+        columns: list[str],
+    ) -> tuple[list[Metric[Any]], list[Metric[Any]]]:
+        """Count the batch's rows and each column's non-null values, in as few selects as allowed."""
+        expressions: list[sa.ColumnElement[Any]] = [sa.func.count()] if row_count else []
+        expressions.extend(sa.func.count(sa.column(column)) for column in columns)
+        if not expressions:
+            return [], []
+        selectable = self._count_selectable(execution_engine, batch_id)
+        limit = SELECT_LIST_LIMITS.get(execution_engine.dialect_name, len(expressions))
+        values: list[Any] = []
+        exceptions: list[MetricException | None] = []
+        for start in range(0, len(expressions), limit):
+            chunk = expressions[start : start + limit]
+            try:
+                row = execution_engine.execute_query(
+                    sa.select(*chunk).select_from(selectable)
+                ).one()
+            except Exception as e:
+                # like MetricListMetricRetriever, a failed count is reported with its metric
+                LOGGER.warning("count_metrics.failed", exc_info=True)
+                values.extend([None] * len(chunk))
+                exceptions.extend([MetricException(type="Unknown", message=str(e))] * len(chunk))
+            else:
+                values.extend(int(value) for value in row)
+                exceptions.extend([None] * len(chunk))
+
+        ColumnMetric.update_forward_refs()  # type: ignore[no-untyped-call] # as GX does
+        metrics: list[Metric[Any]] = (
+            [
+                TableMetric[int](
+                    batch_id=batch_id,
+                    metric_name=MetricTypes.TABLE_ROW_COUNT,
+                    value=values.pop(0),
+                    exception=exceptions.pop(0),
+                )
+            ]
+            if row_count
+            else []
+        )
+        column_metrics: list[Metric[Any]] = [
+            ColumnMetric[int](
+                batch_id=batch_id,
+                metric_name=MetricTypes.COLUMN_NON_NULL_COUNT,
+                column=column,
+                value=value,
+                exception=exception,
+            )
+            for column, value, exception in zip(columns, values, exceptions, strict=True)
+        ]
+        return metrics, column_metrics
+
+    def _count_selectable(
+        self, execution_engine: SqlAlchemyExecutionEngine, batch_id: str
+    ) -> sa.FromClause:
+        """The batch's records, as something to select from."""
+        selectable: Any = execution_engine.get_domain_records(domain_kwargs={"batch_id": batch_id})
+        # as in SqlAlchemyExecutionEngine.resolve_metric_bundle
+        if isinstance(selectable, sa.TextClause):
+            return selectable.columns().subquery()
+        if isinstance(selectable, (sa.Select, sa.TextualSelect)):
+            return selectable.subquery()
+        from_clause: sa.FromClause = selectable
+        return from_clause
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from great_expectations.data_context import CloudDataContext
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+@dataclass
+class _PooledContext:
+    context: CloudDataContext
+    created_at: float
+    generation: int
+
+
+class DataContextPool:
+    """A bounded pool of warm CloudDataContexts keyed by workspace_id.
+
+    Loading a CloudDataContext and saving its progress bar settings makes several requests
+    to GX Cloud, which costs more than short jobs like ListAssetNames. The pool hands out
+    idle contexts instead, and only builds a new one when none is available.
+
+    A context is used by one job at a time: checkout removes it from the pool and checkin
+    returns it. Idle contexts are evicted least recently used first once the pool is full,
+    and are rebuilt once they are older than the TTL. invalidate drops every context for a
+    workspace, including ones checked out when it is called.
+
+    Args:
+        factory: builds a ready-to-use context for a workspace.
+        max_size: number of idle contexts to keep. 0 disables pooling.
+        ttl_seconds: age after which a context is rebuilt rather than reused.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[UUID], CloudDataContext],
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._factory = factory
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._idle: OrderedDict[UUID, _PooledContext] = OrderedDict()
+        # context id -> pool entry, for contexts currently checked out
+        self._checked_out: dict[int, tuple[UUID, _PooledContext]] = {}
+        self._generations: defaultdict[UUID, int] = defaultdict(int)
+
+    def checkout(self, workspace_id: UUID) -> CloudDataContext:
+        """Take a context for the workspace, building one if no warm context is available."""
+        with self._lock:
+            entry = self._idle.pop(workspace_id, None)
+            if entry is not None and self._is_expired(entry):
+                LOGGER.debug(
+                    "Discarding expired DataContext.", extra={"workspace_id": str(workspace_id)}
+                )
+                entry = None
+            generation = self._generations[workspace_id]
+
+        if entry is None:
+            entry = _PooledContext(
+                context=self._factory(workspace_id),
+                created_at=self._clock(),
+                generation=generation,
+            )
+        else:
+            LOGGER.debug("Reusing warm DataContext.", extra={"workspace_id": str(workspace_id)})
+
+        with self._lock:
+            self._checked_out[id(entry.context)] = (workspace_id, entry)
+        return entry.context
+
+    def checkin(self, context: CloudDataContext) -> None:
+        """Return a context to the pool so the next job in its workspace can reuse it."""
+        with self._lock:
+            checked_out = self._checked_out.pop(id(context), None)
+            if checked_out is None or self._max_size == 0:
+                return
+            workspace_id, entry = checked_out
+            if entry.generation != self._generations[workspace_id] or self._is_expired(entry):
+                return
+            if workspace_id in self._idle:
+                # another job in this workspace returned its context first; keep that one
+                self._idle.move_to_end(workspace_id)
+                return
+            self._idle[workspace_id] = entry
+            while len(self._idle) > self._max_size:
+                self._idle.popitem(last=False)
+
+    def discard(self, context: CloudDataContext) -> None:
+        """Stop tracking a checked out context without returning it to the pool."""
+        with self._lock:
+            self._checked_out.pop(id(context), None)
+
+    def invalidate(self, workspace_id: UUID | None = None) -> None:
+        """Drop the contexts for a workspace, or for every workspace if none is given."""
+        with self._lock:
+            if workspace_id is None:
+                self._idle.clear()
+                for checked_out_workspace_id, _ in self._checked_out.values():
+                    self._generations[checked_out_workspace_id] += 1
+                return
+            self._idle.pop(workspace_id, None)
+            self._generations[workspace_id] += 1
+
+    def __len__(self) -> int:
+        """Number of idle contexts in the pool."""
+        with self._lock:
+            return len(self._idle)
+
+    def _is_expired(self, entry: _PooledContext) -> bool:
+        return self._clock() - entry.created_at >= self._ttl_seconds
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from great_expectations.datasource.fluent.interfaces import Datasource
+
+
+def get_datasource_scope(datasource: Datasource[Any, Any]) -> tuple[str, str]:
+    """The organization and workspace ids of the GX Cloud context a datasource belongs to.
+
+    Datasource names are only unique within a workspace, so process-wide state about a
+    datasource is kept per scope. Both ids are empty for a datasource outside GX Cloud.
+    """
+    cloud_config = getattr(datasource.data_context, "ge_cloud_config", None)
+    if cloud_config is None:
+        return "", ""
+    return str(cloud_config.organization_id or ""), str(cloud_config.workspace_id or "")
+
+
+def fingerprint_datasource(datasource: Datasource[Any, Any]) -> str:
+    """A digest of the datasource config as used to connect, without keeping the config.
+
+    Config variables such as ${DB_PASSWORD} are substituted and secrets revealed first, so
+    a rotated password changes the fingerprint even though the stored config does not.
+    """
+    config = datasource.dict(config_provider=datasource._config_provider)
+    serialized = json.dumps(
+        {"type": type(datasource).__name__, "config": config}, sort_keys=True, default=reveal
+    )
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def reveal(value: Any) -> str:
+    """JSON default for configs: the value of a secret, or the string of anything else."""
+    get_secret_value = getattr(value, "get_secret_value", None)
+    return get_secret_value() if callable(get_secret_value) else str(value)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Final
+
+from great_expectations.datasource.fluent import SQLDatasource
+
+from great_expectations_cloud.agent.datasource_fingerprint import get_datasource_scope
+from great_expectations_cloud.agent.engine_registry import runs_on_one_connection
+
+if TYPE_CHECKING:
+    from great_expectations.datasource.fluent.interfaces import Datasource
+    from sqlalchemy.engine import Engine
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+
+class DatasourceLimiter:
+    """Cap the work sent to each datasource at once, across every job of the process.
+
+    A job capping its own queries still lets several jobs against the same datasource add up,
+    so the slots are kept per organization, workspace and datasource name, and shared by the
+    jobs of each. Engines running their queries on one connection get a lock of their own.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._slots: dict[tuple[str, str, str, int], threading.BoundedSemaphore] = {}
+        self._engine_locks: weakref.WeakKeyDictionary[Engine, threading.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def slots(self, datasource: Datasource[Any, Any], limit: int) -> threading.BoundedSemaphore:
+        """The semaphore letting limit callers at a time work on the datasource."""
+        key = (*get_datasource_scope(datasource), datasource.name, limit)
+        with self._lock:
+            slots = self._slots.get(key)
+            if slots is None:
+                slots = self._slots[key] = threading.BoundedSemaphore(limit)
+            return slots
+
+    def engine_lock(self, engine: Engine) -> threading.Lock:
+        """The lock serializing work on an engine, for engines running queries on one connection.
+
+        Statements that change the connection's state, like SQL Server's SET PARSEONLY, would
+        otherwise apply to another thread's queries on the same connection.
+        """
+        with self._lock:
+            lock = self._engine_locks.get(engine)
+            if lock is None:
+                lock = self._engine_locks[engine] = threading.Lock()
+            return lock
+
+
+def allows_concurrent_queries(datasource: Datasource[Any, Any]) -> bool:
+    """Whether queries to the datasource can run at once, each on a pooled connection.
+
+    GX runs the queries of SQLite, SQL Server, BigQuery and Databricks on one persistent
+    connection, and the batches of other datasources aren't safe to share between threads.
+    """
+    if not isinstance(datasource, SQLDatasource):
+        return False
+    try:
+        engine = datasource.get_engine()
+    except Exception:
+        # the queries report the datasource's error, one after another
+        LOGGER.debug("datasource_limiter.no_engine", exc_info=True)
+        return False
+    return not runs_on_one_connection(engine)
+
+
+_limiter = DatasourceLimiter()
+
+
+def get_datasource_limiter() -> DatasourceLimiter:
+    """The process-wide DatasourceLimiter."""
+    return _limiter
+
+
+def _reset_after_fork() -> None:
+    # slots held by other threads of the parent would never be released in the child
+    global _limiter  # noqa: PLW0603 # process-wide singleton
+    _limiter = DatasourceLimiter()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
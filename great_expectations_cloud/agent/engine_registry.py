@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+from great_expectations.datasource.fluent import SQLDatasource
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    _PERSISTED_CONNECTION_DIALECTS,
+)
+from sqlalchemy import event
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+
+from great_expectations_cloud.agent.datasource_fingerprint import reveal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from great_expectations.datasource.fluent.interfaces import Datasource
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+    from sqlalchemy.engine import Engine
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+# GX keeps temp tables on one persistent connection for these dialects, so their engines
+# must not be handed to other jobs
+_SINGLE_CONNECTION_DIALECTS: Final[frozenset[str]] = frozenset(
+    dialect.value for dialect in _PERSISTED_CONNECTION_DIALECTS
+)
+# the datasource methods attach() wraps, which must not count as datasource config
+_WRAPPED_METHODS: Final[frozenset[str]] = frozenset({"get_engine", "get_execution_engine"})
+_CONNECT_STARTED: Final[str] = "gx_agent_connect_started"
+
+
+@dataclass
+class EnginePoolStats:
+    """Connection pool usage of one shared SQLAlchemy engine."""
+
+    dialect: str
+    checked_out: int = 0
+    overflow: int = 0
+    checkouts: int = 0
+    connections_opened: int = 0
+    # time spent waiting on the database to open new connections, e.g. for TLS and auth
+    connect_wait_seconds: float = 0.0
+
+
+@dataclass
+class _SharedEngine:
+    engine: Engine
+    last_used: float
+    stats: EnginePoolStats
+
+
+class EngineRegistry:
+    """SQLAlchemy engines shared across jobs, keyed by the resolved datasource connection config.
+
+    Every job loads new Datasource objects, and each would otherwise build its own engine and
+    connection pool. Attaching a datasource to the registry hands it the engine already built
+    for the same connection config, so consecutive jobs against a warehouse reuse its warm
+    connections. Engines that go unused for idle_seconds are disposed.
+
+    Args:
+        idle_seconds: how long an unused engine is kept. 0 disables sharing.
+    """
+
+    def __init__(self, idle_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._idle_seconds = idle_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._engines: dict[str, _SharedEngine] = {}
+
+    def attach(self, datasource: Datasource[Any, Any]) -> None:
+        """Make a SQL datasource use the shared engine for its connection config.
+
+        Other datasources are left alone, as is any datasource whose engine can't be built
+        or shared; those report their errors when they are used, as they would without sharing.
+        """
+        if self._idle_seconds <= 0 or not isinstance(datasource, SQLDatasource):
+            return
+        self.dispose_idle()
+        try:
+            key = _engine_key(datasource)
+            with self._lock:
+                shared = self._engines.get(key)
+            if shared is None:
+                shared = self._add(key, datasource.get_engine())
+            if shared is None:
+                return
+            _use_engine(datasource, shared.engine)
+        except Exception:
+            LOGGER.warning(
+                "engine_pool.attach_failed",
+                extra={"datasource_name": datasource.name},
+                exc_info=True,
+            )
+
+    def get_stats(self) -> dict[str, EnginePoolStats]:
+        """Snapshot of pool usage per shared engine, keyed by a prefix of its config digest."""
+        with self._lock:
+            return {key[:12]: _snapshot(shared) for key, shared in self._engines.items()}
+
+    def dispose_idle(self) -> None:
+        """Dispose engines with no connection checked out for idle_seconds."""
+        now = self._clock()
+        with self._lock:
+            idle = [
+                key
+                for key, shared in self._engines.items()
+                if now - shared.last_used >= self._idle_seconds and _checked_out(shared.engine) == 0
+            ]
+            disposed = [(key, self._engines.pop(key)) for key in idle]
+        for key, shared in disposed:
+            shared.engine.dispose()
+            LOGGER.info(
+                "engine_pool.disposed",
+                extra={"engine_key": key[:12], **vars(_snapshot(shared))},
+            )
+
+    def _add(self, key: str, engine: Engine) -> _SharedEngine | None:
+        if runs_on_one_connection(engine):
+            return None
+        with self._lock:
+            shared = self._engines.get(key)
+            if shared is not None:
+                # another job built an engine for the same config first
+                return shared
+            shared = _SharedEngine(
+                engine=engine,
+                last_used=self._clock(),
+                stats=EnginePoolStats(dialect=engine.dialect.name),
+            )
+            self._engines[key] = shared
+        self._instrument(shared)
+        LOGGER.info(
+            "engine_pool.created", extra={"engine_key": key[:12], "dialect": engine.dialect.name}
+        )
+        return shared
+
+    def _instrument(self, shared: _SharedEngine) -> None:
+        def connect_started(dialect: Any, connection_record: Any, *args: Any) -> None:
+            connection_record.info[_CONNECT_STARTED] = time.perf_counter()
+
+        def connected(dbapi_connection: Any, connection_record: Any) -> None:
+            started = connection_record.info.pop(_CONNECT_STARTED, None)
+            with self._lock:
+                shared.stats.connections_opened += 1
+                if started is not None:
+                    shared.stats.connect_wait_seconds += time.perf_counter() - started
+
+        def used(*args: Any) -> None:
+            with self._lock:
+                shared.last_used = self._clock()
+
+        def checked_out(*args: Any) -> None:
+            with self._lock:
+                shared.stats.checkouts += 1
+                shared.last_used = self._clock()
+
+        event.listen(shared.engine, "do_connect", connect_started)
+        event.listen(shared.engine, "connect", connected)
+        event.listen(shared.engine, "checkout", checked_out)
+        event.listen(shared.engine, "checkin", used)
+
+
+def runs_on_one_connection(engine: Engine) -> bool:
+    """Whether the engine's queries all run on one connection, so they can't overlap."""
+    return engine.dialect.name in _SINGLE_CONNECTION_DIALECTS or isinstance(
+        engine.pool, (StaticPool, SingletonThreadPool)
+    )
+
+
+def _engine_key(datasource: SQLDatasource) -> str:
+    """A digest of the config the datasource builds its engine from, secrets resolved."""
+    serialized = json.dumps(
+        {"type": type(datasource).__name__, "config": _execution_engine_kwargs(datasource)},
+        sort_keys=True,
+        # secrets must count towards the key, or a rotated password would reuse the old engine
+        default=reveal,
+    )
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
+def _execution_engine_kwargs(datasource: SQLDatasource) -> dict[str, Any]:
+    return datasource.dict(
+        exclude=datasource._get_exec_engine_excludes() | _WRAPPED_METHODS,
+        config_provider=datasource._config_provider,
+        exclude_unset=False,
+    )
+
+
+def _use_engine(datasource: SQLDatasource, engine: Engine) -> None:
+    """Wrap the datasource's get_engine() and get_execution_engine() to use a shared engine.
+
+    The execution engine is built once per datasource, since it holds the job's batches. If
+    the datasource config changes, the wrappers are removed and GX's own methods take over.
+    """
+    config = _execution_engine_kwargs(datasource)
+    execution_engine_kwargs = {
+        name: value for name, value in config.items() if name not in ("connection_string", "kwargs")
+    }
+    execution_engines: list[SqlAlchemyExecutionEngine] = []
+
+    def get_engine() -> Engine:
+        if _execution_engine_kwargs(datasource) != config:
+            _detach(datasource)
+            return datasource.get_engine()
+        return engine
+
+    def get_execution_engine() -> SqlAlchemyExecutionEngine:
+        if _execution_engine_kwargs(datasource) != config:
+            _detach(datasource)
+            return datasource.get_execution_engine()
+        if not execution_engines:
+            execution_engines.append(
+                datasource.execution_engine_type(engine=engine, **execution_engine_kwargs)
+            )
+        return execution_engines[0]
+
+    # pydantic only allows fields to be set; these are methods, left out of the datasource's
+    # config by _execution_engine_kwargs() and by GX, which excludes unset values when saving
+    object.__setattr__(datasource, "get_engine", get_engine)
+    object.__setattr__(datasource, "get_execution_engine", get_execution_engine)
+
+
+def _detach(datasource: SQLDatasource) -> None:
+    # GX builds its engines from the datasource's full dict, which must not hold the wrappers
+    for name in _WRAPPED_METHODS:
+        datasource.__dict__.pop(name, None)
+
+
+def _checked_out(engine: Engine) -> int:
+    checkedout = getattr(engine.pool, "checkedout", None)
+    return checkedout() if checkedout else 0
+
+
+def _snapshot(shared: _SharedEngine) -> EnginePoolStats:
+    overflow = getattr(shared.engine.pool, "overflow", None)
+    return EnginePoolStats(
+        **{
+            **vars(shared.stats),
+            "checked_out": _checked_out(shared.engine),
+            "overflow": max(overflow(), 0) if overflow else 0,
+        }
+    )
+
+
+_registry = EngineRegistry(idle_seconds=0)
+
+
+def get_engine_registry() -> EngineRegistry:
+    """The process-wide EngineRegistry. Sharing is off until configured."""
+    return _registry
+
+
+def configure_engine_registry(idle_seconds: float) -> None:
+    """Replace the process-wide EngineRegistry with one keeping engines for idle_seconds."""
+    global _registry  # noqa: PLW0603 # process-wide singleton
+    _registry = EngineRegistry(idle_seconds=idle_seconds)
+
+
+def _reset_registry_after_fork() -> None:
+    # pooled connections must not be shared with a forked worker process; SQLAlchemy's advice
+    # is to drop them in the child without closing them, which would close the parent's too
+    global _registry  # noqa: PLW0603
+    for shared in _registry._engines.values():
+        shared.engine.dispose(close=False)
+    _registry = EngineRegistry(idle_seconds=_registry._idle_seconds)
+
+
+os.register_at_fork(after_in_child=_reset_registry_after_fork)
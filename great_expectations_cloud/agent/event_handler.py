@@ -1,25 +1,31 @@
 from __future__ import annotations
 
+import importlib
 import logging
+import threading
+import time
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, Final
 from uuid import UUID
 
 import great_expectations as gx
+import orjson
 from packaging.version import Version
 from packaging.version import parse as parse_version
 from pydantic import v1 as pydantic_v1
 
 from great_expectations_cloud.agent.actions.unknown import UnknownEventAction
+from great_expectations_cloud.agent.constants import JobWeight
 from great_expectations_cloud.agent.exceptions import GXAgentError
 from great_expectations_cloud.agent.models import (
     DomainContext,
     Event,
     EventType,
     UnknownEvent,
-    get_event_union,
+    get_event_registry,
+    invalidate_event_registry,
 )
 
 if TYPE_CHECKING:
@@ -45,21 +51,122 @@ LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 #     },
 # }
 _EVENT_ACTION_MAP: dict[str, dict[str, type[AgentAction[Any]]]] = defaultdict(dict)
+# Map of event types to the worker lane their actions run on, keyed like _EVENT_ACTION_MAP.
+_EVENT_WEIGHT_MAP: dict[str, dict[str, JobWeight]] = defaultdict(dict)
+
+
+@dataclass(frozen=True)
+class LazyEventAction:
+    """A module that registers the action for an event type when it is imported.
+
+    Attributes:
+        module: dotted path of the module.
+        weight: the worker lane the action runs on, known before the module is imported.
+        expect_ai: whether the module imports the ExpectAI stack (LangChain, OpenAI).
+    """
+
+    module: str
+    weight: JobWeight = JobWeight.HEAVY
+    expect_ai: bool = False
+
+
+# Map of event `type` discriminator values to the modules registering their actions.
+# Built via register_lazy_event_action(). The modules are only imported when the first
+# matching event arrives, so agents don't pay at startup for actions they never run.
+_LAZY_EVENT_ACTION_MAP: dict[str, LazyEventAction] = {}
+# Seconds spent importing each lazily imported module, for the import time report.
+_LAZY_IMPORT_SECONDS: dict[str, float] = {}
+_LAZY_IMPORT_LOCK = threading.Lock()
 
 
 def register_event_action(
-    version: str, event_type: EventType, action_class: type[AgentAction[Any]]
+    version: str,
+    event_type: EventType,
+    action_class: type[AgentAction[Any]],
+    weight: JobWeight | None = None,
 ) -> None:
-    """Register an event type to an action class."""
+    """Register an event type to an action class.
+
+    Actions that are quick and that a user waits on in the UI should be registered as
+    JobWeight.LIGHT, so that they run on the GX Agent's light worker lane. Without a weight,
+    the action runs on the lane its event type was lazily registered with, or as HEAVY.
+    """
     if version in _EVENT_ACTION_MAP and event_type.__name__ in _EVENT_ACTION_MAP[version]:
         raise EventAlreadyRegisteredError(event_type_name=event_type.__name__, version=version)
     event_type_str = event_type.__name__
     _EVENT_ACTION_MAP[version][event_type_str] = action_class
+    if weight is not None:
+        _EVENT_WEIGHT_MAP[version][event_type_str] = weight
+    invalidate_event_registry()
     LOGGER.debug(
         f"Registered event action: {event_type_str} -> {action_class.__name__} (version {version})"
     )
 
 
+def get_event_weight(event: Event) -> JobWeight:
+    """Get the weight an event's action was registered with."""
+    weight_map = _EVENT_WEIGHT_MAP.get(_GX_MAJOR_VERSION, {})
+    weight = weight_map.get(_get_event_name(event))
+    if weight is not None:
+        return weight
+    lazy_action = _LAZY_EVENT_ACTION_MAP.get(event.type)
+    return lazy_action.weight if lazy_action is not None else JobWeight.HEAVY
+
+
+def register_lazy_event_action(
+    event_type: EventType,
+    module: str,
+    weight: JobWeight = JobWeight.HEAVY,
+    expect_ai: bool = False,
+) -> None:
+    """Register a module to import, registering its action, when an event type first arrives.
+
+    The module must call register_event_action() for the event when it is imported, without
+    a weight: the weight registered here is the one the action runs with.
+    """
+    _LAZY_EVENT_ACTION_MAP[event_type.__fields__["type"].default] = LazyEventAction(
+        module=module, weight=weight, expect_ai=expect_ai
+    )
+
+
+def import_event_action(event_type: str) -> None:
+    """Import the module registered for an event type, if it isn't imported yet."""
+    lazy_action = _LAZY_EVENT_ACTION_MAP.get(event_type)
+    if lazy_action is None:
+        return
+    with _LAZY_IMPORT_LOCK:
+        if lazy_action.module in _LAZY_IMPORT_SECONDS:
+            return
+        start = time.perf_counter()
+        importlib.import_module(lazy_action.module)
+        import_seconds = time.perf_counter() - start
+        _LAZY_IMPORT_SECONDS[lazy_action.module] = import_seconds
+    LOGGER.info(
+        "event_action.imported",
+        extra={
+            "event_type": event_type,
+            "action_module": lazy_action.module,
+            "import_seconds": round(import_seconds, 3),
+        },
+    )
+
+
+def preload_event_actions(include_expect_ai: bool) -> None:
+    """Import the modules for every lazily registered event type up front.
+
+    Used before forking prefork worker processes, so workers share warm imports.
+    """
+    for event_type, lazy_action in list(_LAZY_EVENT_ACTION_MAP.items()):
+        if include_expect_ai or not lazy_action.expect_ai:
+            import_event_action(event_type)
+
+
+def get_import_report() -> dict[str, float]:
+    """Seconds spent importing each lazily imported action module so far."""
+    with _LAZY_IMPORT_LOCK:
+        return dict(_LAZY_IMPORT_SECONDS)
+
+
 class EventHandler:
     """
     Core business logic mapping events to actions.
@@ -78,10 +185,14 @@ class EventHandler:
             # Making message more generic
             raise GXAgentError("Unable to process job. Invalid input.")  # noqa: TRY003
 
+        event_name = _get_event_name(event)
+        if event_name not in _EVENT_ACTION_MAP.get(_GX_MAJOR_VERSION, {}):
+            # importing the action's module registers it
+            import_event_action(event.type)
         action_map = _EVENT_ACTION_MAP.get(_GX_MAJOR_VERSION)
         if action_map is None:
             raise NoVersionImplementationError(version=_GX_MAJOR_VERSION)
-        action_class = action_map.get(_get_event_name(event))
+        action_class = action_map.get(event_name)
         if action_class is None:
             action_class = UnknownEventAction
         return action_class(
@@ -108,14 +219,27 @@ class EventHandler:
 
     @classmethod
     def parse_event_from(cls, msg_body: bytes) -> Event:
-        event_union = get_event_union()
+        # Look up the model by its `type` discriminator instead of validating against
+        # the whole Event union: one JSON decode plus one model validation per message.
         try:
-            event: Event = pydantic_v1.parse_raw_as(event_union, msg_body)
-        except (pydantic_v1.ValidationError, JSONDecodeError):
+            payload = orjson.loads(msg_body)
+        except orjson.JSONDecodeError:
             # Log as bytes
             LOGGER.exception("Unable to parse event type", extra={"msg_body": f"{msg_body!r}"})
             return UnknownEvent()
 
+        event_type = payload.get("type") if isinstance(payload, dict) else None
+        event_class = get_event_registry().get(event_type) if isinstance(event_type, str) else None
+        if event_class is None:
+            LOGGER.error("Unable to parse event type", extra={"msg_body": f"{msg_body!r}"})
+            return UnknownEvent()
+
+        try:
+            event: Event = event_class.parse_obj(payload)  # type: ignore[assignment] # the registry only holds Event classes
+        except pydantic_v1.ValidationError:
+            LOGGER.exception("Unable to parse event type", extra={"msg_body": f"{msg_body!r}"})
+            return UnknownEvent()
+
         return event
 
     @staticmethod
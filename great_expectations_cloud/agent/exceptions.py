@@ -3,6 +3,8 @@ from __future__ import annotations
 from enum import StrEnum
 from typing import NoReturn
 
+from typing_extensions import override
+
 
 def raise_with_error_code(e: Exception, error_code: ErrorCode) -> NoReturn:
     """Raise a GXCoreError with the given error_code and the message from the given exception.
@@ -41,3 +43,46 @@ class GXAgentConfigError(GXAgentError): ...
 
 
 class GXAgentUnrecoverableConnectionError(GXAgentError): ...
+
+
+class GXAgentWorkerProcessError(GXAgentError):
+    """An error raised by a job running in a prefork worker process.
+
+    Exceptions raised by GX or database drivers are not guaranteed to be picklable, so the
+    worker process converts them into this error before handing them back to the parent.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        error_type: str,
+        error_code: str | None = None,
+        error_params: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(message)
+        self.message = message
+        self.error_type = error_type
+        self.error_code = error_code
+        self.error_params = error_params or {}
+
+    @override
+    def __reduce__(self) -> tuple[type[GXAgentWorkerProcessError], tuple[object, ...]]:
+        return (
+            self.__class__,
+            (self.message, self.error_type, self.error_code, self.error_params),
+        )
+
+    @classmethod
+    def from_exception(cls, error: BaseException) -> GXAgentWorkerProcessError:
+        if isinstance(error, GXCoreError):
+            return cls(
+                message=str(error),
+                error_type=type(error).__name__,
+                error_code=error.error_code,
+                error_params=error.get_error_params(),
+            )
+        return cls(message=str(error), error_type=type(error).__name__)
+
+
+class GXAgentQueryCancelledError(GXAgentError):
+    """A SQL statement was not run because the work it belongs to was cancelled."""
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
-from asyncio import gather
+from asyncio import Semaphore, gather, to_thread
 from collections.abc import Mapping
-from typing import TYPE_CHECKING
+from contextlib import AbstractContextManager, nullcontext
+from functools import cache
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 from great_expectations import ExpectationSuite
@@ -23,6 +25,14 @@ from langgraph.types import Send
 from openai import APIConnectionError, APITimeoutError
 from pydantic import BaseModel, ConfigDict
 
+from great_expectations_cloud.agent.cloud_client import (
+    get_job_correlation_id,
+    set_job_correlation_id,
+)
+from great_expectations_cloud.agent.datasource_limiter import (
+    allows_concurrent_queries,
+    get_datasource_limiter,
+)
 from great_expectations_cloud.agent.expect_ai.asset_review_agent.prompts import (
     EXPECTATION_ASSISTANT_SYSTEM_MESSAGE,
     EXPECTATION_BUILDER_SYSTEM_MESSAGE,
@@ -46,16 +56,26 @@ from great_expectations_cloud.agent.expect_ai.exceptions import (
     InvalidResponseTypeError,
     MissingDataQualityPlanError,
 )
-from great_expectations_cloud.agent.expect_ai.expectations import AddExpectationsResponse
+from great_expectations_cloud.agent.expect_ai.expectations import (
+    AddExpectationsResponse,
+    OpenAIGXExpectation,
+)
 from great_expectations_cloud.agent.expect_ai.graphs.expectation_checker import (
     ExpectationChecker,
     ExpectationCheckerInput,
     get_dialect_constraint_message,
 )
+from great_expectations_cloud.agent.expect_ai.graphs.job_node import JOB_NODES, JobNode
 from great_expectations_cloud.agent.expect_ai.nodes.PlannerNode import PlannerNode
 
 if TYPE_CHECKING:
+    from threading import BoundedSemaphore
+
+    from great_expectations.metrics.metric import Metric
+    from langchain_core.tools import Tool
+
     from great_expectations_cloud.agent.analytics import AgentAnalytics
+    from great_expectations_cloud.agent.expect_ai.graphs.job_node import Node
     from great_expectations_cloud.agent.expect_ai.metric_service import MetricService
     from great_expectations_cloud.agent.expect_ai.tools.metrics import AgentToolsManager
     from great_expectations_cloud.agent.expect_ai.tools.query_runner import QueryRunner
@@ -64,6 +84,10 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 MAX_PLAN_DEPTH = 3
+# metric tools run at once against one data source, each blocking on a query to it
+MAX_CONCURRENT_METRIC_TOOLS = 4
+# potential expectations checked at once, each compiling its query and possibly rewriting it
+MAX_CONCURRENT_EXPECTATION_CHECKS = 5
 
 
 ToolCallLike = ToolCall | dict[str, object]
@@ -98,11 +122,19 @@ class AssetReviewAgent:
         query_runner: QueryRunner,
         metric_service: MetricService,
         analytics: AgentAnalytics | None = None,
+        max_concurrent_checks: int = MAX_CONCURRENT_EXPECTATION_CHECKS,
     ):
         self._tools_manager = tools_manager
         self._query_runner = query_runner
         self._metric_service = metric_service
         self._analytics = analytics
+        self._max_concurrent_checks = max_concurrent_checks
+        self._expectation_checker_subgraph = ExpectationChecker.shared_graph()
+        # built once per job, so that the checks of a job share its nodes' caches
+        self._expectation_checker_nodes = ExpectationChecker(
+            query_runner=self._query_runner,
+            analytics=self._analytics,
+        ).job_nodes()
 
     async def arun(
         self,
@@ -123,6 +155,7 @@ class AssetReviewAgent:
                     "thread_id": thread_id,
                     "temperature": temperature,
                     "seed": seed,
+                    JOB_NODES: self._job_nodes(),
                 },
                 "recursion_limit": 30,
             },
@@ -145,7 +178,8 @@ class AssetReviewAgent:
         GenerateExpectationsInput,
         GenerateExpectationsOutput,
     ]:
-        return self._get_graph_builder().compile()
+        # LangGraph Studio doesn't pass the job's nodes, so its graph is built with them
+        return _graph_builder(self._job_nodes()).compile()
 
     def _build_agent_graph(
         self,
@@ -155,86 +189,130 @@ class AssetReviewAgent:
         GenerateExpectationsInput,
         GenerateExpectationsOutput,
     ]:
-        builder = self._get_graph_builder()
-        return builder.compile()
+        return _shared_graph()
 
-    def _get_graph_builder(
-        self,
-    ) -> StateGraph[
-        GenerateExpectationsState,
-        GenerateExpectationsConfig,
-        GenerateExpectationsInput,
-        GenerateExpectationsOutput,
-    ]:
-        self._expectation_checker_subgraph = ExpectationChecker(
-            query_runner=self._query_runner,
-            analytics=self._analytics,
-        ).graph()
-
-        builder = StateGraph(
-            state_schema=GenerateExpectationsState,
-            context_schema=GenerateExpectationsConfig,
-            input_schema=GenerateExpectationsInput,
-            output_schema=GenerateExpectationsOutput,
-        )
-        builder.add_node(
-            "planner",
-            PlannerNode(
+    def _job_nodes(self) -> dict[str, Node]:
+        """The nodes the shared graph runs for this job, which hold its services."""
+        return {
+            "planner": PlannerNode(
                 tools_manager=self._tools_manager,
                 metric_service=self._metric_service,
             ),
-        )
-        builder.add_node(
-            "expectation_assistant",
-            ExpectationAssistantNode(tools_manager=self._tools_manager),
-        )
-        builder.add_node("metric_provider", MetricProviderNode(tools_manager=self._tools_manager))
-        builder.add_node("quality_issue_summarizer", QualityIssueSummarizerNode())
-        builder.add_node(
-            "expectation_builder",
-            ExpectationBuilderNode(
+            "expectation_assistant": ExpectationAssistantNode(tools_manager=self._tools_manager),
+            "metric_provider": MetricProviderNode(tools_manager=self._tools_manager),
+            "expectation_builder": ExpectationBuilderNode(
                 sql_tools_manager=self._query_runner,
                 templated_system_message=EXPECTATION_BUILDER_SYSTEM_MESSAGE,
                 task_human_message=EXPECTATION_BUILDER_TASK_MESSAGE,
             ),
-        )
-        builder.add_node("expectation_checker", self._invoke_expectation_checker)
-        builder.add_edge(START, "planner")
-        builder.add_edge("planner", "expectation_assistant")
-        builder.add_conditional_edges(
-            "expectation_assistant",
-            tools_condition,
-            ["metric_provider", "quality_issue_summarizer", "expectation_assistant"],
-        )
-        builder.add_conditional_edges(
-            "quality_issue_summarizer",
-            expectation_builder_fanout,
-            ["expectation_builder"],
-        )
-        builder.add_edge("metric_provider", "expectation_assistant")
-        builder.add_edge("expectation_builder", "expectation_checker")
-        builder.add_edge("expectation_checker", END)
-        return builder
+            "expectation_checker": self._invoke_expectation_checker,
+        }
 
     async def _invoke_expectation_checker(
         self, state: GenerateExpectationsState, config: RunnableConfig
     ) -> GenerateExpectationsOutput:
-        expectations = []
-        for expectation in state.potential_expectations:
+        # Each check may wait on the data source and on several LLM rewrites, so the potential
+        # expectations are checked concurrently. gather keeps them in their original order.
+        semaphore = Semaphore(self._max_concurrent_checks)
+        # the subgraph shares this graph's config, whose job nodes are the agent's
+        checker_config: RunnableConfig = {
+            **config,
+            "configurable": {
+                **config["configurable"],
+                JOB_NODES: self._expectation_checker_nodes,
+            },
+        }
+
+        async def _check(expectation: OpenAIGXExpectation) -> dict[str, Any]:
             checker_input = ExpectationCheckerInput(
                 expectation=expectation,
                 data_source_name=state.data_source_name,
                 data_asset_name=state.data_asset_name,
             )
-            result = await self._expectation_checker_subgraph.ainvoke(checker_input, config=config)
-            if result.get("error") is None:
-                expectations.append(result["expectation"])
+            async with semaphore:
+                return await self._expectation_checker_subgraph.ainvoke(
+                    checker_input, config=checker_config
+                )
+
+        results = await gather(*(_check(e) for e in state.potential_expectations))
+        expectations = [result["expectation"] for result in results if result.get("error") is None]
 
         return GenerateExpectationsOutput(
             expectations=expectations, metrics=state.collected_metrics
         )
 
 
+# the nodes holding a job's services, run by the shared graph from the runnable config
+_JOB_NODE_NAMES = (
+    "planner",
+    "expectation_assistant",
+    "metric_provider",
+    "expectation_builder",
+    "expectation_checker",
+)
+
+
+@cache
+def _shared_graph() -> CompiledStateGraph[
+    GenerateExpectationsState,
+    GenerateExpectationsConfig,
+    GenerateExpectationsInput,
+    GenerateExpectationsOutput,
+]:
+    """The agent's graph, compiled once per process and run by every job with its own nodes."""
+    return _graph_builder({name: JobNode(name) for name in _JOB_NODE_NAMES}).compile()
+
+
+def _graph_builder(
+    nodes: Mapping[str, Node],
+) -> StateGraph[
+    GenerateExpectationsState,
+    GenerateExpectationsConfig,
+    GenerateExpectationsInput,
+    GenerateExpectationsOutput,
+]:
+    builder = StateGraph(
+        state_schema=GenerateExpectationsState,
+        context_schema=GenerateExpectationsConfig,
+        input_schema=GenerateExpectationsInput,
+        output_schema=GenerateExpectationsOutput,
+    )
+    builder.add_node("planner", nodes["planner"], input_schema=GenerateExpectationsInput)
+    builder.add_node(
+        "expectation_assistant",
+        nodes["expectation_assistant"],
+        input_schema=GenerateExpectationsState,
+    )
+    builder.add_node(
+        "metric_provider", nodes["metric_provider"], input_schema=GenerateExpectationsState
+    )
+    builder.add_node("quality_issue_summarizer", QualityIssueSummarizerNode())
+    builder.add_node(
+        "expectation_builder", nodes["expectation_builder"], input_schema=ExpectationBuilderState
+    )
+    builder.add_node(
+        "expectation_checker",
+        nodes["expectation_checker"],
+        input_schema=GenerateExpectationsState,
+    )
+    builder.add_edge(START, "planner")
+    builder.add_edge("planner", "expectation_assistant")
+    builder.add_conditional_edges(
+        "expectation_assistant",
+        tools_condition,
+        ["metric_provider", "quality_issue_summarizer", "expectation_assistant"],
+    )
+    builder.add_conditional_edges(
+        "quality_issue_summarizer",
+        expectation_builder_fanout,
+        ["expectation_builder"],
+    )
+    builder.add_edge("metric_provider", "expectation_assistant")
+    builder.add_edge("expectation_builder", "expectation_checker")
+    builder.add_edge("expectation_checker", END)
+    return builder
+
+
 class ExpectationAssistantNode:
     def __init__(self, tools_manager: AgentToolsManager):
         self._tools_manager = tools_manager
@@ -289,8 +367,13 @@ class ExpectationAssistantNode:
 
 
 class MetricProviderNode:
-    def __init__(self, tools_manager: AgentToolsManager):
+    def __init__(
+        self,
+        tools_manager: AgentToolsManager,
+        max_concurrent_metrics: int = MAX_CONCURRENT_METRIC_TOOLS,
+    ):
         self._tools_manager = tools_manager
+        self._max_concurrent_metrics = max_concurrent_metrics
 
     async def __call__(
         self, state: GenerateExpectationsState, config: RunnableConfig
@@ -314,7 +397,19 @@ class MetricProviderNode:
             )
         }
 
-        # Execute all tool calls concurrently for speed
+        # The tools are synchronous and block on the data source, so they run on worker threads.
+        # Where the data source takes queries on pooled connections, they run concurrently,
+        # capped per data source across every job of the process; otherwise one after another.
+        # The MetricService still computes on the batch they share one call at a time.
+        datasource_slots = self._get_datasource_slots(state)
+        slots: AbstractContextManager[Any] = datasource_slots or nullcontext()
+        correlation_id = get_job_correlation_id()
+
+        def _compute(tool: Tool, args: dict[str, Any]) -> Any:
+            set_job_correlation_id(correlation_id)
+            with slots:
+                return tool.func(**args) if tool.func is not None else None
+
         async def _run_tool(tool_call: ToolCall) -> ToolMessage:
             tool_name, tool_args, tool_id = _toolcall_triplet(tool_call)
             tool = tools_by_name[tool_name]
@@ -324,7 +419,7 @@ class MetricProviderNode:
                 **tool_args,
             }
             logger.debug(f"Getting metric {tool.name}: {tool_args!s}")
-            observation = tool.func(**args) if tool.func is not None else None
+            observation = await to_thread(_compute, tool, args)
             if observation is None:
                 observation = "METRIC FAILED\nMetric: {tool.name}\nError: tool has no function"
             if "Could not compute metric" in str(observation):
@@ -346,7 +441,16 @@ class MetricProviderNode:
             state.executed_tool_signatures.add(signature)
             return ToolMessage(content=str(observation), tool_call_id=tool_id)
 
-        tool_msgs = await gather(*(_run_tool(tc) for tc in (state.messages[-1].tool_calls or [])))
+        tool_calls = state.messages[-1].tool_calls or []
+        # The metrics of the whole batch of tool calls are computed in one pass over the data,
+        # so that each tool only reads its metric's result.
+        metrics = self._get_metrics(tool_calls)
+        if len(metrics) > 1:
+            await to_thread(self._compute_metrics, state, metrics, correlation_id, slots)
+        if datasource_slots is not None:
+            tool_msgs = await gather(*(_run_tool(tc) for tc in tool_calls))
+        else:
+            tool_msgs = [await _run_tool(tc) for tc in tool_calls]
         result.extend(tool_msgs)
         # track execution count
         state.executed_tool_calls = state.executed_tool_calls + len(tool_msgs)
@@ -359,6 +463,41 @@ class MetricProviderNode:
         )
         return {"messages": result}
 
+    def _get_datasource_slots(self, state: GenerateExpectationsState) -> BoundedSemaphore | None:
+        """The data source's slots for metric tools, or None if they must run one after another."""
+        datasource = state.batch_definition.data_asset.datasource
+        if self._max_concurrent_metrics > 1 and allows_concurrent_queries(datasource):
+            return get_datasource_limiter().slots(datasource, self._max_concurrent_metrics)
+        return None
+
+    def _get_metrics(self, tool_calls: list[ToolCall]) -> list[Metric[Any]]:
+        metrics: list[Metric[Any]] = []
+        for tc in tool_calls:
+            tool_name, tool_args, _ = _toolcall_triplet(tc)
+            metric = self._tools_manager.get_metric(tool_name, tool_args)
+            if metric is not None:
+                metrics.append(metric)
+        return metrics
+
+    def _compute_metrics(
+        self,
+        state: GenerateExpectationsState,
+        metrics: list[Metric[Any]],
+        correlation_id: str | None,
+        slots: AbstractContextManager[Any],
+    ) -> None:
+        set_job_correlation_id(correlation_id)
+        try:
+            with slots:
+                self._tools_manager.compute_metrics(
+                    batch_definition=state.batch_definition,
+                    batch_parameters=state.batch_parameters,
+                    metrics=metrics,
+                )
+        except Exception:
+            # each tool then computes its metric on its own, and reports its error
+            logger.warning("metric_batch.failed", exc_info=True)
+
 
 class QualityIssueSummarizerNode:
     async def __call__(
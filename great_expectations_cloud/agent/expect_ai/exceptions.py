@@ -86,3 +86,15 @@ class InvalidBatchDefinitionError(AgentError, TypeError):
             expected_type: The type that was expected.
         """
         super().__init__(f"Expected {expected_type.__name__}, got {received_type}")
+
+
+class MissingJobNodeError(AgentError):
+    """Raised when a graph shared by every job runs without the job's node."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the exception with the name of the missing node.
+
+        Args:
+            name: The name of the node missing from the runnable config.
+        """
+        super().__init__(f"No job node named {name} in the runnable config.")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from asyncio import to_thread
+from functools import cache
 from typing import TYPE_CHECKING, Annotated, Final
 
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -14,6 +16,10 @@ from pydantic import ValidationError as PydanticV2ValidationError
 from pydantic.v1 import ValidationError as PydanticV1ValidationError
 
 from great_expectations_cloud.agent.analytics import AgentAnalytics, RejectionReason
+from great_expectations_cloud.agent.cloud_client import (
+    get_job_correlation_id,
+    set_job_correlation_id,
+)
 from great_expectations_cloud.agent.expect_ai.config import OPENAI_MODEL
 from great_expectations_cloud.agent.expect_ai.exceptions import (
     InvalidExpectationTypeError,
@@ -23,8 +29,12 @@ from great_expectations_cloud.agent.expect_ai.expectations import (
     OpenAIGXExpectation,
     UnexpectedRowsExpectation,
 )
+from great_expectations_cloud.agent.expect_ai.graphs.job_node import JobNode
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from great_expectations_cloud.agent.expect_ai.graphs.job_node import Node
     from great_expectations_cloud.agent.expect_ai.tools.query_runner import QueryRunner
 
 LOGGER = logging.getLogger(__name__)
@@ -94,6 +104,33 @@ class ExpectationChecker:
         self,
     ) -> CompiledStateGraph[
         ExpectationCheckerState, None, ExpectationCheckerInput, ExpectationCheckerOutput
+    ]:
+        return self._graph_builder(self.job_nodes()).compile()
+
+    def job_nodes(self) -> dict[str, Node]:
+        """The nodes to run shared_graph with, under configurable[JOB_NODES]."""
+        return {
+            "expectation_checker": ExpectationCheckerNode(
+                sql_tools_manager=self._query_runner, analytics=self._analytics
+            ),
+            "query_rewriter": QueryRewriterNode(sql_tools_manager=self._query_runner),
+        }
+
+    @staticmethod
+    @cache
+    def shared_graph() -> CompiledStateGraph[
+        ExpectationCheckerState, None, ExpectationCheckerInput, ExpectationCheckerOutput
+    ]:
+        """The checker graph compiled once per process, running the nodes in the runnable config."""
+        return ExpectationChecker._graph_builder(
+            {name: JobNode(name) for name in ("expectation_checker", "query_rewriter")}
+        ).compile()
+
+    @staticmethod
+    def _graph_builder(
+        nodes: Mapping[str, Node],
+    ) -> StateGraph[
+        ExpectationCheckerState, None, ExpectationCheckerInput, ExpectationCheckerOutput
     ]:
         builder = StateGraph(
             state_schema=ExpectationCheckerState,
@@ -102,16 +139,19 @@ class ExpectationChecker:
         )
         builder.add_node(
             "expectation_checker",
-            ExpectationCheckerNode(sql_tools_manager=self._query_runner, analytics=self._analytics),
+            nodes["expectation_checker"],
+            input_schema=ExpectationCheckerState,
         )
-        builder.add_node("query_rewriter", QueryRewriterNode(sql_tools_manager=self._query_runner))
+        builder.add_node("query_rewriter", nodes["query_rewriter"], input_schema=QueryRewriterInput)
 
         builder.add_conditional_edges(
-            "expectation_checker", self._query_rewriter_or_end, ["query_rewriter", END]
+            "expectation_checker",
+            ExpectationChecker._query_rewriter_or_end,
+            ["query_rewriter", END],
         )
         builder.add_edge(START, "expectation_checker")
         builder.add_edge("query_rewriter", "expectation_checker")
-        return builder.compile()
+        return builder
 
     @staticmethod
     def _query_rewriter_or_end(state: ExpectationCheckerState) -> str:
@@ -217,8 +257,12 @@ class ExpectationCheckerNode:
             )
 
         query_text = state.expectation.query.replace("{batch}", state.data_asset_name)
-        (success, error) = self._sql_tools_manager.check_query_compiles(
-            data_source_name=state.data_source_name, query_text=query_text
+        # off the event loop, so that expectations checked concurrently compile concurrently
+        (success, error) = await to_thread(
+            self._check_query_compiles,
+            get_job_correlation_id(),
+            state.data_source_name,
+            query_text,
         )
 
         if success:
@@ -232,6 +276,14 @@ class ExpectationCheckerNode:
             expectation=state.expectation,
         )
 
+    def _check_query_compiles(
+        self, correlation_id: str | None, data_source_name: str, query_text: str
+    ) -> tuple[bool, str | None]:
+        set_job_correlation_id(correlation_id)
+        return self._sql_tools_manager.check_query_compiles(
+            data_source_name=data_source_name, query_text=query_text
+        )
+
     def _error_for_output(self, state: ExpectationCheckerState, error: str | None) -> str | None:
         """Hack to get force langgraph's state management to allow us to overwrite non-None with None.
 
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Final, Protocol
+
+from langchain_core.runnables import RunnableConfig  # noqa: TC002
+
+from great_expectations_cloud.agent.expect_ai.exceptions import MissingJobNodeError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Mapping
+
+
+# the configurable key holding a job's nodes, by node name
+JOB_NODES: Final[str] = "job_nodes"
+
+
+class Node(Protocol):
+    """An agent graph node."""
+
+    def __call__(self, state: Any, config: RunnableConfig) -> Awaitable[Any]: ...
+
+
+class JobNode:
+    """A node of a graph compiled once per process, running the job's node of the same name.
+
+    The agents' nodes hold the services of one job, such as its MetricService and QueryRunner,
+    so a graph built from them can't be shared by the next job. Graphs built from JobNodes are:
+    each job passes its nodes in the runnable config, under configurable[JOB_NODES].
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    async def __call__(self, state: Any, config: RunnableConfig) -> Any:
+        nodes: Mapping[str, Node] = config["configurable"].get(JOB_NODES, {})
+        node = nodes.get(self._name)
+        if node is None:
+            raise MissingJobNodeError(self._name)
+        return await node(state, config)
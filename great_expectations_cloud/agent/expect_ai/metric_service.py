@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from great_expectations.metrics.metric_results import (
@@ -8,11 +10,18 @@ from great_expectations.metrics.metric_results import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from great_expectations.core.batch_definition import PartitionerT
     from great_expectations.data_context import CloudDataContext
     from great_expectations.datasource.fluent import BatchDefinition, Datasource
-    from great_expectations.datasource.fluent.interfaces import _DataAssetT, _ExecutionEngineT
+    from great_expectations.datasource.fluent.interfaces import (
+        Batch,
+        _DataAssetT,
+        _ExecutionEngineT,
+    )
     from great_expectations.metrics.metric import Metric
+    from great_expectations.validator.metric_configuration import MetricConfigurationID
 
     from great_expectations_cloud.agent.expect_ai.asset_review_agent.state import BatchParameters
 
@@ -25,9 +34,49 @@ class MetricNotComputableError(Exception):
         super().__init__(f"Could not compute metric: {message}")
 
 
+@dataclass(frozen=True)
+class MetricCacheStats:
+    """How often a MetricService reused a MetricResult rather than computing it."""
+
+    hits: int
+    misses: int
+
+
+@dataclass
+class _CachedBatch:
+    batch: Batch
+    # GX computes a batch's metrics on its execution engine, whose batch manager and metric
+    # cache aren't safe to use from several threads at once
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
 class MetricService:
+    """Computes metrics for the batches of one job.
+
+    The batches and the MetricResults are cached for the life of the service, which is created
+    per job: the agents often ask for the same metric more than once across turns. Failed
+    metrics are not cached, so they are computed again if asked for.
+
+    The service may be called from several threads. Each batch is loaded once, and computes
+    one call's metrics at a time.
+    """
+
     def __init__(self, context: CloudDataContext):
         self._context = context
+        self._lock = threading.Lock()
+        # held while a batch is loaded, so that callers asking for it at once load it once
+        self._loading = threading.Lock()
+        self._batches: dict[tuple[Any, ...], _CachedBatch] = {}
+        self._results: dict[MetricConfigurationID, MetricResult[Any]] = {}
+        # results computed by compute_metric_results that nothing has asked for yet
+        self._unclaimed: set[MetricConfigurationID] = set()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def cache_stats(self) -> MetricCacheStats:
+        with self._lock:
+            return MetricCacheStats(hits=self._hits, misses=self._misses)
 
     def get_data_source(self, data_source_name: str) -> Datasource[_DataAssetT, _ExecutionEngineT]:
         return self._context.data_sources.get(data_source_name)
@@ -42,8 +91,84 @@ class MetricService:
 
         Returns the MetricResult associated with the Metric, or a MetricErrorResult if the Metric computation failed.
         """
-        batch = batch_definition.get_batch(batch_parameters=batch_parameters)
-        return batch.compute_metrics(metric)
+        cached_batch = self._get_batch(batch_definition, batch_parameters)
+        metric_id = metric.metric_id_for_batch(cached_batch.batch.id)
+        cached = self._claim(metric_id)
+        if cached is not None:
+            return cached  # type: ignore[return-value] # cached under this metric's id
+        with cached_batch.lock:
+            # another caller may have computed it while this one waited for the batch
+            cached = self._claim(metric_id)
+            if cached is not None:
+                return cached  # type: ignore[return-value] # cached under this metric's id
+            with self._lock:
+                self._misses += 1
+            result = cached_batch.batch.compute_metrics(metric)
+            if not isinstance(result, MetricErrorResult):
+                with self._lock:
+                    self._results[metric_id] = result
+        return result
+
+    def _claim(self, metric_id: MetricConfigurationID) -> MetricResult[Any] | None:
+        """The cached MetricResult of the metric, counted as reused or not, or None."""
+        with self._lock:
+            cached = self._results.get(metric_id)
+            if cached is None:
+                return None
+            if metric_id in self._unclaimed:
+                # computed ahead of this request, not reused
+                self._unclaimed.discard(metric_id)
+                self._misses += 1
+            else:
+                self._hits += 1
+            return cached
+
+    def compute_metric_results(
+        self,
+        batch_definition: BatchDefinition[PartitionerT],
+        metrics: Sequence[Metric[Any]],
+        batch_parameters: BatchParameters | None,
+    ) -> None:
+        """Compute the metrics not cached yet with one compute_metrics call, caching their results.
+
+        The execution engine can bundle compatible aggregates of one call into a single query,
+        where computing the metrics one at a time would scan the batch for each of them.
+        get_metric_result then returns the results.
+        """
+        cached_batch = self._get_batch(batch_definition, batch_parameters)
+        with cached_batch.lock:
+            missing: dict[MetricConfigurationID, Metric[Any]] = {}
+            with self._lock:
+                for metric in metrics:
+                    metric_id = metric.metric_id_for_batch(cached_batch.batch.id)
+                    if metric_id not in self._results:
+                        missing.setdefault(metric_id, metric)
+            if not missing:
+                return
+            results = cached_batch.batch.compute_metrics(list(missing.values()))
+            with self._lock:
+                for metric_id, result in zip(missing, results, strict=True):
+                    if not isinstance(result, MetricErrorResult):
+                        self._results[metric_id] = result
+                        self._unclaimed.add(metric_id)
+
+    def _get_batch(
+        self,
+        batch_definition: BatchDefinition[PartitionerT],
+        batch_parameters: BatchParameters | None,
+    ) -> _CachedBatch:
+        key = (
+            batch_definition.data_asset.datasource.name,
+            batch_definition.data_asset.name,
+            batch_definition.name,
+            tuple(sorted((batch_parameters or {}).items())),
+        )
+        with self._loading:
+            cached_batch = self._batches.get(key)
+            if cached_batch is None:
+                batch = batch_definition.get_batch(batch_parameters=batch_parameters)
+                cached_batch = self._batches[key] = _CachedBatch(batch)
+            return cached_batch
 
     def get_metric_value(
         self,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
@@ -7,6 +8,7 @@ from great_expectations.expectations import UnexpectedRowsExpectation
 from langgraph.constants import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 
+from great_expectations_cloud.agent.expect_ai.graphs.job_node import JOB_NODES, JobNode
 from great_expectations_cloud.agent.expect_ai.sql_expectation_agent.nodes import (
     QueryRewriterNode,
     SqlGeneratorNode,
@@ -21,6 +23,9 @@ from great_expectations_cloud.agent.expect_ai.sql_expectation_agent.state import
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from great_expectations_cloud.agent.expect_ai.graphs.job_node import Node
     from great_expectations_cloud.agent.expect_ai.metric_service import MetricService
     from great_expectations_cloud.agent.expect_ai.tools.query_runner import QueryRunner
 
@@ -60,6 +65,7 @@ class SqlExpectationAgent:
                     "thread_id": thread_id,
                     "temperature": temperature,
                     "seed": seed,
+                    JOB_NODES: self._job_nodes(),
                 },
             },
         )
@@ -74,63 +80,75 @@ class SqlExpectationAgent:
     ) -> CompiledStateGraph[
         SqlExpectationState, SqlExpectationConfig, SqlExpectationInput, SqlExpectationOutput
     ]:
-        builder = self._get_graph_builder()
-        return builder.compile()
-
-    def _get_graph_builder(
-        self,
-    ) -> StateGraph[
-        SqlExpectationState, SqlExpectationConfig, SqlExpectationInput, SqlExpectationOutput
-    ]:
-        builder = StateGraph(
-            state_schema=SqlExpectationState,
-            context_schema=SqlExpectationConfig,
-            input_schema=SqlExpectationInput,
-            output_schema=SqlExpectationOutput,
-        )
+        return _shared_graph()
 
-        builder.add_node(
-            PLANNER_NODE,
-            SqlPlannerNode(
+    def _job_nodes(self) -> dict[str, Node]:
+        """The nodes the shared graph runs for this job, which hold its services."""
+        return {
+            PLANNER_NODE: SqlPlannerNode(
                 metric_service=self._metric_service,
             ),
-        )
-
-        builder.add_node(
-            SQL_GENERATOR_NODE,
-            SqlGeneratorNode(query_runner=self._query_runner),
-        )
-
-        builder.add_node(
-            SQL_VALIDATOR_NODE,
-            SqlValidatorNode(
+            SQL_GENERATOR_NODE: SqlGeneratorNode(query_runner=self._query_runner),
+            SQL_VALIDATOR_NODE: SqlValidatorNode(
                 query_runner=self._query_runner,
                 metric_service=self._metric_service,
             ),
-        )
+            QUERY_REWRITER_NODE: QueryRewriterNode(query_runner=self._query_runner),
+        }
+
+
+@cache
+def _shared_graph() -> CompiledStateGraph[
+    SqlExpectationState, SqlExpectationConfig, SqlExpectationInput, SqlExpectationOutput
+]:
+    """The agent's graph, compiled once per process and run by every job with its own nodes."""
+    job_nodes = (PLANNER_NODE, SQL_GENERATOR_NODE, SQL_VALIDATOR_NODE, QUERY_REWRITER_NODE)
+    return _graph_builder({name: JobNode(name) for name in job_nodes}).compile()
+
+
+def _graph_builder(
+    nodes: Mapping[str, Node],
+) -> StateGraph[
+    SqlExpectationState, SqlExpectationConfig, SqlExpectationInput, SqlExpectationOutput
+]:
+    builder = StateGraph(
+        state_schema=SqlExpectationState,
+        context_schema=SqlExpectationConfig,
+        input_schema=SqlExpectationInput,
+        output_schema=SqlExpectationOutput,
+    )
 
-        builder.add_node(
-            QUERY_REWRITER_NODE,
-            QueryRewriterNode(query_runner=self._query_runner),
-        )
+    builder.add_node(PLANNER_NODE, nodes[PLANNER_NODE], input_schema=SqlExpectationInput)
 
-        builder.add_node(
-            CREATE_OUTPUT_NODE,
-            create_final_output,
-        )
+    builder.add_node(
+        SQL_GENERATOR_NODE, nodes[SQL_GENERATOR_NODE], input_schema=SqlExpectationState
+    )
 
-        builder.add_edge(START, PLANNER_NODE)
-        builder.add_edge(PLANNER_NODE, SQL_GENERATOR_NODE)
-        builder.add_edge(SQL_GENERATOR_NODE, SQL_VALIDATOR_NODE)
-        builder.add_conditional_edges(
-            SQL_VALIDATOR_NODE,
-            sql_validation_condition,
-            [QUERY_REWRITER_NODE, CREATE_OUTPUT_NODE],
-        )
-        builder.add_edge(QUERY_REWRITER_NODE, SQL_VALIDATOR_NODE)
-        builder.add_edge(CREATE_OUTPUT_NODE, END)
+    builder.add_node(
+        SQL_VALIDATOR_NODE, nodes[SQL_VALIDATOR_NODE], input_schema=SqlExpectationState
+    )
+
+    builder.add_node(
+        QUERY_REWRITER_NODE, nodes[QUERY_REWRITER_NODE], input_schema=SqlExpectationState
+    )
+
+    builder.add_node(
+        CREATE_OUTPUT_NODE,
+        create_final_output,
+    )
+
+    builder.add_edge(START, PLANNER_NODE)
+    builder.add_edge(PLANNER_NODE, SQL_GENERATOR_NODE)
+    builder.add_edge(SQL_GENERATOR_NODE, SQL_VALIDATOR_NODE)
+    builder.add_conditional_edges(
+        SQL_VALIDATOR_NODE,
+        sql_validation_condition,
+        [QUERY_REWRITER_NODE, CREATE_OUTPUT_NODE],
+    )
+    builder.add_edge(QUERY_REWRITER_NODE, SQL_VALIDATOR_NODE)
+    builder.add_edge(CREATE_OUTPUT_NODE, END)
 
-        return builder
+    return builder
 
 
 def sql_validation_condition(state: SqlExpectationState) -> str:
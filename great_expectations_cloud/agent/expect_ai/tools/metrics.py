@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import pydantic
@@ -23,12 +25,10 @@ from langchain_core.tools import Tool
 from great_expectations_cloud.agent.expect_ai.metric_service import MetricNotComputableError
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     from great_expectations.data_context import CloudDataContext
-    from great_expectations.datasource.fluent.interfaces import (
-        DataAsset,
-        Datasource,
-    )
-    from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.metrics.metric import Metric
 
     from great_expectations_cloud.agent.expect_ai.asset_review_agent.state import BatchParameters
     from great_expectations_cloud.agent.expect_ai.metric_service import MetricService
@@ -49,6 +49,44 @@ class ColumnRegexValuesArgs(pydantic.BaseModel):
     regex: str
 
 
+@dataclass(frozen=True)
+class _MetricTool:
+    """A metric the agent can ask for, as a tool taking the metric's arguments."""
+
+    metric: type[Metric[Any]]
+    args_schema: type[pydantic.BaseModel]
+    # the tool reports the metric's value under the metric's name
+    keyed: bool = False
+    # reported with the number of values instead of values longer than the manager's limit,
+    # which could consume all the tokens available to the model
+    too_many_values: str | None = None
+
+
+# the metric tools, by name, each computing its metric from the tool's arguments
+METRIC_TOOLS: dict[str, _MetricTool] = {
+    tool.metric.__name__: tool
+    for tool in (
+        _MetricTool(BatchColumnTypes, NoArgs),
+        _MetricTool(BatchRowCount, NoArgs),
+        _MetricTool(SampleValues, NoArgs),
+        _MetricTool(ColumnSampleValues, ColumnArgs, keyed=True),
+        _MetricTool(ColumnNullCount, ColumnArgs),
+        _MetricTool(ColumnDistinctValuesCount, ColumnArgs),
+        _MetricTool(
+            ColumnDistinctValues,
+            ColumnArgs,
+            keyed=True,
+            too_many_values="Too many distinct values",
+        ),
+        _MetricTool(ColumnValuesMatchRegexValues, ColumnRegexValuesArgs, keyed=True),
+        _MetricTool(ColumnValuesMatchRegexCount, ColumnRegexValuesArgs),
+        _MetricTool(ColumnValuesNotMatchRegexValues, ColumnRegexValuesArgs, keyed=True),
+        _MetricTool(ColumnValuesNotMatchRegexCount, ColumnRegexValuesArgs),
+        _MetricTool(ColumnDescriptiveStats, ColumnArgs),
+    )
+}
+
+
 class AgentToolsManager:
     def __init__(
         self,
@@ -58,7 +96,6 @@ class AgentToolsManager:
     ):
         self._context = context
         self._metric_service = metric_service
-        self._data_sources: dict[str, Datasource[DataAsset[Any, Any], ExecutionEngine[Any]]] = {}
         self._tools: dict[str, list[Tool]] = {}
         self._distinct_values_str_length_limit = distinct_values_str_length_limit
 
@@ -69,204 +106,63 @@ class AgentToolsManager:
         return self._tools[data_source_name]
 
     def _create_tools_with_core_metrics(self, data_source_name: str) -> list[Tool]:
-        metric_service = self._metric_service
-
-        table_schema_metric_tool = Tool(
-            name=BatchColumnTypes.__name__,
-            description=BatchColumnTypes.__doc__ or "",
-            args_schema=NoArgs,
-            func=lambda batch_definition, batch_parameters: (
-                metric_service.get_metric_value_or_error_text(
-                    metric=BatchColumnTypes(),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            ),
-        )
-
-        table_row_count_metric_tool = Tool(
-            name=BatchRowCount.__name__,
-            description=BatchRowCount.__doc__ or "",
-            args_schema=NoArgs,
-            func=lambda batch_definition, batch_parameters: (
-                metric_service.get_metric_value_or_error_text(
-                    metric=BatchRowCount(),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            ),
-        )
-
-        sample_values_metric_tool = Tool(
-            name=SampleValues.__name__,
-            description=SampleValues.__doc__ or "",
-            args_schema=NoArgs,
-            func=lambda batch_definition, batch_parameters: (
-                metric_service.get_metric_value_or_error_text(
-                    metric=SampleValues(),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            ),
-        )
-
-        column_sample_values_metric_tool = Tool(
-            name=ColumnSampleValues.__name__,
-            description=ColumnSampleValues.__doc__ or "",
-            args_schema=ColumnArgs,
-            func=lambda batch_definition, batch_parameters, column: {
-                ColumnSampleValues.__name__: metric_service.get_metric_value_or_error_text(
-                    metric=ColumnSampleValues(column=column),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                ),
-            },
-        )
-
-        column_null_count_metric_tool = Tool(
-            name=ColumnNullCount.__name__,
-            description=ColumnNullCount.__doc__ or "",
-            args_schema=ColumnArgs,
-            func=lambda batch_definition, batch_parameters, column: (
-                metric_service.get_metric_value_or_error_text(
-                    metric=ColumnNullCount(column=column),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            ),
-        )
-
-        column_distinct_values_count_metric_tool = Tool(
-            name=ColumnDistinctValuesCount.__name__,
-            description=ColumnDistinctValuesCount.__doc__ or "",
-            args_schema=ColumnArgs,
-            func=lambda batch_definition, batch_parameters, column: (
-                metric_service.get_metric_value_or_error_text(
-                    metric=ColumnDistinctValuesCount(column=column),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            ),
-        )
-
-        def _get_distinct_values_and_check_length(
-            batch_definition: BatchDefinition[PartitionerT],
-            batch_parameters: BatchParameters,
-            column: str,
-        ) -> dict[str, list[str] | str]:
-            try:
-                distinct_values = metric_service.get_metric_value(
-                    metric=ColumnDistinctValues(column=column),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            except MetricNotComputableError as e:
-                return {"ColumnDistinctValues": str(e)}
-            # If the number of distinct values is too large, simply
-            # including the list of values could consume all the
-            # tokens available to the model.
-            if len(str(distinct_values)) > self._distinct_values_str_length_limit:
-                return {
-                    "ColumnDistinctValues": f"Too many distinct values ({len(distinct_values)})"
-                }
-            return {"ColumnDistinctValues": distinct_values}
-
-        column_distinct_values_metric_tool = Tool(
-            name=ColumnDistinctValues.__name__,
-            description=ColumnDistinctValues.__doc__ or "",
-            args_schema=ColumnArgs,
-            func=_get_distinct_values_and_check_length,
-        )
-
-        column_values_match_regex_values_metric_tool = Tool(
-            name=ColumnValuesMatchRegexValues.__name__,
-            description=ColumnValuesMatchRegexValues.__doc__ or "",
-            args_schema=ColumnRegexValuesArgs,
-            func=lambda batch_definition, batch_parameters, column, regex: {
-                ColumnValuesMatchRegexValues.__name__: metric_service.get_metric_value_or_error_text(
-                    metric=ColumnValuesMatchRegexValues(column=column, regex=regex),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                ),
-            },
-        )
-
-        column_values_match_regex_count_metric_tool = Tool(
-            name=ColumnValuesMatchRegexCount.__name__,
-            description=ColumnValuesMatchRegexCount.__doc__ or "",
-            args_schema=ColumnRegexValuesArgs,
-            func=lambda batch_definition, batch_parameters, column, regex: (
-                metric_service.get_metric_value_or_error_text(
-                    metric=ColumnValuesMatchRegexCount(
-                        column=column,
-                        regex=regex,
-                    ),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            ),
-        )
-
-        column_values_not_match_regex_values_metric_tool = Tool(
-            name=ColumnValuesNotMatchRegexValues.__name__,
-            description=ColumnValuesNotMatchRegexValues.__doc__ or "",
-            args_schema=ColumnRegexValuesArgs,
-            func=lambda batch_definition, batch_parameters, column, regex: {
-                ColumnValuesNotMatchRegexValues.__name__: metric_service.get_metric_value_or_error_text(
-                    metric=ColumnValuesNotMatchRegexValues(
-                        column=column,
-                        regex=regex,
-                    ),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            },
-        )
-
-        column_values_not_match_regex_count_metric_tool = Tool(
-            name=ColumnValuesNotMatchRegexCount.__name__,
-            description=ColumnValuesNotMatchRegexCount.__doc__ or "",
-            args_schema=ColumnRegexValuesArgs,
-            func=lambda batch_definition, batch_parameters, column, regex: (
-                metric_service.get_metric_value_or_error_text(
-                    metric=ColumnValuesNotMatchRegexCount(
-                        column=column,
-                        regex=regex,
-                    ),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            ),
-        )
-
-        column_descriptive_stats_metric_tool = Tool(
-            name=ColumnDescriptiveStats.__name__,
-            description=ColumnDescriptiveStats.__doc__ or "",
-            args_schema=ColumnArgs,
-            func=lambda batch_definition, batch_parameters, column: (
-                metric_service.get_metric_value_or_error_text(
-                    metric=ColumnDescriptiveStats(column=column),
-                    batch_definition=self._ensure_core_batch_definition(batch_definition),
-                    batch_parameters=batch_parameters,
-                )
-            ),
-        )
-
         return [
-            table_schema_metric_tool,
-            table_row_count_metric_tool,
-            sample_values_metric_tool,
-            column_sample_values_metric_tool,
-            column_null_count_metric_tool,
-            column_distinct_values_count_metric_tool,
-            column_distinct_values_metric_tool,
-            column_values_match_regex_values_metric_tool,
-            column_values_match_regex_count_metric_tool,
-            column_values_not_match_regex_values_metric_tool,
-            column_values_not_match_regex_count_metric_tool,
-            column_descriptive_stats_metric_tool,
+            Tool(
+                name=name,
+                description=metric_tool.metric.__doc__ or "",
+                args_schema=metric_tool.args_schema,
+                func=partial(self._get_metric_tool_value, metric_tool),
+            )
+            for name, metric_tool in METRIC_TOOLS.items()
         ]
 
+    def _get_metric_tool_value(
+        self,
+        metric_tool: _MetricTool,
+        batch_definition: BatchDefinition[PartitionerT],
+        batch_parameters: BatchParameters | None,
+        **metric_args: Any,
+    ) -> Any:
+        try:
+            value = self._metric_service.get_metric_value(
+                metric=metric_tool.metric(**metric_args),
+                batch_definition=self._ensure_core_batch_definition(batch_definition),
+                batch_parameters=batch_parameters,
+            )
+        except MetricNotComputableError as e:
+            value = str(e)
+        else:
+            if (
+                metric_tool.too_many_values is not None
+                and len(str(value)) > self._distinct_values_str_length_limit
+            ):
+                value = f"{metric_tool.too_many_values} ({len(value)})"
+        return {metric_tool.metric.__name__: value} if metric_tool.keyed else value
+
+    def get_metric(self, tool_name: str, tool_args: Mapping[str, Any]) -> Metric[Any] | None:
+        """The metric a call of the named tool computes, or None if it doesn't compute one."""
+        metric_tool = METRIC_TOOLS.get(tool_name)
+        if metric_tool is None:
+            return None
+        try:
+            return metric_tool.metric(**tool_args)
+        except ValueError:
+            # a metric's pydantic.v1 ValidationError; the tool reports the bad arguments itself
+            return None
+
+    def compute_metrics(
+        self,
+        batch_definition: BatchDefinition[PartitionerT],
+        batch_parameters: BatchParameters | None,
+        metrics: Sequence[Metric[Any]],
+    ) -> None:
+        """Compute the metrics together, so the tools computing them read their cached results."""
+        self._metric_service.compute_metric_results(
+            batch_definition=self._ensure_core_batch_definition(batch_definition),
+            metrics=metrics,
+            batch_parameters=batch_parameters,
+        )
+
     def _ensure_core_batch_definition(
         self,
         batch_definition: BatchDefinition[PartitionerT],
@@ -4,6 +4,12 @@ from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import text
 
+from great_expectations_cloud.agent.datasource_limiter import get_datasource_limiter
+from great_expectations_cloud.agent.engine_registry import (
+    get_engine_registry,
+    runs_on_one_connection,
+)
+
 if TYPE_CHECKING:
     from great_expectations.data_context import CloudDataContext
     from great_expectations.datasource.fluent.interfaces import (
@@ -38,7 +44,9 @@ class QueryRunner:
         :param data_source_name: The name of the data source to retrieve.
         :return: The Datasource object associated with the given name.
         """
-        return self._context.data_sources.get(name=data_source_name)
+        data_source = self._context.data_sources.get(name=data_source_name)
+        get_engine_registry().attach(data_source)
+        return data_source
 
     def check_query_compiles(
         self, data_source_name: str, query_text: str
@@ -54,8 +62,11 @@ class QueryRunner:
             self._get_data_source_from_context(data_source_name)
         )
         engine: Engine = ds.get_execution_engine().engine
-
-        return self._check_query_compiles(engine=engine, query_text=query_text)
+        if not runs_on_one_connection(engine):
+            return self._check_query_compiles(engine=engine, query_text=query_text)
+        # expectations are checked concurrently, and these checks would share the connection
+        with get_datasource_limiter().engine_lock(engine):
+            return self._check_query_compiles(engine=engine, query_text=query_text)
 
     @staticmethod
     def _check_query_compiles(engine: Engine, query_text: str) -> tuple[bool, str | None]:
@@ -70,8 +81,11 @@ class QueryRunner:
             with engine.connect() as conn:
                 if engine.dialect.name == "mssql":
                     conn.execute(text("SET PARSEONLY ON"))
-                    conn.execute(text(query_text))
-                    conn.execute(text("SET PARSEONLY OFF"))
+                    try:
+                        conn.execute(text(query_text))
+                    finally:
+                        # the connection may be GX's persistent one, which must run queries again
+                        conn.execute(text("SET PARSEONLY OFF"))
                 else:
                     conn.execute(text("EXPLAIN " + query_text))
         except Exception as e:
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
+
+from great_expectations_cloud.agent.constants import JobPriority
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from great_expectations_cloud.agent.message_service.subscriber import EventContext
+
+# jobs a user is waiting on in the UI overtake checkpoints that run on a schedule
+DEFAULT_JOB_PRIORITIES: Final[Mapping[str, JobPriority]] = {
+    "test_datasource_config": JobPriority.INTERACTIVE,
+    "list_table_names_request.received": JobPriority.INTERACTIVE,
+    "metrics_list_request.received": JobPriority.INTERACTIVE,
+    "generate_sql_expectation_event": JobPriority.INTERACTIVE,
+    "run_scheduled_checkpoint.received": JobPriority.SCHEDULED,
+    "run_window_checkpoint.received": JobPriority.SCHEDULED,
+}
+
+_PRIORITY_RANK: Final[Mapping[JobPriority, int]] = {
+    JobPriority.INTERACTIVE: 0,
+    JobPriority.DEFAULT: 1,
+    JobPriority.SCHEDULED: 2,
+}
+
+
+@dataclass(order=True)
+class _QueuedJob:
+    rank: int
+    sequence: int
+    event_context: EventContext = field(compare=False)
+
+
+class JobQueue:
+    """A bounded queue of jobs waiting for a free worker, served by priority.
+
+    Jobs of the same priority are served first in, first out. A job that is put again while
+    it is still waiting, e.g. when the broker redelivers it after a reconnect, keeps its
+    place in the queue but is tracked by its newest delivery, since only that one can
+    still be acked.
+
+    The queue is not threadsafe; the GX Agent only uses it while holding its job lock.
+
+    Args:
+        max_size: number of jobs that can wait. 0 disables queueing.
+        priorities: event type to priority, overriding DEFAULT_JOB_PRIORITIES.
+    """
+
+    def __init__(self, max_size: int, priorities: Mapping[str, JobPriority] | None = None) -> None:
+        self._max_size = max_size
+        self._priorities = {**DEFAULT_JOB_PRIORITIES, **(priorities or {})}
+        self._heap: list[_QueuedJob] = []
+        # correlation_id -> heap entry, so a redelivery can replace the delivery it supersedes
+        self._entries: dict[str, _QueuedJob] = {}
+        self._counter = itertools.count()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def priority_of(self, event_type: str) -> JobPriority:
+        return self._priorities.get(event_type, JobPriority.DEFAULT)
+
+    def put(self, event_context: EventContext) -> bool:
+        """Add a job to the queue, returning False if the queue is full."""
+        if self.replace(event_context) is not None:
+            return True
+        if len(self._entries) >= self._max_size:
+            return False
+        rank = _PRIORITY_RANK[self.priority_of(event_context.event.type)]
+        entry = _QueuedJob(rank=rank, sequence=next(self._counter), event_context=event_context)
+        self._entries[event_context.correlation_id] = entry
+        heapq.heappush(self._heap, entry)
+        return True
+
+    def replace(self, event_context: EventContext) -> EventContext | None:
+        """Track a waiting job by a newer delivery of it, keeping its place in the queue.
+
+        Returns the delivery it supersedes, or None if the job isn't waiting.
+        """
+        entry = self._entries.get(event_context.correlation_id)
+        if entry is None:
+            return None
+        superseded = entry.event_context
+        entry.event_context = event_context
+        return superseded
+
+    def pop(self, can_start: Callable[[EventContext], bool] | None = None) -> EventContext | None:
+        """Take the job that should run next, if any are waiting.
+
+        Args:
+            can_start: if given, jobs it rejects are skipped and stay in the queue, e.g. when
+                the worker lane they run on is full.
+        """
+        entry: _QueuedJob | None
+        if can_start is None:
+            if not self._heap:
+                return None
+            entry = heapq.heappop(self._heap)
+        else:
+            entry = next(
+                (queued for queued in sorted(self._heap) if can_start(queued.event_context)), None
+            )
+            if entry is None:
+                return None
+            self._heap.remove(entry)
+            heapq.heapify(self._heap)
+        del self._entries[entry.event_context.correlation_id]
+        return entry.event_context
+
+    def __len__(self) -> int:
+        return len(self._entries)
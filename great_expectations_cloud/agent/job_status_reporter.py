@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+MAX_BACKOFF_SECONDS: Final = 30.0
+
+
+@dataclass
+class JobStatusUpdate:
+    """One pending status update for a job.
+
+    Attributes:
+        correlation_id: the job the update belongs to.
+        send: delivers the update to GX Cloud, raising if it should be retried.
+        description: what is being sent, for logs.
+        supersedable: whether a later update for the same job makes this one redundant.
+        on_delivered: called once the update has been delivered.
+        on_failed: called with the last error once every attempt has failed.
+    """
+
+    correlation_id: str
+    send: Callable[[], None]
+    description: str
+    supersedable: bool = False
+    on_delivered: Callable[[], None] | None = None
+    on_failed: Callable[[Exception], None] | None = None
+
+
+@dataclass
+class _PendingUpdate:
+    """An update in the outbox, with its delivery attempts so far."""
+
+    update: JobStatusUpdate
+    # order in which updates were reported, across jobs
+    sequence: int
+    attempts: int = 0
+    # time.monotonic() before which the update is not sent again
+    retry_at: float = 0.0
+
+
+class JobStatusReporter:
+    """Send job status updates to GX Cloud from a background thread.
+
+    Job threads hand their JobStarted and JobCompleted updates to report() and carry on,
+    instead of waiting on GX Cloud. Updates sit in an in-memory outbox, one queue per job,
+    and are sent one at a time in the order they were reported, so a job's updates never
+    arrive out of order. A pending update marked supersedable is dropped when a newer
+    update for the same job is reported. Failed sends are retried with exponential
+    backoff; while one job's update backs off, other jobs' updates are still sent.
+
+    The outbox is not persisted. Callers that need an update to be durable should only
+    ack the work it describes from on_delivered, so that it is redelivered if the process
+    dies first.
+
+    Args:
+        max_attempts: number of times an update is sent before giving up on it.
+        backoff_seconds: delay before the first retry; doubled for every retry after it.
+    """
+
+    def __init__(self, max_attempts: int, backoff_seconds: float) -> None:
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+        # pending updates by correlation_id
+        self._outbox: dict[str, deque[_PendingUpdate]] = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._sending = False
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def report(self, update: JobStatusUpdate) -> None:
+        """Queue an update to be sent in the background."""
+        with self._condition:
+            job_outbox = self._outbox.setdefault(update.correlation_id, deque())
+            superseded = [pending for pending in job_outbox if pending.update.supersedable]
+            for pending in superseded:
+                job_outbox.remove(pending)
+                self._log_superseded(pending.update)
+            job_outbox.append(_PendingUpdate(update=update, sequence=next(self._sequence)))
+            self._ensure_started()
+            self._condition.notify_all()
+
+    def send(self, update: JobStatusUpdate) -> None:
+        """Send an update from the calling thread, retrying like report() does.
+
+        For updates the caller can't go on without. The callbacks are not called; the
+        last error is raised once every attempt has failed.
+        """
+        pending = _PendingUpdate(update=update, sequence=next(self._sequence))
+        while True:
+            error = self._attempt(pending)
+            if error is None:
+                return
+            if self._should_give_up(pending):
+                raise error
+            self._stopping.wait(self._retry_in_seconds(pending, error))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every reported update has been sent or given up on.
+
+        Returns:
+            False if the timeout expired first.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._outbox and not self._sending, timeout=timeout
+            )
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Stop the background thread once the outbox is empty, or after the timeout."""
+        self.flush(timeout=timeout)
+        self._stopping.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def __len__(self) -> int:
+        """Number of updates waiting to be sent."""
+        with self._condition:
+            return sum(len(job_outbox) for job_outbox in self._outbox.values())
+
+    def _ensure_started(self) -> None:
+        # the thread is started on first use so that worker processes forked earlier never inherit it
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="gx-agent-status-reporter", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                pending = self._pop_next()
+                while pending is None:
+                    if not self._outbox and self._stopping.is_set():
+                        return
+                    self._condition.wait(timeout=self._seconds_until_next_retry())
+                    pending = self._pop_next()
+                self._sending = True
+            done = False
+            try:
+                done = self._deliver(pending)
+            finally:
+                with self._condition:
+                    if not done:
+                        self._requeue(pending)
+                    self._sending = False
+                    self._condition.notify_all()
+
+    def _pop_next(self) -> _PendingUpdate | None:
+        """Take the earliest reported update that isn't backing off. The caller holds the lock."""
+        now = time.monotonic()
+        ready = [
+            job_outbox[0]
+            for job_outbox in self._outbox.values()
+            if job_outbox[0].retry_at <= now or self._stopping.is_set()
+        ]
+        if not ready:
+            return None
+        pending = min(ready, key=lambda ready_update: ready_update.sequence)
+        job_outbox = self._outbox[pending.update.correlation_id]
+        job_outbox.popleft()
+        if not job_outbox:
+            del self._outbox[pending.update.correlation_id]
+        return pending
+
+    def _seconds_until_next_retry(self) -> float | None:
+        """How long until a backing off update is due; None to wait for a report. The caller holds the lock."""
+        if not self._outbox:
+            return None
+        retry_at = min(job_outbox[0].retry_at for job_outbox in self._outbox.values())
+        return max(retry_at - time.monotonic(), 0.0)
+
+    def _requeue(self, pending: _PendingUpdate) -> None:
+        """Put a failed update back at the head of its job's queue. The caller holds the lock."""
+        job_outbox = self._outbox.setdefault(pending.update.correlation_id, deque())
+        if pending.update.supersedable and job_outbox:
+            # a newer update for the job was reported while this one was being sent
+            self._log_superseded(pending.update)
+            return
+        job_outbox.appendleft(pending)
+
+    def _deliver(self, pending: _PendingUpdate) -> bool:
+        """Make one attempt at sending an update.
+
+        Returns:
+            False if the update should be sent again once it has backed off.
+        """
+        update = pending.update
+        error = self._attempt(pending)
+        if error is None:
+            if update.on_delivered is not None:
+                self._call(update.on_delivered)
+            return True
+        if self._should_give_up(pending):
+            LOGGER.error(
+                "Giving up on status update",
+                exc_info=error,
+                extra={
+                    "correlation_id": update.correlation_id,
+                    "status": update.description,
+                    "attempts": pending.attempts,
+                },
+            )
+            if update.on_failed is not None:
+                self._call(update.on_failed, error)
+            return True
+        pending.retry_at = time.monotonic() + self._retry_in_seconds(pending, error)
+        return False
+
+    def _attempt(self, pending: _PendingUpdate) -> Exception | None:
+        pending.attempts += 1
+        try:
+            pending.update.send()
+        except Exception as error:
+            return error
+        return None
+
+    def _should_give_up(self, pending: _PendingUpdate) -> bool:
+        return pending.attempts >= self._max_attempts or self._stopping.is_set()
+
+    def _retry_in_seconds(self, pending: _PendingUpdate, error: Exception) -> float:
+        delay = min(self._backoff_seconds * 2.0 ** (pending.attempts - 1), MAX_BACKOFF_SECONDS)
+        LOGGER.warning(
+            "Status update failed, retrying",
+            extra={
+                "correlation_id": pending.update.correlation_id,
+                "status": pending.update.description,
+                "attempt": pending.attempts,
+                "retry_in_seconds": delay,
+                "error_message": str(error)[:500],
+            },
+        )
+        return delay
+
+    @staticmethod
+    def _log_superseded(update: JobStatusUpdate) -> None:
+        LOGGER.debug(
+            "Dropping superseded status update",
+            extra={"correlation_id": update.correlation_id, "status": update.description},
+        )
+
+    @staticmethod
+    def _call(callback: Callable[..., None], *args: object) -> None:
+        # a failing callback must not take down the thread delivering every other job's updates
+        try:
+            callback(*args)
+        except Exception:
+            LOGGER.exception("Status update callback failed")
@@ -13,8 +13,6 @@ import pika
 from pika.adapters.asyncio_connection import AsyncioConnection
 from pika.exceptions import ChannelClosed, ConnectionClosed
 
-from great_expectations_cloud.agent.exceptions import GXAgentUnrecoverableConnectionError
-
 if TYPE_CHECKING:
     from pika.channel import Channel
     from pika.spec import Basic, BasicProperties
@@ -43,8 +41,9 @@ class OnMessageFn(Protocol):
 class AsyncRabbitMQClient:
     """Configuration for a particular AMQP client library."""
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, prefetch_count: int = 1):
         self._parameters = self._build_client_parameters(url=url)
+        self._prefetch_count = prefetch_count
         self.should_reconnect = False
         self.was_consuming = False
         self._connection = None
@@ -52,7 +51,6 @@ class AsyncRabbitMQClient:
         self._closing = False
         self._consumer_tag = None
         self._consuming = False
-        self._is_unrecoverable = False
 
     def run(self, queue: str, on_message: OnMessageFn) -> None:
         """Run an async connection to RabbitMQ.
@@ -76,11 +74,8 @@ class AsyncRabbitMQClient:
             on_close_callback=self._on_connection_closed,
         )
         self._connection = connection
+        # returns once the connection is stopped; should_reconnect tells the caller whether to run again
         connection.ioloop.run_forever()
-        if self._is_unrecoverable:
-            raise GXAgentUnrecoverableConnectionError(  # noqa: TRY003
-                "AsyncRabbitMQClient has encountered an unrecoverable error."
-            )
 
     def stop(self) -> None:
         """Close the connection to RabbitMQ."""
@@ -107,13 +102,18 @@ class AsyncRabbitMQClient:
         self._consumer_tag = None
         self._consuming = False
 
-    def nack(self, delivery_tag: int, requeue: bool) -> None:
-        """Nack a message, and indicate if it should be requeued.
+    def get_nack_callback(self, delivery_tag: int, requeue: bool) -> Callable[[], None]:
+        """Get a callback to nack a message, and indicate if it should be requeued.
 
-        Note that this method is not threadsafe, and must be invoked in the main thread.
+        The nack goes to the channel the message arrived on, even if the client has reconnected
+        since. Note that the callback is not threadsafe, and must be invoked in the main thread.
         """
-        if self._channel is not None:
-            self._channel.basic_nack(delivery_tag=delivery_tag, requeue=requeue)
+        if self._channel is None:
+            # if the channel is gone, we can't nack
+            return lambda: None
+        return partial(
+            self._nack_if_open, channel=self._channel, delivery_tag=delivery_tag, requeue=requeue
+        )
 
     def get_threadsafe_ack_callback(self, delivery_tag: int) -> Callable[[], None]:
         """Get a callback to ack a message from any thread."""
@@ -149,7 +149,7 @@ class AsyncRabbitMQClient:
     def _ack_threadsafe(self, channel: Channel, delivery_tag: int, loop: AbstractEventLoop) -> None:
         """Ack a message in a threadsafe manner."""
         if channel.is_closed is not True:
-            ack = partial(channel.basic_ack, delivery_tag=delivery_tag)
+            ack = partial(self._ack_if_open, channel=channel, delivery_tag=delivery_tag)
             loop.call_soon_threadsafe(callback=ack)
 
     def _nack_threadsafe(
@@ -161,9 +161,31 @@ class AsyncRabbitMQClient:
     ) -> None:
         """Nack a message in a threadsafe manner."""
         if channel.is_closed is not True:
-            nack = partial(channel.basic_nack, delivery_tag=delivery_tag, requeue=requeue)
+            nack = partial(
+                self._nack_if_open, channel=channel, delivery_tag=delivery_tag, requeue=requeue
+            )
             loop.call_soon_threadsafe(callback=nack)
 
+    def _ack_if_open(self, channel: Channel, delivery_tag: int) -> None:
+        # Delivery tags belong to the channel the message arrived on. If that channel was
+        # lost in the meantime, the broker has already requeued the message.
+        if channel.is_open:
+            channel.basic_ack(delivery_tag=delivery_tag)
+        else:
+            LOGGER.warning(
+                "rabbitmq.ack.dropped",
+                extra={"delivery_tag": delivery_tag, "reason": "channel closed"},
+            )
+
+    def _nack_if_open(self, channel: Channel, delivery_tag: int, requeue: bool) -> None:
+        if channel.is_open:
+            channel.basic_nack(delivery_tag=delivery_tag, requeue=requeue)
+        else:
+            LOGGER.warning(
+                "rabbitmq.nack.dropped",
+                extra={"delivery_tag": delivery_tag, "reason": "channel closed"},
+            )
+
     def _callback_handler(
         self,
         channel: Channel,
@@ -189,9 +211,10 @@ class AsyncRabbitMQClient:
         """Consume from a channel with the on_message callback."""
         LOGGER.debug("Issuing consumer-related RPC commands")
         channel.add_on_cancel_callback(self._on_consumer_canceled)
-        # set RabbitMQ prefetch count to equal the max_threads value in the GX Agent's ThreadPoolExecutor
-        channel.basic_qos(prefetch_count=1)
+        # set RabbitMQ prefetch count to equal the max_workers value in the GX Agent's ThreadPoolExecutor
+        channel.basic_qos(prefetch_count=self._prefetch_count)
         self._consumer_tag = channel.basic_consume(queue=queue, on_message_callback=on_message)
+        self.was_consuming = True
 
     def _on_consumer_canceled(self, method_frame: Basic.Cancel) -> None:
         """Callback invoked when the broker cancels the client's connection."""
@@ -267,7 +290,6 @@ class AsyncRabbitMQClient:
                 },
             )
         self._channel = None
-        self._is_unrecoverable = True
         if self._closing:
             connection.ioloop.stop()
         else:
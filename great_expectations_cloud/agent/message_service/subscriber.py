@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import random
 import time
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from functools import partial
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Final, Protocol
 
 from pika.exceptions import (
     AMQPError,
@@ -23,6 +25,10 @@ if TYPE_CHECKING:
     )
     from great_expectations_cloud.agent.models import Event
 
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+MAX_RECONNECT_DELAY_SECONDS: Final = 30
+
 
 @dataclass(frozen=True)
 class EventContext:
@@ -61,16 +67,18 @@ class Subscriber:
 
     # abstraction between the main application and client serving a specific stream
 
-    def __init__(self, client: AsyncRabbitMQClient):
+    def __init__(self, client: AsyncRabbitMQClient, max_reconnect_attempts: int = 5):
         """Initialize instance of Subscriber.
 
         Args:
             client: RabbitMQClient class.
+            max_reconnect_attempts: consecutive failed attempts to reconnect to the broker
+                before giving up with GXAgentUnrecoverableConnectionError.
         """
         self.client = client
-        self._reconnect_delay = 0
+        self._max_reconnect_attempts = max_reconnect_attempts
+        self._reconnect_attempts = 0
 
-    # TODO: Consider using tenacity to handle reconnecting
     def consume(
         self,
         queue: str,
@@ -79,7 +87,8 @@ class Subscriber:
         """Subscribe to queue with on_message callback.
 
         Listens to an event stream and invokes on_message with an EventContext
-        built from the incoming message.
+        built from the incoming message. If the connection is lost, it is reopened in
+        this process after a jittered backoff, so jobs that are already running carry on.
 
         Args:
             queue: Name of queue.
@@ -104,11 +113,31 @@ class Subscriber:
             except KeyboardInterrupt as e:
                 self.client.stop()
                 raise KeyboardInterrupt from e
-            except GXAgentUnrecoverableConnectionError:
-                self.client.stop()
-                raise
-            else:
+            if not self.client.should_reconnect:
                 break  # exit
+            self._wait_to_reconnect()
+            self.client.reset()
+
+    def _wait_to_reconnect(self) -> None:
+        """Back off before reconnecting, giving up once too many attempts in a row fail."""
+        if self.client.was_consuming:
+            # the last connection worked, so this is a new outage rather than a failed attempt
+            self._reconnect_attempts = 0
+        self._reconnect_attempts += 1
+        if self._reconnect_attempts > self._max_reconnect_attempts:
+            raise GXAgentUnrecoverableConnectionError(  # noqa: TRY003
+                f"Unable to reconnect to the broker after {self._max_reconnect_attempts} attempts."
+            )
+        reconnect_delay = self._get_reconnect_delay()
+        LOGGER.warning(
+            "rabbitmq.reconnecting",
+            extra={
+                "attempt": self._reconnect_attempts,
+                "max_attempts": self._max_reconnect_attempts,
+                "delay_seconds": round(reconnect_delay, 2),
+            },
+        )
+        time.sleep(reconnect_delay)
 
     def _on_message_handler(
         self,
@@ -134,8 +163,7 @@ class Subscriber:
         # redeliver_message is not threadsafe
         redeliver_message = partial(
             self._redeliver_message,
-            delivery_tag=payload.delivery_tag,
-            requeue=True,
+            nack=self.client.get_nack_callback(delivery_tag=payload.delivery_tag, requeue=True),
             delay=3,
         )
 
@@ -152,23 +180,21 @@ class Subscriber:
 
     async def _redeliver_message(
         self,
-        delivery_tag: int,
-        requeue: bool = True,
+        nack: Callable[[], None],
         delay: float | int = 3,  # noqa: PYI041
     ) -> None:
         """Coroutine to request a redelivery with delay."""
         # not threadsafe
         await asyncio.sleep(delay)
-        return self.client.nack(delivery_tag=delivery_tag, requeue=requeue)
-
-    def _get_reconnect_delay(self) -> int:
-        """Get a timeout delay with a 1 second backoff for each attempt."""
-        if self.client.was_consuming:
-            self._reconnect_delay = 0
-        else:
-            self._reconnect_delay += 1
-        self._reconnect_delay = min(self._reconnect_delay, 30)
-        return self._reconnect_delay
+        # The nack is bound to the channel the message arrived on. If the client reconnected
+        # during the delay, that channel is closed, the nack is dropped, and the broker
+        # redelivers the message anyway.
+        nack()
+
+    def _get_reconnect_delay(self) -> float:
+        """Exponential backoff with full jitter, so that agents don't reconnect in lockstep."""
+        max_delay = min(2**self._reconnect_attempts, MAX_RECONNECT_DELAY_SECONDS)
+        return random.uniform(0, max_delay)  # noqa: S311 # not used for cryptography
 
     def close(self) -> None:
         """Gracefully closes the Subscriber's connection.
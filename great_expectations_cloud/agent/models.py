@@ -8,8 +8,9 @@ from uuid import UUID
 from great_expectations.expectations.metadata_types import DataQualityIssues
 from great_expectations.experimental.metric_repository.metrics import MetricTypes
 from pydantic.v1 import BaseModel, Extra, Field
+from typing_extensions import override
 
-from great_expectations_cloud.agent.exceptions import GXCoreError
+from great_expectations_cloud.agent.exceptions import GXAgentWorkerProcessError, GXCoreError
 
 
 def all_subclasses(cls: type) -> list[type]:
@@ -24,6 +25,17 @@ def all_subclasses(cls: type) -> list[type]:
     return all_sub_cls
 
 
+# Map of the `type` discriminator to its Event class, built lazily from _build_event_union().
+# Reset by invalidate_event_registry() whenever a new model subclass is defined.
+_EVENT_REGISTRY: dict[str, type[AgentBaseExtraForbid | AgentBaseExtraIgnore]] | None = None
+
+
+def invalidate_event_registry() -> None:
+    """Mark the Event registry and union as stale so they are rebuilt on next use."""
+    global _EVENT_REGISTRY  # noqa: PLW0603
+    _EVENT_REGISTRY = None
+
+
 class DomainContext(BaseModel):
     """
     Encapsulates domain-related context information.
@@ -41,12 +53,24 @@ class AgentBaseExtraForbid(BaseModel):
         # 2024-03-04: ZEL-501 Strictly enforce models for handling outdated APIs
         extra: str = Extra.forbid
 
+    @override
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # a new subclass may be a new Event
+        invalidate_event_registry()
+
 
 class AgentBaseExtraIgnore(BaseModel):
     class Config:
         # Extra fields on Events are not strictly enforced
         extra: str = Extra.ignore
 
+    @override
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # a new subclass may be a new Event
+        invalidate_event_registry()
+
 
 class EventBase(AgentBaseExtraIgnore):
     type: str
@@ -227,14 +251,34 @@ else:
     Event = Annotated[Union[_event_classes], Field(discriminator="type")]
 
 
+def get_event_registry() -> dict[str, EventType]:
+    """Map each Event `type` discriminator value to its Event class.
+
+    Built once and reused until invalidate_event_registry() is called, so looking up
+    the class for a message does not walk the model hierarchy.
+    """
+    registry = _EVENT_REGISTRY
+    if registry is None:
+        reload_event_union()
+        registry = _EVENT_REGISTRY
+    assert registry is not None  # noqa: S101 # set by reload_event_union
+    return registry
+
+
 def reload_event_union() -> None:
     """Rebuild the Event union dynamically.
 
     Call this method after subclassing one of the EventBase models in order
     to make it available in the Event union."""
-    global Event  # noqa: PLW0603
+    global Event, _EVENT_REGISTRY  # noqa: PLW0603
     reloaded_event_classes = _build_event_union()
     Event = Annotated[Union[reloaded_event_classes], Field(discriminator="type")]  # type: ignore[valid-type]
+    registry: dict[str, EventType] = {}
+    for cls in reloaded_event_classes:
+        if issubclass(cls, (AgentBaseExtraForbid, AgentBaseExtraIgnore)):
+            # later classes win, matching how pydantic resolves duplicate discriminator values
+            registry[cls.__fields__["type"].default] = cls
+    _EVENT_REGISTRY = registry
 
 
 def get_event_union() -> Any:
@@ -259,7 +303,7 @@ def get_event_union() -> Any:
         so we use Any. At runtime, this represents a properly typed
         discriminated union of concrete event model classes.
     """
-    reload_event_union()
+    get_event_registry()
     return Event
 
 
@@ -316,6 +360,14 @@ def build_failed_job_completed_status(
             error_params=error.get_error_params(),
             processed_by=processed_by,
         )
+    elif isinstance(error, GXAgentWorkerProcessError) and error.error_code is not None:
+        status = JobCompleted(
+            success=False,
+            error_stack_trace=str(error),
+            error_code=error.error_code,
+            error_params=error.error_params,
+            processed_by=processed_by,
+        )
     else:
         status = JobCompleted(
             success=False,
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool, ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Final
+
+from typing_extensions import override
+
+from great_expectations_cloud.agent.exceptions import GXAgentWorkerProcessError
+from great_expectations_cloud.agent.message_service.subscriber import EventContext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from great_expectations_cloud.agent.actions.agent_action import ActionResult
+    from great_expectations_cloud.agent.agent import GXAgent
+    from great_expectations_cloud.agent.models import Event
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+# The GXAgent inherited from the parent at fork time. Only set inside worker processes.
+_worker_agent: GXAgent | None = None
+
+
+def _init_worker_process(agent: GXAgent) -> None:
+    """Initializer for prefork worker processes.
+
+    The agent is passed through fork rather than pickled, so the worker shares the
+    parent's already-imported modules copy-on-write.
+    """
+    global _worker_agent  # noqa: PLW0603 # one agent per worker process
+    _worker_agent = agent
+    # Ctrl-C is delivered to the whole process group; let the parent decide when to stop.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _warm_up_worker_process() -> int:
+    return os.getpid()
+
+
+def handle_event_in_worker_process(
+    event: Event, correlation_id: str, redelivered: bool
+) -> ActionResult:
+    """Run a job in a prefork worker process.
+
+    Only picklable values cross the process boundary: the parent keeps the broker
+    connection and the ack/nack callbacks, the worker gets the event and returns an
+    ActionResult or raises a GXAgentWorkerProcessError.
+    """
+    if _worker_agent is None:
+        raise GXAgentWorkerProcessError(
+            message="Prefork worker process was not initialized with a GX Agent.",
+            error_type="GXAgentError",
+        )
+
+    async def _noop() -> None:
+        return None
+
+    event_context = EventContext(
+        event=event,
+        correlation_id=correlation_id,
+        processed_successfully=lambda: None,
+        processed_with_failures=lambda: None,
+        redeliver_message=_noop,
+        redelivered=redelivered,
+    )
+    try:
+        return _worker_agent._handle_event(event_context=event_context)
+    except Exception as error:
+        raise GXAgentWorkerProcessError.from_exception(error) from None
+
+
+class PreforkExecutor(Executor):
+    """Run jobs in a fixed set of worker processes forked from the GX Agent.
+
+    Each worker slot is its own single-process pool, so a worker killed by a native
+    driver crash only fails the job it was running. Every worker is forked in start(),
+    while the agent is still single threaded; forking a replacement later would copy
+    locks held by the broker, reporter and pool threads, so a crashed worker's slot is
+    retired instead. Once every slot is retired, on_all_workers_exited is called.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        agent: GXAgent,
+        on_all_workers_exited: Callable[[], None] | None = None,
+    ) -> None:
+        self._max_workers = max_workers
+        self._agent = agent
+        self._on_all_workers_exited = on_all_workers_exited
+        self._lock = threading.Lock()
+        self._started = False
+        self._pools: list[ProcessPoolExecutor | None] = [None] * max_workers
+        self._slot_futures: list[Future[Any] | None] = [None] * max_workers
+
+    @property
+    def live_workers(self) -> int:
+        """Number of worker slots that have not been retired."""
+        with self._lock:
+            if not self._started:
+                return self._max_workers
+            return sum(1 for pool in self._pools if pool is not None)
+
+    def fork_workers(self) -> None:
+        """Fork all worker processes, without starting any thread.
+
+        Call it for every PreforkExecutor before starting any of them, since start() starts
+        the threads that manage the worker processes.
+        """
+        with self._lock:
+            self._fork_workers()
+
+    def start(self) -> None:
+        """Fork all worker processes now, before the agent opens its broker connection."""
+        with self._lock:
+            warm_ups = self._start()
+        pids = [future.result() for future in warm_ups]
+        LOGGER.info("Prefork worker processes started.", extra={"worker_pids": pids})
+
+    @override
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        with self._lock:
+            if not self._started:
+                self._start()
+            while True:
+                slot, pool = self._get_free_slot()
+                try:
+                    future = pool.submit(fn, *args, **kwargs)
+                except BrokenProcessPool:
+                    # the worker died and its done callback has not retired it yet
+                    self._retire_slot(slot, pool)
+                    continue
+                self._slot_futures[slot] = future
+                break
+        future.add_done_callback(partial(self._on_job_done, slot, pool))
+        return future
+
+    @override
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            pools = [pool for pool in self._pools if pool is not None]
+            self._pools = [None] * self._max_workers
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _fork_workers(self) -> None:
+        if self._started:
+            return
+        pools = [
+            ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker_process,
+                initargs=(self._agent,),
+            )
+            for _ in range(self._max_workers)
+        ]
+        # A pool forks its worker and then starts its manager thread on first submit. Fork
+        # every worker first, so no worker is forked while another pool's thread is running.
+        for pool in pools:
+            pool._launch_processes()  # type: ignore[attr-defined] # not in typeshed
+        self._pools = list(pools)
+        self._started = True
+
+    def _start(self) -> list[Future[int]]:
+        self._fork_workers()
+        return [pool.submit(_warm_up_worker_process) for pool in self._pools if pool is not None]
+
+    def _get_free_slot(self) -> tuple[int, ProcessPoolExecutor]:
+        if all(pool is None for pool in self._pools):
+            raise BrokenProcessPool(  # noqa: TRY003 # every worker process has crashed
+                "All prefork worker processes have exited."
+            )
+        for slot, (pool, future) in enumerate(zip(self._pools, self._slot_futures, strict=True)):
+            if pool is not None and (future is None or future.done()):
+                return slot, pool
+        raise RuntimeError(  # noqa: TRY003 # the agent only submits when a slot is free
+            "All prefork worker processes are busy."
+        )
+
+    def _retire_slot(self, slot: int, pool: ProcessPoolExecutor) -> None:
+        pool.shutdown(wait=False)
+        if self._pools[slot] is not pool:
+            return
+        self._pools[slot] = None
+        live_workers = sum(1 for live_pool in self._pools if live_pool is not None)
+        LOGGER.error(
+            "Prefork worker process exited unexpectedly, retiring its slot.",
+            extra={"slot": slot, "live_workers": live_workers},
+        )
+        if live_workers == 0 and self._on_all_workers_exited is not None:
+            self._on_all_workers_exited()
+
+    def _on_job_done(self, slot: int, pool: ProcessPoolExecutor, future: Future[Any]) -> None:
+        if future.cancelled() or not isinstance(future.exception(), BrokenProcessPool):
+            return
+        with self._lock:
+            self._retire_slot(slot, pool)
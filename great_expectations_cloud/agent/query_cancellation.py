@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, ParamSpec, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from great_expectations_cloud.agent.exceptions import GXAgentQueryCancelledError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+    from typing import Self
+
+    from sqlalchemy.engine import Connection, ExceptionContext
+
+LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# the CancelScope of the work running on the current thread, if any
+_thread_scope = threading.local()
+
+
+@dataclass
+class _Statement:
+    dialect: str
+    dbapi_connection: Any
+    cursor: Any
+
+
+class CancelScope:
+    """The SQL statements run by a block of code, so that another thread can cancel them.
+
+    Python threads cannot be interrupted, so a thread blocked on a slow query is only freed
+    once the database gives up on that query. Work run inside a scope can be cancelled from
+    another thread: the statements it is running are cancelled in the database, which makes
+    the blocked driver call raise, and it may not start any further statements.
+
+        scope = CancelScope()
+        future = pool.submit(scope.run, datasource.test_connection)
+        ...
+        scope.cancel()
+
+    A thread blocked opening a connection holds on until the driver's connect timeout; there
+    is no statement to cancel yet.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._statements: dict[int, _Statement] = {}
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Call fn on the current thread, inside this scope."""
+        with self:
+            return fn(*args, **kwargs)
+
+    def cancel(self) -> int:
+        """Cancel the statements running in this scope and any it would run later.
+
+        Returns:
+            The number of running statements that were cancelled.
+        """
+        with self._lock:
+            self._cancelled = True
+            statements = list(self._statements.values())
+        return sum(_cancel_statement(statement) for statement in statements)
+
+    def __enter__(self) -> Self:
+        _thread_scope.scope = self
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        _thread_scope.scope = None
+
+    def _started(self, statement: _Statement) -> None:
+        with self._lock:
+            if self._cancelled:
+                raise GXAgentQueryCancelledError("Statement not run, its work was cancelled")  # noqa: TRY003
+            self._statements[id(statement.cursor)] = statement
+
+    def _finished(self, cursor: Any) -> None:
+        with self._lock:
+            self._statements.pop(id(cursor), None)
+
+
+def _cancel_statement(statement: _Statement) -> bool:
+    """Ask the database to cancel a running statement, using whatever its driver supports."""
+    try:
+        if statement.dialect == "snowflake":
+            # cancel from a second cursor on the same session, since the first is blocked
+            canceller = statement.dbapi_connection.cursor()
+            try:
+                canceller.execute(
+                    "SELECT SYSTEM$CANCEL_ALL_QUERIES(%s)",
+                    (statement.dbapi_connection.session_id,),
+                )
+            finally:
+                canceller.close()
+        elif callable(getattr(statement.cursor, "cancel", None)):
+            # e.g. pyodbc and databricks-sql
+            statement.cursor.cancel()
+        elif callable(getattr(statement.dbapi_connection, "cancel", None)):
+            # psycopg sends the server a cancel request, as pg_cancel_backend does
+            statement.dbapi_connection.cancel()
+        elif callable(getattr(statement.dbapi_connection, "interrupt", None)):
+            # sqlite3
+            statement.dbapi_connection.interrupt()
+        else:
+            LOGGER.warning("query.cancel_unsupported", extra={"dialect": statement.dialect})
+            return False
+    except Exception:
+        LOGGER.warning("query.cancel_failed", extra={"dialect": statement.dialect}, exc_info=True)
+        return False
+    LOGGER.info("query.cancelled", extra={"dialect": statement.dialect})
+    return True
+
+
+def _current_scope() -> CancelScope | None:
+    scope: CancelScope | None = getattr(_thread_scope, "scope", None)
+    return scope
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _statement_started(conn: Connection, cursor: Any, *args: Any) -> None:
+    scope = _current_scope()
+    if scope is not None:
+        scope._started(
+            _Statement(
+                dialect=conn.dialect.name,
+                dbapi_connection=conn.connection.dbapi_connection,
+                cursor=cursor,
+            )
+        )
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _statement_finished(conn: Connection, cursor: Any, *args: Any) -> None:
+    scope = _current_scope()
+    if scope is not None:
+        scope._finished(cursor)
+
+
+@event.listens_for(Engine, "handle_error")
+def _statement_failed(exception_context: ExceptionContext) -> None:
+    scope = _current_scope()
+    # ExceptionContext.cursor is never set; the execution context has the failed cursor
+    if scope is not None and exception_context.execution_context is not None:
+        scope._finished(exception_context.execution_context.cursor)
@@ -1,18 +1,26 @@
 from __future__ import annotations
 
 import logging
-from typing import Final
+from typing import TYPE_CHECKING, Final
 
 from great_expectations_cloud.agent import GXAgent
 from great_expectations_cloud.agent.agent import GXAgentConfigError
 
+if TYPE_CHECKING:
+    from great_expectations_cloud.agent.constants import ExecutionMode
+
 LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 
 
-def run_agent() -> None:
-    """Run an instance of the GX Agent."""
+def run_agent(max_workers: int | None = None, execution_mode: ExecutionMode | None = None) -> None:
+    """Run an instance of the GX Agent.
+
+    Args:
+        max_workers: number of jobs to run concurrently. Defaults to GX_AGENT_MAX_WORKERS.
+        execution_mode: run jobs on threads or prefork processes. Defaults to GX_AGENT_EXECUTION_MODE.
+    """
     try:
-        agent = GXAgent()
+        agent = GXAgent(max_workers=max_workers, execution_mode=execution_mode)
         agent.run()
     except GXAgentConfigError as error:
         # catch error to avoid stacktrace printout
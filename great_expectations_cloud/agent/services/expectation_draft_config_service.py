@@ -7,8 +7,7 @@ from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin
 from uuid import UUID
 
-from great_expectations.core.http import create_session
-
+from great_expectations_cloud.agent.cloud_client import get_cloud_session
 from great_expectations_cloud.agent.models import CreatedResource
 from great_expectations_cloud.agent.services.exceptions import MissingCloudConfigError
 
@@ -94,7 +93,7 @@ class ExpectationDraftConfigService:
         if event_id:
             headers["Agent-Job-Id"] = event_id
 
-        with create_session(access_token=self._context.ge_cloud_config.access_token) as session:
+        with get_cloud_session(access_token=self._context.ge_cloud_config.access_token) as session:
             response = session.post(url=url, json=payload, headers=headers)
             if response.status_code != HTTPStatus.CREATED:
                 raise ExpectationDraftConfigError(
@@ -6,8 +6,7 @@ from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 from uuid import UUID
 
-from great_expectations.core.http import create_session
-
+from great_expectations_cloud.agent.cloud_client import get_cloud_session
 from great_expectations_cloud.agent.expect_ai.asset_review_agent.state import (
     ExistingExpectationContext,
 )
@@ -57,7 +56,7 @@ class ExpectationService:
             url=f"/api/v1/organizations/{organization_id}/workspaces/{workspace_id}/expectations?data_asset_id={asset.id}",
         )
 
-        with create_session(access_token=self._context.ge_cloud_config.access_token) as session:
+        with get_cloud_session(access_token=self._context.ge_cloud_config.access_token) as session:
             response = session.get(url=url)
             if response.status_code != HTTPStatus.OK:
                 raise ListExpectationsError(
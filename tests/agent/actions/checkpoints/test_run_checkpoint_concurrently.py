@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from great_expectations_cloud.agent import action_settings
+from great_expectations_cloud.agent.action_settings import ActionSettings
+from great_expectations_cloud.agent.actions.run_checkpoint import (
+    run_checkpoint,
+    run_checkpoint_concurrently,
+)
+from great_expectations_cloud.agent.cloud_client import (
+    get_job_correlation_id,
+    set_job_correlation_id,
+)
+from great_expectations_cloud.agent.models import RunCheckpointEvent
+
+pytestmark = pytest.mark.unit
+
+
+class ConcurrencyTracker:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._running: dict[str, int] = {}
+        self.max_running: dict[str, int] = {}
+        self.max_running_total = 0
+
+    def run(self, datasource_name: str, seconds: float) -> None:
+        with self._lock:
+            self._running[datasource_name] = self._running.get(datasource_name, 0) + 1
+            self.max_running[datasource_name] = max(
+                self.max_running.get(datasource_name, 0), self._running[datasource_name]
+            )
+            self.max_running_total = max(self.max_running_total, sum(self._running.values()))
+        time.sleep(seconds)
+        with self._lock:
+            self._running[datasource_name] -= 1
+
+
+def build_validation_definition(
+    tracker: ConcurrencyTracker,
+    data_source: MagicMock,
+    seconds: float = 0.2,
+) -> MagicMock:
+    vd = MagicMock()
+    vd.data_source = data_source
+
+    def run(**kwargs: Any) -> MagicMock:
+        tracker.run(data_source.name, seconds)
+        return MagicMock(batch_id=f"batch-{id(vd)}")
+
+    vd.run.side_effect = run
+    return vd
+
+
+def build_data_source(name: str) -> MagicMock:
+    data_source = MagicMock()
+    data_source.name = name
+    return data_source
+
+
+def build_checkpoint(validation_definitions: list[MagicMock]) -> MagicMock:
+    checkpoint = MagicMock()
+    checkpoint.validation_definitions = validation_definitions
+    checkpoint.is_fresh.return_value.success = True
+    checkpoint._build_result_key.side_effect = lambda validation_definition, **kwargs: id(
+        validation_definition
+    )
+    return checkpoint
+
+
+@pytest.fixture
+def tracker() -> ConcurrencyTracker:
+    return ConcurrencyTracker()
+
+
+def test_validation_definitions_run_concurrently_within_the_datasource_limit(tracker):
+    warehouse = [build_data_source("warehouse") for _ in range(4)]
+    lake = [build_data_source("lake") for _ in range(2)]
+    vds = [build_validation_definition(tracker, ds) for ds in warehouse + lake]
+    checkpoint = build_checkpoint(vds)
+
+    start = time.monotonic()
+    run_checkpoint_concurrently(
+        checkpoint, batch_parameters=None, expectation_parameters=None, validations_per_datasource=2
+    )
+
+    # four on the warehouse two at a time, alongside the lake
+    assert time.monotonic() - start < 0.6
+    assert tracker.max_running == {"warehouse": 2, "lake": 2}
+    assert tracker.max_running_total == 4
+
+
+def test_results_are_merged_in_checkpoint_order_before_actions_run(tracker):
+    slow = build_validation_definition(tracker, build_data_source("warehouse"), seconds=0.3)
+    fast = build_validation_definition(tracker, build_data_source("lake"), seconds=0)
+    checkpoint = build_checkpoint([slow, fast])
+
+    result = run_checkpoint_concurrently(
+        checkpoint,
+        batch_parameters={"year": 2024},
+        expectation_parameters=None,
+        validations_per_datasource=1,
+    )
+
+    run_results = checkpoint._construct_result.call_args.kwargs["run_results"]
+    assert list(run_results) == [id(slow), id(fast)]
+    assert [r.batch_id for r in run_results.values()] == [f"batch-{id(slow)}", f"batch-{id(fast)}"]
+    checkpoint._run_actions.assert_called_once_with(
+        checkpoint_result=checkpoint._construct_result.return_value
+    )
+    assert result is checkpoint._construct_result.return_value
+    assert slow.run.call_args.kwargs["batch_parameters"] == {"year": 2024}
+    assert slow.run.call_args.kwargs["run_id"] is fast.run.call_args.kwargs["run_id"]
+
+
+def test_validation_definitions_sharing_a_datasource_object_run_one_after_another(tracker):
+    data_source = build_data_source("warehouse")
+    vds = [build_validation_definition(tracker, data_source) for _ in range(3)]
+    checkpoint = build_checkpoint(vds)
+
+    run_checkpoint_concurrently(
+        checkpoint, batch_parameters=None, expectation_parameters=None, validations_per_datasource=3
+    )
+
+    assert tracker.max_running == {"warehouse": 1}
+
+
+def test_first_failure_is_raised_and_actions_are_skipped(tracker):
+    first = build_validation_definition(tracker, build_data_source("warehouse"))
+    first.run.side_effect = ValueError("first")
+    second = build_validation_definition(tracker, build_data_source("lake"))
+    second.run.side_effect = ValueError("second")
+    checkpoint = build_checkpoint([first, second])
+
+    with pytest.raises(ValueError, match="first"):
+        run_checkpoint_concurrently(
+            checkpoint,
+            batch_parameters=None,
+            expectation_parameters=None,
+            validations_per_datasource=1,
+        )
+
+    checkpoint._run_actions.assert_not_called()
+
+
+def test_validation_threads_are_tagged_with_the_job(tracker):
+    seen: list[str | None] = []
+    vd = build_validation_definition(tracker, build_data_source("warehouse"))
+
+    def run(**kwargs: Any) -> MagicMock:
+        seen.append(get_job_correlation_id())
+        return MagicMock()
+
+    vd.run.side_effect = run
+    checkpoint = build_checkpoint([vd])
+    set_job_correlation_id("job-1")
+    try:
+        run_checkpoint_concurrently(
+            checkpoint,
+            batch_parameters=None,
+            expectation_parameters=None,
+            validations_per_datasource=1,
+        )
+    finally:
+        set_job_correlation_id(None)
+
+    assert seen == ["job-1"]
+
+
+@pytest.mark.parametrize(
+    "validations_per_datasource, vd_count, runs_concurrently",
+    [(0, 2, False), (2, 1, False), (2, 2, True)],
+)
+def test_run_checkpoint_validates_concurrently_when_enabled(
+    mocker, monkeypatch, tracker, validations_per_datasource, vd_count, runs_concurrently
+):
+    monkeypatch.setattr(
+        action_settings,
+        "_settings",
+        ActionSettings(validations_per_datasource=validations_per_datasource),
+    )
+    concurrently = mocker.patch(
+        "great_expectations_cloud.agent.actions.run_checkpoint.run_checkpoint_concurrently"
+    )
+    mocker.patch(
+        "great_expectations_cloud.agent.actions.run_checkpoint.check_datasources_and_assets_connections"
+    )
+    context = MagicMock()
+    checkpoint = context.checkpoints.get.return_value
+    checkpoint.validation_definitions = [
+        build_validation_definition(tracker, build_data_source(f"ds-{index}"))
+        for index in range(vd_count)
+    ]
+    checkpoint.run.return_value.run_results = {}
+    concurrently.return_value.run_results = {}
+    event = RunCheckpointEvent(
+        checkpoint_id=uuid.uuid4(),
+        datasource_names_to_asset_names={},
+        organization_id=uuid.uuid4(),
+        workspace_id=uuid.uuid4(),
+        checkpoint_name="checkpoint",
+    )
+
+    run_checkpoint(context, event, id="job-1")
+
+    assert concurrently.called is runs_concurrently
+    assert checkpoint.run.called is not runs_concurrently
@@ -1,20 +1,31 @@
 from __future__ import annotations
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 import pytest
+import sqlalchemy as sa
 from great_expectations.datasource.fluent import Datasource
 from great_expectations.datasource.fluent.interfaces import (
     DataAsset,
     TestConnectionError,
 )
 
+from great_expectations_cloud.agent import circuit_breaker
+from great_expectations_cloud.agent.actions import run_checkpoint
 from great_expectations_cloud.agent.actions.run_checkpoint import (
+    CONNECTION_TEST_WORKERS_PER_JOB,
     DataSourceAssets,
     check_datasource_and_assets_connection,
     check_datasource_and_assets_connection_with_timeout,
+    check_datasources_and_assets_connections,
+)
+from great_expectations_cloud.agent.circuit_breaker import (
+    MIN_LATENCY_SAMPLES,
+    DatasourceCircuitBreaker,
 )
 
 if TYPE_CHECKING:
@@ -29,6 +40,7 @@ def mock_datasource(mocker: MockerFixture) -> MagicMock:
     datasource = mocker.Mock(spec=Datasource)
     datasource.name = "test-datasource"
     datasource.type = "sql"
+    datasource.dict.return_value = {"name": "test-datasource"}
     datasource.test_connection.return_value = None
     return datasource  # type: ignore[no-any-return]
 
@@ -318,3 +330,212 @@ class TestCheckDatasourceAndAssetsConnectionWithTimeout:
             )
 
         mock_datasource.test_connection.assert_called_once_with(test_assets=False)
+
+
+class TestCheckDatasourcesAndAssetsConnections:
+    """Tests for check_datasources_and_assets_connections function."""
+
+    def build_datasource_assets(
+        self, mocker: MockerFixture, name: str, connection_seconds: float = 0
+    ) -> tuple[DataSourceAssets, MagicMock, MagicMock]:
+        datasource = mocker.Mock(spec=Datasource)
+        datasource.name = name
+        datasource.test_connection.side_effect = lambda **kwargs: time.sleep(connection_seconds)
+        asset = mocker.Mock(spec=DataAsset)
+        asset.name = f"{name}-asset"
+        asset.test_connection.side_effect = lambda: time.sleep(connection_seconds)
+        data_source_assets = DataSourceAssets(
+            data_source=datasource, assets_by_name={asset.name: asset}
+        )
+        return data_source_assets, datasource, asset
+
+    def test_datasources_are_tested_concurrently(
+        self, mocker: MockerFixture, log_extra: dict[str, str]
+    ) -> None:
+        built = {
+            name: self.build_datasource_assets(mocker, name, connection_seconds=0.5)
+            for name in ("ds-1", "ds-2", "ds-3")
+        }
+
+        start = time.monotonic()
+        check_datasources_and_assets_connections(
+            {name: data_source_assets for name, (data_source_assets, _, _) in built.items()},
+            log_extra,
+            timeout=5,
+        )
+
+        # one datasource and one asset test after another per datasource, all in parallel
+        assert time.monotonic() - start < 1.5
+        for _, datasource, asset in built.values():
+            datasource.test_connection.assert_called_once_with(test_assets=False)
+            asset.test_connection.assert_called_once_with()
+
+    def test_failures_of_several_datasources_are_reported_together(
+        self, mocker: MockerFixture, log_extra: dict[str, str]
+    ) -> None:
+        failing, failing_datasource, failing_asset = self.build_datasource_assets(
+            mocker, "ds-failing"
+        )
+        failing_datasource.test_connection.side_effect = TestConnectionError(message="refused")
+        slow, _, _ = self.build_datasource_assets(mocker, "ds-slow", connection_seconds=3)
+        healthy, _, _ = self.build_datasource_assets(mocker, "ds-healthy")
+
+        with pytest.raises(TestConnectionError) as error:
+            check_datasources_and_assets_connections(
+                {"ds-failing": failing, "ds-slow": slow, "ds-healthy": healthy},
+                log_extra,
+                timeout=1,
+            )
+
+        assert "ds-failing: refused" in str(error.value)
+        assert "Datasource 'ds-slow' was unresponsive after 1 seconds" in str(error.value)
+        assert "ds-healthy" not in str(error.value)
+        failing_asset.test_connection.assert_not_called()
+
+    def test_queries_of_timed_out_tests_are_cancelled(
+        self, mocker: MockerFixture, log_extra: dict[str, str]
+    ) -> None:
+        engine = sa.create_engine("sqlite://")
+        released = threading.Event()
+
+        def endless_query() -> None:
+            try:
+                with engine.connect() as connection:
+                    connection.execute(
+                        sa.text(
+                            "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) "
+                            "SELECT count(*) FROM c"
+                        )
+                    )
+            finally:
+                released.set()
+
+        data_source_assets, _, asset = self.build_datasource_assets(mocker, "ds-slow")
+        asset.test_connection.side_effect = endless_query
+
+        with pytest.raises(TestConnectionError, match="'ds-slow' was unresponsive"):
+            check_datasources_and_assets_connections(
+                {"ds-slow": data_source_assets}, log_extra, timeout=1
+            )
+
+        # the pool thread is freed rather than left running the query
+        assert released.wait(timeout=5)
+
+    def test_deadline_starts_when_the_test_runs_on_a_saturated_pool(
+        self, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, log_extra: dict[str, str]
+    ) -> None:
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(run_checkpoint, "_connection_test_pool", pool)
+        # another job's test holds the only pool thread for longer than the timeout
+        pool.submit(time.sleep, 1.5)
+        data_source_assets, datasource, asset = self.build_datasource_assets(mocker, "ds-1")
+
+        try:
+            check_datasources_and_assets_connections(
+                {"ds-1": data_source_assets}, log_extra, timeout=1
+            )
+        finally:
+            pool.shutdown()
+
+        datasource.test_connection.assert_called_once_with(test_assets=False)
+        asset.test_connection.assert_called_once_with()
+
+    def test_job_keeps_its_share_of_the_pool(
+        self, mocker: MockerFixture, log_extra: dict[str, str]
+    ) -> None:
+        running = 0
+        most_running = 0
+        lock = threading.Lock()
+
+        def counted_test() -> None:
+            nonlocal running, most_running
+            with lock:
+                running += 1
+                most_running = max(most_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        data_source_assets, _, _ = self.build_datasource_assets(mocker, "ds-1")
+        for name in (f"asset-{i}" for i in range(CONNECTION_TEST_WORKERS_PER_JOB * 3)):
+            asset = mocker.Mock(spec=DataAsset)
+            asset.name = name
+            asset.test_connection.side_effect = counted_test
+            data_source_assets.assets_by_name[name] = asset
+
+        check_datasources_and_assets_connections({"ds-1": data_source_assets}, log_extra, timeout=5)
+
+        assert most_running == CONNECTION_TEST_WORKERS_PER_JOB
+
+
+class TestCircuitBreaker:
+    """Tests for the circuit breaker around check_datasources_and_assets_connections."""
+
+    @pytest.fixture
+    def breaker(self, monkeypatch: pytest.MonkeyPatch) -> DatasourceCircuitBreaker:
+        breaker = DatasourceCircuitBreaker(
+            failure_threshold=1, open_seconds=60, min_timeout_seconds=1
+        )
+        monkeypatch.setattr(circuit_breaker, "_breaker", breaker)
+        return breaker
+
+    def test_unreachable_datasource_fails_fast(
+        self,
+        breaker: DatasourceCircuitBreaker,
+        mock_datasource: MagicMock,
+        log_extra: dict[str, str],
+    ) -> None:
+        mock_datasource.test_connection.side_effect = TestConnectionError(message="refused")
+        data_sources_assets = DataSourceAssets(data_source=mock_datasource, assets_by_name={})
+        with pytest.raises(TestConnectionError, match="refused"):
+            check_datasources_and_assets_connections(
+                {"test-datasource": data_sources_assets}, log_extra
+            )
+
+        with pytest.raises(TestConnectionError, match="failed its last 1 connection tests"):
+            check_datasources_and_assets_connections(
+                {"test-datasource": data_sources_assets}, log_extra
+            )
+
+        mock_datasource.test_connection.assert_called_once_with(test_assets=False)
+
+    def test_failing_asset_does_not_open_the_circuit(
+        self,
+        breaker: DatasourceCircuitBreaker,
+        mock_datasource: MagicMock,
+        mock_data_asset: MagicMock,
+        log_extra: dict[str, str],
+    ) -> None:
+        mock_data_asset.test_connection.side_effect = TestConnectionError(message="no table")
+        data_sources_assets = DataSourceAssets(
+            data_source=mock_datasource, assets_by_name={"test-asset": mock_data_asset}
+        )
+
+        for _ in range(2):
+            with pytest.raises(TestConnectionError, match="no table"):
+                check_datasources_and_assets_connections(
+                    {"test-datasource": data_sources_assets}, log_extra
+                )
+
+        assert mock_datasource.test_connection.call_count == 2
+
+    def test_timeout_follows_connect_latency(
+        self,
+        breaker: DatasourceCircuitBreaker,
+        mock_datasource: MagicMock,
+        mock_data_asset: MagicMock,
+        log_extra: dict[str, str],
+    ) -> None:
+        for _ in range(MIN_LATENCY_SAMPLES):
+            breaker.record_success(mock_datasource, connect_seconds=0.01)
+        mock_data_asset.test_connection.side_effect = lambda: time.sleep(3)
+        data_sources_assets = DataSourceAssets(
+            data_source=mock_datasource, assets_by_name={"test-asset": mock_data_asset}
+        )
+
+        with pytest.raises(
+            TestConnectionError, match="'test-datasource' was unresponsive after 1 seconds"
+        ):
+            check_datasources_and_assets_connections(
+                {"test-datasource": data_sources_assets}, log_extra, timeout=600
+            )
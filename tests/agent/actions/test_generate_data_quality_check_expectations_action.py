@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import logging
+import sqlite3
+import threading
+import time
 import uuid
 from collections.abc import Callable
+from contextlib import closing
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
+import great_expectations as gx
 import great_expectations.expectations as gx_expectations
 import pytest
 from great_expectations.datasource.fluent.interfaces import TestConnectionError
@@ -28,22 +34,30 @@ from great_expectations.experimental.metric_repository.metrics import (
     TableMetric,
 )
 
+from great_expectations_cloud.agent import action_settings
+from great_expectations_cloud.agent.action_settings import ActionSettings
 from great_expectations_cloud.agent.actions.generate_data_quality_check_expectations_action import (
     GenerateDataQualityCheckExpectationsAction,
     PartialGenerateDataQualityCheckExpectationError,
     _strip_bracketed_error_code,
 )
 from great_expectations_cloud.agent.analytics import AgentAnalytics
+from great_expectations_cloud.agent.exceptions import GXAgentError
 from great_expectations_cloud.agent.models import (
+    CreatedResource,
     DomainContext,
     GenerateDataQualityCheckExpectationsEvent,
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from great_expectations.data_context.data_context.cloud_data_context import CloudDataContext
     from great_expectations.datasource.fluent import DataAsset
     from pytest_mock import MockerFixture
 
+    from tests.agent.conftest import MockCreateSessionType
+
 pytestmark = pytest.mark.unit
 
 LOGGER = logging.getLogger(__name__)
@@ -301,7 +315,7 @@ def test_generate_schema_change_expectations_action_success(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -358,7 +372,7 @@ def test_anomaly_detection_expectation_not_created_if_asset_already_has_coverage
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -411,7 +425,7 @@ def test_generate_completeness_expectation_not_added_when_coverage_already_exist
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -438,15 +452,15 @@ def test_generate_completeness_expectation_not_added_when_coverage_already_exist
         action, "_get_current_anomaly_detection_coverage", side_effect=mock_get_coverage
     )
 
-    # Mock the _create_expectation_for_asset method to capture created expectations
+    # Mock the _create_expectations_for_asset method to capture created expectations
     created_expectations = []
 
-    def mock_create_expectation(expectation, asset_id, created_via):
-        created_expectations.append(expectation)
-        return uuid.uuid4()
+    def mock_create_expectations(expectations, asset_id, created_via):
+        created_expectations.extend(expectations)
+        return [uuid.uuid4() for _ in expectations]
 
     mocker.patch.object(
-        action, "_create_expectation_for_asset", side_effect=mock_create_expectation
+        action, "_create_expectations_for_asset", side_effect=mock_create_expectations
     )
 
     # Run the action with expect_non_null_proportion_enabled=True
@@ -529,7 +543,7 @@ def test_succeeding_and_failing_assets_together(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -590,7 +604,7 @@ def test_missing_table_columns_metric_raises_runtime_error(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -636,7 +650,7 @@ def test_generate_volume_change_forecast_expectations_action_success(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -711,7 +725,7 @@ def test_generate_completeness_expectations_with_proportion_approach(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -738,15 +752,15 @@ def test_generate_completeness_expectations_with_proportion_approach(
         action, "_get_current_anomaly_detection_coverage", side_effect=mock_get_coverage
     )
 
-    # Mock the _create_expectation_for_asset method to capture created expectations
+    # Mock the _create_expectations_for_asset method to capture created expectations
     created_expectations = []
 
-    def mock_create_expectation(expectation, asset_id, created_via):
-        created_expectations.append(expectation)
-        return uuid.uuid4()
+    def mock_create_expectations(expectations, asset_id, created_via):
+        created_expectations.extend(expectations)
+        return [uuid.uuid4() for _ in expectations]
 
     mocker.patch.object(
-        action, "_create_expectation_for_asset", side_effect=mock_create_expectation
+        action, "_create_expectations_for_asset", side_effect=mock_create_expectations
     )
 
     # Run the action
@@ -795,7 +809,7 @@ def test_generate_completeness_forecast_expectations_action_success(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -822,15 +836,15 @@ def test_generate_completeness_forecast_expectations_action_success(
         action, "_get_current_anomaly_detection_coverage", side_effect=mock_get_coverage
     )
 
-    # Mock the _create_expectation_for_asset method to capture created expectations
+    # Mock the _create_expectations_for_asset method to capture created expectations
     created_expectations = []
 
-    def mock_create_expectation(expectation, asset_id, created_via):
-        created_expectations.append(expectation)
-        return uuid.uuid4()
+    def mock_create_expectations(expectations, asset_id, created_via):
+        created_expectations.extend(expectations)
+        return [uuid.uuid4() for _ in expectations]
 
     mocker.patch.object(
-        action, "_create_expectation_for_asset", side_effect=mock_create_expectation
+        action, "_create_expectations_for_asset", side_effect=mock_create_expectations
     )
 
     # Run the action
@@ -892,7 +906,7 @@ def test_completeness_expectations_count_based_on_data(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -919,15 +933,15 @@ def test_completeness_expectations_count_based_on_data(
         action, "_get_current_anomaly_detection_coverage", side_effect=mock_get_coverage
     )
 
-    # Mock the _create_expectation_for_asset method to capture created expectations
+    # Mock the _create_expectations_for_asset method to capture created expectations
     created_expectations = []
 
-    def mock_create_expectation(expectation, asset_id, created_via):
-        created_expectations.append(expectation)
-        return uuid.uuid4()
+    def mock_create_expectations(expectations, asset_id, created_via):
+        created_expectations.extend(expectations)
+        return [uuid.uuid4() for _ in expectations]
 
     mocker.patch.object(
-        action, "_create_expectation_for_asset", side_effect=mock_create_expectation
+        action, "_create_expectations_for_asset", side_effect=mock_create_expectations
     )
 
     # Run the action
@@ -958,7 +972,7 @@ def test_generate_completeness_expectations_edge_cases(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -983,9 +997,9 @@ def test_generate_completeness_expectations_edge_cases(
     # All nulls (non_null_proportion = 0)
     created_expectations = []
 
-    def mock_create_expectation(expectation, asset_id, created_via):
-        created_expectations.append(expectation)
-        return uuid.uuid4()
+    def mock_create_expectations(expectations, asset_id, created_via):
+        created_expectations.extend(expectations)
+        return [uuid.uuid4() for _ in expectations]
 
     def mock_get_metrics_all_nulls(data_asset):
         metrics = mock_completeness_metrics(100, 100)  # 100 nulls out of 100 rows
@@ -993,7 +1007,7 @@ def test_generate_completeness_expectations_edge_cases(
 
     mocker.patch.object(action, "_get_metrics", side_effect=mock_get_metrics_all_nulls)
     mocker.patch.object(
-        action, "_create_expectation_for_asset", side_effect=mock_create_expectation
+        action, "_create_expectations_for_asset", side_effect=mock_create_expectations
     )
 
     action.run(
@@ -1072,7 +1086,7 @@ def test_test_connection_error_logs_at_warning_not_error(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -1153,7 +1167,7 @@ def test_non_test_connection_error_logs_at_error(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -1259,7 +1273,7 @@ def test_error_message_includes_asset_error_details(
     action = GenerateDataQualityCheckExpectationsAction(
         context=mock_context,
         metric_repository=mock_metric_repository,
-        batch_inspector=mock_batch_inspector,
+        batch_inspector_factory=lambda: mock_batch_inspector,
         base_url="",
         auth_key="",
         domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
@@ -1307,5 +1321,279 @@ def test_error_message_includes_asset_error_details(
     assert "Check your connection details" in error_message
 
 
+@pytest.mark.parametrize("asset_workers, max_running", [(4, 4), (1, 1)])
+def test_assets_are_processed_concurrently_in_a_deterministic_order(
+    mock_context: CloudDataContext,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    asset_workers: int,
+    max_running: int,
+):
+    monkeypatch.setattr(
+        action_settings,
+        "_settings",
+        ActionSettings(data_quality_check_asset_workers=asset_workers),
+    )
+    action = GenerateDataQualityCheckExpectationsAction(
+        context=mock_context,
+        metric_repository=mocker.Mock(spec=MetricRepository),
+        batch_inspector_factory=lambda: mocker.Mock(spec=BatchInspector),
+        base_url="",
+        auth_key="",
+        domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
+        analytics=AgentAnalytics(),
+    )
+    lock = threading.Lock()
+    running = [0]
+    seen_running: list[int] = []
+    asset_names = [f"asset-{index}" for index in range(8)]
+
+    def generate_for_asset(
+        event: GenerateDataQualityCheckExpectationsEvent,
+        asset_name: str,
+        created_resources: list[CreatedResource],
+    ) -> None:
+        with lock:
+            running[0] += 1
+            seen_running.append(running[0])
+        # later assets finish first
+        time.sleep(0.05 * (len(asset_names) - asset_names.index(asset_name)))
+        with lock:
+            running[0] -= 1
+        created_resources.append(CreatedResource(resource_id=asset_name, type="MetricRun"))
+        if asset_name in ("asset-1", "asset-6"):
+            raise RuntimeError(f"{asset_name} failed")  # noqa: TRY003
+
+    mocker.patch.object(action, "_generate_for_asset", side_effect=generate_for_asset)
+
+    with pytest.raises(PartialGenerateDataQualityCheckExpectationError) as e:
+        action.run(
+            event=GenerateDataQualityCheckExpectationsEvent(
+                type="generate_data_quality_check_expectations_request.received",
+                organization_id=uuid.uuid4(),
+                datasource_name="test-datasource",
+                data_assets=asset_names,
+                selected_data_quality_issues=[DataQualityIssues.SCHEMA],
+                workspace_id=uuid.uuid4(),
+            ),
+            id="test-id",
+        )
+
+    assert max(seen_running) == max_running
+    assert "Unable to autogenerate expectations for 2 of 8 Data Assets." in str(e.value)
+    assert str(e.value).index("asset-1: asset-1 failed") < str(e.value).index(
+        "asset-6: asset-6 failed"
+    )
+
+
+def test_created_resources_follow_event_order(
+    mock_context: CloudDataContext, mocker: MockerFixture
+):
+    action = GenerateDataQualityCheckExpectationsAction(
+        context=mock_context,
+        metric_repository=mocker.Mock(spec=MetricRepository),
+        batch_inspector_factory=lambda: mocker.Mock(spec=BatchInspector),
+        base_url="",
+        auth_key="",
+        domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
+        analytics=AgentAnalytics(),
+    )
+    asset_names = [f"asset-{index}" for index in range(6)]
+
+    def generate_for_asset(
+        event: GenerateDataQualityCheckExpectationsEvent,
+        asset_name: str,
+        created_resources: list[CreatedResource],
+    ) -> None:
+        time.sleep(0.02 * (len(asset_names) - asset_names.index(asset_name)))
+        created_resources.append(CreatedResource(resource_id=asset_name, type="MetricRun"))
+        created_resources.append(
+            CreatedResource(resource_id=f"{asset_name}-expectation", type="Expectation")
+        )
+
+    mocker.patch.object(action, "_generate_for_asset", side_effect=generate_for_asset)
+
+    result = action.run(
+        event=GenerateDataQualityCheckExpectationsEvent(
+            type="generate_data_quality_check_expectations_request.received",
+            organization_id=uuid.uuid4(),
+            datasource_name="test-datasource",
+            data_assets=asset_names,
+            selected_data_quality_issues=[DataQualityIssues.SCHEMA],
+            workspace_id=uuid.uuid4(),
+        ),
+        id="test-id",
+    )
+
+    assert [resource.resource_id for resource in result.created_resources] == [
+        resource_id
+        for asset_name in asset_names
+        for resource_id in (asset_name, f"{asset_name}-expectation")
+    ]
+
+
+def test_expectations_are_created_in_batches_on_one_session(
+    mock_context: CloudDataContext,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_create_session: MockCreateSessionType,
+):
+    monkeypatch.setattr(action_settings, "_settings", ActionSettings(expectation_batch_size=2))
+    module_path = GenerateDataQualityCheckExpectationsAction.__module__
+    session = mock_create_session(module_path, "post", HTTPStatus.CREATED, {})
+    expectation_ids = [uuid.uuid4() for _ in range(5)]
+    responses = iter([expectation_ids[:2], expectation_ids[2:4], expectation_ids[4:]])
+
+    def post(url: str, json: list[dict[str, Any]]) -> Any:
+        response = mocker.Mock(status_code=HTTPStatus.CREATED)
+        response.json.return_value = {"data": [{"id": str(id)} for id in next(responses)]}
+        return response
+
+    session.post.side_effect = post
+    action = GenerateDataQualityCheckExpectationsAction(
+        context=mock_context,
+        metric_repository=mocker.Mock(spec=MetricRepository),
+        batch_inspector_factory=lambda: mocker.Mock(spec=BatchInspector),
+        base_url="https://api.greatexpectations.io",
+        auth_key="",
+        domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
+        analytics=AgentAnalytics(),
+    )
+    expectations: list[gx_expectations.Expectation] = [
+        gx_expectations.ExpectColumnProportionOfNonNullValuesToBeBetween(
+            column=f"col{index}", min_value=1, severity=FailureSeverity.WARNING
+        )
+        for index in range(5)
+    ]
+
+    created = action._create_expectations_for_asset(
+        expectations=expectations, asset_id=TABLE_ASSET_ID, created_via="test"
+    )
+
+    assert created == expectation_ids
+    payloads = [call.kwargs["json"] for call in session.post.call_args_list]
+    assert [len(payload) for payload in payloads] == [2, 2, 1]
+    assert [item["kwargs"]["column"] for payload in payloads for item in payload] == [
+        f"col{index}" for index in range(5)
+    ]
+    assert all(
+        item["expectation_type"] == "expect_column_proportion_of_non_null_values_to_be_between"
+        and item["autogenerated"]
+        and item["created_via"] == "test"
+        for payload in payloads
+        for item in payload
+    )
+    assert session.post.call_args.kwargs["url"].endswith(f"/expectations/{TABLE_ASSET_ID}")
+    mock_get_cloud_session = mocker.patch(f"{module_path}.get_cloud_session")
+    assert action._create_expectations_for_asset([], TABLE_ASSET_ID, None) == []
+    mock_get_cloud_session.assert_not_called()
+
+
+def test_failed_batch_raises(
+    mock_context: CloudDataContext,
+    mocker: MockerFixture,
+    mock_create_session: MockCreateSessionType,
+):
+    mock_create_session(
+        GenerateDataQualityCheckExpectationsAction.__module__,
+        "post",
+        HTTPStatus.BAD_REQUEST,
+        {},
+    )
+    action = GenerateDataQualityCheckExpectationsAction(
+        context=mock_context,
+        metric_repository=mocker.Mock(spec=MetricRepository),
+        batch_inspector_factory=lambda: mocker.Mock(spec=BatchInspector),
+        base_url="https://api.greatexpectations.io",
+        auth_key="",
+        domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
+        analytics=AgentAnalytics(),
+    )
+
+    with pytest.raises(
+        GXAgentError,
+        match="Failed to add autogenerated expectations: "
+        "expect_column_proportion_of_non_null_values_to_be_between",
+    ):
+        action._create_expectations_for_asset(
+            expectations=[
+                gx_expectations.ExpectColumnProportionOfNonNullValuesToBeBetween(
+                    column="col1", min_value=1
+                )
+            ],
+            asset_id=TABLE_ASSET_ID,
+            created_via=None,
+        )
+
+
+def test_each_asset_is_inspected_with_its_own_validator(
+    tmp_path: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        action_settings, "_settings", ActionSettings(data_quality_check_asset_workers=4)
+    )
+    database = tmp_path / "warehouse.db"
+    tables = {
+        f"table_{index}": [f"t{index}_col{column}" for column in range(3)] for index in range(4)
+    }
+    with closing(sqlite3.connect(database)) as connection:
+        for table, columns in tables.items():
+            connection.execute(f"CREATE TABLE {table} ({', '.join(columns)})")
+            connection.execute(f"INSERT INTO {table} VALUES (1, NULL, 3)")
+        connection.commit()
+    context = gx.get_context(mode="file", project_root_dir=tmp_path)
+    datasource = context.data_sources.add_sqlite(
+        name="warehouse", connection_string=f"sqlite:///{database}"
+    )
+    asset_ids = {
+        datasource.add_table_asset(name=table, table_name=table).id: table for table in tables
+    }
+    # every asset's validator is built before any of them is used
+    all_built = threading.Barrier(len(tables))
+    get_validator = context.get_validator
+
+    def build_validator(**kwargs: Any) -> Any:
+        validator = get_validator(**kwargs)
+        all_built.wait(timeout=10)
+        return validator
+
+    mocker.patch.object(context, "get_validator", side_effect=build_validator)
+    metric_repository = mocker.Mock(spec=MetricRepository)
+    metric_repository.add_metric_run.return_value = uuid.uuid4()
+    action = GenerateDataQualityCheckExpectationsAction(
+        context=context,  # type: ignore[arg-type] # a file context works the same here
+        metric_repository=metric_repository,
+        base_url="",
+        auth_key="",
+        domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
+        analytics=AgentAnalytics(),
+    )
+
+    action.run(
+        event=GenerateDataQualityCheckExpectationsEvent(
+            type="generate_data_quality_check_expectations_request.received",
+            organization_id=uuid.uuid4(),
+            datasource_name="warehouse",
+            data_assets=list(tables),
+            selected_data_quality_issues=[],
+            workspace_id=uuid.uuid4(),
+        ),
+        id="test-id",
+    )
+
+    metric_runs: list[MetricRun] = [
+        call.args[0] for call in metric_repository.add_metric_run.call_args_list
+    ]
+    assert len(metric_runs) == len(tables)
+    for metric_run in metric_runs:
+        table = asset_ids[metric_run.data_asset_id]
+        non_null_counts = {
+            metric.column: metric.value
+            for metric in metric_run.metrics
+            if isinstance(metric, ColumnMetric)
+        }
+        assert non_null_counts == dict(zip(tables[table], (1, 0, 1), strict=True))
+
+
 if __name__ == "__main__":
     print(GenerateDataQualityCheckExpectationsEvent.__module__)
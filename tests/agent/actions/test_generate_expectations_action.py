@@ -24,6 +24,7 @@ from great_expectations_cloud.agent.expect_ai.asset_review_agent.agent import As
 from great_expectations_cloud.agent.expect_ai.asset_review_agent.state import (
     GenerateExpectationsOutputMetrics,
 )
+from great_expectations_cloud.agent.expect_ai.metric_service import MetricCacheStats
 from great_expectations_cloud.agent.models import (
     CreatedResource,
     DomainContext,
@@ -723,6 +724,7 @@ def test_run_generate_expectations_action_empty_table_error(
     workspace_id: uuid.UUID,
     mocker: MockerFixture,
     mock_openai_credentials: None,
+    caplog: pytest.LogCaptureFixture,
 ):
     """Test that GenerateExpectationsAction raises RuntimeError when the table has no records."""
     # Arrange
@@ -748,6 +750,7 @@ def test_run_generate_expectations_action_empty_table_error(
         "great_expectations_cloud.agent.actions.generate_expectations_action.MetricService"
     )
     mock_metric_service.return_value.get_metric_result.return_value = mock_metric_result
+    mock_metric_service.return_value.cache_stats = MetricCacheStats(hits=0, misses=1)
 
     generate_expectations_event = GenerateExpectationsEvent(
         organization_id=organization_id,
@@ -784,3 +787,6 @@ def test_run_generate_expectations_action_empty_table_error(
     assert "Ensure the table or view connected to your Data Asset has records and try again" in str(
         exc_info.value
     )
+    # the job's metric cache usage is reported even though it failed
+    (stats,) = [record for record in caplog.records if record.msg == "metric_cache.stats"]
+    assert (stats.__dict__["hits"], stats.__dict__["misses"]) == (0, 1)
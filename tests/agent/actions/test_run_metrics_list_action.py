@@ -18,8 +18,11 @@ from great_expectations.experimental.metric_repository.metrics import (
     MetricTypes,
 )
 
+from great_expectations_cloud.agent import action_settings
+from great_expectations_cloud.agent.action_settings import ActionSettings
 from great_expectations_cloud.agent.actions import MetricListAction
 from great_expectations_cloud.agent.analytics import AgentAnalytics
+from great_expectations_cloud.agent.column_chunk_metric_retriever import ColumnChunkMetricRetriever
 from great_expectations_cloud.agent.models import (
     CreatedResource,
     DomainContext,
@@ -272,3 +275,26 @@ def test_run_metrics_list_creates_metric_run_then_raises_on_any_metric_exception
             id="test-id",
         )
     mock_metric_repository.add_metric_run.assert_called_once_with(mock_metric_run)
+
+
+def test_run_metrics_list_chunks_columns_as_configured(
+    mock_context: CloudDataContext, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        action_settings,
+        "_settings",
+        ActionSettings(metric_column_chunk_size=100, metric_column_workers=2),
+    )
+
+    action = MetricListAction(
+        context=mock_context,
+        base_url="",
+        auth_key="",
+        domain_context=DomainContext(organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()),
+        analytics=AgentAnalytics(),
+    )
+
+    (retriever,) = action._batch_inspector._metric_retrievers
+    assert isinstance(retriever, ColumnChunkMetricRetriever)
+    assert retriever._column_chunk_size == 100
+    assert retriever._max_workers == 2
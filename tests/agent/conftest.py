@@ -18,6 +18,7 @@ from great_expectations.data_context import CloudDataContext
 from packaging.version import Version
 from typing_extensions import override
 
+from great_expectations_cloud.agent import circuit_breaker
 from great_expectations_cloud.agent.actions.agent_action import ActionResult, AgentAction
 from great_expectations_cloud.agent.event_handler import (
     register_event_action,
@@ -44,6 +45,12 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker(monkeypatch: pytest.MonkeyPatch) -> None:
+    # a GXAgent configures the process-wide breaker, whose open circuits would fail later tests
+    monkeypatch.setattr(circuit_breaker, "_breaker", circuit_breaker._breaker)
+
+
 @pytest.fixture
 def base_url() -> str:
     return "https://api.greatexpectations.io"
@@ -102,7 +109,7 @@ def mock_create_session(mocker: MockerFixture):
     Factory fixture that creates a mock session for HTTP requests.
 
     Returns a callable that accepts:
-    - module_path: The module path where create_session should be patched
+    - module_path: The module path where get_cloud_session should be patched
     - http_method: The HTTP method to mock (e.g., 'get', 'post')
     - status_code: The HTTP status code to return
     - response_data: The response data to return
@@ -116,8 +123,8 @@ def mock_create_session(mocker: MockerFixture):
         status_code: HTTPStatus,
         response_data: dict[str, Any],
     ):
-        # Patch create_session in the specified module
-        mock_session_factory = mocker.patch(f"{module_path}.create_session")
+        # Patch get_cloud_session in the specified module
+        mock_session_factory = mocker.patch(f"{module_path}.get_cloud_session")
 
         # Create a mock response
         mock_response = mocker.Mock()
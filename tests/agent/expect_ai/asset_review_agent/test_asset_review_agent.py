@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest import mock
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, create_autospec
 
 import pytest
 from great_expectations import ExpectationSuite
+from great_expectations.core.batch_definition import BatchDefinition
 from great_expectations.expectations import (
     ExpectColumnValuesToBeUnique as GXExpectColumnValuesToBeUnique,
 )
+from langchain_core.runnables import RunnableConfig
 from langgraph.constants import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 
@@ -24,7 +27,14 @@ from great_expectations_cloud.agent.expect_ai.asset_review_agent.state import (
     GenerateExpectationsOutputMetrics,
     GenerateExpectationsState,
 )
-from great_expectations_cloud.agent.expect_ai.expectations import ExpectColumnValuesToBeUnique
+from great_expectations_cloud.agent.expect_ai.expectations import (
+    ExpectColumnValuesToBeUnique,
+    UnexpectedRowsExpectation,
+)
+from great_expectations_cloud.agent.expect_ai.graphs.expectation_checker import (
+    ExpectationCheckerInput,
+)
+from great_expectations_cloud.agent.expect_ai.graphs.job_node import JOB_NODES
 from great_expectations_cloud.agent.expect_ai.metric_service import MetricService
 from great_expectations_cloud.agent.expect_ai.tools.metrics import AgentToolsManager
 from great_expectations_cloud.agent.expect_ai.tools.query_runner import QueryRunner
@@ -101,3 +111,113 @@ async def test_asset_review_agent_interface(
     assert isinstance(result.expectation_suite, ExpectationSuite)
     assert len(result.expectation_suite.expectations) == 1
     assert isinstance(result.expectation_suite.expectations[0], GXExpectColumnValuesToBeUnique)
+
+
+def _state_with_potential_expectations(columns: list[str]) -> GenerateExpectationsState:
+    return GenerateExpectationsState(
+        organization_id="test_org",
+        data_source_name="test_datasource",
+        data_asset_name="test_asset",
+        batch_definition_name="test_batch_def",
+        batch_definition=create_autospec(BatchDefinition, instance=True),
+        messages=[],
+        potential_expectations=[
+            ExpectColumnValuesToBeUnique(column=column, description=column, mostly=1.0)
+            for column in columns
+        ],
+        expectations=[],
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_expectations_are_checked_concurrently_in_order() -> None:
+    agent = AssetReviewAgent(
+        tools_manager=MagicMock(spec=AgentToolsManager),
+        query_runner=MagicMock(spec=QueryRunner),
+        metric_service=MagicMock(spec=MetricService),
+        max_concurrent_checks=3,
+    )
+    all_checks_started = asyncio.Barrier(3)
+
+    async def check(checker_input: ExpectationCheckerInput, config: Any) -> dict[str, Any]:
+        # times out unless the three checks run at once
+        await asyncio.wait_for(all_checks_started.wait(), timeout=5)
+        expectation = checker_input.expectation
+        error = "rejected" if expectation.description == "b" else None
+        return {"expectation": expectation, "error": error}
+
+    agent._expectation_checker_subgraph = MagicMock()
+    agent._expectation_checker_subgraph.ainvoke = AsyncMock(side_effect=check)
+
+    output = await agent._invoke_expectation_checker(
+        _state_with_potential_expectations(["a", "b", "c"]), RunnableConfig(configurable={})
+    )
+
+    assert [expectation.description for expectation in output.expectations] == ["a", "c"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_expectation_checks_are_capped() -> None:
+    agent = AssetReviewAgent(
+        tools_manager=MagicMock(spec=AgentToolsManager),
+        query_runner=MagicMock(spec=QueryRunner),
+        metric_service=MagicMock(spec=MetricService),
+        max_concurrent_checks=2,
+    )
+    running = 0
+    most_running = 0
+
+    async def check(checker_input: ExpectationCheckerInput, config: Any) -> dict[str, Any]:
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"expectation": checker_input.expectation, "error": None}
+
+    agent._expectation_checker_subgraph = MagicMock()
+    agent._expectation_checker_subgraph.ainvoke = AsyncMock(side_effect=check)
+
+    output = await agent._invoke_expectation_checker(
+        _state_with_potential_expectations(["a", "b", "c", "d", "e"]),
+        RunnableConfig(configurable={}),
+    )
+
+    assert len(output.expectations) == 5
+    assert most_running == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_jobs_share_the_compiled_graphs_but_not_their_services() -> None:
+    query_runners = [MagicMock(spec=QueryRunner), MagicMock(spec=QueryRunner)]
+    agents = [
+        AssetReviewAgent(
+            tools_manager=MagicMock(spec=AgentToolsManager),
+            query_runner=query_runner,
+            metric_service=MagicMock(spec=MetricService),
+        )
+        for query_runner in query_runners
+    ]
+    assert agents[0]._build_agent_graph() is agents[1]._build_agent_graph()
+    assert agents[0]._expectation_checker_subgraph is agents[1]._expectation_checker_subgraph
+
+    for query_runner in query_runners:
+        query_runner.get_dialect.return_value = "postgresql"
+        query_runner.check_query_compiles.return_value = (True, None)
+    for agent, table in zip(agents, ["first", "second"], strict=True):
+        state = _state_with_potential_expectations([])
+        state.data_asset_name = table
+        state.potential_expectations = [
+            UnexpectedRowsExpectation(query="SELECT * FROM {batch}", description=table)
+        ]
+        await agent._invoke_expectation_checker(
+            state, RunnableConfig(configurable={JOB_NODES: agent._job_nodes()})
+        )
+
+    for query_runner, table in zip(query_runners, ["first", "second"], strict=True):
+        query_runner.check_query_compiles.assert_called_once_with(
+            data_source_name="test_datasource", query_text=f"SELECT * FROM {table}"
+        )
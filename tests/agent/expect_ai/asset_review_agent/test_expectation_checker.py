@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from great_expectations_cloud.agent.analytics import AgentAnalytics, RejectionReason
+from great_expectations_cloud.agent.expect_ai.exceptions import MissingJobNodeError
 from great_expectations_cloud.agent.expect_ai.expectations import (
     ExpectColumnValuesToBeUnique,
     ExpectColumnValuesToMatchRegex,
@@ -18,6 +19,7 @@ from great_expectations_cloud.agent.expect_ai.graphs.expectation_checker import
     ExpectationCheckerNode,
     ExpectationCheckerState,
 )
+from great_expectations_cloud.agent.expect_ai.graphs.job_node import JOB_NODES
 from great_expectations_cloud.agent.expect_ai.tools.query_runner import QueryRunner
 
 if TYPE_CHECKING:
@@ -262,3 +264,45 @@ async def test_expectation_checker_allows_regex_for_non_mssql_dialect(
     )
     mock_analytics.emit_expectation_rejected.assert_not_called()
     mock_query_runner.check_query_compiles.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_shared_graph_runs_the_job_nodes(
+    mock_query_runner: MagicMock, config: RunnableConfig
+) -> None:
+    mock_query_runner.get_dialect.return_value = "postgresql"
+    mock_query_runner.check_query_compiles.return_value = (True, None)
+    checker = ExpectationChecker(query_runner=mock_query_runner)
+    expectation = UnexpectedRowsExpectation(
+        query="SELECT * FROM {batch} WHERE value < 0",
+        description="Find negative values",
+    )
+
+    result = await ExpectationChecker.shared_graph().ainvoke(
+        ExpectationCheckerInput(
+            expectation=expectation, data_source_name="test_source", data_asset_name="test_asset"
+        ),
+        {"configurable": {**config["configurable"], JOB_NODES: checker.job_nodes()}},
+    )
+
+    assert result["success"] is True
+    assert result["expectation"] == expectation
+    mock_query_runner.check_query_compiles.assert_called_once_with(
+        data_source_name="test_source", query_text="SELECT * FROM test_asset WHERE value < 0"
+    )
+    assert ExpectationChecker.shared_graph() is ExpectationChecker.shared_graph()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_shared_graph_requires_the_job_nodes(config: RunnableConfig) -> None:
+    expectation = ExpectColumnValuesToBeUnique(column="test_column", description="test", mostly=1.0)
+
+    with pytest.raises(MissingJobNodeError):
+        await ExpectationChecker.shared_graph().ainvoke(
+            ExpectationCheckerInput(
+                expectation=expectation, data_source_name="foo", data_asset_name="bar"
+            ),
+            config,
+        )
@@ -1,19 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from typing import Any
 from unittest.mock import Mock, create_autospec
 
 import pytest
 from great_expectations.core.batch_definition import BatchDefinition
+from great_expectations.datasource.fluent import SQLDatasource
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
 
+from great_expectations_cloud.agent import datasource_limiter
+from great_expectations_cloud.agent.cloud_client import (
+    get_job_correlation_id,
+    set_job_correlation_id,
+)
+from great_expectations_cloud.agent.datasource_limiter import DatasourceLimiter
 from great_expectations_cloud.agent.expect_ai.asset_review_agent.agent import MetricProviderNode
 from great_expectations_cloud.agent.expect_ai.asset_review_agent.state import (
     GenerateExpectationsState,
 )
+from great_expectations_cloud.agent.expect_ai.metric_service import MetricService
 from great_expectations_cloud.agent.expect_ai.tools.metrics import AgentToolsManager
 
 
+def _batch_definition_on(dialect: str) -> Mock:
+    datasource = Mock(spec=SQLDatasource)
+    datasource.name = "test_datasource"
+    datasource.data_context.ge_cloud_config = None
+    datasource.get_engine.return_value.dialect.name = dialect
+    batch_definition: Mock = create_autospec(BatchDefinition, instance=True)
+    batch_definition.data_asset.datasource = datasource
+    return batch_definition
+
+
+@pytest.fixture(autouse=True)
+def limiter(monkeypatch: pytest.MonkeyPatch) -> DatasourceLimiter:
+    limiter = DatasourceLimiter()
+    monkeypatch.setattr(datasource_limiter, "_limiter", limiter)
+    return limiter
+
+
 class TestMetricProviderNodeInitialization:
     @pytest.mark.unit
     def test_init_with_tools_manager(self) -> None:
@@ -55,7 +84,7 @@ class TestMetricProviderNodeCall:
             data_source_name="test_datasource",
             data_asset_name="test_asset",
             batch_definition_name="test_batch_def",
-            batch_definition=create_autospec(BatchDefinition, instance=True),
+            batch_definition=_batch_definition_on("postgresql"),
             messages=[ai_message],
             potential_expectations=[],
             expectations=[],
@@ -251,3 +280,301 @@ class TestMetricProviderNodeCall:
         assert len(messages) == 2  # 1 ToolMessage + 1 HumanMessage
         assert isinstance(messages[0], ToolMessage)
         assert messages[0].content == "Tool result"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_call_runs_tools_concurrently_off_the_event_loop(
+        self,
+        metric_provider_node: MetricProviderNode,
+        sample_state_with_tool_calls: GenerateExpectationsState,
+        mock_config: RunnableConfig,
+        mock_tools_manager: Mock,
+    ) -> None:
+        # each tool blocks until both are running, which deadlocks if they run one at a time
+        both_running = threading.Barrier(2, timeout=5)
+        event_loop_thread = threading.current_thread()
+        tool_threads: list[threading.Thread] = []
+
+        def blocking_metric(**kwargs: object) -> str:
+            tool_threads.append(threading.current_thread())
+            both_running.wait()
+            return f"Metric for {kwargs['column']}"
+
+        mock_tool_1 = Mock()
+        mock_tool_1.name = "ColumnDescriptiveStats"
+        mock_tool_1.func = Mock(side_effect=blocking_metric)
+        mock_tool_2 = Mock()
+        mock_tool_2.name = "ColumnDistinctValues"
+        mock_tool_2.func = Mock(side_effect=blocking_metric)
+        mock_tools_manager.get_tools.return_value = [mock_tool_1, mock_tool_2]
+
+        result = await metric_provider_node(sample_state_with_tool_calls, mock_config)
+
+        messages = result["messages"]
+        assert [message.content for message in messages[:2]] == [
+            "Metric for age",
+            "Metric for status",
+        ]
+        assert event_loop_thread not in tool_threads
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_call_caps_concurrent_tools(
+        self,
+        sample_state_with_tool_calls: GenerateExpectationsState,
+        mock_config: RunnableConfig,
+        mock_tools_manager: Mock,
+    ) -> None:
+        lock = threading.Lock()
+        running = 0
+        most_running = 0
+
+        def metric(**kwargs: object) -> str:
+            nonlocal running, most_running
+            with lock:
+                running += 1
+                most_running = max(most_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return "ok"
+
+        mock_tool_1 = Mock()
+        mock_tool_1.name = "ColumnDescriptiveStats"
+        mock_tool_1.func = Mock(side_effect=metric)
+        mock_tool_2 = Mock()
+        mock_tool_2.name = "ColumnDistinctValues"
+        mock_tool_2.func = Mock(side_effect=metric)
+        mock_tools_manager.get_tools.return_value = [mock_tool_1, mock_tool_2]
+        node = MetricProviderNode(tools_manager=mock_tools_manager, max_concurrent_metrics=1)
+
+        await node(sample_state_with_tool_calls, mock_config)
+
+        assert most_running == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("dialect", ["sqlite", "mssql", "bigquery", "databricks"])
+    async def test_call_runs_tools_one_after_another_on_a_single_connection(
+        self,
+        metric_provider_node: MetricProviderNode,
+        sample_state_with_tool_calls: GenerateExpectationsState,
+        mock_config: RunnableConfig,
+        mock_tools_manager: Mock,
+        dialect: str,
+    ) -> None:
+        # GX runs these dialects' queries on one persistent connection
+        sample_state_with_tool_calls.batch_definition = _batch_definition_on(dialect)
+        lock = threading.Lock()
+        running = 0
+        most_running = 0
+
+        def metric(**kwargs: object) -> str:
+            nonlocal running, most_running
+            with lock:
+                running += 1
+                most_running = max(most_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return "ok"
+
+        mock_tool_1 = Mock()
+        mock_tool_1.name = "ColumnDescriptiveStats"
+        mock_tool_1.func = Mock(side_effect=metric)
+        mock_tool_2 = Mock()
+        mock_tool_2.name = "ColumnDistinctValues"
+        mock_tool_2.func = Mock(side_effect=metric)
+        mock_tools_manager.get_tools.return_value = [mock_tool_1, mock_tool_2]
+
+        await metric_provider_node(sample_state_with_tool_calls, mock_config)
+
+        assert most_running == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_call_caps_concurrent_tools_across_jobs_of_the_data_source(
+        self,
+        sample_state_with_tool_calls: GenerateExpectationsState,
+        mock_config: RunnableConfig,
+    ) -> None:
+        lock = threading.Lock()
+        running = 0
+        most_running = 0
+
+        def metric(**kwargs: object) -> str:
+            nonlocal running, most_running
+            with lock:
+                running += 1
+                most_running = max(most_running, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return "ok"
+
+        def job_node() -> MetricProviderNode:
+            mock_tool_1 = Mock()
+            mock_tool_1.name = "ColumnDescriptiveStats"
+            mock_tool_1.func = Mock(side_effect=metric)
+            mock_tool_2 = Mock()
+            mock_tool_2.name = "ColumnDistinctValues"
+            mock_tool_2.func = Mock(side_effect=metric)
+            tools_manager = Mock(spec=AgentToolsManager)
+            tools_manager.get_tools.return_value = [mock_tool_1, mock_tool_2]
+            return MetricProviderNode(tools_manager=tools_manager, max_concurrent_metrics=2)
+
+        other_state = sample_state_with_tool_calls.model_copy(
+            update={"batch_definition": _batch_definition_on("postgresql")}
+        )
+
+        await asyncio.gather(
+            job_node()(sample_state_with_tool_calls, mock_config),
+            job_node()(other_state, mock_config),
+        )
+
+        assert most_running == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_call_tags_tool_threads_with_the_job(
+        self,
+        metric_provider_node: MetricProviderNode,
+        sample_state_with_tool_calls: GenerateExpectationsState,
+        mock_config: RunnableConfig,
+        mock_tools_manager: Mock,
+    ) -> None:
+        correlation_ids: list[str | None] = []
+
+        def metric(**kwargs: object) -> str:
+            correlation_ids.append(get_job_correlation_id())
+            return "ok"
+
+        mock_tool_1 = Mock()
+        mock_tool_1.name = "ColumnDescriptiveStats"
+        mock_tool_1.func = Mock(side_effect=metric)
+        mock_tool_2 = Mock()
+        mock_tool_2.name = "ColumnDistinctValues"
+        mock_tool_2.func = Mock(side_effect=metric)
+        mock_tools_manager.get_tools.return_value = [mock_tool_1, mock_tool_2]
+
+        set_job_correlation_id("job-id")
+        try:
+            await metric_provider_node(sample_state_with_tool_calls, mock_config)
+        finally:
+            set_job_correlation_id(None)
+
+        assert correlation_ids == ["job-id", "job-id"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_call_computes_the_metrics_together_before_the_tools(
+        self,
+        metric_provider_node: MetricProviderNode,
+        sample_state_with_tool_calls: GenerateExpectationsState,
+        mock_config: RunnableConfig,
+        mock_tools_manager: Mock,
+    ) -> None:
+        calls: list[str] = []
+
+        def metric(**kwargs: object) -> str:
+            calls.append("tool")
+            return "ok"
+
+        mock_tools_manager.get_metric.side_effect = lambda name, args: f"{name}({args['column']})"
+        mock_tools_manager.compute_metrics.side_effect = lambda **kwargs: calls.append(
+            "compute_metrics"
+        )
+        mock_tool_1 = Mock()
+        mock_tool_1.name = "ColumnDescriptiveStats"
+        mock_tool_1.func = Mock(side_effect=metric)
+        mock_tool_2 = Mock()
+        mock_tool_2.name = "ColumnDistinctValues"
+        mock_tool_2.func = Mock(side_effect=metric)
+        mock_tools_manager.get_tools.return_value = [mock_tool_1, mock_tool_2]
+
+        await metric_provider_node(sample_state_with_tool_calls, mock_config)
+
+        mock_tools_manager.compute_metrics.assert_called_once_with(
+            batch_definition=sample_state_with_tool_calls.batch_definition,
+            batch_parameters=sample_state_with_tool_calls.batch_parameters,
+            metrics=["ColumnDescriptiveStats(age)", "ColumnDistinctValues(status)"],
+        )
+        assert calls == ["compute_metrics", "tool", "tool"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_call_runs_the_tools_when_computing_the_metrics_together_fails(
+        self,
+        metric_provider_node: MetricProviderNode,
+        sample_state_with_tool_calls: GenerateExpectationsState,
+        mock_config: RunnableConfig,
+        mock_tools_manager: Mock,
+    ) -> None:
+        mock_tools_manager.compute_metrics.side_effect = RuntimeError("connection lost")
+        mock_tool_1 = Mock()
+        mock_tool_1.name = "ColumnDescriptiveStats"
+        mock_tool_1.func = Mock(return_value="Stats: mean=35, std=10")
+        mock_tool_2 = Mock()
+        mock_tool_2.name = "ColumnDistinctValues"
+        mock_tool_2.func = Mock(return_value="Values: ['active', 'inactive']")
+        mock_tools_manager.get_tools.return_value = [mock_tool_1, mock_tool_2]
+
+        result = await metric_provider_node(sample_state_with_tool_calls, mock_config)
+
+        assert [message.content for message in result["messages"][:2]] == [
+            "Stats: mean=35, std=10",
+            "Values: ['active', 'inactive']",
+        ]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_call_computes_on_the_batch_one_tool_at_a_time_when_the_batched_metrics_fail(
+        self,
+        sample_state_with_tool_calls: GenerateExpectationsState,
+        mock_config: RunnableConfig,
+    ) -> None:
+        lock = threading.Lock()
+        running = 0
+        most_running = 0
+
+        class FakeBatch:
+            id = "test_batch_id"
+
+            def compute_metrics(self, metrics: object) -> Mock:
+                nonlocal running, most_running
+                if isinstance(metrics, list):
+                    raise ConnectionError
+                with lock:
+                    running += 1
+                    most_running = max(most_running, running)
+                time.sleep(0.05)
+                with lock:
+                    running -= 1
+                return Mock(value=f"{type(metrics).__name__} value")
+
+        batch_definition = sample_state_with_tool_calls.batch_definition
+        batch_definition.name = "test_batch_def"
+        batch_definition.get_batch.return_value = FakeBatch()
+        tools_manager = AgentToolsManager(
+            context=Mock(), metric_service=MetricService(context=Mock())
+        )
+        # both tools run at once, up to the batch they share
+        both_running = threading.Barrier(2, timeout=5)
+        for tool in tools_manager.get_tools("test_datasource"):
+            func = tool.func
+            assert func is not None
+
+            def entered_together(func: Any = func, **kwargs: Any) -> Any:
+                both_running.wait()
+                return func(**kwargs)
+
+            tool.func = entered_together
+        node = MetricProviderNode(tools_manager=tools_manager)
+
+        result = await node(sample_state_with_tool_calls, mock_config)
+
+        assert [message.content for message in result["messages"][:2]] == [
+            "ColumnDescriptiveStats value",
+            "{'ColumnDistinctValues': 'ColumnDistinctValues value'}",
+        ]
+        assert most_running == 1
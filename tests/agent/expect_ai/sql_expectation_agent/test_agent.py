@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
+
+import pytest
+from great_expectations.core.batch_definition import BatchDefinition
+
+from great_expectations_cloud.agent.expect_ai.metric_service import MetricService
+from great_expectations_cloud.agent.expect_ai.sql_expectation_agent.agent import (
+    PLANNER_NODE,
+    QUERY_REWRITER_NODE,
+    SQL_GENERATOR_NODE,
+    SQL_VALIDATOR_NODE,
+    SqlExpectationAgent,
+)
+from great_expectations_cloud.agent.expect_ai.sql_expectation_agent.state import (
+    SqlExpectationInput,
+)
+from great_expectations_cloud.agent.expect_ai.tools.query_runner import QueryRunner
+
+
+def _agent() -> SqlExpectationAgent:
+    return SqlExpectationAgent(
+        query_runner=MagicMock(spec=QueryRunner), metric_service=MagicMock(spec=MetricService)
+    )
+
+
+@pytest.mark.unit
+def test_jobs_share_the_compiled_graph() -> None:
+    assert _agent()._build_agent_graph() is _agent()._build_agent_graph()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_arun_runs_the_job_nodes() -> None:
+    agent = _agent()
+    job_nodes: dict[str, Any] = {
+        PLANNER_NODE: AsyncMock(
+            return_value={
+                "batch_definition": create_autospec(BatchDefinition, instance=True),
+                "messages": [],
+            }
+        ),
+        SQL_GENERATOR_NODE: AsyncMock(
+            return_value={
+                "potential_sql": "SELECT * FROM {batch} WHERE amount < 0",
+                "potential_description": "Expect no negative amounts",
+            }
+        ),
+        SQL_VALIDATOR_NODE: AsyncMock(return_value={"success": True}),
+        QUERY_REWRITER_NODE: AsyncMock(),
+    }
+
+    with patch.object(agent, "_job_nodes", return_value=job_nodes):
+        expectation = await agent.arun(
+            SqlExpectationInput(
+                organization_id="test_org",
+                workspace_id="test_workspace",
+                user_prompt="No negative amounts",
+                data_source_name="test_datasource",
+                data_asset_name="test_asset",
+                batch_definition_name="test_batch_def",
+            )
+        )
+
+    assert expectation.unexpected_rows_query == "SELECT * FROM {batch} WHERE amount < 0"
+    assert expectation.description == "Expect no negative amounts"
+    job_nodes[QUERY_REWRITER_NODE].assert_not_called()
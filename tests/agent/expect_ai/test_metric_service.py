@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 from unittest.mock import create_autospec
 
 import pytest
 from great_expectations.core.batch_definition import BatchDefinition
 from great_expectations.datasource.fluent.interfaces import Batch
+from great_expectations.metrics import ColumnNullCount
 from great_expectations.metrics.batch.row_count import BatchRowCount, BatchRowCountResult
 from great_expectations.metrics.metric_results import MetricErrorResult, MetricErrorResultValue
 from great_expectations.validator.metric_configuration import MetricConfigurationID
 
 from great_expectations_cloud.agent.expect_ai.metric_service import (
+    MetricCacheStats,
     MetricNotComputableError,
     MetricService,
 )
@@ -27,6 +32,7 @@ def mock_batch():
 @pytest.fixture
 def mock_batch_definition(mock_batch):
     mock_def = create_autospec(BatchDefinition)
+    mock_def.name = "test_batch_definition"
     mock_def.get_batch.return_value = mock_batch
     return mock_def
 
@@ -216,3 +222,174 @@ def test_get_metric_value_or_error_text_error(
     # Assert
     assert isinstance(result, str)
     assert "Could not compute metric" in result
+
+
+@pytest.mark.unit
+def test_metric_results_and_batches_are_reused(
+    mock_context, mock_batch, mock_batch_definition, mock_metric_result
+):
+    mock_batch.id = "test_batch_id"
+    mock_batch.compute_metrics.return_value = mock_metric_result
+    service = MetricService(context=mock_context)
+
+    results = [
+        service.get_metric_result(
+            batch_definition=mock_batch_definition,
+            metric=BatchRowCount(),
+            batch_parameters={"year": 2024, "month": 1},
+        ),
+        service.get_metric_result(
+            batch_definition=mock_batch_definition,
+            metric=BatchRowCount(),
+            batch_parameters={"month": 1, "year": 2024},
+        ),
+    ]
+
+    assert results == [mock_metric_result, mock_metric_result]
+    mock_batch_definition.get_batch.assert_called_once()
+    mock_batch.compute_metrics.assert_called_once()
+    assert service.cache_stats == MetricCacheStats(hits=1, misses=1)
+
+
+@pytest.mark.unit
+def test_batches_are_not_shared_between_batch_parameters(
+    mock_context, mock_batch, mock_batch_definition, mock_metric_result
+):
+    mock_batch.id = "test_batch_id"
+    mock_batch.compute_metrics.return_value = mock_metric_result
+    service = MetricService(context=mock_context)
+
+    for month in (1, 2):
+        service.get_metric_result(
+            batch_definition=mock_batch_definition,
+            metric=BatchRowCount(),
+            batch_parameters={"month": month},
+        )
+
+    assert mock_batch_definition.get_batch.call_count == 2
+
+
+@pytest.mark.unit
+def test_failed_metrics_are_not_reused(
+    mock_context, mock_batch, mock_batch_definition, mock_error_result
+):
+    mock_batch.id = "test_batch_id"
+    mock_batch.compute_metrics.return_value = mock_error_result
+    service = MetricService(context=mock_context)
+
+    for _ in range(2):
+        service.get_metric_result(
+            batch_definition=mock_batch_definition,
+            metric=BatchRowCount(),
+            batch_parameters=None,
+        )
+
+    assert mock_batch.compute_metrics.call_count == 2
+    assert service.cache_stats == MetricCacheStats(hits=0, misses=2)
+
+
+@pytest.mark.unit
+def test_metrics_computed_together_are_read_from_the_cache(
+    mock_context, mock_batch, mock_batch_definition, mock_metric_result, mock_error_result
+):
+    mock_batch.id = "test_batch_id"
+    mock_batch.compute_metrics.return_value = [mock_metric_result, mock_error_result]
+    service = MetricService(context=mock_context)
+
+    service.compute_metric_results(
+        batch_definition=mock_batch_definition,
+        metrics=[BatchRowCount(), BatchRowCount(), ColumnNullCount(column="age")],
+        batch_parameters=None,
+    )
+    mock_batch.compute_metrics.assert_called_once_with(
+        [BatchRowCount(), ColumnNullCount(column="age")]
+    )
+    assert (
+        service.get_metric_result(
+            batch_definition=mock_batch_definition, metric=BatchRowCount(), batch_parameters=None
+        )
+        == mock_metric_result
+    )
+
+    # the failed metric is computed again, on its own
+    mock_batch.compute_metrics.return_value = mock_metric_result
+    service.get_metric_result(
+        batch_definition=mock_batch_definition,
+        metric=ColumnNullCount(column="age"),
+        batch_parameters=None,
+    )
+    assert mock_batch.compute_metrics.call_count == 2
+    # results computed ahead of their request don't count as reused
+    assert service.cache_stats == MetricCacheStats(hits=0, misses=2)
+
+    service.compute_metric_results(
+        batch_definition=mock_batch_definition, metrics=[BatchRowCount()], batch_parameters=None
+    )
+    assert mock_batch.compute_metrics.call_count == 2
+
+
+@pytest.mark.unit
+def test_a_batch_computes_one_call_at_a_time(
+    mock_context, mock_batch, mock_batch_definition, mock_metric_result
+):
+    lock = threading.Lock()
+    running = 0
+    most_running = 0
+
+    def compute_metrics(metrics):
+        nonlocal running, most_running
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return mock_metric_result
+
+    mock_batch.id = "test_batch_id"
+    mock_batch.compute_metrics.side_effect = compute_metrics
+    service = MetricService(context=mock_context)
+    metrics = [ColumnNullCount(column=column) for column in ("a", "b", "c", "d")] * 2
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(
+            pool.map(
+                lambda metric: service.get_metric_result(
+                    batch_definition=mock_batch_definition, metric=metric, batch_parameters=None
+                ),
+                metrics,
+            )
+        )
+
+    assert most_running == 1
+    # a metric asked for while another caller computed it is read from the cache
+    assert mock_batch.compute_metrics.call_count == 4
+    assert service.cache_stats == MetricCacheStats(hits=4, misses=4)
+
+
+@pytest.mark.unit
+def test_a_batch_asked_for_at_once_is_loaded_once(
+    mock_context, mock_batch, mock_batch_definition, mock_metric_result
+):
+    def get_batch(batch_parameters):
+        time.sleep(0.02)
+        return mock_batch
+
+    mock_batch.id = "test_batch_id"
+    mock_batch.compute_metrics.return_value = mock_metric_result
+    mock_batch_definition.get_batch.side_effect = get_batch
+    service = MetricService(context=mock_context)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(
+            pool.map(
+                lambda _: service.get_metric_result(
+                    batch_definition=mock_batch_definition,
+                    metric=BatchRowCount(),
+                    batch_parameters=None,
+                ),
+                range(4),
+            )
+        )
+
+    mock_batch_definition.get_batch.assert_called_once()
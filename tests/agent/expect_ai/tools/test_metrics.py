@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import create_autospec
+
+import pytest
+from great_expectations.core.batch_definition import BatchDefinition
+from great_expectations.metrics import (
+    BatchRowCount,
+    ColumnDistinctValues,
+    ColumnNullCount,
+    ColumnSampleValues,
+    ColumnValuesMatchRegexCount,
+)
+
+from great_expectations_cloud.agent.expect_ai.metric_service import (
+    MetricNotComputableError,
+    MetricService,
+)
+from great_expectations_cloud.agent.expect_ai.tools.metrics import (
+    METRIC_TOOLS,
+    AgentToolsManager,
+    ExpectedCoreBatchDefinitionError,
+)
+
+
+@pytest.fixture
+def metric_service():
+    return create_autospec(MetricService, instance=True)
+
+
+@pytest.fixture
+def tools_manager(mock_context, metric_service):
+    return AgentToolsManager(context=mock_context, metric_service=metric_service)
+
+
+@pytest.mark.unit
+def test_every_metric_tool_has_its_metric(tools_manager):
+    assert {tool.name for tool in tools_manager.get_tools("test_datasource")} == set(METRIC_TOOLS)
+
+
+def _tool_value(tools_manager: AgentToolsManager, tool_name: str, **tool_args: str) -> Any:
+    tool = next(t for t in tools_manager.get_tools("test_datasource") if t.name == tool_name)
+    batch_definition = create_autospec(BatchDefinition, instance=True)
+    assert tool.func is not None
+    return tool.func(batch_definition=batch_definition, batch_parameters=None, **tool_args)
+
+
+@pytest.mark.unit
+def test_metric_tool_computes_its_metric(tools_manager, metric_service):
+    metric_service.get_metric_value.return_value = 3
+
+    assert _tool_value(tools_manager, "ColumnNullCount", column="age") == 3
+    assert metric_service.get_metric_value.call_args.kwargs["metric"] == ColumnNullCount(
+        column="age"
+    )
+
+
+@pytest.mark.unit
+def test_metric_tool_reports_its_value_under_the_metric_name(tools_manager, metric_service):
+    metric_service.get_metric_value.return_value = ["a", "b"]
+
+    assert _tool_value(tools_manager, "ColumnSampleValues", column="name") == {
+        ColumnSampleValues.__name__: ["a", "b"]
+    }
+
+
+@pytest.mark.unit
+def test_metric_tool_reports_the_error_of_a_metric_not_computable(tools_manager, metric_service):
+    metric_service.get_metric_value.side_effect = MetricNotComputableError("no such column")
+
+    assert _tool_value(tools_manager, "BatchRowCount") == (
+        "Could not compute metric: no such column"
+    )
+
+
+@pytest.mark.unit
+def test_metric_tool_reports_the_number_of_too_many_distinct_values(mock_context, metric_service):
+    tools_manager = AgentToolsManager(
+        context=mock_context, metric_service=metric_service, distinct_values_str_length_limit=10
+    )
+    metric_service.get_metric_value.return_value = ["active", "inactive", "pending"]
+
+    assert _tool_value(tools_manager, "ColumnDistinctValues", column="status") == {
+        ColumnDistinctValues.__name__: "Too many distinct values (3)"
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "tool_name,tool_args,expected",
+    [
+        ("BatchRowCount", {}, BatchRowCount()),
+        ("ColumnNullCount", {"column": "age"}, ColumnNullCount(column="age")),
+        (
+            "ColumnValuesMatchRegexCount",
+            {"column": "email", "regex": ".+@.+"},
+            ColumnValuesMatchRegexCount(column="email", regex=".+@.+"),
+        ),
+    ],
+)
+def test_get_metric(tools_manager, tool_name, tool_args, expected):
+    assert tools_manager.get_metric(tool_name, tool_args) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "tool_name,tool_args",
+    [("run_query", {"query": "SELECT 1"}), ("ColumnNullCount", {})],
+)
+def test_get_metric_without_a_metric(tools_manager, tool_name, tool_args):
+    assert tools_manager.get_metric(tool_name, tool_args) is None
+
+
+@pytest.mark.unit
+def test_compute_metrics(tools_manager, metric_service):
+    batch_definition = create_autospec(BatchDefinition, instance=True)
+    metrics = [BatchRowCount(), ColumnNullCount(column="age")]
+
+    tools_manager.compute_metrics(
+        batch_definition=batch_definition, batch_parameters=None, metrics=metrics
+    )
+
+    metric_service.compute_metric_results.assert_called_once_with(
+        batch_definition=batch_definition, metrics=metrics, batch_parameters=None
+    )
+
+
+@pytest.mark.unit
+def test_compute_metrics_requires_a_core_batch_definition(tools_manager):
+    with pytest.raises(ExpectedCoreBatchDefinitionError):
+        tools_manager.compute_metrics(
+            batch_definition=object(),
+            batch_parameters=None,
+            metrics=[BatchRowCount()],
+        )
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 import pytest
 
+from great_expectations_cloud.agent import datasource_limiter
+from great_expectations_cloud.agent.datasource_limiter import DatasourceLimiter
 from great_expectations_cloud.agent.expect_ai.tools.query_runner import QueryRunner
 
 
@@ -58,6 +63,66 @@ def test_check_query_compiles_returns_error_on_mssql_syntax_error() -> None:
     assert "Incorrect syntax" in error
 
 
+@pytest.mark.unit
+def test_check_query_compiles_turns_parseonly_off_after_an_mssql_error() -> None:
+    engine, conn = _make_engine("mssql")
+    conn.execute.side_effect = [None, Exception("Incorrect syntax near 'BADINPUT'"), None]
+
+    success, error = QueryRunner._check_query_compiles(engine, "SELECT BADINPUT")
+
+    assert success is False
+    assert error == "Incorrect syntax near 'BADINPUT'"
+    assert "SET PARSEONLY OFF" in str(conn.execute.call_args_list[-1][0][0])
+
+
+class TestCheckQueryCompilesConcurrently:
+    @pytest.fixture(autouse=True)
+    def limiter(self, monkeypatch: pytest.MonkeyPatch) -> DatasourceLimiter:
+        limiter = DatasourceLimiter()
+        monkeypatch.setattr(datasource_limiter, "_limiter", limiter)
+        return limiter
+
+    @staticmethod
+    def _most_running(dialect_name: str) -> int:
+        engine, conn = _make_engine(dialect_name)
+        lock = threading.Lock()
+        running = 0
+        most_running = 0
+
+        def execute(statement: object) -> None:
+            nonlocal running, most_running
+            with lock:
+                running += 1
+                most_running = max(most_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        conn.execute.side_effect = execute
+        context = MagicMock()
+        context.data_sources.get.return_value.get_execution_engine.return_value.engine = engine
+        runner = QueryRunner(context=context)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(
+                pool.map(lambda _: runner.check_query_compiles("ds", "SELECT 1"), range(4))
+            )
+
+        assert results == [(True, None)] * 4
+        return most_running
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("dialect_name", ["mssql", "sqlite", "bigquery", "databricks"])
+    def test_checks_one_at_a_time_on_one_connection(self, dialect_name: str) -> None:
+        # GX runs these dialects' queries on one persistent connection, where SET PARSEONLY
+        # of one check would apply to the others
+        assert self._most_running(dialect_name) == 1
+
+    @pytest.mark.unit
+    def test_checks_concurrently_on_pooled_connections(self) -> None:
+        assert self._most_running("postgresql") > 1
+
+
 class TestGetDialectConstraints:
     @staticmethod
     def _make_runner(dialect_name: str) -> QueryRunner:
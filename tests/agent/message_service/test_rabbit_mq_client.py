@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import pytest
+from pika.exceptions import ConnectionClosed
 
-from great_expectations_cloud.agent.exceptions import GXAgentUnrecoverableConnectionError
 from great_expectations_cloud.agent.message_service.asyncio_rabbit_mq_client import (
     AsyncRabbitMQClient,
 )
@@ -38,15 +38,47 @@ def test_rabbit_mq_client_calls_run_forever(pika, asyncio_connection):
     asyncio_connection().ioloop.run_forever.assert_called_with()
 
 
-def test_rabbit_mq_client_throws_appropriate_error(pika, asyncio_connection):
-    url = "test/url"
-    queue = "test-queue"
+def test_rabbit_mq_client_asks_to_reconnect_when_connection_is_lost(
+    pika, asyncio_connection, mocker
+):
+    client = AsyncRabbitMQClient(url="test/url")
+    connection = mocker.Mock()
+    client._connection = connection
 
-    def on_message():
-        return None
+    client._on_connection_closed(connection, ConnectionClosed(320, "CONNECTION_FORCED"))
 
-    client = AsyncRabbitMQClient(url=url)
-    client._is_unrecoverable = True
+    assert client.should_reconnect
+    connection.ioloop.stop.assert_called_with()
+
+
+def test_rabbit_mq_client_does_not_reconnect_when_stopped(pika, asyncio_connection, mocker):
+    client = AsyncRabbitMQClient(url="test/url")
+    connection = mocker.Mock()
+    client._connection = connection
+    client.stop()
+
+    client._on_connection_closed(connection, ConnectionClosed(200, "Normal shutdown"))
+
+    assert not client.should_reconnect
+
+
+def test_rabbit_mq_client_drops_ack_for_closed_channel(pika, asyncio_connection, mocker):
+    client = AsyncRabbitMQClient(url="test/url")
+    channel = mocker.Mock()
+    channel.is_open = False
+
+    client._ack_if_open(channel=channel, delivery_tag=1)
+    client._nack_if_open(channel=channel, delivery_tag=2, requeue=False)
+
+    channel.basic_ack.assert_not_called()
+    channel.basic_nack.assert_not_called()
+
+
+@pytest.mark.parametrize("prefetch_count", [1, 4])
+def test_rabbit_mq_client_sets_prefetch_count(pika, asyncio_connection, mocker, prefetch_count):
+    client = AsyncRabbitMQClient(url="test/url", prefetch_count=prefetch_count)
+    channel = mocker.Mock()
+
+    client._start_consuming(queue="test-queue", on_message=mocker.Mock(), channel=channel)
 
-    with pytest.raises(GXAgentUnrecoverableConnectionError):
-        client.run(queue=queue, on_message=on_message)  # type: ignore[arg-type] # test double
+    channel.basic_qos.assert_called_once_with(prefetch_count=prefetch_count)
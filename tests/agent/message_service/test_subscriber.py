@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import ANY
 
 import pytest
 
+from great_expectations_cloud.agent.exceptions import GXAgentUnrecoverableConnectionError
 from great_expectations_cloud.agent.message_service.asyncio_rabbit_mq_client import (
     AsyncRabbitMQClient,
+    OnMessagePayload,
 )
 from great_expectations_cloud.agent.message_service.subscriber import (
     EventContext,
@@ -32,6 +34,40 @@ def test_subscriber_consume_calls_run(mocker: MockerFixture):
     client.run.assert_called_with(queue=queue, on_message=ANY)
 
 
+def test_subscriber_reconnects_when_connection_is_lost(mocker: MockerFixture):
+    sleep = mocker.patch("great_expectations_cloud.agent.message_service.subscriber.time.sleep")
+    client = mocker.Mock(autospec=AsyncRabbitMQClient)
+    client.should_reconnect = True
+    client.was_consuming = True
+
+    def run(queue: str, on_message: Any) -> None:
+        # lose the connection once, then shut down normally
+        client.should_reconnect = client.run.call_count == 1
+
+    client.run.side_effect = run
+    subscriber = Subscriber(client=client)
+
+    subscriber.consume(queue="test-queue", on_message=lambda event_context: None)
+
+    assert client.run.call_count == 2
+    client.reset.assert_called_once_with()
+    sleep.assert_called_once()
+    assert 0 <= sleep.call_args.args[0] <= 2
+
+
+def test_subscriber_gives_up_after_max_reconnect_attempts(mocker: MockerFixture):
+    mocker.patch("great_expectations_cloud.agent.message_service.subscriber.time.sleep")
+    client = mocker.Mock(autospec=AsyncRabbitMQClient)
+    client.should_reconnect = True
+    client.was_consuming = False
+    subscriber = Subscriber(client=client, max_reconnect_attempts=3)
+
+    with pytest.raises(GXAgentUnrecoverableConnectionError):
+        subscriber.consume(queue="test-queue", on_message=lambda event_context: None)
+
+    assert client.run.call_count == 4
+
+
 def test_subscriber_close_closes_channel(mocker: MockerFixture):
     client = mocker.Mock(autospec=AsyncRabbitMQClient)
     subscriber = Subscriber(client=client)
@@ -66,3 +102,61 @@ def test_subscriber_close_handles_amqp_errors_from_connection(error, mocker: Moc
     subscriber = Subscriber(client=client)
 
     subscriber.close()  # no exception
+
+
+def _received_message(mocker: MockerFixture, client: AsyncRabbitMQClient) -> EventContext:
+    mocker.patch(
+        "great_expectations_cloud.agent.message_service.subscriber.EventHandler.parse_event_from"
+    )
+    received: list[EventContext] = []
+
+    def on_message(event_context: EventContext) -> None:
+        received.append(event_context)
+
+    Subscriber(client=client)._on_message_handler(
+        OnMessagePayload(correlation_id="job-id", delivery_tag=7, body=b"{}"),
+        on_message=on_message,
+    )
+    return received[0]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_redelivers_on_the_channel_the_message_arrived_on(
+    mocker: MockerFixture,
+):
+    mocker.patch("great_expectations_cloud.agent.message_service.subscriber.asyncio.sleep")
+    client = AsyncRabbitMQClient(url="test/url")
+    channel = mocker.Mock(is_open=True, is_closed=False)
+    client._channel = channel
+    event_context = _received_message(mocker, client)
+
+    await event_context.redeliver_message()
+
+    channel.basic_nack.assert_called_once_with(delivery_tag=7, requeue=True)
+
+
+@pytest.mark.asyncio
+async def test_subscriber_drops_the_redelivery_when_reconnected_during_its_delay(
+    mocker: MockerFixture,
+):
+    client = AsyncRabbitMQClient(url="test/url")
+    old_channel = mocker.Mock(is_open=True, is_closed=False)
+    new_channel = mocker.Mock(is_open=True, is_closed=False)
+    client._channel = old_channel
+    event_context = _received_message(mocker, client)
+
+    async def reconnect(delay: float) -> None:
+        old_channel.is_open, old_channel.is_closed = False, True
+        client.reset()
+        client._channel = new_channel
+
+    mocker.patch(
+        "great_expectations_cloud.agent.message_service.subscriber.asyncio.sleep",
+        side_effect=reconnect,
+    )
+
+    await event_context.redeliver_message()
+
+    # the delivery tag belongs to the old channel; the broker requeued the message itself
+    old_channel.basic_nack.assert_not_called()
+    new_channel.basic_nack.assert_not_called()
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+import os
 import random
 import signal
 import string
+import threading
 import uuid
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from typing import TYPE_CHECKING, Any, Literal
 from unittest.mock import call
@@ -13,6 +16,8 @@ from unittest.mock import call
 import pytest
 import requests
 import responses
+from great_expectations.datasource.fluent import Datasource
+from great_expectations.datasource.fluent.interfaces import TestConnectionError
 from pika.exceptions import (
     AuthenticationError,
     ConnectionClosedByBroker,
@@ -21,14 +26,21 @@ from pika.exceptions import (
 from pydantic.v1 import ValidationError
 from tenacity import RetryError
 
-from great_expectations_cloud.agent import GXAgent
+from great_expectations_cloud.agent import (
+    GXAgent,
+    action_settings,
+    circuit_breaker,
+    cloud_client,
+    connection_test_cache,
+)
 from great_expectations_cloud.agent.actions.agent_action import ActionResult
-from great_expectations_cloud.agent.agent import GXAgentConfig
-from great_expectations_cloud.agent.constants import USER_AGENT_HEADER
+from great_expectations_cloud.agent.agent import ActiveJob, GXAgentConfig
+from great_expectations_cloud.agent.constants import USER_AGENT_HEADER, ExecutionMode, JobWeight
 from great_expectations_cloud.agent.exceptions import (
     GXAgentConfigError,
     GXAgentError,
 )
+from great_expectations_cloud.agent.job_status_reporter import JobStatusReporter
 from great_expectations_cloud.agent.message_service.asyncio_rabbit_mq_client import (
     AsyncRabbitMQClient,
     ClientError,
@@ -46,6 +58,10 @@ from great_expectations_cloud.agent.models import (
     RunScheduledCheckpointEvent,
     UpdateJobStatusRequest,
 )
+from great_expectations_cloud.agent.prefork import (
+    PreforkExecutor,
+    handle_event_in_worker_process,
+)
 from tests.agent.conftest import FakeSubscriber
 
 if TYPE_CHECKING:
@@ -126,6 +142,141 @@ def test_get_data_context_builds_context_per_event(mocker, monkeypatch):
     assert get_context_spy.call_count == 2
 
 
+@pytest.mark.unit
+def test_get_data_context_reuses_warm_context_per_workspace(mocker, monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", str(uuid.uuid4()))
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "dummy")
+    monkeypatch.setenv("GX_CLOUD_BASE_URL", "http://localhost:5000/")
+    built_context = mocker.MagicMock()
+    get_context_spy = mocker.patch(
+        "great_expectations_cloud.agent.agent.get_context", return_value=built_context
+    )
+    agent = GXAgent()
+    event_context = mocker.Mock()
+    event_context.event.workspace_id = uuid.uuid4()
+
+    first = agent.get_data_context(event_context)
+    agent.release_data_context(event_context, first, reusable=True)
+    second = agent.get_data_context(event_context)
+
+    assert second is first is built_context
+    assert get_context_spy.call_count == 1
+    # the progress bar settings are only saved when the context is built
+    built_context.variables.save.assert_called_once_with()
+
+
+@pytest.mark.unit
+def test_get_data_context_rebuilds_context_after_failed_job(mocker, monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", str(uuid.uuid4()))
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "dummy")
+    monkeypatch.setenv("GX_CLOUD_BASE_URL", "http://localhost:5000/")
+    get_context_spy = mocker.patch("great_expectations_cloud.agent.agent.get_context")
+    get_context_spy.side_effect = lambda **kwargs: mocker.MagicMock()
+    agent = GXAgent()
+    event_context = mocker.Mock()
+    event_context.event.workspace_id = uuid.uuid4()
+
+    first = agent.get_data_context(event_context)
+    agent.release_data_context(event_context, first, reusable=False)
+    second = agent.get_data_context(event_context)
+
+    assert second is not first
+    assert get_context_spy.call_count == 2
+
+
+@pytest.mark.unit
+def test_get_data_context_pool_can_be_disabled(mocker, monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", str(uuid.uuid4()))
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "dummy")
+    monkeypatch.setenv("GX_CLOUD_BASE_URL", "http://localhost:5000/")
+    monkeypatch.setenv("GX_AGENT_DATA_CONTEXT_POOL_SIZE", "0")
+    get_context_spy = mocker.patch("great_expectations_cloud.agent.agent.get_context")
+    agent = GXAgent()
+    event_context = mocker.Mock()
+    event_context.event.workspace_id = uuid.uuid4()
+
+    agent.release_data_context(event_context, agent.get_data_context(event_context), reusable=True)
+    agent.get_data_context(event_context)
+
+    assert get_context_spy.call_count == 2
+
+
+@pytest.mark.unit
+def test_gx_agent_configures_connection_test_cache(mocker, monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", str(uuid.uuid4()))
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "dummy")
+    monkeypatch.setenv("GX_CLOUD_BASE_URL", "http://localhost:5000/")
+    monkeypatch.setenv("GX_AGENT_CONNECTION_TEST_TTL_SECONDS", "42")
+    # restore the process-wide cache after the test
+    monkeypatch.setattr(connection_test_cache, "_cache", connection_test_cache._cache)
+    mocker.patch("great_expectations_cloud.agent.agent.get_context")
+
+    GXAgent()
+
+    assert connection_test_cache.get_connection_test_cache().ttl_seconds == 42
+
+
+def test_gx_agent_configures_action_settings(mocker, monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", str(uuid.uuid4()))
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "dummy")
+    monkeypatch.setenv("GX_CLOUD_BASE_URL", "http://localhost:5000/")
+    monkeypatch.setenv("GX_AGENT_DATA_QUALITY_CHECK_ASSET_WORKERS", "2")
+    monkeypatch.setenv("GX_AGENT_EXPECTATION_BATCH_SIZE", "50")
+    monkeypatch.setenv("GX_AGENT_METRIC_COLUMN_CHUNK_SIZE", "100")
+    monkeypatch.setenv("GX_AGENT_METRIC_COLUMN_WORKERS", "2")
+    monkeypatch.setenv("GX_AGENT_VALIDATIONS_PER_DATASOURCE", "3")
+    monkeypatch.setattr(action_settings, "_settings", action_settings.ActionSettings())
+    mocker.patch("great_expectations_cloud.agent.agent.get_context")
+
+    GXAgent()
+
+    assert action_settings.get_action_settings() == action_settings.ActionSettings(
+        data_quality_check_asset_workers=2,
+        expectation_batch_size=50,
+        metric_column_chunk_size=100,
+        metric_column_workers=2,
+        validations_per_datasource=3,
+    )
+
+
+def test_gx_agent_configures_cloud_client(mocker, monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", str(uuid.uuid4()))
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "dummy")
+    monkeypatch.setenv("GX_CLOUD_BASE_URL", "http://localhost:5000/")
+    monkeypatch.setenv("GX_CLOUD_HTTP_TIMEOUT_SECONDS", "5")
+    monkeypatch.setenv("GX_CLOUD_HTTP_RETRIES", "2")
+    monkeypatch.setenv("GX_CLOUD_HTTP_BACKOFF_FACTOR", "0.5")
+    monkeypatch.setenv("GX_CLOUD_HTTP_POOL_SIZE", "3")
+    # restore the process-wide client after the test
+    monkeypatch.setattr(cloud_client, "_client", None)
+    monkeypatch.setattr(cloud_client, "_client_settings", cloud_client.GXCloudClientSettings())
+    mocker.patch("great_expectations_cloud.agent.agent.get_context")
+
+    GXAgent()
+
+    assert cloud_client.get_cloud_client()._settings == cloud_client.GXCloudClientSettings(
+        timeout_seconds=5, retries=2, backoff_factor=0.5, pool_size=3
+    )
+
+
+def test_gx_agent_configures_circuit_breaker(mocker, monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", str(uuid.uuid4()))
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "dummy")
+    monkeypatch.setenv("GX_CLOUD_BASE_URL", "http://localhost:5000/")
+    monkeypatch.setenv("GX_AGENT_CIRCUIT_BREAKER_FAILURES", "1")
+    mocker.patch("great_expectations_cloud.agent.agent.get_context")
+
+    GXAgent()
+
+    breaker = circuit_breaker.get_circuit_breaker()
+    datasource = mocker.Mock(spec=Datasource)
+    datasource.name = "warehouse"
+    datasource.dict.return_value = {"name": "warehouse"}
+    breaker.record_failure(datasource)
+    with pytest.raises(TestConnectionError, match="failed its last 1 connection tests"):
+        breaker.before_test(datasource)
+
+
 @pytest.fixture
 def set_required_env_vars(monkeypatch, random_uuid, random_string, local_mercury):
     monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", random_uuid)
@@ -266,8 +417,8 @@ def connection_string() -> str:
 
 @pytest.fixture(autouse=True)
 def create_session(mocker, queue, connection_string):
-    """Patch for great_expectations.core.http.create_session"""
-    create_session = mocker.patch("great_expectations_cloud.agent.agent.create_session")
+    """Patch for great_expectations_cloud.agent.cloud_client.get_cloud_session"""
+    create_session = mocker.patch("great_expectations_cloud.agent.agent.get_cloud_session")
     mock_response = mocker.Mock()
     mock_response.json.return_value = {
         "queue": queue,
@@ -350,7 +501,7 @@ def test_gx_agent_run_starts_subscriber(get_context, subscriber, client, gx_agen
     agent = GXAgent()
     agent.run()
 
-    subscriber.assert_called_with(client=client())
+    subscriber.assert_called_with(client=client(), max_reconnect_attempts=5)
 
 
 def test_gx_agent_run_invokes_consume(get_context, subscriber, client, gx_agent_config):
@@ -499,14 +650,10 @@ def test_gx_agent_updates_cloud_on_job_status(
 
     # sessions created with context managers now, so we need to
     # test the runtime calls rather than the return value calls.
-    # the calls also appear to store in any order, hence the any_order=True
-    create_session().__enter__().patch.assert_has_calls(
-        any_order=True,
-        calls=[
-            call(url, data=job_started_data),
-            call(url, data=job_completed_data),
-        ],
-    )
+    # JobStarted is dropped from the outbox if the job completes before it is sent
+    patch_calls = create_session().__enter__().patch.call_args_list
+    assert patch_calls[-1] == call(url, data=job_completed_data)
+    assert patch_calls[:-1] in ([], [call(url, data=job_started_data)])
 
 
 def test_gx_agent_sends_request_to_create_scheduled_job(
@@ -804,6 +951,7 @@ def test_handle_event_as_thread_exit_succeeds_when_job_succeeds(
     agent = GXAgent()
     update_status = mocker.patch.object(agent, "_update_status")
     agent._handle_event_as_thread_exit(future, event_context)
+    assert agent._status_reporter.flush(timeout=5)
 
     update_status.assert_called_once_with(
         correlation_id="test-correlation-id",
@@ -817,7 +965,7 @@ def test_handle_event_as_thread_exit_succeeds_when_job_succeeds(
     )
     event_context.processed_successfully.assert_called_once()
     event_context.processed_with_failures.assert_not_called()
-    assert agent._current_task is None
+    assert agent._active_jobs == {}
 
 
 def test_handle_event_as_thread_exit_succeeds_when_job_has_failure(
@@ -836,6 +984,7 @@ def test_handle_event_as_thread_exit_succeeds_when_job_has_failure(
     agent = GXAgent()
     update_status = mocker.patch.object(agent, "_update_status")
     agent._handle_event_as_thread_exit(future, event_context)
+    assert agent._status_reporter.flush(timeout=5)
 
     update_status.assert_called_once_with(
         correlation_id="test-correlation-id",
@@ -851,10 +1000,14 @@ def test_handle_event_as_thread_exit_succeeds_when_job_has_failure(
     # Should ACK the message since we ran the job
     event_context.processed_successfully.assert_called_once()
     event_context.processed_with_failures.assert_not_called()
-    assert agent._current_task is None
+    assert agent._active_jobs == {}
 
 
-def test_handle_event_as_thread_exit_update_status_failure(mocker, gx_agent_config, get_context):
+def test_handle_event_as_thread_exit_update_status_failure(
+    mocker, gx_agent_config, get_context, monkeypatch
+):
+    monkeypatch.setenv("GX_AGENT_STATUS_UPDATE_MAX_ATTEMPTS", "3")
+    monkeypatch.setenv("GX_AGENT_STATUS_UPDATE_BACKOFF_SECONDS", "0")
     event_context = mocker.Mock()
     event_context.correlation_id = "test-correlation-id"
     event_context.event.type = "test-event-type"
@@ -875,8 +1028,11 @@ def test_handle_event_as_thread_exit_update_status_failure(mocker, gx_agent_conf
     update_status.side_effect = Exception("Update status error")
 
     agent._handle_event_as_thread_exit(future, event_context)
+    assert agent._status_reporter.flush(timeout=5)
 
-    update_status.assert_called_once_with(
+    # retried before giving up
+    assert update_status.call_count == 3
+    update_status.assert_called_with(
         correlation_id="test-correlation-id",
         status=JobCompleted(
             success=True,
@@ -889,7 +1045,331 @@ def test_handle_event_as_thread_exit_update_status_failure(mocker, gx_agent_conf
     event_context.processed_successfully.assert_not_called()
     # Should nack the message since we failed to update the status
     event_context.processed_with_failures.assert_called_once()
-    assert agent._current_task is None
+    assert agent._active_jobs == {}
+
+
+def test_handle_event_as_thread_exit_does_not_wait_for_status_update(
+    mocker, gx_agent_config, get_context
+):
+    event_context = mocker.Mock()
+    event_context.correlation_id = "test-correlation-id"
+    future = mocker.Mock()
+    future.exception.return_value = None
+    future.result.return_value = ActionResult(
+        id="test-correlation-id", type="test-event-type", created_resources=[], job_duration=None
+    )
+    agent = GXAgent()
+    gx_cloud_responded = threading.Event()
+    update_status = mocker.patch.object(agent, "_update_status")
+    update_status.side_effect = lambda **kwargs: gx_cloud_responded.wait(timeout=5)
+
+    agent._handle_event_as_thread_exit(future, event_context)
+
+    # the slot is free straight away, but the message is only acked once the status is sent
+    assert agent._active_jobs == {}
+    event_context.processed_successfully.assert_not_called()
+    gx_cloud_responded.set()
+    assert agent._status_reporter.flush(timeout=5)
+    event_context.processed_successfully.assert_called_once()
+
+
+def test_redelivered_message_for_running_job_is_acked_with_it(mocker, gx_agent_config, get_context):
+    agent = GXAgent()
+    mocker.patch.object(agent, "_update_status")
+    submit_job = mocker.patch.object(agent, "_submit_job")
+    original, redelivery = mocker.Mock(), mocker.Mock()
+    for event_context in (original, redelivery):
+        event_context.correlation_id = "test-correlation-id"
+    redelivery.redelivered = True
+    agent._handle_event_as_thread_enter(original)
+
+    agent._handle_event_as_thread_enter(redelivery)
+
+    submit_job.assert_called_once_with(original)
+    future = mocker.Mock()
+    future.exception.return_value = None
+    future.result.return_value = ActionResult(
+        id="test-correlation-id", type="test-event-type", created_resources=[], job_duration=None
+    )
+    agent._handle_event_as_thread_exit(future, original)
+    assert agent._status_reporter.flush(timeout=5)
+    original.processed_successfully.assert_called_once_with()
+    redelivery.processed_successfully.assert_called_once_with()
+
+
+def test_job_started_is_reported_when_the_job_is_dispatched(mocker, gx_agent_config, get_context):
+    agent = GXAgent()
+    update_status = mocker.patch.object(agent, "_update_status")
+    mocker.patch.object(agent, "_submit_job")
+    event_context = mocker.Mock()
+    event_context.correlation_id = "test-correlation-id"
+    event_context.redelivered = False
+
+    agent._handle_event_as_thread_enter(event_context)
+    assert agent._status_reporter.flush(timeout=5)
+
+    update_status.assert_called_once_with(
+        correlation_id="test-correlation-id",
+        status=JobStarted(),
+        org_id=uuid.UUID(gx_agent_config.gx_cloud_organization_id),
+        workspace_id=event_context.event.workspace_id,
+    )
+
+
+def test_gx_agent_max_workers_defaults_to_one(get_context, gx_agent_config):
+    agent = GXAgent()
+
+    assert agent._max_workers == 1
+    assert isinstance(agent._executor, ThreadPoolExecutor)
+    assert agent._executor._max_workers == 1
+
+
+def test_gx_agent_max_workers_from_env_var(get_context, gx_agent_config, monkeypatch):
+    monkeypatch.setenv("GX_AGENT_MAX_WORKERS", "3")
+
+    agent = GXAgent()
+
+    assert agent._config.max_workers == 3
+    assert agent._max_workers == 3
+    assert isinstance(agent._executor, ThreadPoolExecutor)
+    assert agent._executor._max_workers == 3
+
+
+def test_gx_agent_max_workers_argument_overrides_env_var(get_context, gx_agent_config, monkeypatch):
+    monkeypatch.setenv("GX_AGENT_MAX_WORKERS", "3")
+
+    agent = GXAgent(max_workers=2)
+
+    assert agent._max_workers == 2
+    assert isinstance(agent._executor, ThreadPoolExecutor)
+    assert agent._executor._max_workers == 2
+
+
+def test_gx_agent_run_sets_prefetch_count_to_max_workers_plus_job_queue_depth(
+    get_context, subscriber, client, gx_agent_config
+):
+    agent = GXAgent(max_workers=4)
+    agent.run()
+
+    client.assert_called_with(
+        url=gx_agent_config.connection_string,
+        prefetch_count=4 + gx_agent_config.light_workers + gx_agent_config.job_queue_depth,
+    )
+
+
+def test_light_job_runs_on_its_own_lane_while_heavy_workers_are_busy(
+    mocker, get_context, gx_agent_config
+):
+    agent = GXAgent(max_workers=1)
+    mocker.patch.object(agent, "_update_status")
+    light_submit = mocker.patch.object(agent._light_executor, "submit")
+    heavy_submit = mocker.patch.object(agent._executor, "submit")
+    heavy, light = mocker.Mock(), mocker.Mock()
+    heavy.correlation_id, light.correlation_id = "job-1", "job-2"
+    heavy.event = RunCheckpointEvent(
+        checkpoint_id=uuid.uuid4(),
+        datasource_names_to_asset_names={},
+        organization_id=uuid.uuid4(),
+        workspace_id=uuid.uuid4(),
+    )
+    light.event = DraftDatasourceConfigEvent(
+        config_id=uuid.uuid4(), organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()
+    )
+
+    agent._handle_event_as_thread_enter(heavy)
+    agent._handle_event_as_thread_enter(light)
+
+    heavy_submit.assert_called_once_with(agent._handle_event, event_context=heavy)
+    light_submit.assert_called_once_with(agent._handle_event, event_context=light)
+    assert len(agent._job_queue) == 0
+    assert {job.correlation_id: job.weight for job in agent._get_active_jobs()} == {
+        "job-1": JobWeight.HEAVY,
+        "job-2": JobWeight.LIGHT,
+    }
+
+
+def test_job_is_queued_while_workers_are_busy_and_started_when_one_frees_up(
+    mocker, get_context, gx_agent_config, monkeypatch
+):
+    monkeypatch.setenv("GX_AGENT_JOB_QUEUE_DEPTH", "1")
+    agent = GXAgent(max_workers=1)
+    mocker.patch.object(agent, "_update_status")
+    submit_job = mocker.patch.object(agent, "_submit_job")
+    running, waiting = mocker.Mock(), mocker.Mock()
+    running.correlation_id, waiting.correlation_id = "job-1", "job-2"
+
+    agent._handle_event_as_thread_enter(running)
+    agent._handle_event_as_thread_enter(waiting)
+
+    submit_job.assert_called_once_with(running)
+    assert len(agent._job_queue) == 1
+    waiting.redeliver_message.assert_not_called()
+
+    future = mocker.Mock()
+    future.exception.return_value = None
+    future.result.return_value = ActionResult(
+        id="job-1", type="test-event-type", created_resources=[], job_duration=None
+    )
+    agent._handle_event_as_thread_exit(future, running)
+
+    submit_job.assert_called_with(waiting)
+    assert len(agent._job_queue) == 0
+    assert [job.correlation_id for job in agent._get_active_jobs()] == ["job-2"]
+
+
+def test_redelivered_message_for_queued_job_replaces_its_delivery(
+    mocker, get_context, gx_agent_config, monkeypatch
+):
+    monkeypatch.setenv("GX_AGENT_JOB_QUEUE_DEPTH", "1")
+    agent = GXAgent(max_workers=1)
+    mocker.patch.object(agent, "_update_status")
+    submit_job = mocker.patch.object(agent, "_submit_job")
+    running, waiting, redelivery = mocker.Mock(), mocker.Mock(), mocker.Mock()
+    running.correlation_id = "job-1"
+    waiting.correlation_id = redelivery.correlation_id = "job-2"
+    redelivery.redelivered = True
+    agent._handle_event_as_thread_enter(running)
+    agent._handle_event_as_thread_enter(waiting)
+    # a slot freeing up must not start the redelivered job next to its queued copy
+    has_free_slot = mocker.patch.object(agent, "_has_free_slot", return_value=True)
+
+    agent._handle_event_as_thread_enter(redelivery)
+
+    submit_job.assert_called_once_with(running)
+    assert len(agent._job_queue) == 1
+    # the queued delivery belongs to the lost channel
+    waiting.processed_with_failures.assert_called_once_with()
+    redelivery.redeliver_message.assert_not_called()
+
+    mocker.stop(has_free_slot)
+    future = mocker.Mock()
+    future.exception.return_value = None
+    future.result.return_value = ActionResult(
+        id="job-1", type="test-event-type", created_resources=[], job_duration=None
+    )
+    agent._handle_event_as_thread_exit(future, running)
+
+    submit_job.assert_called_with(redelivery)
+    assert submit_job.call_count == 2
+
+
+def test_gx_agent_prefork_execution_mode_from_env_var(
+    get_context, subscriber, client, gx_agent_config, monkeypatch, mocker
+):
+    monkeypatch.setenv("GX_AGENT_EXECUTION_MODE", "prefork")
+    calls = mocker.Mock()
+    mocker.patch.object(PreforkExecutor, "fork_workers", calls.fork_workers)
+    mocker.patch.object(PreforkExecutor, "start", calls.start)
+
+    agent = GXAgent(max_workers=2)
+    agent.run()
+
+    assert isinstance(agent._executor, PreforkExecutor)
+    # light jobs get worker processes of their own, forked with the heavy lane's before any starts
+    assert isinstance(agent._light_executor, PreforkExecutor)
+    assert calls.mock_calls == [
+        call.fork_workers(),
+        call.fork_workers(),
+        call.start(),
+        call.start(),
+    ]
+
+
+def test_prefork_light_jobs_run_in_worker_processes(mocker, get_context, gx_agent_config):
+    agent = GXAgent(execution_mode=ExecutionMode.PREFORK)
+    submit = mocker.patch.object(agent._light_executor, "submit")
+    mocker.patch.object(agent, "_get_job_weight", return_value=JobWeight.LIGHT)
+    event_context = mocker.Mock()
+
+    agent._submit_job(event_context)
+
+    submit.assert_called_once_with(
+        handle_event_in_worker_process,
+        event=event_context.event,
+        correlation_id=event_context.correlation_id,
+        redelivered=event_context.redelivered,
+    )
+
+
+def test_prefork_submit_job_sends_only_picklable_arguments(mocker, get_context, gx_agent_config):
+    agent = GXAgent(execution_mode=ExecutionMode.PREFORK)
+    submit = mocker.patch.object(agent._executor, "submit")
+    event_context = mocker.Mock()
+
+    agent._submit_job(event_context)
+
+    submit.assert_called_once_with(
+        handle_event_in_worker_process,
+        event=event_context.event,
+        correlation_id=event_context.correlation_id,
+        redelivered=event_context.redelivered,
+    )
+
+
+def test_prefork_heavy_lane_shrinks_when_worker_processes_exit(
+    mocker, get_context, gx_agent_config
+):
+    agent = GXAgent(max_workers=2, execution_mode=ExecutionMode.PREFORK)
+    mocker.patch.object(
+        PreforkExecutor, "live_workers", new_callable=mocker.PropertyMock, return_value=0
+    )
+
+    assert not agent._has_free_slot(JobWeight.HEAVY)
+
+
+def test_gx_agent_stops_when_all_worker_processes_exited(mocker, get_context, gx_agent_config):
+    agent = GXAgent(execution_mode=ExecutionMode.PREFORK)
+    kill = mocker.patch("great_expectations_cloud.agent.agent.os.kill")
+
+    agent._stop_after_worker_processes_exited()
+
+    kill.assert_called_once_with(os.getpid(), signal.SIGTERM)
+
+
+def test_can_accept_new_task_until_all_workers_are_busy(mocker, get_context, gx_agent_config):
+    agent = GXAgent(max_workers=2)
+    handle_event = mocker.patch.object(agent, "_handle_event")
+    handle_event.side_effect = lambda event_context: sleep(0.5)
+    mocker.patch.object(agent, "_handle_event_as_thread_exit")
+
+    def build_event_context(correlation_id: str) -> Any:
+        event_context = mocker.Mock()
+        event_context.correlation_id = correlation_id
+        event_context.redelivered = False
+        return event_context
+
+    assert agent._can_accept_new_task()
+    agent._handle_event_as_thread_enter(build_event_context("job-1"))
+    assert agent._can_accept_new_task()
+    agent._handle_event_as_thread_enter(build_event_context("job-2"))
+    assert not agent._can_accept_new_task()
+    assert {job.correlation_id for job in agent._get_active_jobs()} == {"job-1", "job-2"}
+
+    agent._release_job("job-1")
+    assert agent._can_accept_new_task()
+    agent._executor.shutdown(wait=True)
+
+
+def test_handle_event_as_thread_exit_releases_only_its_own_slot(
+    mocker, gx_agent_config, get_context
+):
+    agent = GXAgent(max_workers=2)
+    mocker.patch.object(agent, "_update_status")
+    for correlation_id in ("job-1", "job-2"):
+        agent._active_jobs[correlation_id] = ActiveJob(
+            correlation_id=correlation_id, event_type="test-event-type", start_time=0.0
+        )
+    event_context = mocker.Mock()
+    event_context.correlation_id = "job-1"
+    future = mocker.Mock()
+    future.exception.return_value = None
+    future.result.return_value = ActionResult(
+        id="job-1", type="test-event-type", created_resources=[], job_duration=None
+    )
+
+    agent._handle_event_as_thread_exit(future, event_context)
+
+    assert list(agent._active_jobs) == ["job-2"]
 
 
 def test_get_workspace_id_raises_when_workspace_id_missing(
@@ -958,7 +1438,7 @@ def test_create_scheduled_job_logs_warning_on_400_response(
     mock_session.__enter__.return_value.post.return_value = mock_response
 
     mocker.patch(
-        "great_expectations_cloud.agent.agent.create_session",
+        "great_expectations_cloud.agent.agent.get_cloud_session",
         return_value=mock_session,
     )
 
@@ -970,6 +1450,41 @@ def test_create_scheduled_job_logs_warning_on_400_response(
     assert "redelivered by RabbitMQ" in caplog.text
 
 
+def test_scheduled_job_fails_when_it_cannot_be_created(mocker, gx_agent_config, get_context):
+    agent = GXAgent()
+    agent._status_reporter = JobStatusReporter(max_attempts=2, backoff_seconds=0)
+    create = mocker.patch.object(
+        agent, "_create_scheduled_job_and_set_started", side_effect=ConnectionError
+    )
+    handle_event = mocker.patch("great_expectations_cloud.agent.agent.EventHandler")
+
+    async def redeliver_message():
+        return None
+
+    event_context = EventContext(
+        event=RunScheduledCheckpointEvent(
+            checkpoint_id=uuid.uuid4(),
+            datasource_names_to_asset_names={},
+            splitter_options=None,
+            schedule_id=uuid.uuid4(),
+            organization_id=uuid.UUID(gx_agent_config.gx_cloud_organization_id),
+            workspace_id=uuid.uuid4(),
+        ),
+        correlation_id=str(uuid.uuid4()),
+        processed_successfully=lambda: None,
+        processed_with_failures=lambda: None,
+        redeliver_message=redeliver_message,
+    )
+
+    agent._report_job_started(event_context)
+    with pytest.raises(ConnectionError):
+        agent._handle_event(event_context)
+
+    assert create.call_count == 2
+    handle_event.assert_not_called()
+    assert len(agent._status_reporter) == 0
+
+
 @pytest.mark.unit
 def test_get_memory_usage_mb_returns_positive_value(monkeypatch):
     """Memory usage helper should return a positive value."""
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from great_expectations.datasource.fluent.interfaces import TestConnectionError
+
+from great_expectations_cloud.agent.circuit_breaker import (
+    MIN_LATENCY_SAMPLES,
+    DatasourceCircuitBreaker,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeDatasource:
+    def __init__(
+        self, name: str, host: str = "db.internal", workspace_id: str = "workspace-1"
+    ) -> None:
+        self.name = name
+        self.host = host
+        self.data_context = SimpleNamespace(
+            ge_cloud_config=SimpleNamespace(organization_id="org-1", workspace_id=workspace_id)
+        )
+        self._config_provider = None
+
+    def dict(self, config_provider: None = None) -> dict[str, Any]:
+        return {"name": self.name, "host": self.host}
+
+
+WAREHOUSE: Any = FakeDatasource("warehouse")
+LAKE: Any = FakeDatasource("lake")
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> DatasourceCircuitBreaker:
+    return DatasourceCircuitBreaker(
+        failure_threshold=3, open_seconds=60, min_timeout_seconds=5, clock=clock
+    )
+
+
+def fail(breaker: DatasourceCircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        breaker.before_test(WAREHOUSE)
+        breaker.record_failure(WAREHOUSE)
+
+
+def test_circuit_opens_after_consecutive_failures(breaker):
+    fail(breaker, times=2)
+    breaker.before_test(WAREHOUSE)
+
+    breaker.record_failure(WAREHOUSE)
+
+    with pytest.raises(
+        TestConnectionError,
+        match="'warehouse' failed its last 3 connection tests; it will be tested again in 60",
+    ):
+        breaker.before_test(WAREHOUSE)
+    breaker.before_test(LAKE)
+
+
+def test_success_resets_the_failure_count(breaker):
+    fail(breaker, times=2)
+    breaker.record_success(WAREHOUSE)
+
+    fail(breaker, times=2)
+
+    breaker.before_test(WAREHOUSE)
+
+
+def test_one_probe_is_let_through_once_open_seconds_pass(breaker, clock):
+    fail(breaker, times=3)
+    clock.now = 60
+
+    breaker.before_test(WAREHOUSE)
+
+    with pytest.raises(TestConnectionError, match="another job is testing it again"):
+        breaker.before_test(WAREHOUSE)
+
+
+def test_passed_probe_closes_the_circuit(breaker, clock):
+    fail(breaker, times=3)
+    clock.now = 60
+    breaker.before_test(WAREHOUSE)
+
+    breaker.record_success(WAREHOUSE)
+
+    breaker.before_test(WAREHOUSE)
+    breaker.record_failure(WAREHOUSE)
+    breaker.before_test(WAREHOUSE)
+
+
+def test_failed_probe_keeps_the_circuit_open(breaker, clock):
+    fail(breaker, times=3)
+    clock.now = 60
+    breaker.before_test(WAREHOUSE)
+
+    breaker.record_failure(WAREHOUSE)
+
+    clock.now = 119
+    with pytest.raises(TestConnectionError, match="failed its last 4 connection tests"):
+        breaker.before_test(WAREHOUSE)
+    clock.now = 120
+    breaker.before_test(WAREHOUSE)
+
+
+def test_circuits_are_kept_per_workspace(breaker):
+    fail(breaker, times=3)
+
+    breaker.before_test(FakeDatasource("warehouse", workspace_id="workspace-2"))
+
+
+def test_changed_config_starts_with_a_closed_circuit(breaker):
+    fail(breaker, times=3)
+
+    breaker.before_test(FakeDatasource("warehouse", host="db-replica.internal"))
+
+
+def test_zero_threshold_never_opens(clock):
+    breaker = DatasourceCircuitBreaker(
+        failure_threshold=0, open_seconds=60, min_timeout_seconds=0, clock=clock
+    )
+
+    fail(breaker, times=10)
+
+    breaker.before_test(WAREHOUSE)
+
+
+def test_timeout_is_the_default_until_enough_latencies_are_seen(breaker):
+    for _ in range(MIN_LATENCY_SAMPLES - 1):
+        breaker.record_success(WAREHOUSE, connect_seconds=1)
+
+    assert breaker.timeout(WAREHOUSE, default=600) == 600
+
+
+def test_timeout_follows_p99_connect_latency(breaker):
+    for _ in range(99):
+        breaker.record_success(WAREHOUSE, connect_seconds=2)
+    breaker.record_success(WAREHOUSE, connect_seconds=30)
+
+    # the single 30s outlier is above the p99
+    assert breaker.timeout(WAREHOUSE, default=600) == 8
+    # cached tests are not timed and don't count
+    breaker.record_success(WAREHOUSE)
+    assert breaker.timeout(WAREHOUSE, default=600) == 8
+
+
+def test_timeout_is_bounded(breaker):
+    fast, slow = FakeDatasource("fast"), FakeDatasource("slow")
+    for _ in range(MIN_LATENCY_SAMPLES):
+        breaker.record_success(fast, connect_seconds=0.1)
+        breaker.record_success(slow, connect_seconds=500)
+
+    assert breaker.timeout(fast, default=600) == 5
+    assert breaker.timeout(slow, default=600) == 600
+
+
+def test_zero_min_timeout_keeps_the_default(clock):
+    breaker = DatasourceCircuitBreaker(
+        failure_threshold=3, open_seconds=60, min_timeout_seconds=0, clock=clock
+    )
+    for _ in range(MIN_LATENCY_SAMPLES):
+        breaker.record_success(WAREHOUSE, connect_seconds=0.1)
+
+    assert breaker.timeout(WAREHOUSE, default=600) == 600
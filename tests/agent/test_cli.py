@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 
 import pytest
 
@@ -30,5 +31,21 @@ def test_custom_log_tags_failure():
     assert cmplt_process.returncode != 0
 
 
+def test_workers_must_be_an_integer():
+    cli_cmds = ["gx-agent", "--workers", "many"]
+    cmplt_process = subprocess.run(cli_cmds, check=False, timeout=20.0)  # noqa: S603 # trusted input
+    assert cmplt_process.returncode != 0
+
+
+def test_importing_the_agent_does_not_import_expect_ai_stack():
+    check = (
+        "import sys; import great_expectations_cloud.agent; "
+        "from great_expectations_cloud.agent.agent import DEFERRED_IMPORTS; "
+        "sys.exit(any(module in sys.modules for module in DEFERRED_IMPORTS))"
+    )
+    cmplt_process = subprocess.run([sys.executable, "-c", check], check=False, timeout=60.0)  # noqa: S603 # trusted input
+    assert cmplt_process.returncode == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
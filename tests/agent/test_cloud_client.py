@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+import responses
+from great_expectations import __version__
+
+from great_expectations_cloud.agent import cloud_client
+from great_expectations_cloud.agent.cloud_client import (
+    GXCloudClient,
+    GXCloudClientSettings,
+    configure_cloud_client,
+    get_cloud_client,
+    get_cloud_session,
+    set_job_correlation_id,
+    set_user_agent,
+)
+
+pytestmark = pytest.mark.unit
+
+URL = "https://api.greatexpectations.io/api/v1/organizations/org/agent-jobs/job"
+
+
+@pytest.fixture
+def client() -> GXCloudClient:
+    return GXCloudClient(GXCloudClientSettings(retries=2, backoff_factor=0))
+
+
+@pytest.fixture(autouse=True)
+def reset_job_correlation_id():
+    yield
+    set_job_correlation_id(None)
+
+
+@responses.activate
+def test_request_sets_gx_cloud_headers(client, monkeypatch):
+    monkeypatch.setattr(cloud_client, "_user_agent", "gx-agent/1.0")
+    responses.get(URL, json={})
+    set_job_correlation_id("job-123")
+
+    client.session(access_token="token").get(URL)
+
+    headers = responses.calls[0].request.headers
+    assert headers["Authorization"] == "Bearer token"
+    assert headers["Gx-Version"] == __version__
+    assert headers["Content-Type"] == "application/vnd.api+json"
+    assert headers["User-Agent"] == "gx-agent/1.0"
+    assert headers["Agent-Job-Id"] == "job-123"
+
+
+@responses.activate
+def test_job_correlation_id_is_per_thread(client):
+    responses.get(URL, json={})
+    set_job_correlation_id("job-main")
+
+    thread = threading.Thread(target=lambda: client.session(access_token="token").get(URL))
+    thread.start()
+    thread.join()
+
+    assert "Agent-Job-Id" not in responses.calls[0].request.headers
+
+
+@responses.activate
+def test_request_uses_default_timeout(client):
+    responses.get(URL, json={})
+
+    client.session(access_token="token").get(URL)
+
+    assert responses.calls[0].request.req_kwargs["timeout"] == 20  # type: ignore[attr-defined] # recorded by responses
+
+
+@responses.activate
+def test_idempotent_request_is_retried(client):
+    responses.get(URL, status=503)
+    responses.get(URL, json={"ok": True})
+
+    response = client.session(access_token="token").get(URL)
+
+    assert response.json() == {"ok": True}
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_post_is_not_retried(client):
+    responses.post(URL, status=503)
+    responses.post(URL, json={"ok": True})
+
+    response = client.session(access_token="token").post(URL, json={})
+
+    assert response.status_code == 503
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_request_latency_is_recorded_per_method(client):
+    responses.get(URL, json={})
+    responses.patch(URL, status=404)
+
+    session = client.session(access_token="token")
+    session.get(URL)
+    session.get(URL)
+    session.patch(URL, data="{}")
+
+    metrics = client.get_metrics()
+    assert metrics["GET"].count == 2
+    assert metrics["GET"].error_count == 0
+    assert metrics["PATCH"].count == 1
+    assert metrics["PATCH"].error_count == 1
+    assert metrics["GET"].max_seconds >= metrics["GET"].mean_seconds > 0
+
+
+def test_sessions_share_the_process_wide_client():
+    with (
+        get_cloud_session(access_token="a") as first,
+        get_cloud_session(access_token="b") as second,
+    ):
+        assert first._client is second._client is get_cloud_client()
+
+
+def test_client_is_recreated_in_forked_process(monkeypatch):
+    monkeypatch.setattr(cloud_client, "_user_agent", None)
+    parent_client = get_cloud_client()
+    set_user_agent("gx-agent/1.0")
+
+    cloud_client._reset_client_after_fork()
+
+    assert get_cloud_client() is not parent_client
+    assert cloud_client._user_agent == "gx-agent/1.0"
+
+
+def test_configure_cloud_client_replaces_the_process_wide_client(monkeypatch):
+    # restore the process-wide client after the test
+    monkeypatch.setattr(cloud_client, "_client", None)
+    monkeypatch.setattr(cloud_client, "_client_settings", GXCloudClientSettings())
+    previous_client = get_cloud_client()
+    settings = GXCloudClientSettings(timeout_seconds=5, pool_size=2)
+
+    configure_cloud_client(settings)
+    cloud_client._reset_client_after_fork()
+
+    client = get_cloud_client()
+    assert client is not previous_client
+    assert client._settings == settings
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import TYPE_CHECKING, Any
+
+import great_expectations as gx
+import pytest
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.experimental.metric_repository.metric_list_metric_retriever import (
+    MetricListMetricRetriever,
+)
+from great_expectations.experimental.metric_repository.metrics import ColumnMetric, MetricTypes
+from great_expectations.validator.validator import Validator
+
+from great_expectations_cloud.agent import column_chunk_metric_retriever
+from great_expectations_cloud.agent.column_chunk_metric_retriever import (
+    ColumnChunkMetricRetriever,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from great_expectations.data_context import AbstractDataContext
+    from great_expectations.datasource.fluent import BatchRequest
+    from pytest_mock import MockerFixture
+
+pytestmark = pytest.mark.unit
+
+COLUMNS = [f"c{index}" for index in range(7)]
+METRIC_LIST = [
+    MetricTypes.TABLE_COLUMNS,
+    MetricTypes.TABLE_COLUMN_TYPES,
+    MetricTypes.COLUMN_MIN,
+    MetricTypes.COLUMN_MAX,
+    MetricTypes.COLUMN_NON_NULL_COUNT,
+]
+
+
+@pytest.fixture
+def context(tmp_path: Path) -> AbstractDataContext:
+    return gx.get_context(mode="file", project_root_dir=tmp_path)
+
+
+@pytest.fixture
+def batch_request(context: AbstractDataContext, tmp_path: Path) -> BatchRequest[Any]:
+    database = tmp_path / "warehouse.db"
+    with closing(sqlite3.connect(database)) as connection:
+        connection.execute(f"CREATE TABLE wide ({', '.join(f'{c} INTEGER' for c in COLUMNS)})")
+        connection.executemany(
+            f"INSERT INTO wide VALUES ({', '.join('?' for _ in COLUMNS)})",
+            [[row * index for index in range(len(COLUMNS))] for row in range(1, 4)],
+        )
+        connection.commit()
+    datasource = context.data_sources.add_sqlite(
+        name="warehouse", connection_string=f"sqlite:///{database}"
+    )
+    return datasource.add_table_asset(name="wide", table_name="wide").build_batch_request()
+
+
+def summarize(metrics: Any) -> list[tuple[str, str | None, Any, Any]]:
+    return [
+        (metric.metric_name, getattr(metric, "column", None), metric.value, metric.exception)
+        for metric in metrics
+    ]
+
+
+def fake_column_metrics(
+    batch_request: BatchRequest[Any],
+    column_list: list[str],
+    column_metric_names: list[MetricTypes | str],
+    column_metric_type: type[ColumnMetric[Any]],
+) -> list[ColumnMetric[Any]]:
+    return [
+        ColumnMetric[int](
+            batch_id="batch", metric_name=metric_name, column=column, value=1, exception=None
+        )
+        for metric_name in column_metric_names
+        for column in column_list
+    ]
+
+
+def test_chunked_metrics_match_metric_list_metric_retriever(context, batch_request):
+    expected = MetricListMetricRetriever(context).get_metrics(batch_request, METRIC_LIST)
+
+    metrics = ColumnChunkMetricRetriever(context, column_chunk_size=3, max_workers=4).get_metrics(
+        batch_request, METRIC_LIST
+    )
+
+    assert summarize(metrics) == summarize(expected)
+    assert len([m for m in metrics if m.metric_name == MetricTypes.COLUMN_MIN]) == len(COLUMNS)
+
+
+def test_chunks_on_their_own_execution_engines_match_metric_list_metric_retriever(
+    context, batch_request, monkeypatch: pytest.MonkeyPatch
+):
+    expected = MetricListMetricRetriever(context).get_metrics(batch_request, METRIC_LIST)
+    # computes sqlite chunks on the pool, as for dialects with a connection pool, but one at a
+    # time since they still share sqlite's single connection
+    monkeypatch.setattr(column_chunk_metric_retriever, "_SINGLE_CONNECTION_DIALECTS", frozenset())
+    monkeypatch.setattr(
+        column_chunk_metric_retriever,
+        "ThreadPoolExecutor",
+        lambda max_workers, thread_name_prefix: ThreadPoolExecutor(1, thread_name_prefix),
+    )
+    retriever = ColumnChunkMetricRetriever(context, column_chunk_size=2, max_workers=4)
+    asset_execution_engine: Any = retriever.get_validator(batch_request).execution_engine
+    execution_engines: list[Any] = []
+    compute_metrics = Validator.compute_metrics
+
+    def record_execution_engine(self: Validator, *args: Any, **kwargs: Any) -> Any:
+        execution_engines.append(self.execution_engine)
+        return compute_metrics(self, *args, **kwargs)
+
+    monkeypatch.setattr(Validator, "compute_metrics", record_execution_engine)
+
+    metrics = retriever.get_metrics(batch_request, METRIC_LIST)
+
+    assert summarize(metrics) == summarize(expected)
+    chunk_execution_engines = [
+        engine for engine in execution_engines if engine is not asset_execution_engine
+    ]
+    # one for each chunk of each group of column metrics, all on the asset's SQLAlchemy engine
+    assert len(set(map(id, chunk_execution_engines))) == len(chunk_execution_engines) > 1
+    assert all(engine.engine is asset_execution_engine.engine for engine in chunk_execution_engines)
+
+
+def test_chunks_are_computed_concurrently(context, mocker: MockerFixture):
+    retriever = ColumnChunkMetricRetriever(context, column_chunk_size=2, max_workers=3)
+    execution_engine = mocker.Mock(spec=SqlAlchemyExecutionEngine, dialect_name="postgresql")
+    execution_engine.engine = mocker.Mock()
+    mocker.patch.object(
+        retriever, "get_validator", return_value=mocker.Mock(execution_engine=execution_engine)
+    )
+    mocker.patch.object(column_chunk_metric_retriever, "Validator")
+    all_chunks_started = threading.Barrier(3, timeout=5)
+    chunks: list[list[str]] = []
+
+    def compute_chunk(self: Any, *args: Any, **kwargs: Any) -> list[ColumnMetric[Any]]:
+        chunks.append(kwargs["column_list"])
+        # fails with BrokenBarrierError unless the three chunks run at once
+        all_chunks_started.wait()
+        return fake_column_metrics(*args, **kwargs)
+
+    mocker.patch.object(MetricListMetricRetriever, "_get_column_metrics", compute_chunk)
+
+    metrics = retriever._get_column_metrics(
+        batch_request=mocker.Mock(),
+        column_list=["a", "b", "c", "d", "e"],
+        column_metric_names=[MetricTypes.COLUMN_MIN, MetricTypes.COLUMN_MAX],
+        column_metric_type=ColumnMetric[int],
+    )
+
+    assert sorted(chunks) == [["a", "b"], ["c", "d"], ["e"]]
+    assert [(m.metric_name, m.column) for m in metrics if isinstance(m, ColumnMetric)] == [
+        (MetricTypes.COLUMN_MIN, column) for column in "abcde"
+    ] + [(MetricTypes.COLUMN_MAX, column) for column in "abcde"]
+
+
+@pytest.mark.parametrize("dialect", ["sqlite", "mssql", "bigquery", "databricks"])
+def test_persisted_connection_chunks_are_computed_one_after_another(
+    context, mocker: MockerFixture, dialect: str
+):
+    retriever = ColumnChunkMetricRetriever(context, column_chunk_size=1, max_workers=4)
+    execution_engine = mocker.Mock(spec=SqlAlchemyExecutionEngine, dialect_name=dialect)
+    mocker.patch.object(
+        retriever, "get_validator", return_value=mocker.Mock(execution_engine=execution_engine)
+    )
+    threads: set[str] = set()
+
+    def compute_chunk(self: Any, *args: Any, **kwargs: Any) -> list[ColumnMetric[Any]]:
+        threads.add(threading.current_thread().name)
+        return fake_column_metrics(*args, **kwargs)
+
+    mocker.patch.object(MetricListMetricRetriever, "_get_column_metrics", compute_chunk)
+
+    metrics = retriever._get_column_metrics(
+        batch_request=mocker.Mock(),
+        column_list=["a", "b", "c"],
+        column_metric_names=[MetricTypes.COLUMN_NON_NULL_COUNT],
+        column_metric_type=ColumnMetric[int],
+    )
+
+    assert len(metrics) == 3
+    assert threads == {threading.current_thread().name}
@@ -10,6 +10,7 @@ from great_expectations_cloud.agent.config import (
     GxAgentEnvVars,
     generate_config_validation_error_text,
 )
+from great_expectations_cloud.agent.constants import ExecutionMode, JobPriority
 
 
 class LoggingUtilTestModel(BaseModel):
@@ -75,3 +76,48 @@ def test_expect_ai_enabled_true_when_openai_api_key_set(monkeypatch):
     env_vars = GxAgentEnvVars()
     assert env_vars.expect_ai_enabled is True
     assert env_vars.openai_api_key == "test-key"
+
+
+def test_gx_agent_max_workers_defaults_to_one(monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", "test-org-id")
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "test-token")
+    monkeypatch.delenv("GX_AGENT_MAX_WORKERS", raising=False)
+
+    env_vars = GxAgentEnvVars()
+    assert env_vars.gx_agent_max_workers == 1
+
+
+def test_gx_agent_max_workers_must_be_positive(monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", "test-org-id")
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "test-token")
+    monkeypatch.setenv("GX_AGENT_MAX_WORKERS", "0")
+
+    with pytest.raises(ValidationError):
+        GxAgentEnvVars()
+
+
+def test_gx_agent_execution_mode_defaults_to_thread(monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", "test-org-id")
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "test-token")
+    monkeypatch.delenv("GX_AGENT_EXECUTION_MODE", raising=False)
+
+    env_vars = GxAgentEnvVars()
+    assert env_vars.gx_agent_execution_mode == ExecutionMode.THREAD
+
+
+def test_gx_agent_execution_mode_rejects_unknown_mode(monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", "test-org-id")
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "test-token")
+    monkeypatch.setenv("GX_AGENT_EXECUTION_MODE", "greenlet")
+
+    with pytest.raises(ValidationError):
+        GxAgentEnvVars()
+
+
+def test_gx_agent_job_priorities_are_read_as_json(monkeypatch):
+    monkeypatch.setenv("GX_CLOUD_ORGANIZATION_ID", "test-org-id")
+    monkeypatch.setenv("GX_CLOUD_ACCESS_TOKEN", "test-token")
+    monkeypatch.setenv("GX_AGENT_JOB_PRIORITIES", '{"run_checkpoint_request": "interactive"}')
+
+    env_vars = GxAgentEnvVars()
+    assert env_vars.gx_agent_job_priorities == {"run_checkpoint_request": JobPriority.INTERACTIVE}
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from great_expectations.datasource.fluent.interfaces import TestConnectionError
+
+from great_expectations_cloud.agent.connection_test_cache import ConnectionTestCache
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeConfigProvider:
+    def __init__(self, variables: dict[str, str]) -> None:
+        self.variables = variables
+
+    def substitute_config(self, config: dict[str, Any]) -> dict[str, Any]:
+        return {key: self.variables.get(value, value) for key, value in config.items()}
+
+
+class FakeDatasource:
+    def __init__(
+        self, name: str, config: dict[str, Any], workspace_id: str = "workspace-1"
+    ) -> None:
+        self.name = name
+        self.config = config
+        self.tests = 0
+        self.error: Exception | None = None
+        self.data_context = SimpleNamespace(
+            ge_cloud_config=SimpleNamespace(organization_id="org-1", workspace_id=workspace_id)
+        )
+        self._config_provider = FakeConfigProvider(variables={})
+
+    def dict(self, config_provider: FakeConfigProvider | None = None) -> dict[str, Any]:
+        config = {"name": self.name, **self.config}
+        return config_provider.substitute_config(config) if config_provider else config
+
+    def test_connection(self, test_assets: bool = True) -> None:
+        assert not test_assets
+        self.tests += 1
+        if self.error:
+            raise self.error
+
+
+class FakeDataAsset:
+    def __init__(self, name: str, datasource: FakeDatasource) -> None:
+        self.name = name
+        self.datasource = datasource
+        self.tests = 0
+
+    def test_connection(self) -> None:
+        self.tests += 1
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> ConnectionTestCache:
+    return ConnectionTestCache(ttl_seconds=60, clock=clock)
+
+
+@pytest.fixture
+def datasource() -> FakeDatasource:
+    return FakeDatasource(name="warehouse", config={"connection_string": "snowflake://a"})
+
+
+def test_passed_test_is_skipped_within_ttl(cache, clock, datasource):
+    cache.test_datasource(datasource)
+    clock.now = 59
+    cache.test_datasource(datasource)
+
+    assert datasource.tests == 1
+
+
+def test_passed_test_is_repeated_after_ttl(cache, clock, datasource):
+    cache.test_datasource(datasource)
+    clock.now = 60
+    cache.test_datasource(datasource)
+
+    assert datasource.tests == 2
+
+
+def test_assets_are_cached_separately(cache, datasource):
+    orders = FakeDataAsset("orders", datasource)
+    customers = FakeDataAsset("customers", datasource)
+
+    cache.test_data_asset(orders)
+    cache.test_data_asset(orders)
+    cache.test_data_asset(customers)
+
+    assert (orders.tests, customers.tests) == (1, 1)
+    assert datasource.tests == 0
+
+
+def test_config_change_is_tested_again(cache, datasource):
+    asset = FakeDataAsset("orders", datasource)
+    cache.test_datasource(datasource)
+    cache.test_data_asset(asset)
+
+    datasource.config = {"connection_string": "snowflake://b"}
+    cache.test_datasource(datasource)
+    cache.test_data_asset(asset)
+
+    assert (datasource.tests, asset.tests) == (2, 2)
+
+
+def test_failed_test_invalidates_datasource(cache, datasource):
+    asset = FakeDataAsset("orders", datasource)
+    cache.test_datasource(datasource)
+    cache.test_data_asset(asset)
+
+    datasource.config = {"connection_string": "snowflake://b"}
+    datasource.error = TestConnectionError(message="unreachable")
+    with pytest.raises(TestConnectionError):
+        cache.test_datasource(datasource)
+
+    datasource.config = {"connection_string": "snowflake://a"}
+    datasource.error = None
+    cache.test_datasource(datasource)
+    cache.test_data_asset(asset)
+    assert (datasource.tests, asset.tests) == (3, 2)
+
+
+def test_failed_test_is_not_cached(cache, datasource):
+    datasource.error = TestConnectionError(message="unreachable")
+
+    for _ in range(2):
+        with pytest.raises(TestConnectionError):
+            cache.test_datasource(datasource)
+
+    assert datasource.tests == 2
+
+
+def test_zero_ttl_always_tests(clock, datasource):
+    cache = ConnectionTestCache(ttl_seconds=0, clock=clock)
+
+    cache.test_datasource(datasource)
+    cache.test_datasource(datasource)
+
+    assert datasource.tests == 2
+
+
+def test_invalidate(cache, datasource):
+    other = FakeDatasource(name="lake", config={})
+    cache.test_datasource(datasource)
+    cache.test_datasource(other)
+
+    cache.invalidate(datasource)
+    cache.test_datasource(datasource)
+    cache.test_datasource(other)
+    assert (datasource.tests, other.tests) == (2, 1)
+
+    cache.invalidate()
+    cache.test_datasource(datasource)
+    cache.test_datasource(other)
+    assert (datasource.tests, other.tests) == (3, 2)
+
+
+def test_rotated_secret_is_tested_again(cache, datasource):
+    datasource.config = {"password": "${DB_PASSWORD}"}
+    datasource._config_provider.variables = {"${DB_PASSWORD}": "old"}
+    cache.test_datasource(datasource)
+    cache.test_datasource(datasource)
+
+    datasource._config_provider.variables = {"${DB_PASSWORD}": "new"}
+    cache.test_datasource(datasource)
+
+    assert datasource.tests == 2
+
+
+def test_datasources_with_the_same_name_are_cached_per_workspace(cache, datasource):
+    other_workspace = FakeDatasource(
+        name="warehouse", config=dict(datasource.config), workspace_id="workspace-2"
+    )
+    other_workspace.error = TestConnectionError(message="unreachable")
+    cache.test_datasource(datasource)
+
+    # a pass in one workspace is not trusted in another, and a failure there keeps it
+    with pytest.raises(TestConnectionError):
+        cache.test_datasource(other_workspace)
+    cache.test_datasource(datasource)
+
+    assert (datasource.tests, other_workspace.tests) == (1, 1)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from typing import TYPE_CHECKING, Any
+
+import great_expectations as gx
+import pytest
+import sqlalchemy as sa
+from great_expectations.experimental.metric_repository.metric_list_metric_retriever import (
+    MetricListMetricRetriever,
+)
+from great_expectations.experimental.metric_repository.metrics import MetricTypes
+
+from great_expectations_cloud.agent import count_metric_retriever
+from great_expectations_cloud.agent.count_metric_retriever import CountScanMetricRetriever
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from great_expectations.data_context import AbstractDataContext
+    from great_expectations.datasource.fluent import BatchRequest
+
+pytestmark = pytest.mark.unit
+
+METRIC_LIST = [
+    MetricTypes.TABLE_COLUMNS,
+    MetricTypes.TABLE_COLUMN_TYPES,
+    MetricTypes.COLUMN_NON_NULL_COUNT,
+    MetricTypes.TABLE_ROW_COUNT,
+]
+
+
+@pytest.fixture
+def context(tmp_path: Path) -> AbstractDataContext:
+    return gx.get_context(mode="file", project_root_dir=tmp_path)
+
+
+@pytest.fixture
+def batch_request(context: AbstractDataContext, tmp_path: Path) -> BatchRequest[Any]:
+    database = tmp_path / "warehouse.db"
+    with closing(sqlite3.connect(database)) as connection:
+        connection.execute('CREATE TABLE orders (id INTEGER, note TEXT, "Unit Price" REAL)')
+        connection.executemany(
+            "INSERT INTO orders VALUES (?, ?, ?)",
+            [(1, None, None), (2, "gift", 9.5), (None, "late", None)],
+        )
+        connection.commit()
+    datasource = context.data_sources.add_sqlite(
+        name="warehouse", connection_string=f"sqlite:///{database}"
+    )
+    return datasource.add_table_asset(name="orders", table_name="orders").build_batch_request()
+
+
+@pytest.fixture
+def count_queries() -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def record(conn: sa.Connection, cursor: Any, statement: str, *args: Any) -> None:
+        if statement.startswith("SELECT count("):
+            statements.append(statement)
+
+    sa.event.listen(sa.Engine, "before_cursor_execute", record)
+    yield statements
+    sa.event.remove(sa.Engine, "before_cursor_execute", record)
+
+
+def summarize(metrics: Any) -> list[tuple[str, str | None, Any, Any]]:
+    return [
+        (metric.metric_name, getattr(metric, "column", None), metric.value, metric.exception)
+        for metric in metrics
+    ]
+
+
+def test_counts_match_metric_list_metric_retriever_in_one_scan(
+    context, batch_request, count_queries
+):
+    expected = MetricListMetricRetriever(context).get_metrics(batch_request, METRIC_LIST)
+    count_queries.clear()
+
+    metrics = CountScanMetricRetriever(context).get_metrics(batch_request, METRIC_LIST)
+
+    assert summarize(metrics) == summarize(expected)
+    assert summarize(metrics)[-3:] == [
+        (MetricTypes.COLUMN_NON_NULL_COUNT, "id", 2, None),
+        (MetricTypes.COLUMN_NON_NULL_COUNT, "note", 2, None),
+        (MetricTypes.COLUMN_NON_NULL_COUNT, "Unit Price", 1, None),
+    ]
+    assert len(count_queries) == 1
+
+
+def test_select_list_is_split_where_the_dialect_limits_it(
+    context, batch_request, count_queries, monkeypatch
+):
+    monkeypatch.setitem(count_metric_retriever.SELECT_LIST_LIMITS, "sqlite", 3)
+
+    metrics = CountScanMetricRetriever(context).get_metrics(batch_request, METRIC_LIST)
+
+    assert [
+        metric.value
+        for metric in metrics
+        if metric.metric_name in count_metric_retriever.COUNT_METRICS
+    ] == [3, 2, 2, 1]
+    assert len(count_queries) == 2
+
+
+def test_failed_count_is_reported_on_its_metrics(context, batch_request, mocker):
+    mocker.patch.object(
+        count_metric_retriever.SqlAlchemyExecutionEngine,
+        "execute_query",
+        side_effect=sa.exc.OperationalError("SELECT count(*)", {}, Exception("disk I/O error")),
+    )
+
+    metrics = CountScanMetricRetriever(context).get_metrics(
+        batch_request, [MetricTypes.TABLE_ROW_COUNT]
+    )
+
+    assert len(metrics) == 1
+    assert metrics[0].value is None
+    assert metrics[0].exception is not None
+    assert "disk I/O error" in metrics[0].exception.message
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import uuid
+from typing import Any
+
+import pytest
+
+from great_expectations_cloud.agent.data_context_pool import DataContextPool
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ContextFactory:
+    def __init__(self) -> None:
+        self.built: list[uuid.UUID] = []
+
+    def __call__(self, workspace_id: uuid.UUID) -> Any:
+        self.built.append(workspace_id)
+        return object()
+
+
+@pytest.fixture
+def factory() -> ContextFactory:
+    return ContextFactory()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def pool(factory: ContextFactory, clock: FakeClock) -> DataContextPool:
+    return DataContextPool(factory=factory, max_size=2, ttl_seconds=60, clock=clock)
+
+
+def test_checkout_reuses_context_after_checkin(pool, factory):
+    workspace_id = uuid.uuid4()
+
+    first = pool.checkout(workspace_id)
+    pool.checkin(first)
+    second = pool.checkout(workspace_id)
+
+    assert second is first
+    assert factory.built == [workspace_id]
+
+
+def test_checked_out_context_is_not_shared(pool, factory):
+    workspace_id = uuid.uuid4()
+
+    first = pool.checkout(workspace_id)
+    second = pool.checkout(workspace_id)
+
+    assert second is not first
+    assert factory.built == [workspace_id, workspace_id]
+
+
+def test_contexts_are_keyed_by_workspace(pool, factory):
+    workspace_1, workspace_2 = uuid.uuid4(), uuid.uuid4()
+
+    pool.checkin(pool.checkout(workspace_1))
+    context = pool.checkout(workspace_2)
+
+    assert factory.built == [workspace_1, workspace_2]
+    assert len(pool) == 1
+    pool.checkin(context)
+    assert len(pool) == 2
+
+
+def test_least_recently_used_context_is_evicted(pool, factory):
+    workspace_1, workspace_2, workspace_3 = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    for workspace_id in (workspace_1, workspace_2, workspace_3):
+        pool.checkin(pool.checkout(workspace_id))
+
+    pool.checkout(workspace_1)
+
+    assert factory.built == [workspace_1, workspace_2, workspace_3, workspace_1]
+
+
+def test_expired_context_is_rebuilt(pool, factory, clock):
+    workspace_id = uuid.uuid4()
+    first = pool.checkout(workspace_id)
+    pool.checkin(first)
+
+    clock.now = 61
+    second = pool.checkout(workspace_id)
+
+    assert second is not first
+    assert factory.built == [workspace_id, workspace_id]
+
+
+def test_invalidate_drops_idle_and_checked_out_contexts(pool, factory):
+    workspace_id = uuid.uuid4()
+    idle = pool.checkout(workspace_id)
+    pool.checkin(idle)
+    in_use = pool.checkout(workspace_id)
+
+    pool.invalidate(workspace_id)
+    pool.checkin(in_use)
+
+    assert len(pool) == 0
+    assert pool.checkout(workspace_id) is not in_use
+
+
+def test_discarded_context_is_not_reused(pool, factory):
+    workspace_id = uuid.uuid4()
+    context = pool.checkout(workspace_id)
+
+    pool.discard(context)
+    pool.checkin(context)
+
+    assert len(pool) == 0
+
+
+def test_pool_size_zero_disables_reuse(factory, clock):
+    pool = DataContextPool(factory=factory, max_size=0, ttl_seconds=60, clock=clock)
+    workspace_id = uuid.uuid4()
+
+    pool.checkin(pool.checkout(workspace_id))
+    pool.checkout(workspace_id)
+
+    assert factory.built == [workspace_id, workspace_id]
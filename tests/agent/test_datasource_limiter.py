@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from great_expectations.datasource.fluent import SQLDatasource
+
+from great_expectations_cloud.agent.datasource_limiter import (
+    DatasourceLimiter,
+    allows_concurrent_queries,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def datasource(name: str = "warehouse", workspace_id: str = "workspace-1") -> Any:
+    return SimpleNamespace(
+        name=name,
+        data_context=SimpleNamespace(
+            ge_cloud_config=SimpleNamespace(organization_id="org-1", workspace_id=workspace_id)
+        ),
+    )
+
+
+def sql_datasource(dialect: str) -> Mock:
+    sql = Mock(spec=SQLDatasource)
+    sql.get_engine.return_value.dialect.name = dialect
+    return sql
+
+
+def test_slots_are_shared_by_every_datasource_object_of_the_same_name() -> None:
+    limiter = DatasourceLimiter()
+
+    slots = limiter.slots(datasource(), limit=2)
+
+    assert limiter.slots(datasource(), limit=2) is slots
+    assert slots.acquire(blocking=False)
+    assert slots.acquire(blocking=False)
+    assert not slots.acquire(blocking=False)
+
+
+def test_slots_are_kept_per_workspace_name_and_limit() -> None:
+    limiter = DatasourceLimiter()
+
+    slots = limiter.slots(datasource(), limit=2)
+
+    assert limiter.slots(datasource(workspace_id="workspace-2"), limit=2) is not slots
+    assert limiter.slots(datasource(name="lake"), limit=2) is not slots
+    assert limiter.slots(datasource(), limit=3) is not slots
+
+
+def test_allows_concurrent_queries_on_pooled_connections() -> None:
+    assert allows_concurrent_queries(sql_datasource("postgresql"))
+
+
+@pytest.mark.parametrize("dialect", ["sqlite", "mssql", "bigquery", "databricks"])
+def test_does_not_allow_concurrent_queries_on_one_persistent_connection(dialect: str) -> None:
+    assert not allows_concurrent_queries(sql_datasource(dialect))
+
+
+def test_does_not_allow_concurrent_queries_for_other_datasources() -> None:
+    assert not allows_concurrent_queries(datasource())
+
+
+def test_does_not_allow_concurrent_queries_without_an_engine() -> None:
+    sql = Mock(spec=SQLDatasource)
+    sql.get_engine.side_effect = ModuleNotFoundError("psycopg2")
+
+    assert not allows_concurrent_queries(sql)
+
+
+def test_engine_lock_is_kept_per_engine() -> None:
+    limiter = DatasourceLimiter()
+    engine, other_engine = Mock(), Mock()
+
+    lock = limiter.engine_lock(engine)
+
+    assert limiter.engine_lock(engine) is lock
+    assert limiter.engine_lock(other_engine) is not lock
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 from unittest.mock import ANY
 from uuid import UUID, uuid4
 
@@ -12,6 +12,7 @@ from great_expectations.experimental.metric_repository.metrics import (
     MetricTypes,
 )
 
+from great_expectations_cloud.agent import models
 from great_expectations_cloud.agent.actions import (
     AgentAction,
     DraftDatasourceConfigAction,
@@ -21,19 +22,27 @@ from great_expectations_cloud.agent.actions import (
 )
 from great_expectations_cloud.agent.agent_warnings import GXAgentUserWarning
 from great_expectations_cloud.agent.analytics import AgentAnalytics
+from great_expectations_cloud.agent.constants import JobWeight
 from great_expectations_cloud.agent.event_handler import (
     _EVENT_ACTION_MAP,
+    _EVENT_WEIGHT_MAP,
+    _LAZY_EVENT_ACTION_MAP,
+    _LAZY_IMPORT_SECONDS,
     EventAlreadyRegisteredError,
     EventHandler,
     NoVersionImplementationError,
     _get_major_version,
+    get_event_weight,
+    get_import_report,
     register_event_action,
+    register_lazy_event_action,
 )
 from great_expectations_cloud.agent.exceptions import GXAgentError
 from great_expectations_cloud.agent.models import (
     DomainContext,
     DraftDatasourceConfigEvent,
     Event,
+    EventBase,
     ListAssetNamesEvent,
     RunCheckpointEvent,
     RunMetricsListEvent,
@@ -285,6 +294,45 @@ class TestEventHandlerRegistry:
         register_event_action(version, DummyEvent, DummyAction)
         assert _EVENT_ACTION_MAP[version][DummyEvent.__name__] == DummyAction
 
+    def test_register_event_action_with_weight(self, mocker: MockerFixture):
+        mocker.patch.dict(_EVENT_ACTION_MAP, {}, clear=True)
+        mocker.patch.dict(_EVENT_WEIGHT_MAP, {}, clear=True)
+        register_event_action("1", DummyEvent, DummyAction, weight=JobWeight.LIGHT)
+        assert _EVENT_WEIGHT_MAP["1"][DummyEvent.__name__] == JobWeight.LIGHT
+
+    def test_ui_events_are_registered_as_light(self):
+        event = DraftDatasourceConfigEvent(
+            config_id=uuid.uuid4(), organization_id=uuid.uuid4(), workspace_id=uuid.uuid4()
+        )
+        assert get_event_weight(event) == JobWeight.LIGHT
+
+    def test_event_handler_imports_lazily_registered_action(
+        self, mocker: MockerFixture, mock_context
+    ):
+        mocker.patch("great_expectations_cloud.agent.event_handler._GX_MAJOR_VERSION", "1")
+        mocker.patch.dict(_EVENT_ACTION_MAP, {}, clear=True)
+        mocker.patch.dict(_LAZY_EVENT_ACTION_MAP, {}, clear=True)
+        mocker.patch.dict(_LAZY_IMPORT_SECONDS, {}, clear=True)
+        import_module = mocker.patch(
+            "great_expectations_cloud.agent.event_handler.importlib.import_module",
+            side_effect=lambda module: register_event_action("1", DummyEvent, DummyAction),
+        )
+        register_lazy_event_action(DummyEvent, "tests.dummy_action")
+        handler = EventHandler(context=mock_context, agent_analytics=AgentAnalytics())
+        test_org_id = uuid.UUID("00000000-0000-0000-0000-000000000000")
+
+        for _ in range(2):
+            action = handler.get_event_action(
+                DummyEvent(organization_id=test_org_id),  # type: ignore[arg-type] # Dummy event only used in testing
+                base_url="",
+                auth_key="",
+                domain_context=DomainContext(organization_id=test_org_id, workspace_id=uuid4()),
+            )
+            assert isinstance(action, DummyAction)
+
+        import_module.assert_called_once_with("tests.dummy_action")
+        assert list(get_import_report()) == ["tests.dummy_action"]
+
     def test_register_event_action_already_registered(self, mocker: MockerFixture):
         mocker.patch.dict(_EVENT_ACTION_MAP, {}, clear=True)
         register_event_action("0", DummyEvent, DummyAction)
@@ -356,3 +404,42 @@ def test_parse_event(example_event):
     event = EventHandler.parse_event_from(serialized_bytes)
 
     assert event.type == "onboarding_data_assistant_request.received"
+
+
+def test_parse_event_unknown_type_yields_unknown(example_event):
+    event_dict = example_event.dict()
+    event_dict["type"] = "not_a_real_event"
+    event = EventHandler.parse_event_from(orjson.dumps(event_dict))
+
+    assert event.type == "unknown_event"
+
+
+@pytest.mark.parametrize("msg_body", [b"[]", b'"run_checkpoint_request"', b"{}", b'{"type": 1}'])
+def test_parse_event_without_type_yields_unknown(msg_body: bytes):
+    event = EventHandler.parse_event_from(msg_body)
+
+    assert event.type == "unknown_event"
+
+
+def test_parse_event_does_not_rebuild_event_union_per_message(example_event, mocker):
+    serialized_bytes = example_event.json().encode("utf-8")
+    EventHandler.parse_event_from(serialized_bytes)
+    build_event_union = mocker.spy(models, "_build_event_union")
+
+    for _ in range(3):
+        EventHandler.parse_event_from(serialized_bytes)
+
+    build_event_union.assert_not_called()
+
+
+def test_parse_event_finds_event_defined_after_first_parse(example_event):
+    EventHandler.parse_event_from(example_event.json().encode("utf-8"))
+
+    class LateEvent(EventBase):
+        type: Literal["late_event_for_registry_test"] = "late_event_for_registry_test"
+
+    event = EventHandler.parse_event_from(
+        orjson.dumps({"type": "late_event_for_registry_test", "workspace_id": str(uuid4())})
+    )
+
+    assert isinstance(event, LateEvent)
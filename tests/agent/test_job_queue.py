@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from great_expectations_cloud.agent.constants import JobPriority
+from great_expectations_cloud.agent.job_queue import JobQueue
+
+pytestmark = pytest.mark.unit
+
+
+def build_event_context(mocker, correlation_id: str, event_type: str) -> Any:
+    event_context = mocker.Mock()
+    event_context.correlation_id = correlation_id
+    event_context.event.type = event_type
+    return event_context
+
+
+def test_interactive_jobs_overtake_scheduled_jobs(mocker):
+    queue = JobQueue(max_size=3)
+    scheduled = build_event_context(mocker, "job-1", "run_scheduled_checkpoint.received")
+    default = build_event_context(mocker, "job-2", "run_checkpoint_request")
+    interactive = build_event_context(mocker, "job-3", "test_datasource_config")
+    for event_context in (scheduled, default, interactive):
+        assert queue.put(event_context)
+
+    assert [queue.pop(), queue.pop(), queue.pop()] == [interactive, default, scheduled]
+    assert queue.pop() is None
+
+
+def test_jobs_of_the_same_priority_are_first_in_first_out(mocker):
+    queue = JobQueue(max_size=2)
+    first = build_event_context(mocker, "job-1", "run_checkpoint_request")
+    second = build_event_context(mocker, "job-2", "run_checkpoint_request")
+    queue.put(first)
+    queue.put(second)
+
+    assert [queue.pop(), queue.pop()] == [first, second]
+
+
+def test_put_returns_false_when_full(mocker):
+    queue = JobQueue(max_size=1)
+
+    assert queue.put(build_event_context(mocker, "job-1", "run_checkpoint_request"))
+    assert not queue.put(build_event_context(mocker, "job-2", "run_checkpoint_request"))
+    assert len(queue) == 1
+
+
+def test_redelivery_replaces_the_queued_delivery(mocker):
+    queue = JobQueue(max_size=1)
+    original = build_event_context(mocker, "job-1", "run_checkpoint_request")
+    redelivery = build_event_context(mocker, "job-1", "run_checkpoint_request")
+    queue.put(original)
+
+    assert queue.put(redelivery)
+    assert len(queue) == 1
+    assert queue.pop() is redelivery
+
+
+def test_replace_returns_the_superseded_delivery(mocker):
+    queue = JobQueue(max_size=1)
+    original = build_event_context(mocker, "job-1", "run_checkpoint_request")
+    redelivery = build_event_context(mocker, "job-1", "run_checkpoint_request")
+
+    assert queue.replace(original) is None
+    queue.put(original)
+
+    assert queue.replace(redelivery) is original
+    assert queue.pop() is redelivery
+
+
+def test_priorities_can_be_overridden(mocker):
+    queue = JobQueue(
+        max_size=2, priorities={"run_scheduled_checkpoint.received": JobPriority.INTERACTIVE}
+    )
+    default = build_event_context(mocker, "job-1", "run_checkpoint_request")
+    scheduled = build_event_context(mocker, "job-2", "run_scheduled_checkpoint.received")
+    queue.put(default)
+    queue.put(scheduled)
+
+    assert queue.pop() is scheduled
+
+
+def test_pop_skips_jobs_that_cannot_start(mocker):
+    queue = JobQueue(max_size=2)
+    interactive = build_event_context(mocker, "job-1", "test_datasource_config")
+    scheduled = build_event_context(mocker, "job-2", "run_scheduled_checkpoint.received")
+    queue.put(interactive)
+    queue.put(scheduled)
+
+    assert queue.pop(can_start=lambda event_context: event_context is scheduled) is scheduled
+    assert queue.pop(can_start=lambda event_context: False) is None
+    assert queue.pop() is interactive
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from great_expectations_cloud.agent.job_status_reporter import (
+    JobStatusReporter,
+    JobStatusUpdate,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeGXCloud:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.sent: list[str] = []
+
+    def update(self, correlation_id: str, status: str) -> JobStatusUpdate:
+        return JobStatusUpdate(
+            correlation_id=correlation_id,
+            send=lambda: self._send(f"{correlation_id}:{status}"),
+            description=status,
+        )
+
+    def _send(self, message: str) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("GX Cloud is unavailable")  # noqa: TRY003 # test double
+        self.sent.append(message)
+
+
+@pytest.fixture
+def reporter() -> JobStatusReporter:
+    return JobStatusReporter(max_attempts=3, backoff_seconds=0)
+
+
+def test_updates_are_sent_in_order(reporter):
+    gx_cloud = FakeGXCloud()
+
+    for correlation_id in ("job-1", "job-2"):
+        reporter.report(gx_cloud.update(correlation_id, "started"))
+        reporter.report(gx_cloud.update(correlation_id, "completed"))
+
+    assert reporter.flush(timeout=5)
+    assert gx_cloud.sent == ["job-1:started", "job-1:completed", "job-2:started", "job-2:completed"]
+
+
+def test_pending_supersedable_update_is_dropped(reporter):
+    gx_cloud = FakeGXCloud()
+    gx_cloud_responded = threading.Event()
+
+    def slow_send() -> None:
+        gx_cloud_responded.wait(timeout=5)
+
+    reporter.report(
+        JobStatusUpdate(correlation_id="job-0", send=slow_send, description="completed")
+    )
+    started = gx_cloud.update("job-1", "started")
+    started.supersedable = True
+    other_job_started = gx_cloud.update("job-2", "started")
+    other_job_started.supersedable = True
+
+    reporter.report(started)
+    reporter.report(other_job_started)
+    reporter.report(gx_cloud.update("job-1", "completed"))
+    gx_cloud_responded.set()
+
+    assert reporter.flush(timeout=5)
+    assert gx_cloud.sent == ["job-2:started", "job-1:completed"]
+
+
+def test_failed_update_is_retried(reporter):
+    gx_cloud = FakeGXCloud(failures=2)
+    delivered = threading.Event()
+    update = gx_cloud.update("job-1", "completed")
+    update.on_delivered = delivered.set
+
+    reporter.report(update)
+
+    assert reporter.flush(timeout=5)
+    assert gx_cloud.sent == ["job-1:completed"]
+    assert delivered.is_set()
+
+
+def test_update_is_given_up_on_after_max_attempts(reporter):
+    gx_cloud = FakeGXCloud(failures=3)
+    errors: list[Exception] = []
+    update = gx_cloud.update("job-1", "completed")
+    update.on_failed = errors.append
+    update.on_delivered = lambda: pytest.fail("update was not delivered")
+
+    reporter.report(update)
+    reporter.report(gx_cloud.update("job-2", "completed"))
+
+    assert reporter.flush(timeout=5)
+    assert [str(error) for error in errors] == ["GX Cloud is unavailable"]
+    assert gx_cloud.sent == ["job-2:completed"]
+
+
+def test_failing_callback_does_not_stop_the_reporter(reporter):
+    gx_cloud = FakeGXCloud()
+    update = gx_cloud.update("job-1", "completed")
+
+    def on_delivered() -> None:
+        raise RuntimeError
+
+    update.on_delivered = on_delivered
+
+    reporter.report(update)
+    reporter.report(gx_cloud.update("job-2", "completed"))
+
+    assert reporter.flush(timeout=5)
+    assert gx_cloud.sent == ["job-1:completed", "job-2:completed"]
+
+
+def test_shutdown_stops_the_thread(reporter):
+    gx_cloud = FakeGXCloud()
+    reporter.report(gx_cloud.update("job-1", "completed"))
+
+    reporter.shutdown(timeout=5)
+
+    assert gx_cloud.sent == ["job-1:completed"]
+    assert reporter._thread is not None
+    assert not reporter._thread.is_alive()
+
+
+def test_backing_off_update_does_not_hold_up_other_jobs():
+    reporter = JobStatusReporter(max_attempts=2, backoff_seconds=30)
+    gx_cloud = FakeGXCloud(failures=1)
+    other_job_delivered = threading.Event()
+    other_job_completed = gx_cloud.update("job-2", "completed")
+    other_job_completed.on_delivered = other_job_delivered.set
+
+    reporter.report(gx_cloud.update("job-1", "completed"))
+    reporter.report(other_job_completed)
+
+    assert other_job_delivered.wait(timeout=5)
+    assert gx_cloud.sent == ["job-2:completed"]
+    assert len(reporter) == 1
+    # shutting down retries the backing off update right away
+    reporter.shutdown(timeout=0.1)
+    assert reporter._thread is not None
+    reporter._thread.join(timeout=5)
+    assert gx_cloud.sent == ["job-2:completed", "job-1:completed"]
+
+
+def test_send_retries_from_the_calling_thread(reporter):
+    gx_cloud = FakeGXCloud(failures=2)
+
+    reporter.send(gx_cloud.update("job-1", "created"))
+
+    assert gx_cloud.sent == ["job-1:created"]
+    assert reporter._thread is None
+
+
+def test_send_raises_after_max_attempts(reporter):
+    gx_cloud = FakeGXCloud(failures=3)
+
+    with pytest.raises(ConnectionError):
+        reporter.send(gx_cloud.update("job-1", "created"))
+
+    assert gx_cloud.sent == []
@@ -16,6 +16,7 @@ from great_expectations_cloud.agent.models import (
     UnknownEvent,
     _build_event_union,
     all_subclasses,
+    get_event_registry,
 )
 
 pytestmark = pytest.mark.unit
@@ -217,3 +218,24 @@ class TestDynamicEventUnion:
         # This should raise MissingEventSubclasses since no valid classes are found
         with pytest.raises(MissingEventSubclasses):
             _build_event_union()
+
+
+class TestEventRegistry:
+    def test_registry_maps_type_to_event_class(self):
+        registry = get_event_registry()
+
+        assert registry["run_checkpoint_request"] is RunCheckpointEvent
+        assert registry["unknown_event"] is UnknownEvent
+
+    def test_registry_is_reused_until_invalidated(self):
+        assert get_event_registry() is get_event_registry()
+
+    def test_new_subclass_invalidates_registry(self):
+        registry = get_event_registry()
+
+        class RegistryTestEvent(AgentBaseExtraIgnore):
+            type: Literal["registry_test_event"] = "registry_test_event"
+
+        rebuilt = get_event_registry()
+        assert rebuilt is not registry
+        assert rebuilt["registry_test_event"] is RegistryTestEvent
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+import pickle
+import uuid
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import pytest
+
+from great_expectations_cloud.agent.actions.agent_action import ActionResult
+from great_expectations_cloud.agent.exceptions import (
+    GXAgentWorkerProcessError,
+    GXCoreError,
+)
+from great_expectations_cloud.agent.models import (
+    RunCheckpointEvent,
+    build_failed_job_completed_status,
+)
+from great_expectations_cloud.agent.prefork import (
+    PreforkExecutor,
+    handle_event_in_worker_process,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeAgent:
+    """Stands in for GXAgent inside the forked worker."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self._error = error
+
+    def _handle_event(self, event_context: Any) -> ActionResult:
+        if self._error is not None:
+            raise self._error
+        return ActionResult(
+            id=event_context.correlation_id,
+            type=str(os.getpid()),
+            created_resources=[],
+        )
+
+
+class UnpicklableError(Exception):
+    def __init__(self, message: str, connection: object) -> None:
+        super().__init__(message)
+        self.connection = connection
+
+
+def _crash_worker() -> None:
+    os._exit(1)
+
+
+def _get_pid() -> int:
+    return os.getpid()
+
+
+@pytest.fixture
+def event() -> RunCheckpointEvent:
+    return RunCheckpointEvent(
+        datasource_names_to_asset_names={},
+        checkpoint_id=uuid.uuid4(),
+        organization_id=uuid.uuid4(),
+        workspace_id=uuid.uuid4(),
+    )
+
+
+def _submit_job(executor: PreforkExecutor, event: RunCheckpointEvent, correlation_id: str) -> Any:
+    return executor.submit(
+        handle_event_in_worker_process,
+        event=event,
+        correlation_id=correlation_id,
+        redelivered=False,
+    )
+
+
+def test_prefork_executor_runs_jobs_in_worker_processes(event):
+    executor = PreforkExecutor(max_workers=2, agent=FakeAgent())  # type: ignore[arg-type] # test double
+    try:
+        executor.start()
+        first = _submit_job(executor, event, "job-1")
+        second = _submit_job(executor, event, "job-2")
+        results = [first.result(timeout=30), second.result(timeout=30)]
+    finally:
+        executor.shutdown(wait=True)
+
+    assert [result.id for result in results] == ["job-1", "job-2"]
+    assert str(os.getpid()) not in {result.type for result in results}
+
+
+def test_prefork_executor_returns_picklable_errors(event):
+    error = UnpicklableError("cannot connect", connection=lambda: None)
+    executor = PreforkExecutor(max_workers=1, agent=FakeAgent(error=error))  # type: ignore[arg-type] # test double
+    try:
+        future = _submit_job(executor, event, "job-1")
+        with pytest.raises(GXAgentWorkerProcessError) as exc_info:
+            future.result(timeout=30)
+    finally:
+        executor.shutdown(wait=True)
+
+    assert str(exc_info.value) == "cannot connect"
+    assert exc_info.value.error_type == "UnpicklableError"
+
+
+def test_prefork_executor_retires_crashed_worker(event):
+    executor = PreforkExecutor(max_workers=2, agent=FakeAgent())  # type: ignore[arg-type] # test double
+    try:
+        executor.start()
+        crashed = executor.submit(_crash_worker)
+        with pytest.raises(BrokenProcessPool):
+            crashed.result(timeout=30)
+        first = _submit_job(executor, event, "job-2").result(timeout=30)
+        second = _submit_job(executor, event, "job-3").result(timeout=30)
+        live_workers = executor.live_workers
+    finally:
+        executor.shutdown(wait=True)
+
+    assert live_workers == 1
+    # the surviving worker runs every job; no worker is forked after start
+    assert first.type == second.type
+
+
+def test_prefork_executor_reports_when_all_workers_exited(event):
+    exited: list[bool] = []
+    executor = PreforkExecutor(
+        max_workers=1,
+        agent=FakeAgent(),  # type: ignore[arg-type] # test double
+        on_all_workers_exited=lambda: exited.append(True),
+    )
+    try:
+        executor.start()
+        crashed = executor.submit(_crash_worker)
+        with pytest.raises(BrokenProcessPool):
+            crashed.result(timeout=30)
+        with pytest.raises(BrokenProcessPool):
+            _submit_job(executor, event, "job-2")
+    finally:
+        executor.shutdown(wait=True)
+
+    assert exited == [True]
+    assert executor.live_workers == 0
+
+
+def test_prefork_executor_raises_when_all_workers_busy():
+    executor = PreforkExecutor(max_workers=1, agent=FakeAgent())  # type: ignore[arg-type] # test double
+    executor._slot_futures[0] = Future()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(_get_pid)
+
+
+def test_worker_process_error_round_trips_through_pickle():
+    error = GXAgentWorkerProcessError(
+        message="bad password",
+        error_type="GXCoreError",
+        error_code="wrong-username-or-password",
+        error_params={"datasource": "pg"},
+    )
+
+    restored = pickle.loads(pickle.dumps(error))  # noqa: S301 # trusted input
+
+    assert str(restored) == "bad password"
+    assert restored.error_type == "GXCoreError"
+    assert restored.error_code == "wrong-username-or-password"
+    assert restored.error_params == {"datasource": "pg"}
+
+
+def test_failed_job_status_keeps_error_code_from_worker_process():
+    error = GXAgentWorkerProcessError.from_exception(
+        GXCoreError(message="bad password", error_code="wrong-username-or-password")
+    )
+
+    status = build_failed_job_completed_status(error, processed_by="agent")
+
+    assert status.error_stack_trace == "bad password"
+    assert status.error_code == "wrong-username-or-password"
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy as sa
+
+from great_expectations_cloud.agent.exceptions import GXAgentQueryCancelledError
+from great_expectations_cloud.agent.query_cancellation import (
+    CancelScope,
+    _cancel_statement,
+    _Statement,
+)
+
+pytestmark = pytest.mark.unit
+
+ENDLESS_QUERY = sa.text(
+    "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT count(*) FROM c"
+)
+
+
+@pytest.fixture
+def engine() -> sa.Engine:
+    return sa.create_engine("sqlite://")
+
+
+def query(engine: sa.Engine, statement: sa.TextClause) -> object:
+    with engine.connect() as connection:
+        return connection.execute(statement).scalar()
+
+
+def wait_for_statement(scope: CancelScope) -> None:
+    deadline = time.monotonic() + 5
+    while not scope._statements:
+        assert time.monotonic() < deadline, "the statement never started"
+        time.sleep(0.01)
+
+
+def test_cancel_interrupts_a_running_query(engine):
+    scope = CancelScope()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(scope.run, query, engine, ENDLESS_QUERY)
+        wait_for_statement(scope)
+
+        assert scope.cancel() == 1
+        with pytest.raises(sa.exc.OperationalError, match="interrupted"):
+            future.result(timeout=5)
+
+    assert scope._statements == {}
+
+
+def test_cancelled_scope_runs_no_further_statements(engine):
+    scope = CancelScope()
+    scope.cancel()
+
+    with pytest.raises(GXAgentQueryCancelledError):
+        scope.run(query, engine, sa.text("SELECT 1"))
+
+
+def test_statements_outside_a_scope_are_not_tracked(engine):
+    scope = CancelScope()
+    scope.cancel()
+
+    with scope:
+        pass
+
+    assert query(engine, sa.text("SELECT 1")) == 1
+
+
+def test_scope_only_covers_its_own_thread(engine):
+    scope = CancelScope()
+    scope.cancel()
+    results: list[object] = []
+
+    with scope:
+        thread = threading.Thread(target=lambda: results.append(query(engine, sa.text("SELECT 1"))))
+        thread.start()
+        thread.join()
+
+    assert results == [1]
+
+
+def test_snowflake_queries_are_cancelled_for_the_session():
+    connection = MagicMock(session_id=42)
+
+    assert _cancel_statement(_Statement("snowflake", connection, MagicMock()))
+
+    connection.cursor.return_value.execute.assert_called_once_with(
+        "SELECT SYSTEM$CANCEL_ALL_QUERIES(%s)", (42,)
+    )
+    connection.cursor.return_value.close.assert_called_once()
+
+
+def test_postgres_queries_are_cancelled_on_the_connection():
+    connection = MagicMock(spec=["cancel"])
+
+    assert _cancel_statement(_Statement("postgresql", connection, MagicMock(spec=[])))
+
+    connection.cancel.assert_called_once()
+
+
+def test_cursor_cancel_is_preferred():
+    cursor = MagicMock(spec=["cancel"])
+
+    assert _cancel_statement(_Statement("mssql", MagicMock(spec=["cancel"]), cursor))
+
+    cursor.cancel.assert_called_once()
+
+
+def test_unsupported_or_failing_cancel_reports_nothing_cancelled():
+    failing = MagicMock(spec=["cancel"])
+    failing.cancel.side_effect = RuntimeError("connection closed")
+
+    assert not _cancel_statement(_Statement("redshift", MagicMock(spec=[]), MagicMock(spec=[])))
+    assert not _cancel_statement(_Statement("postgresql", failing, MagicMock(spec=[])))
@@ -6,5 +6,5 @@ from great_expectations_cloud.agent import run_agent
 def test_run_calls_gx_agent(mocker):
     agent = mocker.patch("great_expectations_cloud.agent.run.GXAgent")
     run_agent()
-    agent.assert_called_with()
+    agent.assert_called_with(max_workers=None, execution_mode=None)
     agent().run.assert_called_with()